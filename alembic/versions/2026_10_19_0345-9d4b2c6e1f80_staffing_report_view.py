@@ -0,0 +1,53 @@
+"""staffing report view
+
+Revision ID: 9d4b2c6e1f80
+Revises: 5c1f3e9a7b2d
+Create Date: 2026-10-19 03:45:41.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4b2c6e1f80'
+down_revision: Union[str, None] = '5c1f3e9a7b2d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW staffing_report AS
+        SELECT
+            project.id AS project_id,
+            project.name AS project_name,
+            project.status AS project_status,
+            project.active AS project_active,
+            customer.id AS customer_id,
+            customer.name AS customer_name,
+            customer.active AS customer_active,
+            count("user".id) AS headcount,
+            count("user".id) FILTER (WHERE "user".role = 'ENGINEER') AS engineers,
+            count("user".id) FILTER (WHERE "user".role = 'MANAGER') AS managers,
+            now() AS refreshed_at
+        FROM project
+        JOIN customer ON customer.id = project.customer_id
+        LEFT JOIN "user" ON "user".project_id = project.id
+        GROUP BY project.id, customer.id
+        WITH DATA
+        """
+    )
+    # A unique index is required to REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        'ix_staffing_report_project_id', 'staffing_report', ['project_id'], unique=True
+    )
+    op.create_index(
+        'ix_staffing_report_customer_id', 'staffing_report', ['customer_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS staffing_report")
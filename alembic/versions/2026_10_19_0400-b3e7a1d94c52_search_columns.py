@@ -0,0 +1,72 @@
+"""search columns
+
+Revision ID: b3e7a1d94c52
+Revises: 9d4b2c6e1f80
+Create Date: 2026-10-19 04:00:08.127764
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e7a1d94c52'
+down_revision: Union[str, None] = '9d4b2c6e1f80'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Searchable text of each table - kept in step with api/database/models.py
+SEARCH_EXPRESSIONS = {
+    'user': "first_name || ' ' || last_name || ' ' || user_name || ' ' || email",
+    'customer': "name || ' ' || coalesce(details, '')",
+    'project': "name || ' ' || coalesce(details, '')",
+}
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, expression in SEARCH_EXPRESSIONS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                'search_text',
+                sa.Text(),
+                sa.Computed(expression, persisted=True),
+                nullable=False,
+            ),
+        )
+        op.add_column(
+            table,
+            sa.Column(
+                'search_vector',
+                postgresql.TSVECTOR(),
+                sa.Computed(f"to_tsvector('simple', {expression})", persisted=True),
+                nullable=False,
+            ),
+        )
+        op.create_index(
+            f'ix_{table}_search_text',
+            table,
+            ['search_text'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'search_text': 'gin_trgm_ops'},
+        )
+        op.create_index(
+            f'ix_{table}_search_vector',
+            table,
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+        )
+
+
+def downgrade() -> None:
+    for table in SEARCH_EXPRESSIONS:
+        op.drop_index(f'ix_{table}_search_vector', table_name=table)
+        op.drop_index(f'ix_{table}_search_text', table_name=table)
+        op.drop_column(table, 'search_vector')
+        op.drop_column(table, 'search_text')
@@ -0,0 +1,71 @@
+"""assignment table
+
+Revision ID: c8f2d5a1e6b3
+Revises: b3e7a1d94c52
+Create Date: 2026-10-19 04:15:41.503217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f2d5a1e6b3'
+down_revision: Union[str, None] = 'b3e7a1d94c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Equality on uuid columns within a GiST exclusion constraint
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.create_table(
+        'assignment',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('project_id', sa.UUID(), nullable=False),
+        sa.Column('allocation', sa.Integer(), nullable=False),
+        sa.Column('validity', postgresql.TSTZRANGE(), nullable=False),
+        sa.CheckConstraint(
+            'allocation BETWEEN 1 AND 100', name='ck_assignment_allocation'
+        ),
+        sa.CheckConstraint(
+            'NOT isempty(validity) AND NOT lower_inf(validity)',
+            name='ck_assignment_validity',
+        ),
+        postgresql.ExcludeConstraint(
+            (sa.column('user_id'), '='),
+            (sa.column('project_id'), '='),
+            (sa.column('validity'), '&&'),
+            name='ex_assignment_user_project_validity',
+            using='gist',
+        ),
+        sa.ForeignKeyConstraint(['project_id'], ['project.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_assignment_id'), 'assignment', ['id'], unique=False)
+    op.create_index(
+        'ix_assignment_validity',
+        'assignment',
+        ['validity'],
+        unique=False,
+        postgresql_using='gist',
+    )
+    op.create_index(
+        'ix_assignment_project_id_validity',
+        'assignment',
+        ['project_id', 'validity'],
+        unique=False,
+        postgresql_using='gist',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_assignment_project_id_validity', table_name='assignment')
+    op.drop_index('ix_assignment_validity', table_name='assignment')
+    op.drop_index(op.f('ix_assignment_id'), table_name='assignment')
+    op.drop_table('assignment')
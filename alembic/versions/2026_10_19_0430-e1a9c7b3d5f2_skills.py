@@ -0,0 +1,58 @@
+"""skills
+
+Revision ID: e1a9c7b3d5f2
+Revises: c8f2d5a1e6b3
+Create Date: 2026-10-19 04:30:17.384920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a9c7b3d5f2'
+down_revision: Union[str, None] = 'c8f2d5a1e6b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'skill',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('name', sa.String(length=30), nullable=False),
+        sa.Column('bit', sa.SmallInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('bit'),
+    )
+    op.create_index(op.f('ix_skill_id'), 'skill', ['id'], unique=False)
+    op.create_index(op.f('ix_skill_name'), 'skill', ['name'], unique=True)
+    # Skill bitsets, stored as little-endian bytes
+    op.add_column(
+        'user',
+        sa.Column(
+            'skills',
+            sa.LargeBinary(),
+            server_default=sa.text("''::bytea"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        'project',
+        sa.Column(
+            'required_skills',
+            sa.LargeBinary(),
+            server_default=sa.text("''::bytea"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('project', 'required_skills')
+    op.drop_column('user', 'skills')
+    op.drop_index(op.f('ix_skill_name'), table_name='skill')
+    op.drop_index(op.f('ix_skill_id'), table_name='skill')
+    op.drop_table('skill')
@@ -0,0 +1,64 @@
+"""assignment event
+
+Revision ID: f4c2a8e6b1d9
+Revises: e1a9c7b3d5f2
+Create Date: 2026-10-19 04:45:42.615083
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c2a8e6b1d9'
+down_revision: Union[str, None] = 'e1a9c7b3d5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The existing project status type is reused for the status columns
+    project_status = postgresql.ENUM(
+        'PENDING', 'DESIGN', 'BUILD', 'COMPLETE', name='projectstatus', create_type=False
+    )
+    op.create_table(
+        'assignment_event',
+        sa.Column('id', sa.BigInteger(), sa.Identity(always=False), nullable=False),
+        sa.Column(
+            'occurred_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'event_type',
+            sa.Enum('USER_PROJECT', 'PROJECT_STATUS', name='assignmenteventtype'),
+            nullable=False,
+        ),
+        sa.Column('actor', sa.String(length=8), nullable=True),
+        sa.Column('user_id', sa.UUID(), nullable=True),
+        sa.Column('project_id', sa.UUID(), nullable=True),
+        sa.Column('previous_project_id', sa.UUID(), nullable=True),
+        sa.Column('status', project_status, nullable=True),
+        sa.Column('previous_status', project_status, nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_assignment_event_user_id_id', 'assignment_event', ['user_id', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_assignment_event_project_id_id',
+        'assignment_event',
+        ['project_id', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_assignment_event_project_id_id', table_name='assignment_event')
+    op.drop_index('ix_assignment_event_user_id_id', table_name='assignment_event')
+    op.drop_table('assignment_event')
+    sa.Enum(name='assignmenteventtype').drop(op.get_bind(), checkfirst=True)
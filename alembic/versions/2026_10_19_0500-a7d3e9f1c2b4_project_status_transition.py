@@ -0,0 +1,92 @@
+"""project status transition
+
+Revision ID: a7d3e9f1c2b4
+Revises: f4c2a8e6b1d9
+Create Date: 2026-10-19 05:00:08.271904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e9f1c2b4'
+down_revision: Union[str, None] = 'f4c2a8e6b1d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'project_status_transition',
+        sa.Column('id', sa.BigInteger(), sa.Identity(always=False), nullable=False),
+        sa.Column('project_id', sa.UUID(), nullable=False),
+        sa.Column(
+            'status',
+            postgresql.ENUM(
+                'PENDING', 'DESIGN', 'BUILD', 'COMPLETE', name='projectstatus', create_type=False
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            'entered_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(['project_id'], ['project.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_project_status_transition_project_id_entered_at',
+        'project_status_transition',
+        ['project_id', 'entered_at', 'id'],
+        unique=False,
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION record_project_status() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO project_status_transition (project_id, status, entered_at)
+            VALUES (NEW.id, NEW.status, now());
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tr_project_status_insert
+        AFTER INSERT ON project
+        FOR EACH ROW EXECUTE FUNCTION record_project_status()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tr_project_status_update
+        AFTER UPDATE OF status ON project
+        FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION record_project_status()
+        """
+    )
+    # Earlier history is unknown - existing projects start in their current status now
+    op.execute(
+        """
+        INSERT INTO project_status_transition (project_id, status, entered_at)
+        SELECT id, status, now() FROM project
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS tr_project_status_update ON project')
+    op.execute('DROP TRIGGER IF EXISTS tr_project_status_insert ON project')
+    op.execute('DROP FUNCTION IF EXISTS record_project_status()')
+    op.drop_index(
+        'ix_project_status_transition_project_id_entered_at',
+        table_name='project_status_transition',
+    )
+    op.drop_table('project_status_transition')
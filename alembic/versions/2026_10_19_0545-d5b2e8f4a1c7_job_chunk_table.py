@@ -0,0 +1,61 @@
+"""job chunk table
+
+Revision ID: d5b2e8f4a1c7
+Revises: c3f8a1d6e9b7
+Create Date: 2026-10-19 05:45:08.126374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5b2e8f4a1c7'
+down_revision: Union[str, None] = 'c3f8a1d6e9b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job_chunk',
+        sa.Column('job_id', sa.UUID(), nullable=False),
+        sa.Column('file', sa.Enum('PAYLOAD', 'OUTPUT', name='jobfile'), nullable=False),
+        sa.Column('seq', sa.Integer(), nullable=False),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['job.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('job_id', 'file', 'seq'),
+    )
+    # Existing files become a single chunk each
+    op.execute(
+        """
+        INSERT INTO job_chunk (job_id, file, seq, data)
+        SELECT id, 'PAYLOAD'::jobfile, 0, payload FROM job WHERE payload IS NOT NULL
+        UNION ALL
+        SELECT id, 'OUTPUT'::jobfile, 0, output FROM job WHERE output IS NOT NULL
+        """
+    )
+    op.drop_column('job', 'output')
+    op.drop_column('job', 'payload')
+
+
+def downgrade() -> None:
+    op.add_column('job', sa.Column('payload', sa.LargeBinary(), nullable=True))
+    op.add_column('job', sa.Column('output', sa.LargeBinary(), nullable=True))
+    op.execute(
+        """
+        UPDATE job SET
+            payload = (
+                SELECT string_agg(data, ''::bytea ORDER BY seq) FROM job_chunk
+                WHERE job_id = job.id AND file = 'PAYLOAD'
+            ),
+            output = (
+                SELECT string_agg(data, ''::bytea ORDER BY seq) FROM job_chunk
+                WHERE job_id = job.id AND file = 'OUTPUT'
+            )
+        """
+    )
+    op.drop_table('job_chunk')
+    sa.Enum(name='jobfile').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,30 @@
+"""idempotency key headers
+
+Revision ID: e8a4c1f7b3d6
+Revises: d5b2e8f4a1c7
+Create Date: 2026-10-19 06:00:41.583906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a4c1f7b3d6'
+down_revision: Union[str, None] = 'd5b2e8f4a1c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'idempotency_key',
+        sa.Column('headers', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('idempotency_key', 'headers')
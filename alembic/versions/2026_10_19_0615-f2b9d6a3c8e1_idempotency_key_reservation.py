@@ -0,0 +1,28 @@
+"""idempotency key reservation
+
+Revision ID: f2b9d6a3c8e1
+Revises: e8a4c1f7b3d6
+Create Date: 2026-10-19 06:15:27.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b9d6a3c8e1'
+down_revision: Union[str, None] = 'e8a4c1f7b3d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'idempotency_key', sa.Column('reservation', sa.String(length=32), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('idempotency_key', 'reservation')
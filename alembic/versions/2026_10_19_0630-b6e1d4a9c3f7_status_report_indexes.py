@@ -0,0 +1,49 @@
+"""status report indexes
+
+Revision ID: b6e1d4a9c3f7
+Revises: f2b9d6a3c8e1
+Create Date: 2026-10-19 06:30:41.517283
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e1d4a9c3f7'
+down_revision: Union[str, None] = 'f2b9d6a3c8e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f('ix_project_customer_id'), 'project', ['customer_id'], unique=False
+    )
+    op.drop_index(
+        'ix_project_status_transition_project_id_entered_at',
+        table_name='project_status_transition',
+    )
+    op.create_index(
+        'ix_project_status_transition_project_id_entered_at',
+        'project_status_transition',
+        ['project_id', 'entered_at', 'id'],
+        unique=False,
+        postgresql_include=['status'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_project_status_transition_project_id_entered_at',
+        table_name='project_status_transition',
+    )
+    op.create_index(
+        'ix_project_status_transition_project_id_entered_at',
+        'project_status_transition',
+        ['project_id', 'entered_at', 'id'],
+        unique=False,
+    )
+    op.drop_index(op.f('ix_project_customer_id'), table_name='project')
@@ -25,6 +25,40 @@ class Config:
     admin_email = environ["ADMIN_EMAIL"]
     admin_first_name = environ["ADMIN_FNAME"]
     admin_last_name = environ["ADMIN_LNAME"]
+    bulk_chunk_size = int(environ.get("BULK_CHUNK_SIZE", "1000"))
+    bulk_max_errors = int(environ.get("BULK_MAX_ERRORS", "1000"))
+    compression_minimum_size = int(environ.get("COMPRESSION_MINIMUM_SIZE", "500"))
+    compression_gzip_level = int(environ.get("COMPRESSION_GZIP_LEVEL", "6"))
+    compression_brotli_quality = int(environ.get("COMPRESSION_BROTLI_QUALITY", "4"))
+    include_max_depth = int(environ.get("INCLUDE_MAX_DEPTH", "3"))
+    lookup_max_ids = int(environ.get("LOOKUP_MAX_IDS", "100"))
+    single_flight_timeout = float(environ.get("SINGLE_FLIGHT_TIMEOUT", "5"))
+    summary_cache_ttl = float(environ.get("SUMMARY_CACHE_TTL", "30"))
+    staffing_refresh_delay = float(environ.get("STAFFING_REFRESH_DELAY", "2"))
+    staffing_refresh_max_delay = float(environ.get("STAFFING_REFRESH_MAX_DELAY", "30"))
+    batch_max_operations = int(environ.get("BATCH_MAX_OPERATIONS", "20"))
+    batch_max_concurrency = int(environ.get("BATCH_MAX_CONCURRENCY", "4"))
+    typeahead_index_ttl = float(environ.get("TYPEAHEAD_INDEX_TTL", "300"))
+    skills_max = int(environ.get("SKILLS_MAX", "512"))
+    skill_matrix_ttl = float(environ.get("SKILL_MATRIX_TTL", "300"))
+    audit_flush_interval_ms = int(environ.get("AUDIT_FLUSH_INTERVAL_MS", "250"))
+    audit_batch_size = int(environ.get("AUDIT_BATCH_SIZE", "500"))
+    audit_max_pending = int(environ.get("AUDIT_MAX_PENDING", "10000"))
+    job_workers = int(environ.get("JOB_WORKERS", "1"))
+    job_poll_interval = float(environ.get("JOB_POLL_INTERVAL", "1"))
+    job_heartbeat_interval = float(environ.get("JOB_HEARTBEAT_INTERVAL", "5"))
+    job_stale_after = float(environ.get("JOB_STALE_AFTER", "60"))
+    job_max_attempts = int(environ.get("JOB_MAX_ATTEMPTS", "3"))
+    job_chunk_size = int(environ.get("JOB_CHUNK_SIZE", "1048576"))
+    idempotency_ttl = float(environ.get("IDEMPOTENCY_TTL", "86400"))
+    idempotency_lock_timeout = float(environ.get("IDEMPOTENCY_LOCK_TIMEOUT", "300"))
+    idempotency_cache_size = int(environ.get("IDEMPOTENCY_CACHE_SIZE", "1024"))
+    idempotency_max_response_size = int(
+        environ.get("IDEMPOTENCY_MAX_RESPONSE_SIZE", "1048576")
+    )
+    idempotency_purge_interval = float(
+        environ.get("IDEMPOTENCY_PURGE_INTERVAL", "3600")
+    )
 
 
 app_config = Config()
@@ -0,0 +1,85 @@
+import logging
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.database.interfaces.assignment_event_repository_interface import (
+    IAssignmentEventRepository,
+)
+from api.database.models import AssignmentEvent
+from api.database.repository import Repository
+from api.schemas.assignment_event import AssignmentEventType
+from api.utils.exceptions import DatabaseConnectionError, RepositoryError
+
+
+logger = logging.getLogger(__name__)
+
+
+class AssignmentEventRepository(
+    Repository[AssignmentEvent], IAssignmentEventRepository
+):
+    """
+    Repository for the assignment audit log, adding keyset paginated history reads
+    to the generic repository.
+
+    Args:
+        Repository (AssignmentEvent): Generic repository providing the CRUD methods.
+        IAssignmentEventRepository: Repository interface defining the history query.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository
+
+        Args:
+            session (AsyncSession): The async SQLAlchemy database session.
+        """
+        super().__init__(session, AssignmentEvent)
+
+    async def list_page(
+        self,
+        limit: int,
+        before: int | None = None,
+        user_id: str | None = None,
+        project_id: str | None = None,
+        event_type: AssignmentEventType | None = None,
+    ) -> List[AssignmentEvent]:
+        """Lists a page of events, newest first.
+
+        Pages are keyed on the event id rather than an offset, so each page is an
+        index range scan however deep into the history it is
+        (on '(user_id, id)' or '(project_id, id)' when filtered by either).
+
+        Args:
+            limit (int): The maximum number of events
+            before (int | None, optional): Only return events older than this event id. Defaults to None.
+            user_id (str | None, optional): Only return the user's events. Defaults to None.
+            project_id (str | None, optional): Only return the project's events. Defaults to None.
+            event_type (AssignmentEventType | None, optional): Only return events of this type. Defaults to None.
+
+        Returns:
+            List[AssignmentEvent]: The events ordered by descending id.
+        """
+        logger.info("Listing assignment events before %s", before)
+        try:
+            stmt = (
+                select(AssignmentEvent)
+                .order_by(AssignmentEvent.id.desc())
+                .limit(limit)
+            )
+            if before is not None:
+                stmt = stmt.where(AssignmentEvent.id < before)
+            if user_id is not None:
+                stmt = stmt.where(AssignmentEvent.user_id == user_id)
+            if project_id is not None:
+                stmt = stmt.where(AssignmentEvent.project_id == project_id)
+            if event_type is not None:
+                stmt = stmt.where(AssignmentEvent.event_type == event_type)
+            return list((await self._session.execute(stmt)).scalars().all())
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
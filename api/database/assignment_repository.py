@@ -0,0 +1,201 @@
+import logging
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import DateTime, any_, bindparam, distinct, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, TSTZRANGE, Range
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.database.interfaces.assignment_repository_interface import (
+    IAssignmentRepository,
+)
+from api.database.models import Assignment, User
+from api.database.repository import Repository
+from api.utils.exceptions import DatabaseConnectionError, RepositoryError
+
+
+logger = logging.getLogger(__name__)
+
+
+class AssignmentRepository(Repository[Assignment], IAssignmentRepository):
+    """
+    Repository for assignments, adding validity range queries to the generic repository.
+
+    Every range query filters with a GiST indexed operator ('@>' or '&&') on the
+    validity range, so it runs as an index scan rather than a table scan.
+
+    Args:
+        Repository (Assignment): Generic repository providing the CRUD methods.
+        IAssignmentRepository: Repository interface defining the range queries.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository
+
+        Args:
+            session (AsyncSession): The async SQLAlchemy database session.
+        """
+        super().__init__(session, Assignment)
+
+    async def list_at(
+        self,
+        at: datetime,
+        user_id: str | None = None,
+        project_id: str | None = None,
+    ) -> List[Assignment]:
+        """Lists the assignments valid at an instant - who is on what at that time.
+
+        Args:
+            at (datetime): The instant
+            user_id (str | None, optional): Only return the user's assignments. Defaults to None.
+            project_id (str | None, optional): Only return the project's assignments. Defaults to None.
+
+        Returns:
+            List[Assignment]: The valid assignments ordered by user and project.
+        """
+        logger.info("Listing assignments at %s", at)
+        try:
+            stmt = (
+                select(Assignment)
+                .where(Assignment.validity.contains(literal(at, DateTime(timezone=True))))
+                .order_by(Assignment.user_id, Assignment.project_id)
+            )
+            if user_id is not None:
+                stmt = stmt.where(Assignment.user_id == user_id)
+            if project_id is not None:
+                stmt = stmt.where(Assignment.project_id == project_id)
+            return list((await self._session.execute(stmt)).scalars().all())
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def list_overlapping(
+        self, user_id: str, validity: Range[datetime]
+    ) -> List[Assignment]:
+        """Lists a user's assignments overlapping a validity range.
+
+        Args:
+            user_id (str): The user
+            validity (Range[datetime]): The validity range
+
+        Returns:
+            List[Assignment]: The overlapping assignments.
+        """
+        logger.info("Listing assignments overlapping %s", validity)
+        try:
+            stmt = select(Assignment).where(
+                Assignment.user_id == user_id,
+                Assignment.validity.overlaps(literal(validity, TSTZRANGE)),
+            )
+            return list((await self._session.execute(stmt)).scalars().all())
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def list_by_users(self, user_ids: List[str]) -> List[Assignment]:
+        """Lists every assignment, past, present and future, of a list of users in a single query.
+
+        Args:
+            user_ids (List[str]): The users
+
+        Returns:
+            List[Assignment]: The users' assignments.
+        """
+        logger.info("Listing assignments of %s users", len(user_ids))
+        try:
+            if not user_ids:
+                return []
+            stmt = select(Assignment).where(
+                Assignment.user_id
+                == any_(
+                    bindparam(
+                        "user_ids",
+                        [str(user_id) for user_id in user_ids],
+                        type_=ARRAY(Assignment.user_id.type),
+                    )
+                )
+            )
+            return list((await self._session.execute(stmt)).scalars().all())
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def lock_user(self, user_id: str) -> bool:
+        """Locks a user's row until the session's transaction ends ('SELECT ... FOR UPDATE').
+
+        Serializes concurrent assignment writes for the user, across every worker,
+        so checks spanning several of its assignments cannot race each other.
+
+        Args:
+            user_id (str): The user
+
+        Returns:
+            bool: Whether the user exists.
+        """
+        logger.info("Locking user")
+        try:
+            stmt = select(User.id).where(User.id == user_id).with_for_update()
+            return (await self._session.execute(stmt)).scalar_one_or_none() is not None
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def utilisation(
+        self, starts_at: datetime, ends_at: datetime, user_id: str | None = None
+    ) -> List[Dict[str, Any]]:
+        """Aggregates each user's time weighted allocation over a window, in a single query.
+
+        Each overlapping assignment contributes its allocation weighted by the share of
+        the window it covers ('validity * window'), so 50% for half the window adds 25%.
+        Users without assignments in the window are left out.
+
+        Args:
+            starts_at (datetime): The start of the window (inclusive)
+            ends_at (datetime): The end of the window (exclusive)
+            user_id (str | None, optional): Only aggregate the user's assignments. Defaults to None.
+
+        Returns:
+            List[Dict[str, Any]]: 'user_id', 'allocation' (percent) and 'projects' rows ordered by user.
+        """
+        logger.info("Aggregating utilisation between %s and %s", starts_at, ends_at)
+        try:
+            window = literal(Range(starts_at, ends_at, bounds="[)"), TSTZRANGE)
+            covered = Assignment.validity.intersection(window)
+            covered_seconds = func.extract(
+                "epoch", func.upper(covered) - func.lower(covered)
+            )
+            stmt = (
+                select(
+                    Assignment.user_id,
+                    (
+                        func.sum(Assignment.allocation * covered_seconds)
+                        / (ends_at - starts_at).total_seconds()
+                    ).label("allocation"),
+                    func.count(distinct(Assignment.project_id)).label("projects"),
+                )
+                .where(Assignment.validity.overlaps(window))
+                .group_by(Assignment.user_id)
+                .order_by(Assignment.user_id)
+            )
+            if user_id is not None:
+                stmt = stmt.where(Assignment.user_id == user_id)
+            return [dict(row) for row in (await self._session.execute(stmt)).mappings()]
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
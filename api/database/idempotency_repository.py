@@ -0,0 +1,205 @@
+import logging
+from datetime import timedelta
+from typing import List, Tuple
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.database.interfaces.idempotency_repository_interface import (
+    IIdempotencyRepository,
+)
+from api.database.models import IdempotencyKey
+from api.database.repository import Repository
+from api.utils.exceptions import DatabaseConnectionError, RepositoryError
+
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyRepository(Repository[IdempotencyKey], IIdempotencyRepository):
+    """
+    Repository for the stored responses of idempotent requests, adding the reservation
+    and replay operations used by the idempotency middleware to the generic repository.
+
+    Every operation is a single statement on the primary key, committed on its own.
+
+    Args:
+        Repository (IdempotencyKey): Generic repository providing the CRUD methods.
+        IIdempotencyRepository: Repository interface defining the reservation and replay operations.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository
+
+        Args:
+            session (AsyncSession): The async SQLAlchemy database session.
+        """
+        super().__init__(session, IdempotencyKey)
+
+    async def get_live(self, key: str) -> IdempotencyKey | None:
+        """Finds the unexpired reservation or stored response of a key.
+
+        Args:
+            key (str): The hashed idempotency key
+
+        Returns:
+            IdempotencyKey | None: The row, or None if the key is unknown or expired.
+        """
+        try:
+            stmt = select(IdempotencyKey).where(
+                IdempotencyKey.key == key, IdempotencyKey.expires_at > func.now()
+            )
+            return (await self._session.execute(stmt)).scalar_one_or_none()
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def reserve(
+        self, key: str, fingerprint: str, reservation: str, lock_timeout: float
+    ) -> bool:
+        """Reserves a key for the request about to run.
+
+        An expired row of the same key is replaced, so a reservation left behind by a
+        crashed process is taken over once its lock times out.
+
+        Args:
+            key (str): The hashed idempotency key
+            fingerprint (str): The hashed request body
+            reservation (str): Random token identifying the request reserving the key
+            lock_timeout (float): Seconds the reservation is held for if never completed
+
+        Returns:
+            bool: False if the key is already reserved or has a stored response.
+        """
+        expires_at = func.now() + timedelta(seconds=lock_timeout)
+        values = insert(IdempotencyKey).values(
+            key=key,
+            fingerprint=fingerprint,
+            reservation=reservation,
+            expires_at=expires_at,
+        )
+        stmt = values.on_conflict_do_update(
+            index_elements=[IdempotencyKey.key],
+            set_={
+                "fingerprint": values.excluded.fingerprint,
+                "reservation": values.excluded.reservation,
+                "status_code": None,
+                "content_type": None,
+                "headers": None,
+                "body": None,
+                "created_at": func.now(),
+                "expires_at": values.excluded.expires_at,
+            },
+            where=IdempotencyKey.expires_at <= func.now(),
+        ).returning(IdempotencyKey.key)
+        try:
+            reserved = (await self._session.execute(stmt)).scalar_one_or_none()
+            await self._session.commit()
+            return reserved is not None
+        except OperationalError as e:
+            await self._session.rollback()
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            await self._session.rollback()
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def complete(
+        self,
+        key: str,
+        reservation: str,
+        status_code: int,
+        content_type: str | None,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        ttl: float,
+    ) -> bool:
+        """Stores the response of a reserved key, to be replayed for 'ttl' seconds.
+
+        Only the request still holding the reservation stores its response, so a
+        request that outlived its reservation cannot overwrite the response of the
+        retry that took the key over.
+
+        Args:
+            key (str): The hashed idempotency key
+            reservation (str): The token the key was reserved with
+            status_code (int): The response status code
+            content_type (str | None): The response Content-Type
+            headers (List[Tuple[str, str]]): The other end-to-end response headers
+            body (bytes): The response body
+            ttl (float): Seconds the response is replayed for
+
+        Returns:
+            bool: False if the key is no longer reserved by the request.
+        """
+        stmt = (
+            update(IdempotencyKey)
+            .where(
+                IdempotencyKey.key == key,
+                IdempotencyKey.reservation == reservation,
+                IdempotencyKey.status_code.is_(None),
+            )
+            .values(
+                status_code=status_code,
+                content_type=content_type,
+                headers=[list(header) for header in headers],
+                body=body,
+                expires_at=func.now() + timedelta(seconds=ttl),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return (await self._execute_and_commit(stmt)).rowcount > 0
+
+    async def release(self, key: str, reservation: str) -> None:
+        """Drops the reservation of a key whose request failed, so a retry runs it again.
+
+        Args:
+            key (str): The hashed idempotency key
+            reservation (str): The token the key was reserved with
+        """
+        stmt = (
+            delete(IdempotencyKey)
+            .where(
+                IdempotencyKey.key == key,
+                IdempotencyKey.reservation == reservation,
+                IdempotencyKey.status_code.is_(None),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self._execute_and_commit(stmt)
+
+    async def purge_expired(self) -> int:
+        """Deletes the expired reservations and stored responses.
+
+        Returns:
+            int: The number of rows deleted
+        """
+        stmt = (
+            delete(IdempotencyKey)
+            .where(IdempotencyKey.expires_at <= func.now())
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._execute_and_commit(stmt)
+        logger.info("Purged %s expired idempotency keys", result.rowcount)
+        return result.rowcount
+
+    async def _execute_and_commit(self, stmt):
+        """Executes and commits a single write statement"""
+        try:
+            result = await self._session.execute(stmt)
+            await self._session.commit()
+            return result
+        except OperationalError as e:
+            await self._session.rollback()
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            await self._session.rollback()
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
@@ -0,0 +1,23 @@
+"""Assignment event repository interface module"""
+
+from abc import abstractmethod
+from typing import List
+
+from api.database.interfaces.repository_interface import IRepository
+from api.database.models import AssignmentEvent
+from api.schemas.assignment_event import AssignmentEventType
+
+
+class IAssignmentEventRepository(IRepository[AssignmentEvent]):
+    """Assignment Event Repository Interface adding the paginated history query to the generic repository."""
+
+    @abstractmethod
+    async def list_page(
+        self,
+        limit: int,
+        before: int | None = None,
+        user_id: str | None = None,
+        project_id: str | None = None,
+        event_type: AssignmentEventType | None = None,
+    ) -> List[AssignmentEvent]:
+        pass
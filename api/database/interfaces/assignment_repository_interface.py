@@ -0,0 +1,43 @@
+"""Assignment repository interface module"""
+
+from abc import abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy.dialects.postgresql import Range
+
+from api.database.interfaces.repository_interface import IRepository
+from api.database.models import Assignment
+
+
+class IAssignmentRepository(IRepository[Assignment]):
+    """Assignment Repository Interface adding the validity range queries to the generic repository."""
+
+    @abstractmethod
+    async def list_at(
+        self,
+        at: datetime,
+        user_id: str | None = None,
+        project_id: str | None = None,
+    ) -> List[Assignment]:
+        pass
+
+    @abstractmethod
+    async def list_overlapping(
+        self, user_id: str, validity: Range[datetime]
+    ) -> List[Assignment]:
+        pass
+
+    @abstractmethod
+    async def list_by_users(self, user_ids: List[str]) -> List[Assignment]:
+        pass
+
+    @abstractmethod
+    async def lock_user(self, user_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def utilisation(
+        self, starts_at: datetime, ends_at: datetime, user_id: str | None = None
+    ) -> List[Dict[str, Any]]:
+        pass
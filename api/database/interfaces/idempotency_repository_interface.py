@@ -0,0 +1,42 @@
+"""Idempotency key repository interface module"""
+
+from abc import abstractmethod
+from typing import List, Tuple
+
+from api.database.interfaces.repository_interface import IRepository
+from api.database.models import IdempotencyKey
+
+
+class IIdempotencyRepository(IRepository[IdempotencyKey]):
+    """Idempotency Key Repository Interface adding the reservation and replay operations to the generic repository."""
+
+    @abstractmethod
+    async def get_live(self, key: str) -> IdempotencyKey | None:
+        pass
+
+    @abstractmethod
+    async def reserve(
+        self, key: str, fingerprint: str, reservation: str, lock_timeout: float
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def complete(
+        self,
+        key: str,
+        reservation: str,
+        status_code: int,
+        content_type: str | None,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        ttl: float,
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def release(self, key: str, reservation: str) -> None:
+        pass
+
+    @abstractmethod
+    async def purge_expired(self) -> int:
+        pass
@@ -0,0 +1,64 @@
+"""Job repository interface module"""
+
+from abc import abstractmethod
+from typing import Any, AsyncIterator, Dict, Iterable
+
+from api.database.interfaces.repository_interface import IRepository
+from api.database.models import Job
+from api.schemas.job import JobFile, JobStatus
+
+
+class IJobRepository(IRepository[Job]):
+    """Job Repository Interface adding the job queue operations to the generic repository."""
+
+    @abstractmethod
+    async def claim(self) -> Job | None:
+        pass
+
+    @abstractmethod
+    async def create_with_file(
+        self, job: Job, file: JobFile, chunks: Iterable[bytes]
+    ) -> Job:
+        pass
+
+    @abstractmethod
+    async def append_chunk(self, job_id: str, file: JobFile, seq: int, data: bytes) -> None:
+        pass
+
+    @abstractmethod
+    async def delete_file(self, job_id: str, file: JobFile) -> None:
+        pass
+
+    @abstractmethod
+    async def has_file(self, job_id: str, file: JobFile) -> bool:
+        pass
+
+    @abstractmethod
+    def iter_file(self, job_id: str, file: JobFile) -> AsyncIterator[bytes]:
+        pass
+
+    @abstractmethod
+    async def heartbeat(
+        self, job_id: str, progress: int, progress_total: int | None
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def finish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        progress: int,
+        progress_total: int | None = None,
+        result: Dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def release(self, job_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def requeue_stale(self, stale_after: float, max_attempts: int) -> int:
+        pass
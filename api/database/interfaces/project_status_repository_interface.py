@@ -0,0 +1,21 @@
+"""Project status history repository interface module"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List
+
+
+class IProjectStatusRepository(ABC):
+    """Project Status Repository Interface defining the shape of the inheriting repository."""
+
+    @abstractmethod
+    async def list_spans(self, project_id: str) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def time_in_status(
+        self,
+        customer_id: str | None = None,
+        since: datetime | None = None,
+    ) -> List[Dict[str, Any]]:
+        pass
@@ -1,7 +1,9 @@
 """Generic Repository interface module"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Generic, List, TypeVar
+from typing import Any, AsyncIterator, Dict, Generic, List, Set, Tuple, TypeVar
+
+from api.schemas.bulk import ExportFormat
 
 
 T = TypeVar("T")
@@ -18,26 +20,78 @@ class IRepository(ABC, Generic[T]):
     async def create(self, entity: T) -> T:
         pass
 
+    @abstractmethod
+    async def bulk_create(
+        self, rows: List[Dict[str, Any]], returning: str | None = None
+    ) -> List[Any]:
+        pass
+
+    @abstractmethod
+    async def bulk_update(
+        self, attr: str, values: Dict[Any, Any], only_unset: bool = False
+    ) -> List[Any]:
+        pass
+
+    @abstractmethod
+    async def existing_values(self, attr: str, values: List[Any]) -> Set[Any]:
+        pass
+
+    @abstractmethod
+    def stream_export(
+        self, columns: List[str], file_format: ExportFormat
+    ) -> AsyncIterator[bytes]:
+        pass
+
     @abstractmethod
     async def find(
         self,
-        params: Dict[str, str],
+        params: Dict[str, Any],
         and_condition: bool = True,
         load_relations: List[str] | None = None,
+        load_only: List[str] | None = None,
     ) -> List[T] | None:
         pass
 
+    @abstractmethod
+    async def get_many(
+        self,
+        ids: List[str],
+        load_relations: List[str] | None = None,
+        load_only: List[str] | None = None,
+    ) -> List[T]:
+        pass
+
+    @abstractmethod
+    async def count_by(
+        self, attr: str, params: Dict[str, Any] | None = None
+    ) -> Dict[Any, int]:
+        pass
+
+    @abstractmethod
+    async def search(self, query: str, limit: int) -> List[Tuple[T, float]]:
+        pass
+
     @abstractmethod
     async def update(
         self,
         item: T,
-        updates: Dict[str, str | None],
+        updates: Dict[str, Any],
         load_relations: List[str] | None = None,
     ) -> T:
         pass
 
     @abstractmethod
-    async def list_all(self, load_relations: List[str] | None = None) -> List[T]:
+    async def update_many(
+        self, items: List[T], updates: List[Dict[str, Any]]
+    ) -> List[T]:
+        pass
+
+    @abstractmethod
+    async def list_all(
+        self,
+        load_relations: List[str] | None = None,
+        load_only: List[str] | None = None,
+    ) -> List[T]:
         pass
 
     @abstractmethod
@@ -0,0 +1,22 @@
+"""Staffing report repository interface module"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+from api.schemas.project import ProjectStatus
+
+
+class IStaffingRepository(ABC):
+    """Staffing Repository Interface defining the shape of the inheriting repository."""
+
+    @abstractmethod
+    async def list_rows(
+        self,
+        customer_id: str | None = None,
+        status: ProjectStatus | None = None,
+    ) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def refresh(self, concurrently: bool = True) -> None:
+        pass
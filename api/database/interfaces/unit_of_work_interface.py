@@ -0,0 +1,22 @@
+"""Unit of work interface module"""
+
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Type
+
+
+class IUnitOfWork(ABC):
+    """Unit of Work Interface defining an async context manager grouping repository writes into one transaction."""
+
+    @abstractmethod
+    async def __aenter__(self) -> "IUnitOfWork":
+        pass
+
+    @abstractmethod
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        pass
@@ -0,0 +1,356 @@
+import logging
+from datetime import timedelta
+from typing import Any, AsyncIterator, Dict, Iterable
+
+from sqlalchemy import delete, exists, func, insert, select, update
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.database.interfaces.job_repository_interface import IJobRepository
+from api.database.models import Job, JobChunk
+from api.database.repository import Repository
+from api.schemas.job import JobFile, JobStatus
+from api.utils.exceptions import (
+    DatabaseConnectionError,
+    IntegrityViolationError,
+    RepositoryError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+STALE_JOB_ERROR = "The worker running the job stopped responding"
+
+
+class JobRepository(Repository[Job], IJobRepository):
+    """
+    Repository for the background job queue, adding the claim, progress and completion
+    operations used by job workers to the generic repository.
+
+    Every operation is a single statement committed on its own, so a job's row is never
+    locked for longer than the statement - a running job is only marked as such by its
+    status and refreshed heartbeat.
+
+    Args:
+        Repository (Job): Generic repository providing the CRUD methods.
+        IJobRepository: Repository interface defining the job queue operations.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository
+
+        Args:
+            session (AsyncSession): The async SQLAlchemy database session.
+        """
+        super().__init__(session, Job)
+
+    async def claim(self) -> Job | None:
+        """Claims the oldest queued job for the calling worker.
+
+        The job is selected with 'FOR UPDATE SKIP LOCKED', so concurrent workers
+        skip a row another worker is claiming rather than waiting on it, and each
+        job is claimed by exactly one worker.
+
+        Returns:
+            Job | None: The claimed job, now RUNNING, or None if no job is queued.
+        """
+        claimable = (
+            select(Job.id)
+            .where(Job.status == JobStatus.QUEUED)
+            .order_by(Job.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(Job)
+            .where(Job.id == claimable)
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=Job.attempts + 1,
+                progress=0,
+                progress_total=None,
+                started_at=func.now(),
+                heartbeat_at=func.now(),
+            )
+            .returning(Job)
+            .execution_options(synchronize_session=False)
+        )
+        return await self._execute_queue_statement(stmt)
+
+    async def create_with_file(
+        self, job: Job, file: JobFile, chunks: Iterable[bytes]
+    ) -> Job:
+        """Creates a job together with a file, such as an uploaded import file.
+
+        The chunks are inserted one at a time in the job's transaction, so the file is
+        never held in memory whole and the job cannot be claimed before it is complete.
+
+        Args:
+            job (Job): The job to be created
+            file (JobFile): The kind of file
+            chunks (Iterable[bytes]): The file's consecutive chunks
+
+        Returns:
+            Job: The newly created job
+        """
+        logger.info("Creating job with %s file", file.value)
+        try:
+            self._session.add(job)
+            await self._session.flush()
+            for seq, data in enumerate(chunks):
+                await self._session.execute(
+                    insert(JobChunk).values(job_id=job.id, file=file, seq=seq, data=data)
+                )
+            await self._commit()
+            await self._session.refresh(job)
+            return job
+        except IntegrityError as e:
+            await self._rollback()
+            logger.error("Integrity Error %s", e)
+            raise IntegrityViolationError(str(e)) from e
+        except OperationalError as e:
+            await self._rollback()
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            await self._rollback()
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def append_chunk(self, job_id: str, file: JobFile, seq: int, data: bytes) -> None:
+        """Writes the next chunk of a job's file, committed on its own.
+
+        Args:
+            job_id (str): The job's id
+            file (JobFile): The kind of file
+            seq (int): The chunk's position in the file, starting at 0
+            data (bytes): The chunk
+        """
+        stmt = insert(JobChunk).values(job_id=job_id, file=file, seq=seq, data=data)
+        await self._execute_file_statement(stmt)
+
+    async def delete_file(self, job_id: str, file: JobFile) -> None:
+        """Deletes a job's file, such as the partial output of an interrupted attempt.
+
+        Args:
+            job_id (str): The job's id
+            file (JobFile): The kind of file
+        """
+        logger.info("Deleting %s file of job %s", file.value, job_id)
+        stmt = delete(JobChunk).where(JobChunk.job_id == job_id, JobChunk.file == file)
+        await self._execute_file_statement(stmt)
+
+    async def has_file(self, job_id: str, file: JobFile) -> bool:
+        """Checks whether a job has a file.
+
+        Args:
+            job_id (str): The job's id
+            file (JobFile): The kind of file
+
+        Returns:
+            bool: True if at least one chunk of the file was written
+        """
+        try:
+            stmt = select(
+                exists().where(JobChunk.job_id == job_id, JobChunk.file == file)
+            )
+            return bool((await self._session.execute(stmt)).scalar())
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def iter_file(self, job_id: str, file: JobFile) -> AsyncIterator[bytes]:
+        """Reads a job's file one chunk at a time, in order.
+
+        Each chunk is read by its primary key with a statement of its own, so only
+        one chunk is held in memory and no cursor stays open between chunks.
+
+        Args:
+            job_id (str): The job's id
+            file (JobFile): The kind of file
+
+        Yields:
+            bytes: The file's consecutive chunks
+        """
+        logger.info("Reading %s file of job %s", file.value, job_id)
+        seq = 0
+        while True:
+            try:
+                stmt = select(JobChunk.data).where(
+                    JobChunk.job_id == job_id, JobChunk.file == file, JobChunk.seq == seq
+                )
+                data = (await self._session.execute(stmt)).scalar_one_or_none()
+            except OperationalError as e:
+                logger.error("Operational Error %s", e)
+                raise DatabaseConnectionError(str(e)) from e
+            except Exception as e:
+                logger.error("Repository error %s", e)
+                raise RepositoryError(str(e)) from e
+            if data is None:
+                return
+            yield data
+            seq += 1
+
+    async def heartbeat(
+        self, job_id: str, progress: int, progress_total: int | None
+    ) -> bool:
+        """Records a running job's progress and marks its worker as alive.
+
+        Args:
+            job_id (str): The job's id
+            progress (int): Units of work done
+            progress_total (int | None): Units of work in total, if known
+
+        Returns:
+            bool: False if the job is no longer running, e.g. it was requeued as stale.
+        """
+        stmt = (
+            update(Job)
+            .where(Job.id == job_id, Job.status == JobStatus.RUNNING)
+            .values(
+                progress=progress,
+                progress_total=progress_total,
+                heartbeat_at=func.now(),
+            )
+            .returning(Job.id)
+        )
+        return await self._execute_queue_statement(stmt) is not None
+
+    async def finish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        progress: int,
+        progress_total: int | None = None,
+        result: Dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> bool:
+        """Records the outcome of a running job.
+
+        Args:
+            job_id (str): The job's id
+            status (JobStatus): SUCCEEDED or FAILED
+            progress (int): Units of work done
+            progress_total (int | None, optional): Units of work in total, if known. Defaults to None.
+            result (Dict[str, Any] | None, optional): The job's JSON result. Defaults to None.
+            error (str | None, optional): Why the job failed. Defaults to None.
+
+        Returns:
+            bool: False if the job is no longer running, e.g. it was requeued as stale.
+        """
+        logger.info("Finishing job %s as %s", job_id, status.value)
+        stmt = (
+            update(Job)
+            .where(Job.id == job_id, Job.status == JobStatus.RUNNING)
+            .values(
+                status=status,
+                progress=progress,
+                progress_total=progress_total,
+                result=result,
+                error=error,
+                finished_at=func.now(),
+            )
+            .returning(Job.id)
+        )
+        return await self._execute_queue_statement(stmt) is not None
+
+    async def release(self, job_id: str) -> bool:
+        """Returns a running job to the queue, e.g. when its worker is shutting down.
+
+        Args:
+            job_id (str): The job's id
+
+        Returns:
+            bool: False if the job is no longer running.
+        """
+        logger.info("Releasing job %s", job_id)
+        stmt = (
+            update(Job)
+            .where(Job.id == job_id, Job.status == JobStatus.RUNNING)
+            .values(status=JobStatus.QUEUED, attempts=Job.attempts - 1)
+            .returning(Job.id)
+        )
+        return await self._execute_queue_statement(stmt) is not None
+
+    async def requeue_stale(self, stale_after: float, max_attempts: int) -> int:
+        """Recovers the running jobs whose worker stopped sending heartbeats.
+
+        Jobs with attempts left are queued again, the rest are failed.
+
+        Args:
+            stale_after (float): Seconds without a heartbeat after which a job is stale
+            max_attempts (int): The number of times a job is claimed before it is failed
+
+        Returns:
+            int: The number of stale jobs recovered
+        """
+        stale = (
+            Job.status == JobStatus.RUNNING,
+            Job.heartbeat_at < func.now() - timedelta(seconds=stale_after),
+        )
+        try:
+            requeued = await self._session.execute(
+                update(Job)
+                .where(*stale, Job.attempts < max_attempts)
+                .values(status=JobStatus.QUEUED)
+                .execution_options(synchronize_session=False)
+            )
+            failed = await self._session.execute(
+                update(Job)
+                .where(*stale, Job.attempts >= max_attempts)
+                .values(
+                    status=JobStatus.FAILED,
+                    error=STALE_JOB_ERROR,
+                    finished_at=func.now(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self._session.commit()
+            if requeued.rowcount or failed.rowcount:
+                logger.warning(
+                    "Requeued %s and failed %s stale jobs",
+                    requeued.rowcount,
+                    failed.rowcount,
+                )
+            return requeued.rowcount + failed.rowcount
+        except OperationalError as e:
+            await self._session.rollback()
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            await self._session.rollback()
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def _execute_file_statement(self, stmt) -> None:
+        """Executes and commits a statement writing job chunks"""
+        try:
+            await self._session.execute(stmt)
+            await self._session.commit()
+        except OperationalError as e:
+            await self._session.rollback()
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            await self._session.rollback()
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def _execute_queue_statement(self, stmt) -> Any:
+        """Executes and commits a single row queue statement, returning the row's first column or None"""
+        try:
+            row = (await self._session.execute(stmt)).scalar_one_or_none()
+            await self._session.commit()
+            return row
+        except OperationalError as e:
+            await self._session.rollback()
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            await self._session.rollback()
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
@@ -0,0 +1,149 @@
+"""Module containing relation load plans and the eager loading options built from them"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Load
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from api.database.session import Base
+from api.utils.fieldsets import ROOT, FieldSet
+
+
+logger = logging.getLogger(__name__)
+
+
+class LoadPlan:
+    """A validated tree of the relations to load alongside an entity.
+
+    Args:
+        entity (Type[Base]): The database entity at this node of the plan
+        uselist (bool, optional): Whether the relation leading to this node is a collection.
+        Defaults to True.
+    """
+
+    def __init__(self, entity: Type[Base], uselist: bool = True) -> None:
+        self.entity = entity
+        self.uselist = uselist
+        self.children: Dict[str, LoadPlan] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.children)
+
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        """A hashable, order independent representation used as a cache key"""
+        return (
+            self.entity,
+            tuple(sorted((name, child.key) for name, child in self.children.items())),
+        )
+
+    def add(self, path: str, max_depth: int) -> None:
+        """Adds a dotted relation path, such as 'projects.users', to the plan
+
+        Args:
+            path (str): The dotted relation path
+            max_depth (int): The maximum number of relations in a path
+
+        Raises:
+            ValueError: If the path is too deep or names an unknown relation
+        """
+        names = [name.strip() for name in path.split(".")]
+        if len(names) > max_depth:
+            raise ValueError(f"Include path exceeds maximum depth of {max_depth}: {path}")
+
+        node = self
+        for name in names:
+            relationships = inspect(node.entity).relationships
+            if name not in relationships:
+                raise ValueError(f"Unknown relation: {path}")
+            if name not in node.children:
+                relationship = relationships[name]
+                node.children[name] = LoadPlan(
+                    relationship.mapper.class_, bool(relationship.uselist)
+                )
+            node = node.children[name]
+
+    def paths(self) -> List[str]:
+        """Returns the dotted path of every leaf relation in the plan
+
+        Returns:
+            List[str]: The leaf relation paths
+        """
+        paths: List[str] = []
+        for name, child in self.children.items():
+            child_paths = child.paths()
+            paths.extend(f"{name}.{path}" for path in child_paths)
+            if not child_paths:
+                paths.append(name)
+        return paths
+
+    def restrict(self, fields: FieldSet, relation: str = ROOT) -> "LoadPlan":
+        """Returns a copy of the plan without the relations a sparse fieldset leaves out
+
+        Args:
+            fields (FieldSet): The requested fields
+            relation (str, optional): The relation name of this node. Defaults to the root entity.
+
+        Returns:
+            LoadPlan: The restricted plan
+        """
+        plan = LoadPlan(self.entity, self.uselist)
+        for name, child in self.children.items():
+            if fields.includes(name, relation):
+                plan.children[name] = child.restrict(fields, name)
+        return plan
+
+
+def parse_include(
+    entity: Type[Base], paths: Iterable[str], max_depth: int
+) -> LoadPlan:
+    """Parses relation paths into a validated load plan.
+
+    Args:
+        entity (Type[Base]): The root database entity
+        paths (Iterable[str]): Dotted relation paths, such as 'projects.users'
+        max_depth (int): The maximum number of relations in a path
+
+    Raises:
+        ValueError: If a path is too deep or names an unknown relation
+
+    Returns:
+        LoadPlan: The load plan
+    """
+    plan = LoadPlan(entity)
+    for path in paths:
+        if path.strip():
+            plan.add(path, max_depth)
+    return plan
+
+
+def loader_options(entity: Type[Base], paths: Iterable[str]) -> List[LoaderOption]:
+    """Builds the eager loading options for dotted relation paths.
+
+    Collections are loaded with one 'SELECT ... WHERE ... IN' per relation level
+    and many-to-one relations are joined, so any plan runs in a bounded number of
+    queries regardless of the number of rows.
+
+    Args:
+        entity (Type[Base]): The root database entity
+        paths (Iterable[str]): Dotted relation paths, such as 'projects.users'
+
+    Returns:
+        List[LoaderOption]: SQLAlchemy loader options for the select statement
+    """
+    options: List[LoaderOption] = []
+    for path in paths:
+        current: Type[Base] = entity
+        option = Load(entity)
+        for name in path.split("."):
+            relationship = inspect(current).relationships[name]
+            attribute = getattr(current, name)
+            if relationship.uselist:
+                option = option.selectinload(attribute)
+            else:
+                option = option.joinedload(attribute)
+            current = relationship.mapper.class_
+        options.append(option)
+    return options
@@ -1,20 +1,147 @@
 """The models module defining the SQLAlchemy database models for the application entities"""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, List, Optional, Tuple, cast
 import uuid
-from sqlalchemy import UUID, Boolean, Enum, ForeignKey, String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    UUID,
+    BigInteger,
+    Boolean,
+    CheckConstraint,
+    Computed,
+    DDL,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+    String,
+    Text,
+    TypeDecorator,
+    event,
+)
+from sqlalchemy.dialects.postgresql import (
+    JSONB,
+    TSTZRANGE,
+    TSVECTOR,
+    ExcludeConstraint,
+    Range,
+)
+from sqlalchemy.orm import Mapped, MappedColumn, mapped_column, relationship
+from sqlalchemy.sql import text
 
+from api.schemas.assignment_event import AssignmentEventType
+from api.schemas.job import JobFile, JobKind, JobStatus
 from api.schemas.project import ProjectStatus
 from api.schemas.user import Roles
 
 from . import Base
 
 
+class BitSet(TypeDecorator[int]):
+    """A set of bit positions held as a Python int and stored as compact little-endian 'bytea'.
+
+    Unlike a 'bigint', the set is not limited to 64 positions and only takes as many
+    bytes as its highest set bit needs.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: int | None, dialect: Any) -> bytes | None:
+        if value is None:
+            return None
+        return value.to_bytes((value.bit_length() + 7) // 8, "little")
+
+    def process_result_value(self, value: bytes | None, dialect: Any) -> int | None:
+        if value is None:
+            return None
+        return int.from_bytes(value, "little")
+
+
+def bitset_column() -> MappedColumn[int]:
+    """Creates a deferred, empty by default bitset column
+
+    Returns:
+        MappedColumn[int]: The bitset column
+    """
+    return mapped_column(
+        BitSet,
+        nullable=False,
+        default=0,
+        server_default=text("''::bytea"),
+        deferred=True,
+    )
+
+
+def search_text_column(expression: str) -> MappedColumn[str]:
+    """Creates the generated 'search_text' column searched by trigram similarity.
+
+    Deferred, so it is only loaded when explicitly selected.
+
+    Args:
+        expression (str): SQL expression of the searchable text
+
+    Returns:
+        MappedColumn[str]: The stored generated column
+    """
+    return mapped_column(Text, Computed(expression, persisted=True), deferred=True)
+
+
+def search_vector_column(expression: str) -> MappedColumn[Any]:
+    """Creates the generated 'search_vector' column searched as full text.
+
+    The 'simple' configuration is used, as names are not stemmed language.
+
+    Args:
+        expression (str): SQL expression of the searchable text
+
+    Returns:
+        MappedColumn[Any]: The stored generated tsvector column
+    """
+    return mapped_column(
+        TSVECTOR,
+        Computed(f"to_tsvector('simple', {expression})", persisted=True),
+        deferred=True,
+    )
+
+
+def search_indexes(table: str) -> Tuple[Index, Index]:
+    """Creates the GIN indexes of a table's search columns (requires the pg_trgm extension)
+
+    Args:
+        table (str): The table name
+
+    Returns:
+        Tuple[Index, Index]: The trigram and full text indexes
+    """
+    return (
+        Index(
+            f"ix_{table}_search_text",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        Index(f"ix_{table}_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+
+# Searchable text of each entity
+USER_SEARCH_EXPRESSION = (
+    "first_name || ' ' || last_name || ' ' || user_name || ' ' || email"
+)
+CUSTOMER_SEARCH_EXPRESSION = "name || ' ' || coalesce(details, '')"
+PROJECT_SEARCH_EXPRESSION = "name || ' ' || coalesce(details, '')"
+
+
 class User(Base):
     """The application 'User' database model."""
 
     __tablename__ = "user"
+    __table_args__ = search_indexes("user")
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4
@@ -32,9 +159,16 @@ class User(Base):
     active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     admin: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     project_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("project.id", ondelete="SET NULL"), nullable=True
+        UUID(as_uuid=True),
+        ForeignKey("project.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
     )
     project: Mapped[Optional["Project"]] = relationship(back_populates="users")
+    # Bit positions of the user's skills, see 'Skill'
+    skills: Mapped[int] = bitset_column()
+    search_text: Mapped[str] = search_text_column(USER_SEARCH_EXPRESSION)
+    search_vector: Mapped[Any] = search_vector_column(USER_SEARCH_EXPRESSION)
 
     def __repr__(self):
         """Function that defines the output when the model is printed to the console."""
@@ -57,6 +191,7 @@ class Customer(Base):
     """The application 'Customer' database model."""
 
     __tablename__ = "customer"
+    __table_args__ = search_indexes("customer")
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4
@@ -70,6 +205,8 @@ class Customer(Base):
     projects: Mapped[Optional[List["Project"]]] = relationship(
         back_populates="customer", cascade="all, delete-orphan"
     )
+    search_text: Mapped[str] = search_text_column(CUSTOMER_SEARCH_EXPRESSION)
+    search_vector: Mapped[Any] = search_vector_column(CUSTOMER_SEARCH_EXPRESSION)
 
     def __repr__(self):
         """Function that defines the output when the model is printed to the console."""
@@ -86,6 +223,7 @@ class Project(Base):
     """The application 'Project' database model."""
 
     __tablename__ = "project"
+    __table_args__ = search_indexes("project")
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4
@@ -102,11 +240,16 @@ class Project(Base):
         UUID(as_uuid=True),
         ForeignKey("customer.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     customer: Mapped["Customer"] = relationship(
         back_populates="projects", lazy="joined"
     )
     users: Mapped[List["User"]] = relationship(back_populates="project")
+    # Bit positions of the skills the project requires, see 'Skill'
+    required_skills: Mapped[int] = bitset_column()
+    search_text: Mapped[str] = search_text_column(PROJECT_SEARCH_EXPRESSION)
+    search_vector: Mapped[Any] = search_vector_column(PROJECT_SEARCH_EXPRESSION)
 
     def __repr__(self):
         """Function that defines the output when the model is printed to the console."""
@@ -119,3 +262,338 @@ class Project(Base):
     details={self.details},
     customer_id={self.customer_id}
 )>"""
+
+
+class Skill(Base):
+    """The application 'Skill' database model.
+
+    Each skill owns a fixed bit position within the user and project skill bitsets.
+    """
+
+    __tablename__ = "skill"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4
+    )
+    name: Mapped[str] = mapped_column(
+        String(30), nullable=False, unique=True, index=True
+    )
+    bit: Mapped[int] = mapped_column(SmallInteger, nullable=False, unique=True)
+
+    def __repr__(self):
+        """Function that defines the output when the model is printed to the console."""
+        return f"""
+<Skill(
+    id={self.id},
+    name={self.name},
+    bit={self.bit}
+)>"""
+
+
+class Assignment(Base):
+    """The application 'Assignment' database model.
+
+    A user's allocation (as a percentage of their time) to a project over a validity
+    range, closed at its start and open at its end. An unbounded end is ongoing.
+    """
+
+    __tablename__ = "assignment"
+    __table_args__ = (
+        CheckConstraint(
+            "allocation BETWEEN 1 AND 100", name="ck_assignment_allocation"
+        ),
+        CheckConstraint(
+            "NOT isempty(validity) AND NOT lower_inf(validity)",
+            name="ck_assignment_validity",
+        ),
+        # A user is assigned to a project at most once at any time (requires the btree_gist extension)
+        ExcludeConstraint(
+            ("user_id", "="),
+            ("project_id", "="),
+            ("validity", "&&"),
+            name="ex_assignment_user_project_validity",
+            using="gist",
+        ),
+        Index("ix_assignment_validity", "validity", postgresql_using="gist"),
+        Index(
+            "ix_assignment_project_id_validity",
+            "project_id",
+            "validity",
+            postgresql_using="gist",
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("project.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    allocation: Mapped[int] = mapped_column(Integer, nullable=False)
+    validity: Mapped[Range[datetime]] = mapped_column(TSTZRANGE, nullable=False)
+
+    @property
+    def starts_at(self) -> datetime:
+        """The start of the validity range (inclusive)"""
+        # Never None - the validity check constraint rejects ranges unbounded below
+        return cast(datetime, self.validity.lower)
+
+    @property
+    def ends_at(self) -> Optional[datetime]:
+        """The end of the validity range (exclusive), or None if ongoing"""
+        return self.validity.upper
+
+    def __repr__(self):
+        """Function that defines the output when the model is printed to the console."""
+        return f"""
+<Assignment(
+    id={self.id},
+    user_id={self.user_id},
+    project_id={self.project_id},
+    allocation={self.allocation},
+    validity={self.validity}
+)>"""
+
+
+class AssignmentEvent(Base):
+    """The application 'AssignmentEvent' database model.
+
+    An append-only audit log of users being assigned to (or removed from) projects
+    and of project status changes. The user and project ids are not foreign keys,
+    so the history outlives the users and projects it refers to.
+    """
+
+    __tablename__ = "assignment_event"
+    __table_args__ = (
+        Index("ix_assignment_event_user_id_id", "user_id", "id"),
+        Index("ix_assignment_event_project_id_id", "project_id", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    occurred_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=text("now()")
+    )
+    event_type: Mapped[AssignmentEventType] = mapped_column(
+        Enum(AssignmentEventType), nullable=False
+    )
+    actor: Mapped[Optional[str]] = mapped_column(String(8), nullable=True)
+    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    project_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    previous_project_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    status: Mapped[Optional[ProjectStatus]] = mapped_column(
+        Enum(ProjectStatus), nullable=True
+    )
+    previous_status: Mapped[Optional[ProjectStatus]] = mapped_column(
+        Enum(ProjectStatus), nullable=True
+    )
+
+    def __repr__(self):
+        """Function that defines the output when the model is printed to the console."""
+        return f"""
+<AssignmentEvent(
+    id={self.id},
+    occurred_at={self.occurred_at},
+    event_type={self.event_type},
+    actor={self.actor},
+    user_id={self.user_id},
+    project_id={self.project_id},
+    previous_project_id={self.previous_project_id},
+    status={self.status},
+    previous_status={self.previous_status}
+)>"""
+
+
+class ProjectStatusTransition(Base):
+    """The application 'ProjectStatusTransition' database model.
+
+    One row per status a project enters, including its initial status. Rows are
+    written by triggers on the 'project' table (see PROJECT_STATUS_TRIGGERS), so
+    every write path records them in the same transaction as the status change.
+    """
+
+    __tablename__ = "project_status_transition"
+    __table_args__ = (
+        Index(
+            "ix_project_status_transition_project_id_entered_at",
+            "project_id",
+            "entered_at",
+            "id",
+            # Lets the history window run as an index only scan
+            postgresql_include=["status"],
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("project.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    status: Mapped[ProjectStatus] = mapped_column(Enum(ProjectStatus), nullable=False)
+    entered_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=text("now()")
+    )
+
+    def __repr__(self):
+        """Function that defines the output when the model is printed to the console."""
+        return f"""
+<ProjectStatusTransition(
+    id={self.id},
+    project_id={self.project_id},
+    status={self.status},
+    entered_at={self.entered_at}
+)>"""
+
+
+# Records a project's initial status and every status change, also created by 'create_all'
+PROJECT_STATUS_TRIGGERS = (
+    """
+    CREATE OR REPLACE FUNCTION record_project_status() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO project_status_transition (project_id, status, entered_at)
+        VALUES (NEW.id, NEW.status, now());
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER tr_project_status_insert
+    AFTER INSERT ON project
+    FOR EACH ROW EXECUTE FUNCTION record_project_status()
+    """,
+    """
+    CREATE TRIGGER tr_project_status_update
+    AFTER UPDATE OF status ON project
+    FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+    EXECUTE FUNCTION record_project_status()
+    """,
+)
+for statement in PROJECT_STATUS_TRIGGERS:
+    event.listen(ProjectStatusTransition.__table__, "after_create", DDL(statement))
+
+
+class Job(Base):
+    """The application 'Job' database model.
+
+    A long running operation queued by an admin and run by a job worker. Workers
+    claim queued jobs with 'SELECT ... FOR UPDATE SKIP LOCKED', so any number of
+    workers can poll the table without claiming the same job twice. The uploaded
+    file of an import and the file written by an export are stored as 'JobChunk' rows.
+    """
+
+    __tablename__ = "job"
+    __table_args__ = (Index("ix_job_status_created_at", "status", "created_at"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4
+    )
+    kind: Mapped[JobKind] = mapped_column(Enum(JobKind), nullable=False)
+    status: Mapped[JobStatus] = mapped_column(
+        Enum(JobStatus), nullable=False, default=JobStatus.QUEUED
+    )
+    params: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    result: Mapped[Optional[dict]] = mapped_column(JSONB)
+    error: Mapped[Optional[str]] = mapped_column(Text)
+    progress: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    progress_total: Mapped[Optional[int]] = mapped_column(Integer)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_by: Mapped[Optional[str]] = mapped_column(String(8))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=text("now()")
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+    def __repr__(self):
+        """Function that defines the output when the model is printed to the console."""
+        return f"""
+<Job(
+    id={self.id},
+    kind={self.kind},
+    status={self.status},
+    progress={self.progress},
+    progress_total={self.progress_total},
+    attempts={self.attempts}
+)>"""
+
+
+class JobChunk(Base):
+    """The application 'JobChunk' database model.
+
+    A consecutive piece of up to JOB_CHUNK_SIZE bytes of a job's file, so files
+    are written and read one chunk at a time rather than held in memory whole.
+    """
+
+    __tablename__ = "job_chunk"
+
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("job.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    file: Mapped[JobFile] = mapped_column(Enum(JobFile), primary_key=True)
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    def __repr__(self):
+        """Function that defines the output when the model is printed to the console."""
+        return f"""
+<JobChunk(
+    job_id={self.job_id},
+    file={self.file},
+    seq={self.seq},
+    size={len(self.data)}
+)>"""
+
+
+class IdempotencyKey(Base):
+    """The application 'IdempotencyKey' database model.
+
+    The stored response of a POST or PATCH request sent with an 'Idempotency-Key'
+    header, replayed to retries of the request. A row without a status code is a
+    reservation held while the first request runs.
+    """
+
+    __tablename__ = "idempotency_key"
+
+    # SHA-256 of the key and the request's method, path and credentials
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    # SHA-256 of the request body, so a key reused for a different request is rejected
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Random token of the request holding the key, so a request whose reservation
+    # expired and was taken over by a retry can no longer store or release it
+    reservation: Mapped[Optional[str]] = mapped_column(String(32))
+    status_code: Mapped[Optional[int]] = mapped_column(SmallInteger)
+    content_type: Mapped[Optional[str]] = mapped_column(String(255))
+    # [name, value] pairs of the other end-to-end response headers, such as Set-Cookie
+    headers: Mapped[Optional[list]] = mapped_column(JSONB)
+    body: Mapped[Optional[bytes]] = mapped_column(LargeBinary)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=text("now()")
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+    def __repr__(self):
+        """Function that defines the output when the model is printed to the console."""
+        return f"""
+<IdempotencyKey(
+    key={self.key},
+    status_code={self.status_code},
+    expires_at={self.expires_at}
+)>"""
@@ -0,0 +1,166 @@
+import logging
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.database.interfaces.project_status_repository_interface import (
+    IProjectStatusRepository,
+)
+from api.database.models import Customer, Project, ProjectStatusTransition
+from api.utils.exceptions import DatabaseConnectionError, RepositoryError
+
+
+logger = logging.getLogger(__name__)
+
+
+def status_spans(customer_id: str | None = None, since: datetime | None = None):
+    """Builds the subquery pairing each status a project entered with when it left it.
+
+    'LEAD' over each project's transitions, ordered as the
+    '(project_id, entered_at, id)' index, gives the time the next status was entered.
+    The current status of a project has no 'left_at'.
+
+    Args:
+        customer_id (str | None, optional): Only include the customer's projects. Defaults to None.
+        since (datetime | None, optional): Only include statuses entered since. Defaults to None.
+
+    Returns:
+        Subquery: project_id, customer_id, status, entered_at and left_at of each span
+    """
+    transition = ProjectStatusTransition
+    stmt = select(
+        transition.project_id,
+        Project.customer_id,
+        transition.status,
+        transition.entered_at,
+        func.lead(transition.entered_at)
+        .over(
+            partition_by=transition.project_id,
+            order_by=(transition.entered_at, transition.id),
+        )
+        .label("left_at"),
+    ).join(Project, Project.id == transition.project_id)
+    if customer_id is not None:
+        stmt = stmt.where(Project.customer_id == customer_id)
+    if since is not None:
+        # Later spans only lead to later transitions, so filtering before the window is safe
+        stmt = stmt.where(transition.entered_at >= since)
+    return stmt.subquery("spans")
+
+
+class ProjectStatusRepository(IProjectStatusRepository):
+    """
+    Repository reading the project status transition history.
+
+    Args:
+        IProjectStatusRepository: Repository interface defining the history queries.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository
+
+        Args:
+            session (AsyncSession): The async SQLAlchemy database session.
+        """
+        logger.info("Initializing project status repository")
+        self._session = session
+
+    async def list_spans(self, project_id: str) -> List[Dict[str, Any]]:
+        """Lists the statuses a project has been in, oldest first.
+
+        Args:
+            project_id (str): The project
+
+        Returns:
+            List[Dict[str, Any]]: The status, entered_at and left_at of each status span.
+        """
+        logger.info("Listing status spans of project %s", project_id)
+        try:
+            transition = ProjectStatusTransition
+            stmt = (
+                select(
+                    transition.status,
+                    transition.entered_at,
+                    func.lead(transition.entered_at)
+                    .over(order_by=(transition.entered_at, transition.id))
+                    .label("left_at"),
+                )
+                .where(transition.project_id == project_id)
+                .order_by(transition.entered_at, transition.id)
+            )
+            return [dict(row) for row in (await self._session.execute(stmt)).mappings()]
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def time_in_status(
+        self,
+        customer_id: str | None = None,
+        since: datetime | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Summarises how long projects stay in each status, per customer.
+
+        Durations are those of the statuses projects have since left. Projects still in
+        a status are counted in 'in_status' instead, as their duration is not known yet.
+
+        Args:
+            customer_id (str | None, optional): Only report the customer's projects. Defaults to None.
+            since (datetime | None, optional): Only report statuses entered since. Defaults to None.
+
+        Returns:
+            List[Dict[str, Any]]: One row per customer and status, with the number of
+            completed and current spans and the mean, median, 90th percentile and longest
+            duration in seconds, ordered by customer name and status.
+        """
+        logger.info("Summarising time in status")
+        try:
+            spans = status_spans(customer_id=customer_id, since=since)
+            duration = func.extract("epoch", spans.c.left_at - spans.c.entered_at)
+            # Grouping by 'customer_id' keeps the sorted span rows narrow, customer
+            # names are only joined to the summary rows
+            stats = (
+                select(
+                    spans.c.customer_id,
+                    spans.c.status,
+                    func.count(spans.c.left_at).label("completed"),
+                    func.count().filter(spans.c.left_at.is_(None)).label("in_status"),
+                    func.avg(duration).label("mean_seconds"),
+                    func.percentile_cont(0.5)
+                    .within_group(duration)
+                    .label("p50_seconds"),
+                    func.percentile_cont(0.9)
+                    .within_group(duration)
+                    .label("p90_seconds"),
+                    func.max(duration).label("max_seconds"),
+                )
+                .group_by(spans.c.customer_id, spans.c.status)
+                .subquery("stats")
+            )
+            stmt = (
+                select(
+                    stats.c.customer_id,
+                    Customer.name.label("customer_name"),
+                    stats.c.status,
+                    stats.c.completed,
+                    stats.c.in_status,
+                    stats.c.mean_seconds,
+                    stats.c.p50_seconds,
+                    stats.c.p90_seconds,
+                    stats.c.max_seconds,
+                )
+                .join(Customer, Customer.id == stats.c.customer_id)
+                .order_by(Customer.name, stats.c.status)
+            )
+            return [dict(row) for row in (await self._session.execute(stmt)).mappings()]
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
@@ -1,25 +1,57 @@
-from asyncio import gather
+from asyncio import Queue, create_task, gather
 import logging
-from typing import Dict, List, Type, TypeVar
-
-from sqlalchemy import and_, or_, select
+from typing import Any, AsyncIterator, Dict, Hashable, List, Set, Tuple, Type, TypeVar
+from uuid import UUID
+
+from sqlalchemy import (
+    Select,
+    and_,
+    any_,
+    bindparam,
+    func,
+    inspect,
+    literal,
+    literal_column,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, lazyload, load_only as load_only_columns
+from sqlalchemy.sql.elements import KeyedColumnElement
 
+from api.core.config import app_config
 from api.database.interfaces.repository_interface import IRepository
+from api.database.loading import loader_options
 from api.database.session import Base
+from api.database.unit_of_work import in_unit_of_work, record_changed
+from api.schemas.bulk import ExportFormat
 from api.utils.exceptions import (
     AttributeNotFoundError,
     DatabaseConnectionError,
     IntegrityViolationError,
     RepositoryError,
 )
+from api.utils.events import publish_entity_changed, published_changes
+from api.utils.singleflight import SingleFlight
 
 
 T = TypeVar("T", bound=Base)
 
+# Maximum number of COPY chunks buffered between the database and the client
+COPY_QUEUE_SIZE = 16
+
+# Rows per group when exporting in the columnar format
+COLUMNAR_GROUP_SIZE = 10_000
+
 logger = logging.getLogger(__name__)
 
+# Coalesces identical concurrent list and id lookups within this worker process
+read_flight = SingleFlight(timeout=app_config.single_flight_timeout)
+
 
 class Repository(IRepository[T]):
     """
@@ -40,6 +72,11 @@ class Repository(IRepository[T]):
         self._session = session
         self._entity = entity
 
+    @property
+    def _id_column(self) -> KeyedColumnElement[Any]:
+        """The entity's 'id' primary key column"""
+        return self._entity.__table__.c.id
+
     async def create(self, entity: T) -> T:
         """Create a new entity within the database.
 
@@ -52,35 +89,181 @@ class Repository(IRepository[T]):
         logger.info("Creating entity")
         try:
             self._session.add(entity)
-            await self._session.commit()
+            await self._commit()
             await self._session.refresh(entity)
             return entity
         except IntegrityError as e:
-            await self._session.rollback()
+            await self._rollback()
             logger.error("Integrity Error %s", e)
             raise IntegrityViolationError(str(e)) from e
         except OperationalError as e:
-            await self._session.rollback()
+            await self._rollback()
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            await self._rollback()
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def bulk_create(
+        self, rows: List[Dict[str, Any]], returning: str | None = None
+    ) -> List[Any]:
+        """Inserts many entities in a single batched statement and commits once.
+
+        Rows violating a unique constraint are skipped rather than failing the batch.
+
+        Args:
+            rows (List[Dict[str, Any]]): A list of dicts mapping entity attributes to values.
+            returning (str | None, optional): An attribute to return for each row actually inserted.
+            Defaults to None.
+
+        Returns:
+            List[Any]: The 'returning' attribute of every inserted row, or an empty list.
+        """
+        logger.info("Bulk creating %s entities", len(rows))
+        try:
+            if not rows:
+                return []
+
+            stmt = insert(self._entity).on_conflict_do_nothing()
+            if returning:
+                inserted = list(
+                    (
+                        await self._session.scalars(
+                            stmt.returning(getattr(self._entity, returning)), rows
+                        )
+                    ).all()
+                )
+            else:
+                await self._session.execute(stmt, rows)
+                inserted = []
+
+            await self._commit()
+            return inserted
+        except IntegrityError as e:
+            await self._rollback()
+            logger.error("Integrity Error %s", e)
+            raise IntegrityViolationError(str(e)) from e
+        except OperationalError as e:
+            await self._rollback()
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            await self._rollback()
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def bulk_update(
+        self, attr: str, values: Dict[Any, Any], only_unset: bool = False
+    ) -> List[Any]:
+        """Sets an attribute of many entities, by id, in a single statement and commits once.
+
+        The ids and values are bound as two arrays and joined back up with 'unnest',
+        ('UPDATE ... FROM unnest(:ids, :values)'), so the statement is the same
+        whatever the number of entities.
+
+        Args:
+            attr (str): The entity attribute to set.
+            values (Dict[Any, Any]): The value to set, keyed by entity id.
+            only_unset (bool, optional): Only update entities whose attribute is still NULL,
+            e.g. not assigned since a plan was made. Defaults to False.
+
+        Returns:
+            List[Any]: The ids of the entities actually updated.
+        """
+        logger.info("Bulk updating %s of %s entities", attr, len(values))
+        try:
+            if not values:
+                return []
+
+            id_column, column = self._id_column, getattr(self._entity, attr)
+            source = select(
+                func.unnest(
+                    bindparam(
+                        "ids",
+                        [str(id_) for id_ in values],
+                        type_=postgresql.ARRAY(id_column.type),
+                    )
+                ).label("id"),
+                func.unnest(
+                    bindparam(
+                        "values",
+                        [
+                            str(value) if isinstance(value, UUID) else value
+                            for value in values.values()
+                        ],
+                        type_=postgresql.ARRAY(column.type),
+                    )
+                ).label("value"),
+            ).subquery()
+            stmt = (
+                update(self._entity)
+                .where(id_column == source.c.id)
+                .values({attr: source.c.value})
+                .returning(id_column)
+                .execution_options(synchronize_session=False)
+            )
+            if only_unset:
+                stmt = stmt.where(column.is_(None))
+
+            updated = list((await self._session.scalars(stmt)).all())
+            await self._commit()
+            return updated
+        except IntegrityError as e:
+            await self._rollback()
+            logger.error("Integrity Error %s", e)
+            raise IntegrityViolationError(str(e)) from e
+        except OperationalError as e:
+            await self._rollback()
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            await self._rollback()
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def existing_values(self, attr: str, values: List[Any]) -> Set[Any]:
+        """Returns which of the input values are already stored against an attribute.
+
+        Args:
+            attr (str): The entity attribute to check.
+            values (List[Any]): The values to look for.
+
+        Returns:
+            Set[Any]: The subset of values that exist in the database.
+        """
+        logger.info("Checking existing values")
+        try:
+            if not values:
+                return set()
+
+            column = getattr(self._entity, attr)
+            return set(
+                (await self._session.scalars(select(column).where(column.in_(values))))
+                .all()
+            )
+        except OperationalError as e:
             logger.error("Operational Error %s", e)
             raise DatabaseConnectionError(str(e)) from e
         except Exception as e:
-            await self._session.rollback()
             logger.error("Repository error %s", e)
             raise RepositoryError(str(e)) from e
 
     async def find(
         self,
-        params: Dict[str, str],
+        params: Dict[str, Any],
         and_condition: bool = True,
         load_relations: List[str] | None = None,
+        load_only: List[str] | None = None,
     ) -> List[T] | None:
         """Attempts to find an entity within the database based on the input params.
 
         Args:
-            params (Dict[str, str]): A dict containing the specific parameters to be queried in the database.
+            params (Dict[str, Any]): A dict containing the specific parameters to be queried in the database.
             and_condition (bool, optional): Whether to utilize 'and' when querying for multiple parameters, if 'False' 'OR' is used. Defaults to True.
             load_relations (List[str] | None, optional): Due to the async database engine, an entities relations are not loaded by default.
-            Pass in a list of the required relations. Defaults to None.
+            Pass in a list of the required relations, as dotted paths for nested relations (e.g. 'projects.users'). Defaults to None.
+            load_only (List[str] | None, optional): The only attributes to select, see '_select'. Defaults to None.
 
         Returns:
             List[T] | None: A list of all found entities or None if no entities are found.
@@ -91,17 +274,134 @@ class Repository(IRepository[T]):
                 return None
 
             filters = self._generate_filters(params, and_condition)
-            results = list(
-                (await self._session.execute(select(self._entity).filter(filters)))
-                .scalars()
-                .all()
+            stmt = self._select(load_only, load_relations).filter(filters)
+            return list((await self._session.execute(stmt)).scalars().all())
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def get_many(
+        self,
+        ids: List[str],
+        load_relations: List[str] | None = None,
+        load_only: List[str] | None = None,
+    ) -> List[T]:
+        """Finds the entities matching a list of ids in a single query.
+
+        The ids are bound as one array parameter ('WHERE id = ANY(:ids)'), so the
+        statement is the same whatever the number of ids.
+
+        Args:
+            ids (List[str]): The ids of the entities to find.
+            load_relations (List[str] | None, optional): Dotted relation paths to load. Defaults to None.
+            load_only (List[str] | None, optional): The only attributes to select, see '_select'. Defaults to None.
+
+        Returns:
+            List[T]: The found entities in the order of the input ids. Unknown ids are skipped
+            and repeated ids return the entity once.
+        """
+        logger.info("Getting %s entities by id", len(ids))
+        try:
+            if not ids:
+                return []
+
+            unique_ids = list(dict.fromkeys(str(id_) for id_ in ids))
+            id_column = self._id_column
+            ids_param = bindparam(
+                "ids", unique_ids, type_=postgresql.ARRAY(id_column.type)
+            )
+            stmt = self._select(load_only, load_relations).where(
+                id_column == any_(ids_param)
             )
+            found = {
+                str(getattr(entity, id_column.key)): entity
+                for entity in await self._read_shared(
+                    ("get_many", tuple(unique_ids)), stmt, load_relations, load_only
+                )
+            }
+            return [found[id_] for id_ in unique_ids if id_ in found]
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
 
-            if not load_relations:
-                return results
+    async def count_by(
+        self, attr: str, params: Dict[str, Any] | None = None
+    ) -> Dict[Any, int]:
+        """Counts the entities grouped by the values of an attribute, in a single aggregate query.
+
+        Args:
+            attr (str): The entity attribute to group by.
+            params (Dict[str, Any] | None, optional): Attribute values the counted entities
+            must match, e.g. {"role": Roles.ENGINEER}. Defaults to None.
+
+        Returns:
+            Dict[Any, int]: The number of entities keyed by attribute value (None for NULLs).
+        """
+        logger.info("Counting entities by %s", attr)
+        try:
+            column = getattr(self._entity, attr)
+            stmt = select(column, func.count()).group_by(column)
+            if params:
+                stmt = stmt.where(self._generate_filters(params, and_condition=True))
+            return dict((await self._session.execute(stmt)).tuples().all())
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def search(self, query: str, limit: int) -> List[Tuple[T, float]]:
+        """Ranks the entities matching a free text query, using the entity's search indexes.
+
+        An entity matches when its 'search_text' contains the query, is similar to it
+        (pg_trgm word similarity) or its 'search_vector' matches it as a full text
+        query. Each condition is served by a GIN index, so no table scan is needed.
 
-            await self.load_awaitables(load_relations=load_relations, results=results)
-            return results
+        Args:
+            query (str): The search text, as typed by the user.
+            limit (int): The maximum number of entities to return.
+
+        Returns:
+            List[Tuple[T, float]]: The matching entities and their rank, best match first.
+        """
+        logger.info("Searching entities")
+        try:
+            columns = self._entity.__table__.c
+            search_text, search_vector = columns.search_text, columns.search_vector
+            tsquery = func.websearch_to_tsquery(
+                literal_column("'simple'::regconfig"), query
+            )
+            # Wildcards typed by the user are matched literally
+            pattern = query.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+            rank = func.greatest(
+                func.word_similarity(query, search_text),
+                func.ts_rank_cd(search_vector, tsquery),
+            ).label("rank")
+
+            stmt = (
+                self._select()
+                .add_columns(rank)
+                .where(
+                    or_(
+                        search_text.ilike(f"%{pattern}%", escape="!"),
+                        literal(query).op("<%")(search_text),
+                        search_vector.op("@@")(tsquery),
+                    )
+                )
+                .order_by(rank.desc())
+                .limit(limit)
+            )
+            return [
+                (entity, float(score))
+                for entity, score in (await self._session.execute(stmt)).tuples()
+            ]
         except OperationalError as e:
             logger.error("Operational Error %s", e)
             raise DatabaseConnectionError(str(e)) from e
@@ -112,14 +412,14 @@ class Repository(IRepository[T]):
     async def update(
         self,
         item: T,
-        updates: Dict[str, str | None],
+        updates: Dict[str, Any],
         load_relations: List[str] | None = None,
     ) -> T:
         """Updates an entity within the database with the input 'updates'.
 
         Args:
             item (T): The database entity to update,
-            updates (Dict[str, str  |  None]): A dict containing the update parameter and update value.
+            updates (Dict[str, Any]): A dict containing the update parameter and update value.
             load_relations (List[str] | None, optional): A list of any entity relations required in the response. Defaults to None.
 
         Returns:
@@ -132,7 +432,7 @@ class Repository(IRepository[T]):
                     raise AttributeError(f"Attribute {attr} not in item {item}")
                 setattr(item, attr, val)
 
-            await self._session.commit()
+            await self._commit()
             await self._session.refresh(item)
 
             if not load_relations:
@@ -141,42 +441,86 @@ class Repository(IRepository[T]):
             await self.load_awaitables(load_relations=load_relations, results=[item])
             return item
         except IntegrityError as e:
-            await self._session.rollback()
+            await self._rollback()
             logger.error("Integrity Error %s", e)
             raise IntegrityViolationError(str(e)) from e
         except AttributeError as e:
-            await self._session.rollback()
+            await self._rollback()
             logger.error("Attribute Error %s", e)
             raise AttributeNotFoundError(str(e)) from e
         except OperationalError as e:
-            await self._session.rollback()
+            await self._rollback()
             logger.error("Operational Error %s", e)
             raise DatabaseConnectionError(str(e)) from e
         except Exception as e:
-            await self._session.rollback()
+            await self._rollback()
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def update_many(
+        self, items: List[T], updates: List[Dict[str, Any]]
+    ) -> List[T]:
+        """Updates many entities within the database, each with its own 'updates'.
+
+        The changes are written in a single flush and commit, batching the UPDATE
+        statements, and the entities are not refreshed. Attributes the database sets on
+        update are expired, so reload the entities, e.g. with 'get_many', before use.
+
+        Args:
+            items (List[T]): The database entities to update.
+            updates (List[Dict[str, Any]]): The update parameters and values of each entity.
+
+        Returns:
+            List[T]: The updated database entities.
+        """
+        logger.info("Updating %s entities", len(items))
+        try:
+            for item, item_updates in zip(items, updates):
+                for attr, val in item_updates.items():
+                    if not hasattr(item, attr):
+                        raise AttributeError(f"Attribute {attr} not in item {item}")
+                    setattr(item, attr, val)
+
+            await self._commit()
+            return items
+        except IntegrityError as e:
+            await self._rollback()
+            logger.error("Integrity Error %s", e)
+            raise IntegrityViolationError(str(e)) from e
+        except AttributeError as e:
+            await self._rollback()
+            logger.error("Attribute Error %s", e)
+            raise AttributeNotFoundError(str(e)) from e
+        except OperationalError as e:
+            await self._rollback()
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            await self._rollback()
             logger.error("Repository error %s", e)
             raise RepositoryError(str(e)) from e
 
-    async def list_all(self, load_relations: List[str] | None = None) -> List[T]:
+    async def list_all(
+        self,
+        load_relations: List[str] | None = None,
+        load_only: List[str] | None = None,
+    ) -> List[T]:
         """Lists all specified entities within the database.
 
         Args:
-            load_relations (List[str] | None, optional): A list of any entity relations required in the response. Defaults to None.
+            load_relations (List[str] | None, optional): A list of any entity relations required in the response,
+            as dotted paths for nested relations (e.g. 'projects.users'). Defaults to None.
+            load_only (List[str] | None, optional): The only attributes to select, see '_select'. Defaults to None.
 
         Returns:
             List[T]: A list containing all entities in the database.
         """
         logger.info("Listing all entities")
         try:
-            results = list(
-                (await self._session.execute(select(self._entity))).scalars().all()
+            stmt = self._select(load_only, load_relations)
+            return await self._read_shared(
+                ("list_all",), stmt, load_relations, load_only
             )
-
-            if not load_relations:
-                return results
-
-            await self.load_awaitables(load_relations=load_relations, results=results)
-            return results
         except OperationalError as e:
             logger.error("Operational Error %s", e)
             raise DatabaseConnectionError(str(e)) from e
@@ -198,25 +542,271 @@ class Repository(IRepository[T]):
         logger.info("Deleting entity")
         try:
             await self._session.delete(item)
-            return await self._session.commit()
+            await self._commit()
         except OperationalError as e:
-            await self._session.rollback()
+            await self._rollback()
             logger.error("Operational Error %s", e)
             raise DatabaseConnectionError(str(e)) from e
         except IntegrityError as e:
-            await self._session.rollback()
+            await self._rollback()
             logger.error("Integrity Error %s", e)
             raise IntegrityViolationError(str(e)) from e
         except Exception as e:
-            await self._session.rollback()
+            await self._rollback()
             logger.error("Repository error %s", e)
             raise RepositoryError(str(e)) from e
 
-    def _generate_filters(self, params: Dict[str, str], and_condition: bool):
+    async def stream_export(
+        self, columns: List[str], file_format: ExportFormat
+    ) -> AsyncIterator[bytes]:
+        """Streams every entity straight from a 'COPY ... TO STDOUT' on the driver connection.
+
+        Rows are never hydrated as ORM objects and at most COPY_QUEUE_SIZE chunks
+        are held in memory, so exports run in constant memory regardless of size.
+
+        Args:
+            columns (List[str]): The entity columns to export, in output order.
+            file_format (ExportFormat): The output format.
+
+        Yields:
+            bytes: Chunks of the encoded export.
+        """
+        logger.info("Streaming entity export")
+        try:
+            query, options = self._export_query(columns, file_format)
+            connection = await (await self._session.connection()).get_raw_connection()
+            driver_connection = connection.driver_connection
+            if driver_connection is None:
+                raise RepositoryError("Connection has no driver connection")
+
+            queue: Queue[bytes | None] = Queue(maxsize=COPY_QUEUE_SIZE)
+
+            async def copy() -> None:
+                try:
+                    await driver_connection.copy_from_query(
+                        query, output=queue.put, **options
+                    )
+                finally:
+                    await queue.put(None)
+
+            task = create_task(copy())
+            try:
+                while (chunk := await queue.get()) is not None:
+                    yield chunk
+                # Surface any error raised by the COPY itself
+                await task
+            finally:
+                if not task.done():
+                    task.cancel()
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    def _export_query(
+        self, columns: List[str], file_format: ExportFormat
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Builds the SQL and COPY options used to export the entity in the requested format.
+
+        Args:
+            columns (List[str]): The entity columns to export.
+            file_format (ExportFormat): The output format.
+
+        Returns:
+            Tuple[str, Dict[str, Any]]: The compiled query and the COPY options.
+        """
+        selected = [getattr(self._entity, column) for column in columns]
+        order = self._id_column
+        stmt: Select
+
+        if file_format == ExportFormat.NDJSON:
+            stmt = select(
+                func.json_build_object(
+                    *(arg for col in selected for arg in (literal(col.key), col))
+                )
+            ).order_by(order)
+        elif file_format == ExportFormat.COLUMNAR:
+            # Each output line is a group of rows stored column-wise
+            numbered = select(
+                *selected,
+                order.label("sort_key"),
+                (
+                    (func.row_number().over(order_by=order) - 1) // COLUMNAR_GROUP_SIZE
+                ).label("row_group"),
+            ).subquery()
+            stmt = (
+                select(
+                    func.json_build_object(
+                        *(
+                            arg
+                            for col in selected
+                            for arg in (
+                                literal(col.key),
+                                func.json_agg(
+                                    aggregate_order_by(
+                                        numbered.c[col.key], numbered.c.sort_key
+                                    )
+                                ),
+                            )
+                        )
+                    )
+                )
+                .group_by(numbered.c.row_group)
+                .order_by(numbered.c.row_group)
+            )
+        else:
+            stmt = select(*selected).order_by(order)
+
+        query = str(
+            stmt.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+
+        if file_format == ExportFormat.CSV:
+            return query, {"format": "csv", "header": True}
+        if file_format == ExportFormat.BINARY:
+            return query, {"format": "binary"}
+        # JSON lines are emitted verbatim by using quote / delimiter characters
+        # that JSON encoding never leaves unescaped
+        return query, {"format": "csv", "quote": "\x01", "delimiter": "\x02"}
+
+    def _select(
+        self,
+        load_only: List[str] | None = None,
+        load_relations: List[str] | None = None,
+    ) -> Select:
+        """Builds the entity SELECT with its relation loading options,
+        optionally narrowed to a subset of its attributes.
+
+        Relations are eagerly loaded as part of the statement, so every entity and
+        relation level is fetched in a bounded number of queries.
+        Primary and foreign key columns are always selected so identities and relations
+        still resolve. Eagerly joined relations left out of 'load_only' are not joined.
+        Attributes left out must not be accessed on the returned entities.
+
+        Args:
+            load_only (List[str] | None, optional): The attributes to select. Defaults to None (all).
+            load_relations (List[str] | None, optional): Dotted relation paths to load. Defaults to None.
+
+        Returns:
+            Select: The SQLAlchemy 2.0 select statement.
+        """
+        stmt = select(self._entity)
+        if load_relations:
+            stmt = stmt.options(*loader_options(self._entity, load_relations))
+        if not load_only:
+            return stmt
+
+        included = set(load_only) | {
+            path.split(".")[0] for path in load_relations or []
+        }
+
+        mapper = inspect(self._entity)
+        columns = [
+            getattr(self._entity, attr.key)
+            for attr in mapper.column_attrs
+            if attr.key in load_only
+            or any(col.primary_key or col.foreign_keys for col in attr.columns)
+        ]
+        joined = [
+            lazyload(getattr(self._entity, rel.key))
+            for rel in mapper.relationships
+            if rel.lazy == "joined" and rel.key not in included
+        ]
+        return stmt.options(load_only_columns(*columns), *joined)
+
+    async def _read_shared(
+        self,
+        key: Tuple[Hashable, ...],
+        stmt: Select,
+        load_relations: List[str] | None,
+        load_only: List[str] | None,
+    ) -> List[T]:
+        """Executes a read, sharing the result with identical reads already in flight.
+
+        Concurrent requests for the same entities, relations and attributes (e.g. a
+        dashboard opened by a whole team at once) run a single query. Authorization
+        happens before the repository is reached and the rows do not depend on the
+        caller, so the query itself is the coalescing scope.
+
+        The caller starting the query runs it on its own session, so an uncoalesced
+        read costs nothing extra. Callers joining it receive copies merged into their own
+        session without any further query, so they can be changed and written like any
+        entity they loaded themselves - unless the starting caller has already changed
+        them, in which case they run the query themselves. A read only joins queries
+        started after the last write committed by this process, so it always sees its
+        own writes. Disabled when SINGLE_FLIGHT_TIMEOUT is 0, and within a unit of work.
+
+        Args:
+            key (Tuple[Hashable, ...]): Identifies the read within this entity.
+            stmt (Select): The select statement to execute.
+            load_relations (List[str] | None): The relation paths loaded by the statement.
+            load_only (List[str] | None): The attributes selected by the statement.
+
+        Returns:
+            List[T]: The selected entities, attached to this repository's session.
+        """
+
+        # Reads within a unit of work must see its uncommitted writes
+        if not app_config.single_flight_timeout or in_unit_of_work(self._session):
+            return list((await self._session.execute(stmt)).scalars().all())
+
+        async def execute() -> List[T]:
+            return list((await self._session.execute(stmt)).scalars().all())
+
+        shared = await read_flight.do(
+            (
+                self._entity,
+                *key,
+                tuple(sorted(load_relations or [])),
+                tuple(sorted(load_only or [])),
+                published_changes(),
+            ),
+            execute,
+        )
+        if all(entity in self._session for entity in shared):
+            return shared
+
+        def merge(session: Session) -> List[T] | None:
+            # Unchanged entities merge without being reloaded
+            if any(inspect(entity).modified for entity in shared):
+                return None
+            return [session.merge(entity, load=False) for entity in shared]
+
+        merged = await self._session.run_sync(merge)
+        return merged if merged is not None else await execute()
+
+    async def _commit(self) -> None:
+        """Commits a write and notifies the table's subscribers.
+
+        Within a unit of work the write is only flushed - the unit commits, and
+        notifies the subscribers, once it completes.
+        """
+        if in_unit_of_work(self._session):
+            await self._session.flush()
+            record_changed(self._session, self._entity.__tablename__)
+            return
+        await self._session.commit()
+        self._publish_changed()
+
+    async def _rollback(self) -> None:
+        """Rolls back a failed write, unless it belongs to a unit of work - the unit
+        then rolls back all of its writes once the error propagates out of it"""
+        if not in_unit_of_work(self._session):
+            await self._session.rollback()
+
+    def _publish_changed(self) -> None:
+        """Notifies subscribers, such as cached snapshots, that the entity's table was written"""
+        publish_entity_changed(self._entity.__tablename__)
+
+    def _generate_filters(self, params: Dict[str, Any], and_condition: bool):
         """Iterates through a dict of params to query for and returns the SQLAlchemy 'AND' cor 'OR' query conditions.
 
         Args:
-            params (Dict[str, str]): A dict containing the parameters to be queried for.
+            params (Dict[str, Any]): A dict containing the parameters to be queried for.
             and_condition (bool): Whether to return 'AND' SQLAlchemy queries. If False, 'OR' conditions are returned.
 
         Returns:
@@ -0,0 +1,88 @@
+import logging
+from typing import Any, Dict, List
+
+from sqlalchemy import select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.database.interfaces.staffing_repository_interface import IStaffingRepository
+from api.database.views import staffing_report
+from api.schemas.project import ProjectStatus
+from api.utils.exceptions import DatabaseConnectionError, RepositoryError
+
+
+logger = logging.getLogger(__name__)
+
+
+class StaffingRepository(IStaffingRepository):
+    """
+    Repository reading and refreshing the 'staffing_report' materialized view.
+
+    Args:
+        IStaffingRepository: Repository interface defining the report methods.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository
+
+        Args:
+            session (AsyncSession): The async SQLAlchemy database session.
+        """
+        logger.info("Initializing staffing repository")
+        self._session = session
+
+    async def list_rows(
+        self,
+        customer_id: str | None = None,
+        status: ProjectStatus | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Reads the pre-joined staffing rows, one per project.
+
+        Args:
+            customer_id (str | None, optional): Only return the customer's projects. Defaults to None.
+            status (ProjectStatus | None, optional): Only return projects in this status. Defaults to None.
+
+        Returns:
+            List[Dict[str, Any]]: The staffing rows ordered by customer and project name.
+        """
+        logger.info("Listing staffing report rows")
+        try:
+            stmt = select(staffing_report).order_by(
+                staffing_report.c.customer_name, staffing_report.c.project_name
+            )
+            if customer_id is not None:
+                stmt = stmt.where(staffing_report.c.customer_id == customer_id)
+            if status is not None:
+                stmt = stmt.where(staffing_report.c.project_status == status)
+            return [dict(row) for row in (await self._session.execute(stmt)).mappings()]
+        except OperationalError as e:
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+
+    async def refresh(self, concurrently: bool = True) -> None:
+        """Recomputes the materialized view.
+
+        A concurrent refresh builds the new contents alongside the old ones, so
+        reads are never blocked while it runs.
+
+        Args:
+            concurrently (bool, optional): Whether to refresh without locking out reads. Defaults to True.
+        """
+        logger.info("Refreshing staffing report")
+        try:
+            mode = "CONCURRENTLY " if concurrently else ""
+            await self._session.execute(
+                text(f"REFRESH MATERIALIZED VIEW {mode}{staffing_report.name}")
+            )
+            await self._session.commit()
+        except OperationalError as e:
+            await self._session.rollback()
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            await self._session.rollback()
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
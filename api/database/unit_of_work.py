@@ -0,0 +1,118 @@
+"""Module containing the unit of work grouping repository writes into a single transaction"""
+
+import logging
+from types import TracebackType
+from typing import Set, Type
+
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.database.interfaces.unit_of_work_interface import IUnitOfWork
+from api.utils.events import publish_entity_changed
+from api.utils.exceptions import (
+    DatabaseConnectionError,
+    IntegrityViolationError,
+    RepositoryError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding the state of the session's open unit of work
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+class UnitOfWorkState:
+    """The state of a session's open unit of work, kept in 'session.info'"""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.changed_tables: Set[str] = set()
+
+
+def in_unit_of_work(session: AsyncSession) -> bool:
+    """Whether a unit of work is open on the session
+
+    Args:
+        session (AsyncSession): The database session
+
+    Returns:
+        bool: True if repository writes should only be flushed
+    """
+    return UNIT_OF_WORK_KEY in session.info
+
+
+def record_changed(session: AsyncSession, table: str) -> None:
+    """Records a table written within the session's unit of work, whose subscribers
+    are notified once the unit commits
+
+    Args:
+        session (AsyncSession): The database session
+        table (str): The table name, e.g. 'project'
+    """
+    session.info[UNIT_OF_WORK_KEY].changed_tables.add(table)
+
+
+class UnitOfWork(IUnitOfWork):
+    """Groups the writes of every repository sharing a session into one transaction.
+
+    Within 'async with unit_of_work:' repository writes are flushed - so generated
+    ids, defaults and constraint violations are available straight away - but not
+    committed. The unit commits once when the block completes, and only then notifies
+    the entity changed subscribers, or rolls every write back if the block raises.
+    Reads within the unit run on its session rather than being shared with concurrent
+    requests, so they see the unit's own writes.
+
+    Units nest: an inner unit joins the outer one, which alone commits. A failed
+    commit raises the same errors as a repository write.
+
+    A failed write is not rolled back by its repository within a unit, so a caught
+    repository error leaves the session unusable until the unit exits - let it
+    propagate out of the block.
+
+    Args:
+        session (AsyncSession): The database session shared with the repositories
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def __aenter__(self) -> "UnitOfWork":
+        state = self._session.info.setdefault(UNIT_OF_WORK_KEY, UnitOfWorkState())
+        state.depth += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        state: UnitOfWorkState = self._session.info[UNIT_OF_WORK_KEY]
+        state.depth -= 1
+        if state.depth:
+            return
+
+        del self._session.info[UNIT_OF_WORK_KEY]
+        if exc_type is not None:
+            logger.info("Rolling back unit of work")
+            await self._session.rollback()
+            return
+
+        try:
+            await self._session.commit()
+        except IntegrityError as e:
+            await self._session.rollback()
+            logger.error("Integrity Error %s", e)
+            raise IntegrityViolationError(str(e)) from e
+        except OperationalError as e:
+            await self._session.rollback()
+            logger.error("Operational Error %s", e)
+            raise DatabaseConnectionError(str(e)) from e
+        except Exception as e:
+            await self._session.rollback()
+            logger.error("Repository error %s", e)
+            raise RepositoryError(str(e)) from e
+        logger.info("Committed unit of work")
+        for table in state.changed_tables:
+            publish_entity_changed(table)
@@ -0,0 +1,40 @@
+"""The views module defining the read-only database views used for reporting.
+
+Views are kept out of Base.metadata, so Alembic autogenerate and 'create_all'
+never try to create them as tables - they are created by their own migrations.
+"""
+
+from sqlalchemy import (
+    UUID,
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    MetaData,
+    String,
+    Table,
+)
+
+from api.schemas.project import ProjectStatus
+
+
+views_metadata = MetaData()
+
+# Materialized view joining customer -> project -> user with per-project headcount
+# and role mix, refreshed by the report service after writes
+staffing_report = Table(
+    "staffing_report",
+    views_metadata,
+    Column("project_id", UUID(as_uuid=True), primary_key=True),
+    Column("project_name", String(50)),
+    Column("project_status", Enum(ProjectStatus)),
+    Column("project_active", Boolean),
+    Column("customer_id", UUID(as_uuid=True)),
+    Column("customer_name", String(50)),
+    Column("customer_active", Boolean),
+    Column("headcount", BigInteger),
+    Column("engineers", BigInteger),
+    Column("managers", BigInteger),
+    Column("refreshed_at", DateTime(timezone=True)),
+)
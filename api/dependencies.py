@@ -1,31 +1,82 @@
 """Contains all application FastAPI Dependencies for dependency injection"""
 
 import logging
-from typing import Annotated
+from typing import Annotated, Any, Dict, Iterable, List, Mapping, Tuple, Type
+from uuid import UUID
 
-from fastapi import Depends, Form, Request
+from fastapi import Depends, Form, Query, Request
 from pydantic import UUID4, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.core.config import app_config
+from api.database.assignment_event_repository import AssignmentEventRepository
+from api.database.assignment_repository import AssignmentRepository
+from api.database.interfaces.assignment_event_repository_interface import (
+    IAssignmentEventRepository,
+)
+from api.database.interfaces.assignment_repository_interface import (
+    IAssignmentRepository,
+)
+from api.database.interfaces.job_repository_interface import IJobRepository
 from api.database.interfaces.repository_interface import IRepository
-from api.database.models import Customer, Project, User
+from api.database.interfaces.project_status_repository_interface import (
+    IProjectStatusRepository,
+)
+from api.database.interfaces.staffing_repository_interface import IStaffingRepository
+from api.database.interfaces.unit_of_work_interface import IUnitOfWork
+from api.database.job_repository import JobRepository
+from api.database.loading import LoadPlan, parse_include
+from api.database.models import Customer, Project, Skill, User
+from api.database.project_status_repository import ProjectStatusRepository
 from api.database.repository import Repository
-from api.database.session import db_session_manager
+from api.database.session import Base, db_session_manager
+from api.database.staffing_repository import StaffingRepository
+from api.database.unit_of_work import UnitOfWork
 from api.schemas.auth import TokenData
+from api.schemas.relationships import CustomerResponse, ProjectResponse, UserResponse
 from api.schemas.user import Roles, UserCreate
+from api.services.assignment_event_service import AssignmentEventService
+from api.services.assignment_service import AssignmentService
 from api.services.auth_service import AuthService
+from api.services.auto_staffing_service import AutoStaffingService
+from api.services.bulk_service import BulkService
 from api.services.customer_service import CustomerService
+from api.services.interfaces.assignment_event_service_interface import (
+    IAssignmentEventService,
+)
+from api.services.interfaces.assignment_service_interface import IAssignmentService
 from api.services.interfaces.auth_service_interface import IAuthService
+from api.services.interfaces.auto_staffing_service_interface import (
+    IAutoStaffingService,
+)
+from api.services.interfaces.bulk_service_interface import IBulkService
 from api.services.interfaces.customer_service_interface import ICustomerService
+from api.services.interfaces.job_service_interface import IJobService
 from api.services.interfaces.project_service_interface import IProjectService
+from api.services.interfaces.report_service_interface import IReportService
+from api.services.interfaces.search_service_interface import ISearchService
+from api.services.interfaces.skill_service_interface import ISkillService
+from api.services.interfaces.summary_service_interface import ISummaryService
+from api.services.interfaces.typeahead_service_interface import ITypeaheadService
 from api.services.interfaces.user_service_interface import IUserService
+from api.services.job_service import JobService
 from api.services.project_service import ProjectService
+from api.services.report_service import ReportService
+from api.services.search_service import SearchService
+from api.services.skill_service import SkillService
+from api.services.summary_service import SummaryService
+from api.services.typeahead_service import TypeaheadService
 from api.services.user_service import UserService
 from api.utils.exceptions import ExceptionHandler, PasswordHashingError
+from api.utils.fieldsets import FieldSet, collect_fields, parse_fieldsets
+from api.utils.serializers import ResponseRenderer, negotiate_media_type
 
 
 logger = logging.getLogger(__name__)
 
+# Query parameter values parsed as True by FastAPI's bool parameters
+TRUTHY_FLAGS = {"1", "true", "t", "yes", "y", "on"}
+
 
 async def get_db_session():
     """Utilizes the DB Session Manager to retrieve a DB session.
@@ -82,6 +133,112 @@ def get_project_repository(
     return Repository(session, Project)
 
 
+def get_skill_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)]
+) -> IRepository:
+    """Factory function that instantiates and returns an instance of a skill repository
+
+    Args:
+        session (Annotated[AsyncSession, Depends): An async database session
+
+    Returns:
+        IRepository: The instantiated skill repository
+    """
+
+    return Repository(session, Skill)
+
+
+def get_assignment_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)]
+) -> IAssignmentRepository:
+    """Factory function that instantiates and returns an instance of an assignment repository
+
+    Args:
+        session (Annotated[AsyncSession, Depends): An async database session
+
+    Returns:
+        IAssignmentRepository: The instantiated assignment repository
+    """
+
+    return AssignmentRepository(session)
+
+
+def get_assignment_event_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)]
+) -> IAssignmentEventRepository:
+    """Factory function that instantiates and returns an instance of an assignment event repository
+
+    Args:
+        session (Annotated[AsyncSession, Depends): An async database session
+
+    Returns:
+        IAssignmentEventRepository: The instantiated assignment event repository
+    """
+
+    return AssignmentEventRepository(session)
+
+
+def get_project_status_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)]
+) -> IProjectStatusRepository:
+    """Factory function that instantiates and returns an instance of a project status history repository
+
+    Args:
+        session (Annotated[AsyncSession, Depends): An async database session
+
+    Returns:
+        IProjectStatusRepository: The instantiated project status history repository
+    """
+
+    return ProjectStatusRepository(session)
+
+
+def get_staffing_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)]
+) -> IStaffingRepository:
+    """Factory function that instantiates and returns an instance of a staffing report repository
+
+    Args:
+        session (Annotated[AsyncSession, Depends): An async database session
+
+    Returns:
+        IStaffingRepository: The instantiated staffing report repository
+    """
+
+    return StaffingRepository(session)
+
+
+def get_job_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)]
+) -> IJobRepository:
+    """Factory function that instantiates and returns an instance of a job queue repository
+
+    Args:
+        session (Annotated[AsyncSession, Depends): An async database session
+
+    Returns:
+        IJobRepository: The instantiated job queue repository
+    """
+
+    return JobRepository(session)
+
+
+def get_unit_of_work(
+    session: Annotated[AsyncSession, Depends(get_db_session)]
+) -> IUnitOfWork:
+    """Factory function that instantiates and returns a unit of work over the request's
+    database session, shared by every repository of the request
+
+    Args:
+        session (Annotated[AsyncSession, Depends): An async database session
+
+    Returns:
+        IUnitOfWork: The instantiated unit of work
+    """
+
+    return UnitOfWork(session)
+
+
 def get_auth_service(
     user_repository: Annotated[IRepository, Depends(get_user_repository)]
 ) -> IAuthService:
@@ -115,33 +272,384 @@ def get_project_service(
 def get_user_service(
     user_repository: Annotated[IRepository, Depends(get_user_repository)],
     auth_service: Annotated[IAuthService, Depends(get_auth_service)],
+    unit_of_work: Annotated[IUnitOfWork, Depends(get_unit_of_work)],
 ) -> IUserService:
     """Factory function that instantiates and returns an instance of a user service
 
     Args:
         user_repository: (Annotated[IRepository, Depends]): A user repository instance
         auth_service: (Annotated[IAuthService, Depends]): An auth service instance
+        unit_of_work: (Annotated[IUnitOfWork, Depends]): A unit of work instance
 
     Returns:
         IUserService: The instantiated user service
     """
 
-    return UserService(user_repository, auth_service)
+    return UserService(user_repository, auth_service, unit_of_work)
 
 
 def get_customer_service(
-    customer_repository: Annotated[IRepository, Depends(get_customer_repository)]
+    customer_repository: Annotated[IRepository, Depends(get_customer_repository)],
+    project_repository: Annotated[IRepository, Depends(get_project_repository)],
+    unit_of_work: Annotated[IUnitOfWork, Depends(get_unit_of_work)],
 ) -> ICustomerService:
     """Factory function that instantiates and returns an instance of a customer service
 
     Args:
         customer_repository: (Annotated[IRepository, Depends]): A customer repository instance
+        project_repository: (Annotated[IRepository, Depends]): A project repository instance
+        unit_of_work: (Annotated[IUnitOfWork, Depends]): A unit of work instance
 
     Returns:
         ICustomerService: The instantiated customer service
     """
 
-    return CustomerService(customer_repository)
+    return CustomerService(customer_repository, project_repository, unit_of_work)
+
+
+def get_bulk_service(
+    user_repository: Annotated[IRepository, Depends(get_user_repository)],
+    customer_repository: Annotated[IRepository, Depends(get_customer_repository)],
+    project_repository: Annotated[IRepository, Depends(get_project_repository)],
+    auth_service: Annotated[IAuthService, Depends(get_auth_service)],
+) -> IBulkService:
+    """Factory function that instantiates and returns an instance of a bulk service
+
+    Args:
+        user_repository: (Annotated[IRepository, Depends]): A user repository instance
+        customer_repository: (Annotated[IRepository, Depends]): A customer repository instance
+        project_repository: (Annotated[IRepository, Depends]): A project repository instance
+        auth_service: (Annotated[IAuthService, Depends]): An auth service instance
+
+    Returns:
+        IBulkService: The instantiated bulk service
+    """
+
+    return BulkService(
+        user_repository, customer_repository, project_repository, auth_service
+    )
+
+
+def get_assignment_service(
+    assignment_repository: Annotated[
+        IAssignmentRepository, Depends(get_assignment_repository)
+    ],
+    project_repository: Annotated[IRepository, Depends(get_project_repository)],
+) -> IAssignmentService:
+    """Factory function that instantiates and returns an instance of an assignment service
+
+    Args:
+        assignment_repository: (Annotated[IAssignmentRepository, Depends]): An assignment repository instance
+        project_repository: (Annotated[IRepository, Depends]): A project repository instance
+
+    Returns:
+        IAssignmentService: The instantiated assignment service
+    """
+
+    return AssignmentService(assignment_repository, project_repository)
+
+
+def get_assignment_event_service(
+    assignment_event_repository: Annotated[
+        IAssignmentEventRepository, Depends(get_assignment_event_repository)
+    ],
+) -> IAssignmentEventService:
+    """Factory function that instantiates and returns an instance of an assignment event service
+
+    Args:
+        assignment_event_repository: (Annotated[IAssignmentEventRepository, Depends]): An assignment event repository instance
+
+    Returns:
+        IAssignmentEventService: The instantiated assignment event service
+    """
+
+    return AssignmentEventService(assignment_event_repository)
+
+
+def get_auto_staffing_service(
+    user_repository: Annotated[IRepository, Depends(get_user_repository)],
+    project_repository: Annotated[IRepository, Depends(get_project_repository)],
+    assignment_repository: Annotated[
+        IAssignmentRepository, Depends(get_assignment_repository)
+    ],
+) -> IAutoStaffingService:
+    """Factory function that instantiates and returns an instance of an auto-staffing service
+
+    Args:
+        user_repository: (Annotated[IRepository, Depends]): A user repository instance
+        project_repository: (Annotated[IRepository, Depends]): A project repository instance
+        assignment_repository: (Annotated[IAssignmentRepository, Depends]): An assignment repository instance
+
+    Returns:
+        IAutoStaffingService: The instantiated auto-staffing service
+    """
+
+    return AutoStaffingService(
+        user_repository, project_repository, assignment_repository
+    )
+
+
+def get_summary_service(
+    user_repository: Annotated[IRepository, Depends(get_user_repository)],
+    project_repository: Annotated[IRepository, Depends(get_project_repository)],
+    customer_repository: Annotated[IRepository, Depends(get_customer_repository)],
+) -> ISummaryService:
+    """Factory function that instantiates and returns an instance of a summary service
+
+    Args:
+        user_repository: (Annotated[IRepository, Depends]): A user repository instance
+        project_repository: (Annotated[IRepository, Depends]): A project repository instance
+        customer_repository: (Annotated[IRepository, Depends]): A customer repository instance
+
+    Returns:
+        ISummaryService: The instantiated summary service
+    """
+
+    return SummaryService(user_repository, project_repository, customer_repository)
+
+
+def get_report_service(
+    staffing_repository: Annotated[
+        IStaffingRepository, Depends(get_staffing_repository)
+    ],
+    project_status_repository: Annotated[
+        IProjectStatusRepository, Depends(get_project_status_repository)
+    ],
+) -> IReportService:
+    """Factory function that instantiates and returns an instance of a report service
+
+    Args:
+        staffing_repository: (Annotated[IStaffingRepository, Depends]): A staffing report repository instance
+        project_status_repository: (Annotated[IProjectStatusRepository, Depends]): A project status history repository instance
+
+    Returns:
+        IReportService: The instantiated report service
+    """
+
+    return ReportService(staffing_repository, project_status_repository)
+
+
+def get_job_service(
+    job_repository: Annotated[IJobRepository, Depends(get_job_repository)],
+) -> IJobService:
+    """Factory function that instantiates and returns an instance of a job service
+
+    Args:
+        job_repository: (Annotated[IJobRepository, Depends]): A job queue repository instance
+
+    Returns:
+        IJobService: The instantiated job service
+    """
+
+    return JobService(job_repository)
+
+
+def get_search_service(
+    user_repository: Annotated[IRepository, Depends(get_user_repository)],
+    project_repository: Annotated[IRepository, Depends(get_project_repository)],
+    customer_repository: Annotated[IRepository, Depends(get_customer_repository)],
+) -> ISearchService:
+    """Factory function that instantiates and returns an instance of a search service
+
+    Args:
+        user_repository: (Annotated[IRepository, Depends]): A user repository instance
+        project_repository: (Annotated[IRepository, Depends]): A project repository instance
+        customer_repository: (Annotated[IRepository, Depends]): A customer repository instance
+
+    Returns:
+        ISearchService: The instantiated search service
+    """
+
+    return SearchService(user_repository, project_repository, customer_repository)
+
+
+def get_typeahead_service(
+    user_repository: Annotated[IRepository, Depends(get_user_repository)],
+    project_repository: Annotated[IRepository, Depends(get_project_repository)],
+    customer_repository: Annotated[IRepository, Depends(get_customer_repository)],
+) -> ITypeaheadService:
+    """Factory function that instantiates and returns an instance of a typeahead service
+
+    Args:
+        user_repository: (Annotated[IRepository, Depends]): A user repository instance
+        project_repository: (Annotated[IRepository, Depends]): A project repository instance
+        customer_repository: (Annotated[IRepository, Depends]): A customer repository instance
+
+    Returns:
+        ITypeaheadService: The instantiated typeahead service
+    """
+
+    return TypeaheadService(user_repository, project_repository, customer_repository)
+
+
+def get_skill_service(
+    skill_repository: Annotated[IRepository, Depends(get_skill_repository)],
+    user_repository: Annotated[IRepository, Depends(get_user_repository)],
+    project_repository: Annotated[IRepository, Depends(get_project_repository)],
+) -> ISkillService:
+    """Factory function that instantiates and returns an instance of a skill service
+
+    Args:
+        skill_repository: (Annotated[IRepository, Depends]): A skill repository instance
+        user_repository: (Annotated[IRepository, Depends]): A user repository instance
+        project_repository: (Annotated[IRepository, Depends]): A project repository instance
+
+    Returns:
+        ISkillService: The instantiated skill service
+    """
+
+    return SkillService(skill_repository, user_repository, project_repository)
+
+
+def get_response_renderer(request: Request) -> ResponseRenderer:
+    """Factory function that instantiates and returns a response renderer
+    for the media type negotiated from the request's Accept header
+
+    Args:
+        request (Request): FastAPI Request containing the Accept header
+
+    Returns:
+        ResponseRenderer: The renderer used to serialize route responses
+    """
+
+    return ResponseRenderer(negotiate_media_type(request.headers.get("accept")))
+
+
+class FieldSetParser:
+    """FastAPI Dependency parsing the sparse fieldset query parameters of a route
+
+    'fields=id,name' selects the root entity's attributes and 'fields[<relation>]=...'
+    the attributes of a nested relation. Names are validated against the route's response model.
+
+    Args:
+        response_model (Any): The route's response model
+    """
+
+    def __init__(self, response_model: Any) -> None:
+        self._allowed = collect_fields(response_model)
+
+    def __call__(
+        self,
+        request: Request,
+        fields: Annotated[  # pylint: disable=unused-argument
+            str | None,
+            Query(
+                description="Comma separated attributes to return. "
+                "Use fields[<relation>] for nested relations."
+            ),
+        ] = None,
+    ) -> FieldSet:
+        """Parses the request's sparse fieldset
+
+        Args:
+            request (Request): FastAPI Request containing the query parameters
+            fields (str | None, optional): The root entity's attributes, declared for the
+            OpenAPI schema (every 'fields' parameter is read from the request). Defaults to None.
+
+        Returns:
+            FieldSet: The requested fields
+        """
+
+        return self.parse(request.query_params.multi_items())
+
+    def parse(self, params: Iterable[Tuple[str, str]]) -> FieldSet:
+        """Parses a sparse fieldset from query parameter style key / value pairs
+
+        Args:
+            params (Iterable[Tuple[str, str]]): The parameter key / value pairs
+
+        Raises:
+            HTTPException: 400 if a relation or attribute is not part of the response model
+
+        Returns:
+            FieldSet: The requested fields
+        """
+
+        try:
+            return parse_fieldsets(params, self._allowed)
+        except ValueError as e:
+            logger.error("Invalid fields: %s", e)
+            ExceptionHandler.raise_http_exception(400, str(e))
+
+
+class IncludeParser:
+    """FastAPI Dependency parsing the 'include' query parameter of a route into a load plan
+
+    'include=projects.users,customer' lists dotted relation paths to load with the entity.
+    Paths are validated against the entity's relations and INCLUDE_MAX_DEPTH.
+
+    Args:
+        entity (Type[Base]): The route's root database entity
+        default (List[str] | None, optional): Paths always loaded by the route. Defaults to None.
+        flags (Dict[str, str] | None, optional): Legacy boolean query parameters (e.g. 'projects=true')
+        mapped to the path they include. A nested path is only included alongside its parent.
+        Defaults to None.
+    """
+
+    def __init__(
+        self,
+        entity: Type[Base],
+        default: List[str] | None = None,
+        flags: Dict[str, str] | None = None,
+    ) -> None:
+        self._entity = entity
+        self._default = default or []
+        self._flags = flags or {}
+
+    def __call__(
+        self,
+        request: Request,
+        include: Annotated[
+            str | None,
+            Query(description="Comma separated relation paths, e.g. projects.users"),
+        ] = None,
+    ) -> LoadPlan:
+        """Parses the request's relation paths
+
+        Args:
+            request (Request): FastAPI Request containing any legacy flags
+            include (str | None, optional): Comma separated relation paths. Defaults to None.
+
+        Returns:
+            LoadPlan: The validated load plan
+        """
+
+        return self.parse({**request.query_params, "include": include or ""})
+
+    def parse(self, params: Mapping[str, str]) -> LoadPlan:
+        """Parses a load plan from query parameter style values
+
+        Args:
+            params (Mapping[str, str]): The 'include' value and any legacy flags
+
+        Raises:
+            HTTPException: 400 if a path is too deep or names an unknown relation
+
+        Returns:
+            LoadPlan: The validated load plan
+        """
+
+        paths = list(self._default)
+        include = params.get("include")
+        if include:
+            paths.extend(include.split(","))
+
+        flagged = {
+            path
+            for flag, path in self._flags.items()
+            if str(params.get(flag, "")).lower() in TRUTHY_FLAGS
+        }
+        paths.extend(
+            path
+            for path in flagged
+            if "." not in path or path.rsplit(".", 1)[0] in flagged
+        )
+
+        try:
+            return parse_include(self._entity, paths, app_config.include_max_depth)
+        except ValueError as e:
+            logger.error("Invalid include: %s", e)
+            ExceptionHandler.raise_http_exception(400, str(e))
 
 
 def validate_user(
@@ -270,6 +778,19 @@ def parse_optional_project_id(project_id: UUID4 | None = None) -> str | None:
     return parse_project_id(project_id) if project_id else None
 
 
+def parse_assignment_id(assignment_id: UUID4) -> str:
+    """Fast API dependency to parse an assignment ID to a string
+
+    Args:
+        assignment_id (UUID4): assignment ID to be parsed
+
+    Returns:
+        str: assignment ID in string format
+    """
+
+    return parse_uuid(assignment_id)
+
+
 def parse_customer_id(customer_id: UUID4) -> str:
     """Fast API dependency to parse a customer ID to a string
 
@@ -320,3 +841,63 @@ def parse_optional_user_id(user_id: UUID4 | None = None) -> str | None:
     """
 
     return parse_user_id(user_id) if user_id else None
+
+
+def parse_optional_ids(
+    ids: Annotated[
+        str | None,
+        Query(description="Comma separated ids of the entities to return, in order"),
+    ] = None
+) -> List[str] | None:
+    """Fast API dependency to parse a comma separated list of entity IDs
+
+    Args:
+        ids (str | None, optional): Comma separated IDs to be parsed. Defaults to None.
+
+    Raises:
+        HTTPException: 400 if an ID is not a valid UUID or there are more than LOOKUP_MAX_IDS
+
+    Returns:
+        List[str] | None: IDs in string format, in their input order, or None.
+    """
+
+    if ids is None:
+        return None
+
+    values = [value.strip() for value in ids.split(",") if value.strip()]
+    if len(values) > app_config.lookup_max_ids:
+        ExceptionHandler.raise_http_exception(
+            400, f"At most {app_config.lookup_max_ids} ids may be requested"
+        )
+    try:
+        return [str(UUID(value)) for value in values]
+    except ValueError:
+        ExceptionHandler.raise_http_exception(400, f"Invalid ids: {ids}")
+
+
+# Sparse fieldset and relation parsers of the entity GET routes
+
+parse_customer_fields = FieldSetParser(CustomerResponse)
+
+# 'projects=true' and 'users=true' are kept as aliases of include=projects,projects.users
+parse_customer_include = IncludeParser(
+    Customer, flags={"projects": "projects", "users": "projects.users"}
+)
+
+parse_project_fields = FieldSetParser(ProjectResponse)
+
+# Projects are always returned with their customer.
+# 'users=true' is kept as an alias of include=users
+parse_project_include = IncludeParser(
+    Project, default=["customer"], flags={"users": "users"}
+)
+
+parse_user_fields = FieldSetParser(UserResponse)
+
+# 'project=true' (and 'projects=true' on /users) are kept as aliases of include=project
+parse_user_include = IncludeParser(
+    User, flags={"project": "project", "projects": "project"}
+)
+
+# The current user is always returned with their project
+parse_current_user_include = IncludeParser(User, default=["project"])
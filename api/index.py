@@ -8,7 +8,28 @@ from fastapi import FastAPI
 
 from api.core.config import app_config
 from api.database.session import db_session_manager
-from api.routers import auth_router, customers_router, projects_router, users_router
+from api.middleware.compression import CompressionMiddleware
+from api.middleware.idempotency import IdempotencyMiddleware
+from api.routers import (
+    assignment_events_router,
+    assignments_router,
+    auth_router,
+    auto_staffing_router,
+    batch_router,
+    bulk_router,
+    customers_router,
+    jobs_router,
+    metrics_router,
+    projects_router,
+    reports_router,
+    search_router,
+    skills_router,
+    summary_router,
+    typeahead_router,
+    users_router,
+)
+from api.services.assignment_event_service import audit_log
+from api.services.job_worker import job_worker
 
 # Config and create application logger
 logging.basicConfig(
@@ -25,7 +46,14 @@ logger.info("Log level is %s", app_config.log_level)
 # Config and create FastAPI application
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # JOB_WORKERS=0 leaves queued jobs to separate 'job_worker.py' processes
+    if app_config.job_workers > 0:
+        job_worker.start()
     yield
+    # Return running jobs to the queue before the connections close
+    await job_worker.stop()
+    # Write any buffered audit events before the connections close
+    await audit_log.close()
     if db_session_manager.engine is not None:
         await db_session_manager.close()
 
@@ -36,8 +64,37 @@ app = FastAPI(
     title="Project Assignment Portal",
 )
 
+# Define application middleware - the last added runs first, so replayed
+# idempotent responses are still compressed
+app.add_middleware(
+    IdempotencyMiddleware,
+    ttl=app_config.idempotency_ttl,
+    lock_timeout=app_config.idempotency_lock_timeout,
+    cache_size=app_config.idempotency_cache_size,
+    max_response_size=app_config.idempotency_max_response_size,
+    purge_interval=app_config.idempotency_purge_interval,
+)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=app_config.compression_minimum_size,
+    gzip_level=app_config.compression_gzip_level,
+    brotli_quality=app_config.compression_brotli_quality,
+)
+
 # Define application routers
 app.include_router(auth_router.router)
 app.include_router(users_router.router)
 app.include_router(customers_router.router)
 app.include_router(projects_router.router)
+app.include_router(assignments_router.router)
+app.include_router(assignment_events_router.router)
+app.include_router(auto_staffing_router.router)
+app.include_router(skills_router.router)
+app.include_router(bulk_router.router)
+app.include_router(jobs_router.router)
+app.include_router(batch_router.router)
+app.include_router(metrics_router.router)
+app.include_router(summary_router.router)
+app.include_router(reports_router.router)
+app.include_router(search_router.router)
+app.include_router(typeahead_router.router)
@@ -0,0 +1,256 @@
+"""Module containing the response compression ASGI middleware"""
+
+import logging
+import zlib
+
+import brotli  # type: ignore[import-untyped]
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.utils.parsers import parse_header_qualities
+
+
+logger = logging.getLogger(__name__)
+
+# Content types worth compressing - anything else (images, archives,
+# binary COPY exports) is passed through untouched
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/msgpack",
+    "application/xml",
+)
+
+# Content types that must never be buffered or compressed
+EXCLUDED_TYPES = ("text/event-stream",)
+
+
+class Encoder:
+    """Incremental encoder wrapping either a gzip or a brotli compressor.
+
+    Args:
+        encoding (str): The content coding - 'gzip' or 'br'
+        gzip_level (int): zlib compression level (1-9)
+        brotli_quality (int): brotli quality (0-11)
+    """
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits of 16 + MAX_WBITS produces a gzip header and trailer
+            self._compressor = zlib.compressobj(
+                gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+            )
+
+    def compress(self, data: bytes) -> bytes:
+        """Compresses a chunk and flushes it so the client can decode it immediately
+
+        Args:
+            data (bytes): The chunk to compress
+
+        Returns:
+            bytes: The compressed chunk
+        """
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self, data: bytes = b"") -> bytes:
+        """Compresses a final chunk and terminates the compressed stream
+
+        Args:
+            data (bytes, optional): The final chunk to compress. Defaults to b"".
+
+        Returns:
+            bytes: The remaining compressed bytes
+        """
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.finish()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with brotli or gzip.
+
+    The coding is negotiated from the request's Accept-Encoding header, preferring brotli.
+    Complete responses smaller than minimum_size are sent uncompressed, as are responses that
+    already carry a Content-Encoding, non-textual content types and server-sent events.
+    Streamed responses are compressed chunk by chunk and flushed after every chunk, so
+    clients receive data as soon as the application produces it.
+
+    Args:
+        app (ASGIApp): The wrapped ASGI application
+        minimum_size (int, optional): Smallest body, in bytes, worth compressing. Defaults to 500.
+        gzip_level (int, optional): zlib compression level (1-9). Defaults to 6.
+        brotli_quality (int, optional): brotli quality (0-11). Defaults to 4.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        encoding = self.select_encoding(headers.get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(
+            send,
+            Encoder(encoding, self.gzip_level, self.brotli_quality),
+            self.minimum_size,
+        )
+        await self.app(scope, receive, responder.send)
+
+    @staticmethod
+    def select_encoding(accept_encoding: str) -> str | None:
+        """Selects the content coding to respond with
+
+        Args:
+            accept_encoding (str): The request's Accept-Encoding header value
+
+        Returns:
+            str | None: 'br', 'gzip' or None if the client accepts neither
+        """
+        accepted = {
+            coding: quality
+            for coding, quality in parse_header_qualities(accept_encoding)
+            if quality > 0
+        }
+        for coding in ("br", "gzip"):
+            if coding in accepted:
+                return coding
+        return None
+
+
+class CompressionResponder:
+    """Intercepts the messages of a single response and compresses its body
+
+    Args:
+        send (Send): The ASGI send callable of the server
+        encoder (Encoder): Encoder for the negotiated content coding
+        minimum_size (int): Smallest complete body, in bytes, worth compressing
+    """
+
+    def __init__(self, send: Send, encoder: Encoder, minimum_size: int) -> None:
+        self._send = send
+        self._encoder = encoder
+        self._minimum_size = minimum_size
+        self._start_message: Message | None = None
+        self._passthrough = False
+        self._streaming = False
+
+    async def send(self, message: Message) -> None:
+        """Handles an ASGI message sent by the application
+
+        Args:
+            message (Message): The ASGI message
+        """
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk shows whether compression applies
+            self._start_message = message
+            headers = Headers(raw=message["headers"])
+            self._passthrough = not self.is_compressible(headers)
+            return
+
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self.flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._streaming:
+            if more_body:
+                chunk = self._encoder.compress(body)
+            else:
+                chunk = self._encoder.finish(body)
+            await self._send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
+            return
+
+        if not more_body:
+            # Complete body - only compressed if large enough to be worthwhile
+            if len(body) < self._minimum_size:
+                await self.flush_start()
+                await self._send(message)
+                return
+            compressed = self._encoder.finish(body)
+            await self.flush_start(compressed=True, content_length=len(compressed))
+            await self._send({"type": "http.response.body", "body": compressed})
+            return
+
+        # First chunk of a streamed body - the total length is unknown
+        logger.debug("Compressing streamed response with %s", self._encoder.encoding)
+        self._streaming = True
+        await self.flush_start(compressed=True)
+        await self._send(
+            {
+                "type": "http.response.body",
+                "body": self._encoder.compress(body),
+                "more_body": True,
+            }
+        )
+
+    def is_compressible(self, headers: Headers) -> bool:
+        """Determines whether a response may be compressed from its headers
+
+        Args:
+            headers (Headers): The response headers
+
+        Returns:
+            bool: True if the response body should be compressed
+        """
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        if content_type.startswith(EXCLUDED_TYPES):
+            return False
+        return content_type.startswith(COMPRESSIBLE_TYPES) or "+json" in content_type
+
+    async def flush_start(
+        self, compressed: bool = False, content_length: int | None = None
+    ) -> None:
+        """Sends the held response start message, rewriting headers if the body is compressed
+
+        Args:
+            compressed (bool, optional): Whether the body is compressed. Defaults to False.
+            content_length (int | None, optional): The compressed body length,
+            None for a streamed body. Defaults to None.
+        """
+        if self._start_message is None:
+            return
+        message, self._start_message = self._start_message, None
+
+        headers = MutableHeaders(raw=list(message["headers"]))
+        if not self._passthrough:
+            # The representation depends on Accept-Encoding even when left uncompressed
+            headers.add_vary_header("Accept-Encoding")
+        if compressed:
+            headers["Content-Encoding"] = self._encoder.encoding
+            if content_length is None:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(content_length)
+        await self._send({**message, "headers": headers.raw})
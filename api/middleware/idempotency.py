@@ -0,0 +1,466 @@
+"""Module containing the Idempotency-Key ASGI middleware"""
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import logging
+import time
+from typing import List, Set, Tuple
+from uuid import uuid4
+
+from starlette.datastructures import Headers
+from starlette.requests import cookie_parser
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.database.idempotency_repository import IdempotencyRepository
+from api.database.session import db_session_manager
+from api.utils.exceptions import IdempotencyConflictError
+
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+IDEMPOTENT_METHODS = ("POST", "PATCH")
+MAX_KEY_LENGTH = 255
+# Request bodies read whole and hashed - other bodies, such as multipart file
+# uploads, are passed through without idempotency handling
+IDEMPOTENT_CONTENT_TYPES = ("application/json", "application/x-www-form-urlencoded")
+# Response headers not stored: hop-by-hop headers, and those the replayed
+# response sets itself
+UNSTORED_HEADERS = frozenset(
+    (
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+        "content-length",
+        "content-type",
+    )
+)
+
+
+class StoredResponse:
+    """A completed response, replayed to retries of its request
+
+    Args:
+        fingerprint (str): The hashed body of the request that produced it
+        status_code (int): The response status code
+        content_type (str | None): The response Content-Type
+        headers (List[Tuple[str, str]]): The other end-to-end response headers, such as
+        Set-Cookie and Location
+        body (bytes): The response body
+    """
+
+    def __init__(
+        self,
+        fingerprint: str,
+        status_code: int,
+        content_type: str | None,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+    ) -> None:
+        self.fingerprint = fingerprint
+        self.status_code = status_code
+        self.content_type = content_type
+        self.headers = headers
+        self.body = body
+
+    def replay(self) -> Response:
+        """Builds the response sent to a retry
+
+        Returns:
+            Response: The stored response, marked as replayed
+        """
+        response = Response(
+            content=self.body,
+            status_code=self.status_code,
+            media_type=self.content_type,
+            headers={REPLAYED_HEADER: "true"},
+        )
+        # Appended raw, as headers such as Set-Cookie may repeat
+        response.raw_headers.extend(
+            (name.encode("latin-1"), value.encode("latin-1"))
+            for name, value in self.headers
+        )
+        return response
+
+
+class ResponseCache:
+    """Bounded, least recently used cache of stored responses in front of the database.
+
+    Entries expire with their database row, so a cached response is never replayed
+    for longer than the stored one would be.
+
+    Args:
+        max_entries (int): The maximum number of cached responses. 0 disables the cache.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[float, StoredResponse]] = OrderedDict()
+
+    def get(self, key: str) -> StoredResponse | None:
+        """Returns the unexpired cached response of a key
+
+        Args:
+            key (str): The hashed idempotency key
+
+        Returns:
+            StoredResponse | None: The cached response, or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, response = entry
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: str, response: StoredResponse, ttl: float) -> None:
+        """Caches a response for 'ttl' seconds, evicting the least recently used if full
+
+        Args:
+            key (str): The hashed idempotency key
+            response (StoredResponse): The response to cache
+            ttl (float): Seconds until the response expires
+        """
+        if not self.max_entries or ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class IdempotencyMiddleware:
+    """ASGI middleware making POST and PATCH requests safe to retry.
+
+    A request sent with an 'Idempotency-Key' header reserves the key before it runs,
+    and its response is stored against the key once it completes. A retry with the
+    same key is answered with the stored response - marked with an
+    'Idempotent-Replayed: true' header - from an in-process cache or a single primary
+    key lookup, and never reaches the routes or services.
+
+    Keys are scoped to the request's method, path and credentials. A key reused for a
+    different request body is rejected with a 422, and a retry arriving while the first
+    request is still running with a 409. Responses with a 5xx status, or larger than
+    max_response_size, are not stored, so their retries run again. Only JSON and form
+    bodies are read and hashed - other requests, such as multipart file uploads, are
+    passed through as if they were sent without a key.
+
+    Args:
+        app (ASGIApp): The wrapped ASGI application
+        ttl (float, optional): Seconds a stored response is replayed for. Defaults to 86400.
+        lock_timeout (float, optional): Seconds a key stays reserved if its request never
+        completes. A request outliving it can have its key taken over by a retry, and
+        its response is then not stored. Defaults to 300.
+        cache_size (int, optional): Responses cached in process. Defaults to 1024.
+        max_response_size (int, optional): Largest body, in bytes, stored. Defaults to 1 MiB.
+        purge_interval (float, optional): Seconds between deletions of expired keys. Defaults to 3600.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        ttl: float = 86400,
+        lock_timeout: float = 300,
+        cache_size: int = 1024,
+        max_response_size: int = 1_048_576,
+        purge_interval: float = 3600,
+    ) -> None:
+        self.app = app
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.max_response_size = max_response_size
+        self.purge_interval = purge_interval
+        self.cache = ResponseCache(cache_size)
+        self._next_purge = time.monotonic() + purge_interval
+        self._purges: Set[asyncio.Task] = set()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in IDEMPOTENT_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        idempotency_key = headers.get(IDEMPOTENCY_HEADER)
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            await self.error(
+                400,
+                f"Idempotency-Key must be between 1 and {MAX_KEY_LENGTH} characters",
+                scope,
+                receive,
+                send,
+            )
+            return
+
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        if media_type and media_type not in IDEMPOTENT_CONTENT_TYPES:
+            logger.info("Ignoring Idempotency-Key of a %s request", media_type)
+            await self.app(scope, receive, send)
+            return
+
+        body = await self.read_body(receive)
+        key = self.scope_key(scope, headers, idempotency_key)
+        fingerprint = hashlib.sha256(body).hexdigest()
+        reservation = uuid4().hex
+
+        stored = self.cache.get(key)
+        if stored is None:
+            try:
+                stored = await self.lookup(key, fingerprint, reservation)
+            except IdempotencyConflictError as e:
+                await self.error(e.status_code, e.detail, scope, receive, send)
+                return
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("Error looking up idempotency key: %s", e)
+                await self.error(500, "Internal Server Error", scope, receive, send)
+                return
+
+        if stored is not None:
+            if stored.fingerprint != fingerprint:
+                await self.error(
+                    422,
+                    "Idempotency-Key was already used for a different request",
+                    scope,
+                    receive,
+                    send,
+                )
+                return
+            logger.info("Replaying response for idempotency key")
+            await stored.replay()(scope, receive, send)
+            return
+
+        await self.run(
+            scope,
+            self.replay_body(body, receive),
+            send,
+            key,
+            fingerprint,
+            reservation,
+        )
+
+    async def lookup(
+        self, key: str, fingerprint: str, reservation: str
+    ) -> StoredResponse | None:
+        """Finds the stored response of a key, or reserves the key for this request
+
+        Args:
+            key (str): The hashed idempotency key
+            fingerprint (str): The hashed request body
+            reservation (str): Random token identifying this request's reservation
+
+        Raises:
+            IdempotencyConflictError: If the key is reserved by a request still running,
+            or by a request with a different body
+
+        Returns:
+            StoredResponse | None: The stored response, or None if the key was reserved
+        """
+        async with db_session_manager.session() as session:
+            repository = IdempotencyRepository(session)
+            row = await repository.get_live(key)
+            if row is None and await repository.reserve(
+                key, fingerprint, reservation, self.lock_timeout
+            ):
+                self.schedule_purge()
+                return None
+            if row is None:
+                # Reserved by a concurrent request between the lookup and the reservation
+                row = await repository.get_live(key)
+
+        if row is None or row.status_code is None:
+            if row is not None and row.fingerprint != fingerprint:
+                raise IdempotencyConflictError(
+                    422, "Idempotency-Key was already used for a different request"
+                )
+            raise IdempotencyConflictError(
+                409, "A request with this Idempotency-Key is already in progress"
+            )
+
+        stored = StoredResponse(
+            row.fingerprint,
+            row.status_code,
+            row.content_type,
+            [(name, value) for name, value in row.headers or []],
+            row.body or b"",
+        )
+        self.cache.put(
+            key, stored, min(self.ttl, row.expires_at.timestamp() - time.time())
+        )
+        return stored
+
+    async def run(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        key: str,
+        fingerprint: str,
+        reservation: str,
+    ) -> None:
+        """Runs the request, capturing its response to store against the reserved key"""
+        status_code, content_type = 500, None
+        headers: List[Tuple[str, str]] = []
+        chunks: List[bytes] = []
+        size = 0
+
+        async def capture(message: Message) -> None:
+            nonlocal status_code, content_type, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_type = Headers(raw=message["headers"]).get("content-type")
+                headers.extend(
+                    (name.decode("latin-1"), value.decode("latin-1"))
+                    for name, value in message["headers"]
+                    if name.decode("latin-1").lower() not in UNSTORED_HEADERS
+                )
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+                if size <= self.max_response_size:
+                    chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, capture)
+        except BaseException:
+            await self.release(key, reservation)
+            raise
+
+        if status_code >= 500 or size > self.max_response_size:
+            await self.release(key, reservation)
+            return
+
+        stored = StoredResponse(
+            fingerprint, status_code, content_type, headers, b"".join(chunks)
+        )
+        try:
+            async with db_session_manager.session() as session:
+                completed = await IdempotencyRepository(session).complete(
+                    key,
+                    reservation,
+                    status_code,
+                    content_type,
+                    headers,
+                    stored.body,
+                    self.ttl,
+                )
+            if completed:
+                self.cache.put(key, stored, self.ttl)
+            else:
+                logger.warning(
+                    "Idempotency key reservation expired before its request completed"
+                )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Error storing idempotent response: %s", e)
+
+    async def release(self, key: str, reservation: str) -> None:
+        """Drops a key's reservation so a retry of its failed request runs again"""
+        try:
+            async with db_session_manager.session() as session:
+                await IdempotencyRepository(session).release(key, reservation)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Error releasing idempotency key: %s", e)
+
+    def schedule_purge(self) -> None:
+        """Deletes the expired keys in the background, at most once per purge interval"""
+        if time.monotonic() < self._next_purge:
+            return
+        self._next_purge = time.monotonic() + self.purge_interval
+        task = asyncio.create_task(self.purge())
+        self._purges.add(task)
+        task.add_done_callback(self._purges.discard)
+
+    async def purge(self) -> None:
+        """Deletes the expired keys"""
+        try:
+            async with db_session_manager.session() as session:
+                await IdempotencyRepository(session).purge_expired()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Error purging idempotency keys: %s", e)
+
+    @staticmethod
+    def scope_key(scope: Scope, headers: Headers, idempotency_key: str) -> str:
+        """Hashes a key with the request's method, path and credentials, so clients
+        cannot replay each other's responses
+
+        Args:
+            scope (Scope): The ASGI connection scope
+            headers (Headers): The request headers
+            idempotency_key (str): The Idempotency-Key header value
+
+        Returns:
+            str: The hashed key
+        """
+        parts = (
+            scope["method"],
+            scope["path"],
+            scope.get("query_string", b"").decode("latin-1"),
+            headers.get("authorization", ""),
+            cookie_parser(headers.get("cookie", "")).get("access_token", ""),
+            idempotency_key,
+        )
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    @staticmethod
+    async def read_body(receive: Receive) -> bytes:
+        """Reads the complete request body
+
+        Args:
+            receive (Receive): The ASGI receive callable of the server
+
+        Returns:
+            bytes: The request body
+        """
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    def replay_body(body: bytes, receive: Receive) -> Receive:
+        """Builds a receive callable serving the already read body to the application
+
+        Args:
+            body (bytes): The request body
+            receive (Receive): The ASGI receive callable of the server
+
+        Returns:
+            Receive: Returns the body once, then defers to the server
+        """
+        sent = False
+
+        async def replay() -> Message:
+            nonlocal sent
+            if sent:
+                return await receive()
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        return replay
+
+    @staticmethod
+    async def error(
+        status_code: int, detail: str, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Sends an error response in the shape of FastAPI's HTTPException responses"""
+        await JSONResponse({"detail": detail}, status_code=status_code)(
+            scope, receive, send
+        )
@@ -0,0 +1,72 @@
+"""Assignment events router module providing entry point for the assignment audit log API route."""
+
+import logging
+from typing import Annotated
+from fastapi import APIRouter, Depends, Query
+
+from api.dependencies import (
+    get_assignment_event_service,
+    get_response_renderer,
+    parse_optional_project_id,
+    parse_optional_user_id,
+    validate_admin,
+)
+from api.schemas.assignment_event import AssignmentEventPage, AssignmentEventType
+from api.schemas.auth import TokenData
+from api.services.interfaces.assignment_event_service_interface import (
+    IAssignmentEventService,
+)
+from api.utils.serializers import ResponseRenderer
+
+
+router = APIRouter(prefix="/api")
+
+logger = logging.getLogger(__name__)
+
+
+@router.get(
+    "/assignment_events", tags=["assignments"], response_model=AssignmentEventPage
+)
+async def get_assignment_events(
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    assignment_event_service: Annotated[
+        IAssignmentEventService, Depends(get_assignment_event_service)
+    ],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    user_id: Annotated[str | None, Depends(parse_optional_user_id)],
+    project_id: Annotated[str | None, Depends(parse_optional_project_id)],
+    event_type: AssignmentEventType | None = None,
+    before: Annotated[int | None, Query(ge=1)] = None,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+):
+    """GET /assignment_events route
+
+    Returns the assignment audit log, newest first: who assigned which user to (or
+    removed them from) which project, and who changed which project's status.
+    Pass the page's 'next_before' as 'before' to read the next page.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        assignment_event_service (Annotated[IAssignmentEventService, Depends): Assignment event service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        user_id (Annotated[str | None, Depends): Only return the user's events.
+        project_id (Annotated[str | None, Depends): Only return the project's events.
+        event_type (AssignmentEventType | None, optional): Only return events of this type. Defaults to None.
+        before (int | None, optional): Only return events older than this event id. Defaults to None.
+        limit (int, optional): The maximum number of events. Defaults to 50.
+
+    Returns:
+        AssignmentEventPage: The events and the cursor of the next page, if any
+    """
+
+    logger.info("user: %s invoked GET /assignment_events", token.username)
+    return renderer.render(
+        AssignmentEventPage,
+        await assignment_event_service.list_events(
+            limit=limit,
+            before=before,
+            user_id=user_id,
+            project_id=project_id,
+            event_type=event_type,
+        ),
+    )
@@ -0,0 +1,210 @@
+"""Assignments router module providing entry point for all 'assignment' API routes."""
+
+from datetime import datetime, timezone
+import logging
+from typing import Annotated, List
+from fastapi import APIRouter, Depends, Query
+from pydantic import AwareDatetime
+
+from api.dependencies import (
+    get_assignment_service,
+    get_response_renderer,
+    parse_assignment_id,
+    parse_optional_project_id,
+    parse_optional_user_id,
+    validate_admin,
+    validate_user,
+)
+from api.schemas.assignment import (
+    AssignmentCreate,
+    AssignmentOut,
+    AssignmentUpdate,
+    UtilisationReport,
+)
+from api.schemas.auth import TokenData
+from api.services.interfaces.assignment_service_interface import IAssignmentService
+from api.utils.serializers import ResponseRenderer
+
+
+router = APIRouter(prefix="/api")
+
+logger = logging.getLogger(__name__)
+
+
+@router.post("/assignment", tags=["assignments"], response_model=AssignmentOut)
+async def create_assignment(
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    assignment: AssignmentCreate,
+    assignment_service: Annotated[
+        IAssignmentService, Depends(get_assignment_service)
+    ],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """POST /assignment route
+
+    Validates and creates a new assignment of a user to a project.
+    Fails with a 409 if the user would be allocated more than 100% at any time
+    of the assignment, or is already assigned to the project within it.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        assignment (AssignmentCreate): The assignment object - validated by the AssignmentCreate model.
+        assignment_service (Annotated[IAssignmentService, Depends): The application assignment service.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        Assignment: The created assignment entity - validated against the AssignmentOut model.
+    """
+
+    logger.info("user: %s invoked POST /assignment", token.username)
+    return renderer.render(
+        AssignmentOut,
+        await assignment_service.create_assignment(assignment=assignment),
+    )
+
+
+@router.get(
+    "/assignments", tags=["assignments"], response_model=List[AssignmentOut]
+)
+async def get_assignments(
+    token: Annotated[TokenData, Depends(validate_user)],  # User
+    assignment_service: Annotated[
+        IAssignmentService, Depends(get_assignment_service)
+    ],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    user_id: Annotated[str | None, Depends(parse_optional_user_id)],
+    project_id: Annotated[str | None, Depends(parse_optional_project_id)],
+    at: AwareDatetime | None = None,
+):
+    """GET /assignments route
+
+    Returns who is assigned to what at an instant, optionally for a single user or project.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        assignment_service (Annotated[IAssignmentService, Depends): Assignment service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        user_id (Annotated[str | None, Depends): Only return the user's assignments.
+        project_id (Annotated[str | None, Depends): Only return the project's assignments.
+        at (AwareDatetime | None, optional): The instant, with a timezone. Defaults to now.
+
+    Returns:
+        List[Assignment]: The assignments valid at the instant.
+    """
+
+    logger.info("user: %s invoked GET /assignments", token.username)
+    return renderer.render(
+        List[AssignmentOut],
+        await assignment_service.list_assignments(
+            at=at or datetime.now(timezone.utc),
+            user_id=user_id,
+            project_id=project_id,
+        ),
+    )
+
+
+@router.get(
+    "/assignments/utilisation",
+    tags=["assignments"],
+    response_model=UtilisationReport,
+)
+async def get_utilisation(
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    assignment_service: Annotated[
+        IAssignmentService, Depends(get_assignment_service)
+    ],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    starts_at: Annotated[AwareDatetime, Query()],
+    ends_at: Annotated[AwareDatetime, Query()],
+    user_id: Annotated[str | None, Depends(parse_optional_user_id)],
+):
+    """GET /assignments/utilisation route
+
+    Returns each user's allocation over a window, weighted by the share of the window
+    each assignment covers. Users without assignments in the window are left out.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        assignment_service (Annotated[IAssignmentService, Depends): Assignment service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        starts_at (AwareDatetime): The start of the window (inclusive), with a timezone.
+        ends_at (AwareDatetime): The end of the window (exclusive), with a timezone.
+        user_id (Annotated[str | None, Depends): Only report the user.
+
+    Returns:
+        UtilisationReport: The utilisation of every user assigned within the window.
+    """
+
+    logger.info("user: %s invoked GET /assignments/utilisation", token.username)
+    return renderer.render(
+        UtilisationReport,
+        await assignment_service.get_utilisation(
+            starts_at=starts_at, ends_at=ends_at, user_id=user_id
+        ),
+    )
+
+
+@router.put(
+    "/assignment/{assignment_id}", tags=["assignments"], response_model=AssignmentOut
+)
+async def update_assignment(
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    assignment_service: Annotated[
+        IAssignmentService, Depends(get_assignment_service)
+    ],
+    assignment_id: Annotated[str, Depends(parse_assignment_id)],
+    assignment: AssignmentUpdate,
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """PUT /assignment/{assignment_id} route
+
+    Replaces the allocation and validity of an existing assignment
+    (validated against the AssignmentUpdate model)
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        assignment_service (Annotated[IAssignmentService, Depends): Assignment service
+        assignment_id (Annotated[str, Depends): The assignment ID to update.
+        assignment (AssignmentUpdate): The assignment object - validated by the AssignmentUpdate model.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        Assignment: The updated assignment entity
+    """
+
+    logger.info("user: %s invoked PUT /assignment/%s", token.username, assignment_id)
+    return renderer.render(
+        AssignmentOut,
+        await assignment_service.update_assignment(
+            assignment_id=assignment_id, assignment=assignment
+        ),
+    )
+
+
+@router.delete(
+    "/assignment/{assignment_id}", tags=["assignments"], status_code=204
+)
+async def delete_assignment(
+    assignment_id: Annotated[str, Depends(parse_assignment_id)],
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    assignment_service: Annotated[
+        IAssignmentService, Depends(get_assignment_service)
+    ],
+):
+    """DELETE /assignment/{assignment_id} route
+
+    Looks for and deletes an existing assignment entity.
+
+    Args:
+        assignment_id (Annotated[str, Depends): ID of assignment to delete
+        token (Annotated[TokenData, Depends): JWT
+        assignment_service (Annotated[IAssignmentService, Depends): Assignment service
+
+    Returns:
+        None: A 204 response returned to client if successful.
+    """
+
+    logger.info(
+        "user: %s invoked DELETE /assignment/%s", token.username, assignment_id
+    )
+    await assignment_service.delete_assignment(assignment_id=assignment_id)
@@ -0,0 +1,91 @@
+"""Auto-staffing router module providing entry point for the auto-staffing API routes."""
+
+import logging
+from typing import Annotated
+from fastapi import APIRouter, Depends
+
+from api.dependencies import (
+    get_auto_staffing_service,
+    get_response_renderer,
+    validate_admin,
+)
+from api.schemas.auth import TokenData
+from api.schemas.auto_staffing import (
+    StaffingPlan,
+    StaffingPlanApply,
+    StaffingPlanResult,
+    StaffingTargets,
+)
+from api.services.interfaces.auto_staffing_service_interface import (
+    IAutoStaffingService,
+)
+from api.utils.serializers import ResponseRenderer
+
+
+router = APIRouter(prefix="/api")
+
+logger = logging.getLogger(__name__)
+
+
+@router.post("/staffing/plan", tags=["staffing"], response_model=StaffingPlan)
+async def propose_staffing_plan(
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    targets: StaffingTargets,
+    auto_staffing_service: Annotated[
+        IAutoStaffingService, Depends(get_auto_staffing_service)
+    ],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """POST /staffing/plan route
+
+    Proposes an optimal assignment of the active, unassigned engineers to the open
+    slots (target less current headcount) of active DESIGN and BUILD projects.
+    Nothing is changed until the plan is applied with POST /staffing/apply.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        targets (StaffingTargets): Target headcounts keyed by project id
+        auto_staffing_service (Annotated[IAutoStaffingService, Depends): The application auto-staffing service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        StaffingPlan: The proposed assignments and the slots left open
+    """
+
+    logger.info("user: %s invoked POST /staffing/plan", token.username)
+    return renderer.render(
+        StaffingPlan, await auto_staffing_service.propose_plan(targets=targets)
+    )
+
+
+@router.post(
+    "/staffing/apply", tags=["staffing"], response_model=StaffingPlanResult
+)
+async def apply_staffing_plan(
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    plan: StaffingPlanApply,
+    auto_staffing_service: Annotated[
+        IAutoStaffingService, Depends(get_auto_staffing_service)
+    ],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """POST /staffing/apply route
+
+    Assigns the users of a (possibly edited) plan to their projects in a single batch
+    update. Users assigned a project since the plan was proposed are skipped.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        plan (StaffingPlanApply): The planned assignments
+        auto_staffing_service (Annotated[IAutoStaffingService, Depends): The application auto-staffing service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        StaffingPlanResult: The users assigned and the users skipped
+    """
+
+    logger.info("user: %s invoked POST /staffing/apply", token.username)
+    return renderer.render(
+        StaffingPlanResult,
+        await auto_staffing_service.apply_plan(plan=plan, actor=token.username),
+    )
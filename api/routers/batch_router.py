@@ -0,0 +1,334 @@
+"""Batch router module providing entry point for batched read operations."""
+
+import asyncio
+import logging
+from typing import Annotated, Any, Awaitable, Callable, Dict, List, Mapping, Tuple
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.config import app_config
+from api.database.session import db_session_manager
+from api.dependencies import (
+    get_auth_service,
+    get_customer_repository,
+    get_customer_service,
+    get_project_repository,
+    get_project_service,
+    get_response_renderer,
+    get_unit_of_work,
+    get_user_repository,
+    get_user_service,
+    parse_current_user_include,
+    parse_customer_fields,
+    parse_customer_include,
+    parse_optional_ids,
+    parse_project_fields,
+    parse_project_include,
+    parse_user_fields,
+    parse_user_include,
+    validate_admin,
+    validate_user,
+)
+from api.schemas.auth import TokenData
+from api.schemas.batch import (
+    BatchOperation,
+    BatchOperationName,
+    BatchRequest,
+    BatchResponse,
+    BatchResult,
+)
+from api.schemas.relationships import expand_response_model
+from api.utils.exceptions import ExceptionHandler
+from api.utils.fieldsets import FieldSet, list_of
+from api.utils.serializers import ResponseRenderer
+
+
+router = APIRouter(prefix="/api")
+
+logger = logging.getLogger(__name__)
+
+# An operation handler returns the response model, content and fieldset to render
+OperationResult = Tuple[Any, Any, FieldSet]
+OperationHandler = Callable[
+    [AsyncSession, TokenData, Mapping[str, str]], Awaitable[OperationResult]
+]
+
+
+def parse_param_uuid(params: Mapping[str, str], name: str) -> str | None:
+    """Parses an optional UUID operation parameter to a string
+
+    Args:
+        params (Mapping[str, str]): The operation parameters
+        name (str): The parameter name
+
+    Raises:
+        HTTPException: 400 if the value is not a valid UUID
+
+    Returns:
+        str | None: UUID in string format, or None if the parameter is absent
+    """
+
+    value = params.get(name)
+    if value is None:
+        return None
+    try:
+        return str(UUID(value))
+    except ValueError:
+        ExceptionHandler.raise_http_exception(400, f"Invalid {name}: {value}")
+
+
+async def current_user(
+    session: AsyncSession, token: TokenData, params: Mapping[str, str]
+) -> OperationResult:
+    """'users.me' operation - equivalent of GET /users/me"""
+
+    fields = parse_user_fields.parse(params.items())
+    plan = parse_current_user_include.parse(params).restrict(fields)
+    user_repository = get_user_repository(session)
+    user_service = get_user_service(
+        user_repository, get_auth_service(user_repository), get_unit_of_work(session)
+    )
+    return (
+        expand_response_model(plan),
+        await user_service.get_current_user(
+            token_data=token, include=plan.paths(), fields=fields.selected()
+        ),
+        fields,
+    )
+
+
+async def get_user(
+    session: AsyncSession, token: TokenData, params: Mapping[str, str]
+) -> OperationResult:
+    """'users.get' operation - equivalent of GET /user/{user_id} (Admin)"""
+
+    validate_admin(token)
+    user_id = parse_param_uuid(params, "user_id")
+    if user_id is None:
+        ExceptionHandler.raise_http_exception(400, "user_id must be provided")
+    fields = parse_user_fields.parse(params.items())
+    plan = parse_user_include.parse(params).restrict(fields)
+    user_repository = get_user_repository(session)
+    user_service = get_user_service(
+        user_repository, get_auth_service(user_repository), get_unit_of_work(session)
+    )
+    return (
+        expand_response_model(plan),
+        await user_service.get_user_by_id(
+            user_id=user_id, include=plan.paths(), fields=fields.selected()
+        ),
+        fields,
+    )
+
+
+async def list_users(
+    session: AsyncSession, token: TokenData, params: Mapping[str, str]
+) -> OperationResult:
+    """'users.list' operation - equivalent of GET /users (Admin)"""
+
+    validate_admin(token)
+    fields = parse_user_fields.parse(params.items())
+    plan = parse_user_include.parse(params).restrict(fields)
+    user_repository = get_user_repository(session)
+    user_service = get_user_service(
+        user_repository, get_auth_service(user_repository), get_unit_of_work(session)
+    )
+    return (
+        list_of(expand_response_model(plan)),
+        await user_service.list_users(
+            include=plan.paths(),
+            fields=fields.selected(),
+            ids=parse_optional_ids(params.get("ids")),
+        ),
+        fields,
+    )
+
+
+async def get_customer(
+    session: AsyncSession, token: TokenData, params: Mapping[str, str]
+) -> OperationResult:
+    """'customers.get' operation - equivalent of GET /customer"""
+
+    customer_id = parse_param_uuid(params, "customer_id")
+    fields = parse_customer_fields.parse(params.items())
+    plan = parse_customer_include.parse(params).restrict(fields)
+    customer_service = get_customer_service(
+        get_customer_repository(session),
+        get_project_repository(session),
+        get_unit_of_work(session),
+    )
+    return (
+        expand_response_model(plan),
+        await customer_service.get_customer(
+            name=params.get("name"),
+            customer_id=customer_id,
+            include=plan.paths(),
+            fields=fields.selected(),
+        ),
+        fields,
+    )
+
+
+async def list_customers(
+    session: AsyncSession, token: TokenData, params: Mapping[str, str]
+) -> OperationResult:
+    """'customers.list' operation - equivalent of GET /customers"""
+
+    fields = parse_customer_fields.parse(params.items())
+    plan = parse_customer_include.parse(params).restrict(fields)
+    customer_service = get_customer_service(
+        get_customer_repository(session),
+        get_project_repository(session),
+        get_unit_of_work(session),
+    )
+    return (
+        list_of(expand_response_model(plan)),
+        await customer_service.list_customers(
+            include=plan.paths(),
+            fields=fields.selected(),
+            ids=parse_optional_ids(params.get("ids")),
+        ),
+        fields,
+    )
+
+
+async def get_project(
+    session: AsyncSession, token: TokenData, params: Mapping[str, str]
+) -> OperationResult:
+    """'projects.get' operation - equivalent of GET /project"""
+
+    project_id = parse_param_uuid(params, "project_id")
+    fields = parse_project_fields.parse(params.items())
+    plan = parse_project_include.parse(params).restrict(fields)
+    project_service = get_project_service(get_project_repository(session))
+    return (
+        expand_response_model(plan),
+        await project_service.get_project(
+            name=params.get("name"),
+            project_id=project_id,
+            include=plan.paths(),
+            fields=fields.selected(),
+        ),
+        fields,
+    )
+
+
+async def list_projects(
+    session: AsyncSession, token: TokenData, params: Mapping[str, str]
+) -> OperationResult:
+    """'projects.list' operation - equivalent of GET /projects"""
+
+    fields = parse_project_fields.parse(params.items())
+    plan = parse_project_include.parse(params).restrict(fields)
+    project_service = get_project_service(get_project_repository(session))
+    return (
+        list_of(expand_response_model(plan)),
+        await project_service.list_projects(
+            include=plan.paths(),
+            fields=fields.selected(),
+            ids=parse_optional_ids(params.get("ids")),
+        ),
+        fields,
+    )
+
+
+OPERATION_HANDLERS: Dict[BatchOperationName, OperationHandler] = {
+    BatchOperationName.CURRENT_USER: current_user,
+    BatchOperationName.GET_USER: get_user,
+    BatchOperationName.LIST_USERS: list_users,
+    BatchOperationName.GET_CUSTOMER: get_customer,
+    BatchOperationName.LIST_CUSTOMERS: list_customers,
+    BatchOperationName.GET_PROJECT: get_project,
+    BatchOperationName.LIST_PROJECTS: list_projects,
+}
+
+
+async def run_operation(
+    operation: BatchOperation,
+    token: TokenData,
+    renderer: ResponseRenderer,
+    semaphore: asyncio.Semaphore,
+) -> BatchResult:
+    """Runs a single batched operation in its own database session
+
+    Errors are reported in the operation's result rather than failing the batch.
+
+    Args:
+        operation (BatchOperation): The operation to run
+        token (TokenData): The batch's decoded JWT
+        renderer (ResponseRenderer): Response renderer
+        semaphore (asyncio.Semaphore): Limits the operations (and connections) in flight
+
+    Returns:
+        BatchResult: The operation's status with its data or error detail
+    """
+
+    async with semaphore:
+        try:
+            async with db_session_manager.session() as session:
+                response_model, content, fields = await OPERATION_HANDLERS[
+                    operation.op
+                ](session, token, operation.params)
+                return BatchResult(
+                    status=200,
+                    data=renderer.dump(response_model, content, fields=fields),
+                )
+        except HTTPException as e:
+            return BatchResult(status=e.status_code, error=e.detail)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error(
+                "Batch operation %s (%s) failed: %s", operation.id, operation.op.value, e
+            )
+            return BatchResult(status=500, error="Internal Server Error")
+
+
+@router.post("/batch", tags=["batch"], response_model=BatchResponse)
+async def run_batch(
+    batch: BatchRequest,
+    token: Annotated[TokenData, Depends(validate_user)],  # User
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """POST /batch route
+
+    Runs a list of read operations concurrently behind a single authentication check.
+    Each operation takes the query parameters of its equivalent GET route and runs in
+    its own database session, at most BATCH_MAX_CONCURRENCY at a time.
+    Admin only operations ('users.get', 'users.list') fail individually with a 403 for other users.
+
+    Args:
+        batch (BatchRequest): The operations to run
+        token (Annotated[TokenData, Depends): JWT
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        BatchResponse: Each operation's status and data or error, keyed by operation id
+    """
+
+    logger.info(
+        "user: %s invoked POST /batch with %s operations",
+        token.username,
+        len(batch.operations),
+    )
+    if len(batch.operations) > app_config.batch_max_operations:
+        ExceptionHandler.raise_http_exception(
+            400,
+            f"A batch may contain at most {app_config.batch_max_operations} operations",
+        )
+
+    semaphore = asyncio.Semaphore(app_config.batch_max_concurrency)
+    results = await asyncio.gather(
+        *(
+            run_operation(operation, token, renderer, semaphore)
+            for operation in batch.operations
+        )
+    )
+    return renderer.render(
+        BatchResponse,
+        {
+            "results": {
+                operation.id: result
+                for operation, result in zip(batch.operations, results)
+            }
+        },
+    )
@@ -0,0 +1,94 @@
+"""Bulk router module providing entry point for all bulk import and export API routes."""
+
+import logging
+from typing import Annotated
+from fastapi import APIRouter, Depends, Query, UploadFile
+from fastapi.responses import StreamingResponse
+
+from api.dependencies import get_bulk_service, get_response_renderer, validate_admin
+from api.schemas.auth import TokenData
+from api.schemas.bulk import BulkEntity, ExportFormat, ImportFormat, ImportReport
+from api.services.interfaces.bulk_service_interface import IBulkService
+from api.utils.serializers import ResponseRenderer
+
+
+router = APIRouter(prefix="/api")
+
+logger = logging.getLogger(__name__)
+
+# Media type and file extension of each export format
+EXPORT_CONTENT_TYPES = {
+    ExportFormat.CSV: ("text/csv", "csv"),
+    ExportFormat.NDJSON: ("application/x-ndjson", "ndjson"),
+    ExportFormat.COLUMNAR: ("application/x-ndjson", "columnar.ndjson"),
+    ExportFormat.BINARY: ("application/octet-stream", "pgcopy"),
+}
+
+
+@router.post("/import/{entity}", tags=["bulk"], response_model=ImportReport)
+async def import_records(
+    entity: BulkEntity,
+    file: UploadFile,
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    bulk_service: Annotated[IBulkService, Depends(get_bulk_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    file_format: Annotated[ImportFormat, Query(alias="format")] = ImportFormat.CSV,
+):
+    """POST /import/{entity} route
+
+    Streams an uploaded CSV or NDJSON file of users, customers or projects into the database.
+    Rows are validated against the entity's creation model and loaded in batches.
+
+    Args:
+        entity (BulkEntity): The type of entity contained in the file
+        file (UploadFile): The uploaded file
+        token (Annotated[TokenData, Depends): JWT
+        bulk_service (Annotated[IBulkService, Depends): The application bulk service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        file_format (ImportFormat, optional): Format of the uploaded file. Defaults to CSV.
+
+    Returns:
+        ImportReport: Counts of processed, imported and failed rows with per-row errors
+    """
+
+    logger.info("user: %s invoked POST /import/%s", token.username, entity.value)
+    return renderer.render(
+        ImportReport,
+        await bulk_service.import_records(
+            entity=entity, stream=file.file, file_format=file_format
+        ),
+    )
+
+
+@router.get("/export/{entity}", tags=["bulk"], response_class=StreamingResponse)
+async def export_records(
+    entity: BulkEntity,
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    bulk_service: Annotated[IBulkService, Depends(get_bulk_service)],
+    file_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.CSV,
+):
+    """GET /export/{entity} route
+
+    Streams every user, customer or project directly from the database.
+    Formats: 'csv', 'ndjson', 'columnar' (NDJSON lines each holding a group of rows
+    stored column-wise) and 'binary' (the PostgreSQL binary COPY format).
+
+    Args:
+        entity (BulkEntity): The type of entity to export
+        token (Annotated[TokenData, Depends): JWT
+        bulk_service (Annotated[IBulkService, Depends): The application bulk service
+        file_format (ExportFormat, optional): The output format. Defaults to CSV.
+
+    Returns:
+        StreamingResponse: The streamed export as a file attachment
+    """
+
+    logger.info("user: %s invoked GET /export/%s", token.username, entity.value)
+    media_type, extension = EXPORT_CONTENT_TYPES[file_format]
+    return StreamingResponse(
+        bulk_service.export_records(entity=entity, file_format=file_format),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{entity.value}.{extension}"'
+        },
+    )
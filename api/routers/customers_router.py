@@ -1,23 +1,36 @@
 """'Customers' router module providing entry point for all 'customer' API routes."""
 
 import logging
-from typing import Annotated, List, Union
+from typing import Annotated, List
 from fastapi import APIRouter, Depends
 
+from api.database.loading import LoadPlan
 from api.dependencies import (
     get_customer_service,
+    get_response_renderer,
+    parse_customer_fields,
     parse_customer_id,
+    parse_customer_include,
+    parse_optional_ids,
     parse_optional_customer_id,
     validate_admin,
     validate_user,
 )
 from api.schemas.auth import TokenData
-from api.schemas.customer import CustomerCreate, CustomerOut, CustomerUpdate
+from api.schemas.customer import (
+    CustomerCreate,
+    CustomerOut,
+    CustomerUpdate,
+    CustomerWithProjectsCreate,
+)
 from api.schemas.relationships import (
+    CustomerResponse,
     CustomerWithProjectsOut,
-    CustomerWithProjectsUsersOut,
+    expand_response_model,
 )
 from api.services.interfaces.customer_service_interface import ICustomerService
+from api.utils.fieldsets import FieldSet, list_of
+from api.utils.serializers import ResponseRenderer
 
 
 router = APIRouter(prefix="/api")
@@ -30,6 +43,7 @@ async def create_customer(
     token: Annotated[TokenData, Depends(validate_admin)],  # Requires admin rights
     customer: CustomerCreate,
     customer_service: Annotated[ICustomerService, Depends(get_customer_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
 ):
     """POST /customer route
 
@@ -39,86 +53,138 @@ async def create_customer(
         token (Annotated[TokenData, Depends): JWT,
         customer (CustomerCreate): The customer object - validated by the CustomerCreate model.
         customer_service (Annotated[ICustomerService, Depends): The application customer service.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
 
     Returns:
         Customer: The updated customer entity - validated against the CustomerOut model.
     """
 
     logger.info("user: %s invoked POST /customer", token.username)
-    return await customer_service.create_customer(customer)
+    return renderer.render(
+        CustomerOut, await customer_service.create_customer(customer)
+    )
+
+
+@router.post(
+    "/customer/with_projects",
+    tags=["customers"],
+    response_model=CustomerWithProjectsOut,
+)
+async def create_customer_with_projects(
+    token: Annotated[TokenData, Depends(validate_admin)],  # Requires admin rights
+    customer: CustomerWithProjectsCreate,
+    customer_service: Annotated[ICustomerService, Depends(get_customer_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """POST /customer/with_projects route
+
+    Validates and creates a new customer together with its projects in a single
+    transaction - if the customer or any project name is taken, nothing is created.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT,
+        customer (CustomerWithProjectsCreate): The customer and its projects - validated by the CustomerWithProjectsCreate model.
+        customer_service (Annotated[ICustomerService, Depends): The application customer service.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        Customer: The created customer entity with its projects - validated against the CustomerWithProjectsOut model.
+    """
+
+    logger.info("user: %s invoked POST /customer/with_projects", token.username)
+    return renderer.render(
+        CustomerWithProjectsOut,
+        await customer_service.create_customer_with_projects(customer),
+    )
 
 
 @router.get(
     "/customer",
     tags=["customers"],
-    response_model=Union[
-        CustomerOut | CustomerWithProjectsOut | CustomerWithProjectsUsersOut
-    ],
+    response_model=CustomerResponse,
 )
 async def get_customer(
     token: Annotated[TokenData, Depends(validate_user)],  # User
     customer_service: Annotated[ICustomerService, Depends(get_customer_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
     customer_id: Annotated[str | None, Depends(parse_optional_customer_id)],
+    fields: Annotated[FieldSet, Depends(parse_customer_fields)],
+    include: Annotated[LoadPlan, Depends(parse_customer_include)],
     name: str | None = None,
-    projects: bool = False,
-    users: bool = False,
 ):
     """GET /customer route
 
     Looks for and returns a specified customer by id or name.
     Provides option to return the customer with related projects and users.
+    (The legacy 'projects=true' and 'users=true' flags are still accepted)
 
     Args:
         token (Annotated[TokenData, Depends): JWT
         customer_service (Annotated[ICustomerService, Depends): Customer service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
         customer_id (Annotated[str  |  None, Depends): The customer ID to search for.
+        fields (Annotated[FieldSet, Depends): Sparse fieldset - 'fields' and 'fields[<relation>]'
+        include (Annotated[LoadPlan, Depends): Relations to load - 'include=projects.users'.
         name (str | None, optional): The customer name to search for. Defaults to None.
-        projects (bool, optional): Set True if customer related 'Projects' required in the response.
-        Defaults to False.
-        users (bool, optional): Set True if customer related 'Users' required in the response..
-        Defaults to False.
 
     Returns:
        Customer: The updated customer entity - validated against the CustomerOut model.
     """
 
     logger.info("user: %s invoked GET /customer", token.username)
-    return await customer_service.get_customer(
-        name=name, customer_id=customer_id, projects=projects, users=users
+    plan = include.restrict(fields)
+    return renderer.render(
+        expand_response_model(plan),
+        await customer_service.get_customer(
+            name=name,
+            customer_id=customer_id,
+            include=plan.paths(),
+            fields=fields.selected(),
+        ),
+        fields=fields,
     )
 
 
 @router.get(
     "/customers",
     tags=["customers"],
-    response_model=List[
-        Union[CustomerOut | CustomerWithProjectsOut | CustomerWithProjectsUsersOut]
-    ],
+    response_model=List[CustomerResponse],
 )
 async def get_all_customers(
     token: Annotated[TokenData, Depends(validate_user)],  # User
     customer_service: Annotated[ICustomerService, Depends(get_customer_service)],
-    projects: bool = False,
-    users: bool = False,
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    fields: Annotated[FieldSet, Depends(parse_customer_fields)],
+    include: Annotated[LoadPlan, Depends(parse_customer_include)],
+    ids: Annotated[List[str] | None, Depends(parse_optional_ids)],
 ):
     """GET /customers route
 
-    Returns all customer entities in the database.
+    Returns all customer entities in the database, or only those listed in 'ids=...'
+    in the same order (looked up in a single query).
+    (The legacy 'projects=true' and 'users=true' flags are still accepted)
 
     Args:
         token (Annotated[TokenData, Depends): JWT
         customer_service (Annotated[ICustomerService, Depends): Customer service
-        projects (bool, optional): Set True if customer related 'Projects' required in the response.
-        Defaults to False.
-        users (bool, optional): Set True if customer related 'Users' required in the response.
-        Defaults to False.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        fields (Annotated[FieldSet, Depends): Sparse fieldset - 'fields' and 'fields[<relation>]'
+        include (Annotated[LoadPlan, Depends): Relations to load - 'include=projects.users'.
+        ids (Annotated[List[str] | None, Depends): Comma separated customer IDs to return.
 
     Returns:
        List[Customer]: A list of all customer entities in the database.
     """
 
     logger.info("user: %s invoked GET /customers", token.username)
-    return await customer_service.list_customers(projects, users)
+    plan = include.restrict(fields)
+    return renderer.render(
+        list_of(expand_response_model(plan)),
+        await customer_service.list_customers(
+            include=plan.paths(), fields=fields.selected(), ids=ids
+        ),
+        fields=fields,
+    )
 
 
 @router.put("/customer/{customer_id}", tags=["customers"], response_model=CustomerOut)
@@ -127,6 +193,7 @@ async def update_customer(
     customer_service: Annotated[ICustomerService, Depends(get_customer_service)],
     customer_id: Annotated[str, Depends(parse_customer_id)],
     customer: CustomerUpdate,
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
 ):
     """PUT /customer/{customer_id} route
 
@@ -138,14 +205,18 @@ async def update_customer(
         customer_service (Annotated[ICustomerService, Depends): Customer service
         customer_id (Annotated[str, Depends): Customer Service
         customer (CustomerUpdate): The customer request validated against the CustomerCreate model
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
 
     Returns:
         Customer: The updated customer entity
     """
 
     logger.info("user: %s invoked PUT /customers/%s", token.username, customer_id)
-    return await customer_service.update_customer(
-        customer_id=customer_id, customer=customer
+    return renderer.render(
+        CustomerOut,
+        await customer_service.update_customer(
+            customer_id=customer_id, customer=customer
+        ),
     )
 
 
@@ -0,0 +1,146 @@
+"""Jobs router module providing entry point for all background job API routes."""
+
+import logging
+from typing import Annotated
+from fastapi import APIRouter, Body, Depends, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from pydantic import UUID4
+
+from api.dependencies import get_job_service, get_response_renderer, validate_admin
+from api.routers.bulk_router import EXPORT_CONTENT_TYPES
+from api.schemas.auth import TokenData
+from api.schemas.bulk import BulkEntity, ExportFormat, ImportFormat
+from api.schemas.job import JobCreate, JobOut
+from api.services.interfaces.job_service_interface import IJobService
+from api.utils.serializers import ResponseRenderer
+
+
+router = APIRouter(prefix="/api")
+
+logger = logging.getLogger(__name__)
+
+
+@router.post("/jobs", tags=["jobs"], response_model=JobOut, status_code=202)
+async def create_job(
+    job: Annotated[JobCreate, Body(discriminator="kind")],
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    job_service: Annotated[IJobService, Depends(get_job_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """POST /jobs route
+
+    Queues an export ('EXPORT'), a staffing report refresh ('STAFFING_REFRESH') or an
+    auto-staffing plan ('STAFFING_PLAN') to run in the background.
+    Poll GET /jobs/{job_id} for its progress and result.
+
+    Args:
+        job (JobCreate): The kind of job and its parameters
+        token (Annotated[TokenData, Depends): JWT
+        job_service (Annotated[IJobService, Depends): The application job service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        JobOut: The queued job
+    """
+
+    logger.info("user: %s invoked POST /jobs (%s)", token.username, job.kind.value)
+    return renderer.render(
+        JobOut, await job_service.enqueue(job, actor=token.username), status_code=202
+    )
+
+
+@router.post(
+    "/jobs/import/{entity}", tags=["jobs"], response_model=JobOut, status_code=202
+)
+async def create_import_job(
+    entity: BulkEntity,
+    file: UploadFile,
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    job_service: Annotated[IJobService, Depends(get_job_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    file_format: Annotated[ImportFormat, Query(alias="format")] = ImportFormat.CSV,
+):
+    """POST /jobs/import/{entity} route
+
+    Queues the import of an uploaded CSV or NDJSON file to run in the background -
+    the equivalent of POST /import/{entity} for files too large to import within a request.
+    The job's result is the import report. The upload, spooled to disk by the
+    multipart parser once large, is copied to the job in chunks.
+
+    Args:
+        entity (BulkEntity): The type of entity contained in the file
+        file (UploadFile): The uploaded file
+        token (Annotated[TokenData, Depends): JWT
+        job_service (Annotated[IJobService, Depends): The application job service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        file_format (ImportFormat, optional): Format of the uploaded file. Defaults to CSV.
+
+    Returns:
+        JobOut: The queued job
+    """
+
+    logger.info("user: %s invoked POST /jobs/import/%s", token.username, entity.value)
+    return renderer.render(
+        JobOut,
+        await job_service.enqueue_import(
+            entity, file_format, file.file, actor=token.username
+        ),
+        status_code=202,
+    )
+
+
+@router.get("/jobs/{job_id}", tags=["jobs"], response_model=JobOut)
+async def get_job(
+    job_id: UUID4,
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    job_service: Annotated[IJobService, Depends(get_job_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """GET /jobs/{job_id} route
+
+    Returns a job's status, progress and, once finished, its result or error.
+    'progress' counts the records processed by imports and the bytes written by exports.
+
+    Args:
+        job_id (UUID4): The job's id
+        token (Annotated[TokenData, Depends): JWT
+        job_service (Annotated[IJobService, Depends): The application job service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        JobOut: The job
+    """
+
+    logger.info("user: %s invoked GET /jobs/%s", token.username, job_id)
+    return renderer.render(JobOut, await job_service.get_job(str(job_id)))
+
+
+@router.get("/jobs/{job_id}/output", tags=["jobs"], response_class=StreamingResponse)
+async def get_job_output(
+    job_id: UUID4,
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    job_service: Annotated[IJobService, Depends(get_job_service)],
+):
+    """GET /jobs/{job_id}/output route
+
+    Streams the file written by a succeeded export job, one stored chunk at a time.
+
+    Args:
+        job_id (UUID4): The job's id
+        token (Annotated[TokenData, Depends): JWT
+        job_service (Annotated[IJobService, Depends): The application job service
+
+    Returns:
+        StreamingResponse: The file as an attachment
+    """
+
+    logger.info("user: %s invoked GET /jobs/%s/output", token.username, job_id)
+    job, output = await job_service.get_output(str(job_id))
+    file_format = ExportFormat(job.params.get("format", ExportFormat.CSV.value))
+    media_type, extension = EXPORT_CONTENT_TYPES[file_format]
+    filename = f"{job.params.get('entity', 'job')}.{extension}"
+    return StreamingResponse(
+        output,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
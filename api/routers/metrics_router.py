@@ -0,0 +1,48 @@
+"""Metrics router module providing entry point for application metrics API routes."""
+
+import logging
+from typing import Annotated
+from fastapi import APIRouter, Depends
+
+from api.database.repository import read_flight
+from api.dependencies import get_response_renderer, validate_admin
+from api.schemas.auth import TokenData
+from api.schemas.metrics import Metrics
+from api.services.assignment_event_service import audit_log
+from api.services.job_worker import job_worker
+from api.utils.serializers import ResponseRenderer
+
+
+router = APIRouter(prefix="/api")
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/metrics", tags=["metrics"], response_model=Metrics)
+async def get_metrics(
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """GET /metrics route
+
+    Returns this worker process's metrics, such as how many identical
+    concurrent reads were coalesced into a single query, how many
+    audit events were written or dropped and how many background jobs it ran.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        Metrics: The worker's metrics since it started
+    """
+
+    logger.info("user: %s invoked GET /metrics", token.username)
+    return renderer.render(
+        Metrics,
+        {
+            "single_flight": read_flight.stats(),
+            "audit_log": audit_log.stats(),
+            "job_worker": job_worker.stats(),
+        },
+    )
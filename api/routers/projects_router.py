@@ -1,23 +1,30 @@
 """Projects router module providing entry point for all 'project' API routes."""
 
 import logging
-from typing import Annotated, List, Union
+from typing import Annotated, List
 from fastapi import APIRouter, Depends
 
+from api.database.loading import LoadPlan
 from api.dependencies import (
     get_project_service,
+    get_response_renderer,
+    parse_optional_ids,
     parse_optional_project_id,
+    parse_project_fields,
     parse_project_id,
+    parse_project_include,
     validate_admin,
     validate_user,
 )
 from api.schemas.auth import TokenData
 from api.schemas.project import ProjectCreate, ProjectOut, ProjectUpdate
 from api.schemas.relationships import (
-    ProjectWithCustomerOut,
-    ProjectWithUsersCustomerOut,
+    ProjectResponse,
+    expand_response_model,
 )
 from api.services.interfaces.project_service_interface import IProjectService
+from api.utils.fieldsets import FieldSet, list_of
+from api.utils.serializers import ResponseRenderer
 
 
 router = APIRouter(prefix="/api")
@@ -30,6 +37,7 @@ async def create_project(
     token: Annotated[TokenData, Depends(validate_admin)],  # Admin
     project: ProjectCreate,
     project_service: Annotated[IProjectService, Depends(get_project_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
 ):
     """POST /project route
 
@@ -39,39 +47,46 @@ async def create_project(
         token (Annotated[TokenData, Depends): JWT,
         project (ProjectCreate): The project object - validated by the ProjectCreate model.
         project_service (Annotated[IProjectService, Depends): The application project service.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
 
     Returns:
         Project: The updated project entity - validated against the ProjectOut model.
     """
 
     logger.info("user: %s invoked POST /project", token.username)
-    return await project_service.create_project(project=project)
+    return renderer.render(
+        ProjectOut, await project_service.create_project(project=project)
+    )
 
 
 @router.get(
     "/project",
     tags=["projects"],
-    response_model=Union[ProjectWithCustomerOut | ProjectWithUsersCustomerOut],
+    response_model=ProjectResponse,
 )
 async def get_project(
     token: Annotated[TokenData, Depends(validate_user)],  # User
     project_service: Annotated[IProjectService, Depends(get_project_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
     project_id: Annotated[str | None, Depends(parse_optional_project_id)],
+    fields: Annotated[FieldSet, Depends(parse_project_fields)],
+    include: Annotated[LoadPlan, Depends(parse_project_include)],
     name: str | None = None,
-    users: bool = False,
 ):
     """GET /project route
 
     Looks for and returns a specified project by id or name.
     Provides option to return the project with related users.
+    (The legacy 'users=true' flag is still accepted)
 
     Args:
         token (Annotated[TokenData, Depends): JWT
         project_service (Annotated[IProjectService, Depends): Project service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
         project_id (Annotated[str  |  None, Depends): The project ID to search for.
+        fields (Annotated[FieldSet, Depends): Sparse fieldset - 'fields' and 'fields[<relation>]'
+        include (Annotated[LoadPlan, Depends): Relations to load - 'include=users'.
         name (str | None, optional): The project name to search for. Defaults to None.
-        users (bool, optional): Set True if project related 'Users' required in the response.
-        Defaults to False.
 
     Returns:
        Project: The updated project entity
@@ -79,37 +94,59 @@ async def get_project(
     """
 
     logger.info("user: %s invoked GET /project", token.username)
-    return await project_service.get_project(
-        name=name, project_id=project_id, users=users
+    plan = include.restrict(fields)
+    return renderer.render(
+        expand_response_model(plan),
+        await project_service.get_project(
+            name=name,
+            project_id=project_id,
+            include=plan.paths(),
+            fields=fields.selected(),
+        ),
+        fields=fields,
     )
 
 
 @router.get(
     "/projects",
     tags=["projects"],
-    response_model=List[Union[ProjectWithCustomerOut | ProjectWithUsersCustomerOut]],
+    response_model=List[ProjectResponse],
 )
 async def get_all_projects(
     token: Annotated[TokenData, Depends(validate_user)],  # User
     project_service: Annotated[IProjectService, Depends(get_project_service)],
-    users: bool = False,
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    fields: Annotated[FieldSet, Depends(parse_project_fields)],
+    include: Annotated[LoadPlan, Depends(parse_project_include)],
+    ids: Annotated[List[str] | None, Depends(parse_optional_ids)],
 ):
     """GET /projects route
 
-    Returns all project entities in the database.
+    Returns all project entities in the database, or only those listed in 'ids=...'
+    in the same order (looked up in a single query).
+    (The legacy 'users=true' flag is still accepted)
 
     Args:
         token (Annotated[TokenData, Depends): JWT
         project_service (Annotated[IProjectService, Depends): Project service
-        users (bool, optional): Set True if project related 'Users' required in the response.
-        Defaults to False.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        fields (Annotated[FieldSet, Depends): Sparse fieldset - 'fields' and 'fields[<relation>]'
+        include (Annotated[LoadPlan, Depends): Relations to load - 'include=users'.
+        ids (Annotated[List[str] | None, Depends): Comma separated project IDs to return.
 
     Returns:
        List[Project]: A list of all project entities in the database.
     """
 
     logger.info("user %s invoked GET /projects", token.username)
-    return await project_service.list_projects(users=users)
+    plan = include.restrict(fields)
+    return renderer.render(
+        list_of(expand_response_model(plan)),
+        await project_service.list_projects(
+            include=plan.paths(), fields=fields.selected(), ids=ids
+        ),
+        fields=fields,
+    )
 
 
 @router.put("/project/{project_id}", tags=["projects"], response_model=ProjectOut)
@@ -118,6 +155,7 @@ async def update_project(
     project_service: Annotated[IProjectService, Depends(get_project_service)],
     project_id: Annotated[str, Depends(parse_project_id)],
     project: ProjectUpdate,
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
 ):
     """PUT /project/{project_id} route
 
@@ -129,13 +167,19 @@ async def update_project(
         project_service (Annotated[IProjectService, Depends): Project service
         project_id (Annotated[str  |  None, Depends): The project ID to search for.
         project (ProjectUpdate): The project object - validated by the ProjectUpdate model.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
 
     Returns:
         Project: The updated project entity
     """
 
     logger.info("user: %s invoked PUT /customers/%s", token.username, project_id)
-    return await project_service.update_project(project_id=project_id, project=project)
+    return renderer.render(
+        ProjectOut,
+        await project_service.update_project(
+            project_id=project_id, project=project, actor=token.username
+        ),
+    )
 
 
 @router.delete("/project/{project_id}", tags=["projects"], status_code=204)
@@ -0,0 +1,151 @@
+"""Reports router module providing entry point for all report API routes."""
+
+import logging
+from typing import Annotated
+from fastapi import APIRouter, Depends
+from pydantic import AwareDatetime
+
+from api.dependencies import (
+    get_report_service,
+    get_response_renderer,
+    parse_optional_customer_id,
+    parse_project_id,
+    validate_admin,
+    validate_user,
+)
+from api.schemas.auth import TokenData
+from api.schemas.project import ProjectStatus
+from api.schemas.report import (
+    ProjectStatusHistory,
+    StaffingReport,
+    TimeInStatusReport,
+)
+from api.services.interfaces.report_service_interface import IReportService
+from api.utils.serializers import ResponseRenderer
+
+
+router = APIRouter(prefix="/api")
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/reports/staffing", tags=["reports"], response_model=StaffingReport)
+async def get_staffing_report(
+    token: Annotated[TokenData, Depends(validate_user)],  # User
+    report_service: Annotated[IReportService, Depends(get_report_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    customer_id: Annotated[str | None, Depends(parse_optional_customer_id)],
+    status: ProjectStatus | None = None,
+):
+    """GET /reports/staffing route
+
+    Returns every project with its customer, headcount and role mix, read from the
+    'staffing_report' materialized view. The view is refreshed shortly after writes,
+    so 'refreshed_at' may trail the latest change by a few seconds.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        report_service (Annotated[IReportService, Depends): The application report service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        customer_id (Annotated[str  |  None, Depends): Only report the customer's projects.
+        status (ProjectStatus | None, optional): Only report projects in this status. Defaults to None.
+
+    Returns:
+        StaffingReport: The staffing rows and when the view was last refreshed
+    """
+
+    logger.info("user: %s invoked GET /reports/staffing", token.username)
+    return renderer.render(
+        StaffingReport,
+        await report_service.get_staffing_report(customer_id=customer_id, status=status),
+    )
+
+
+@router.post("/reports/staffing/refresh", tags=["reports"], status_code=204)
+async def refresh_staffing_report(
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    report_service: Annotated[IReportService, Depends(get_report_service)],
+):
+    """POST /reports/staffing/refresh route
+
+    Refreshes the staffing report immediately, e.g. after changes made outside the API.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        report_service (Annotated[IReportService, Depends): The application report service
+
+    Returns:
+        None
+    """
+
+    logger.info("user: %s invoked POST /reports/staffing/refresh", token.username)
+    await report_service.refresh_staffing_report()
+
+
+@router.get(
+    "/reports/time_in_status", tags=["reports"], response_model=TimeInStatusReport
+)
+async def get_time_in_status(
+    token: Annotated[TokenData, Depends(validate_user)],  # User
+    report_service: Annotated[IReportService, Depends(get_report_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    customer_id: Annotated[str | None, Depends(parse_optional_customer_id)],
+    since: AwareDatetime | None = None,
+):
+    """GET /reports/time_in_status route
+
+    Returns, per customer and status, how long projects stayed in the status before
+    moving on (mean, median, 90th percentile and longest, in seconds) and how many
+    projects are in it now. Computed from the project status transition history.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        report_service (Annotated[IReportService, Depends): The application report service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        customer_id (Annotated[str  |  None, Depends): Only report the customer's projects.
+        since (AwareDatetime | None, optional): Only report statuses entered since, with a timezone.
+        Defaults to None.
+
+    Returns:
+        TimeInStatusReport: The duration distribution of each customer's project statuses
+    """
+
+    logger.info("user: %s invoked GET /reports/time_in_status", token.username)
+    return renderer.render(
+        TimeInStatusReport,
+        await report_service.get_time_in_status(customer_id=customer_id, since=since),
+    )
+
+
+@router.get(
+    "/project/{project_id}/status_history",
+    tags=["reports"],
+    response_model=ProjectStatusHistory,
+)
+async def get_project_status_history(
+    token: Annotated[TokenData, Depends(validate_user)],  # User
+    project_id: Annotated[str, Depends(parse_project_id)],
+    report_service: Annotated[IReportService, Depends(get_report_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """GET /project/{project_id}/status_history route
+
+    Returns every status the project has been in with when it entered and left it.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        project_id (Annotated[str, Depends): The project id - validated as UUID4.
+        report_service (Annotated[IReportService, Depends): The application report service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        ProjectStatusHistory: The project's status spans, oldest first
+    """
+
+    logger.info(
+        "user: %s invoked GET /project/%s/status_history", token.username, project_id
+    )
+    return renderer.render(
+        ProjectStatusHistory,
+        await report_service.get_project_status_history(project_id=project_id),
+    )
@@ -0,0 +1,50 @@
+"""Search router module providing entry point for the search API route."""
+
+import logging
+from typing import Annotated
+from fastapi import APIRouter, Depends, Query
+
+from api.dependencies import get_response_renderer, get_search_service, validate_user
+from api.schemas.auth import TokenData
+from api.schemas.search import SearchResults
+from api.services.interfaces.search_service_interface import ISearchService
+from api.utils.serializers import ResponseRenderer
+
+
+router = APIRouter(prefix="/api")
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/search", tags=["search"], response_model=SearchResults)
+async def search(
+    token: Annotated[TokenData, Depends(validate_user)],  # User
+    search_service: Annotated[ISearchService, Depends(get_search_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    q: Annotated[str, Query(min_length=2, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+):
+    """GET /search route
+
+    Fuzzy, ranked search across customer and project names and details, and for admins
+    user names and emails. Substring, trigram similarity and full text ('"exact phrase"',
+    '-excluded') matches are all served by GIN indexes.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        search_service (Annotated[ISearchService, Depends): The application search service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        q (str): The search text
+        limit (int, optional): The maximum number of results per entity type. Defaults to 10.
+
+    Returns:
+        SearchResults: The ranked matches grouped by entity type
+    """
+
+    logger.info("user: %s invoked GET /search", token.username)
+    return renderer.render(
+        SearchResults,
+        await search_service.search(
+            query=q.strip(), limit=limit, include_users=token.admin
+        ),
+    )
@@ -0,0 +1,169 @@
+"""Skills router module providing entry point for all 'skill' API routes."""
+
+import logging
+from typing import Annotated, List
+from fastapi import APIRouter, Depends, Query
+
+from api.dependencies import (
+    get_response_renderer,
+    get_skill_service,
+    parse_project_id,
+    parse_user_id,
+    validate_admin,
+    validate_user,
+)
+from api.schemas.auth import TokenData
+from api.schemas.skill import CandidateList, SkillCreate, SkillOut, SkillSet
+from api.services.interfaces.skill_service_interface import ISkillService
+from api.utils.serializers import ResponseRenderer
+
+
+router = APIRouter(prefix="/api")
+
+logger = logging.getLogger(__name__)
+
+
+@router.post("/skill", tags=["skills"], response_model=SkillOut)
+async def create_skill(
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    skill: SkillCreate,
+    skill_service: Annotated[ISkillService, Depends(get_skill_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """POST /skill route
+
+    Adds a skill to the skill catalogue. Fails with a 409 if it already exists,
+    or a 400 once SKILLS_MAX skills have been created.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        skill (SkillCreate): The skill object - validated by the SkillCreate model.
+        skill_service (Annotated[ISkillService, Depends): The application skill service.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        Skill: The created skill entity - validated against the SkillOut model.
+    """
+
+    logger.info("user: %s invoked POST /skill", token.username)
+    return renderer.render(SkillOut, await skill_service.create_skill(skill=skill))
+
+
+@router.get("/skills", tags=["skills"], response_model=List[SkillOut])
+async def get_skills(
+    token: Annotated[TokenData, Depends(validate_user)],  # User
+    skill_service: Annotated[ISkillService, Depends(get_skill_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """GET /skills route
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        skill_service (Annotated[ISkillService, Depends): The application skill service.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        List[Skill]: The skill catalogue, ordered by name - validated against the SkillOut model.
+    """
+
+    logger.info("user: %s invoked GET /skills", token.username)
+    return renderer.render(List[SkillOut], await skill_service.list_skills())
+
+
+@router.put("/user/{user_id}/skills", tags=["skills"], response_model=SkillSet)
+async def set_user_skills(
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    user_id: Annotated[str, Depends(parse_user_id)],
+    skills: SkillSet,
+    skill_service: Annotated[ISkillService, Depends(get_skill_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """PUT /user/{user_id}/skills route
+
+    Replaces a user's skills. Fails with a 400 if a skill is not in the skill catalogue.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        user_id (Annotated[str, Depends): The user id - validated as UUID4.
+        skills (SkillSet): The user's skills - validated by the SkillSet model.
+        skill_service (Annotated[ISkillService, Depends): The application skill service.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        SkillSet: The user's stored skills
+    """
+
+    logger.info("user: %s invoked PUT /user/%s/skills", token.username, user_id)
+    return renderer.render(
+        SkillSet, await skill_service.set_user_skills(user_id=user_id, skills=skills)
+    )
+
+
+@router.put("/project/{project_id}/skills", tags=["skills"], response_model=SkillSet)
+async def set_project_skills(
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    project_id: Annotated[str, Depends(parse_project_id)],
+    skills: SkillSet,
+    skill_service: Annotated[ISkillService, Depends(get_skill_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """PUT /project/{project_id}/skills route
+
+    Replaces the skills a project requires. Fails with a 400 if a skill is not in the skill catalogue.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        project_id (Annotated[str, Depends): The project id - validated as UUID4.
+        skills (SkillSet): The required skills - validated by the SkillSet model.
+        skill_service (Annotated[ISkillService, Depends): The application skill service.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        SkillSet: The project's stored required skills
+    """
+
+    logger.info("user: %s invoked PUT /project/%s/skills", token.username, project_id)
+    return renderer.render(
+        SkillSet,
+        await skill_service.set_project_skills(project_id=project_id, skills=skills),
+    )
+
+
+@router.get(
+    "/project/{project_id}/candidates", tags=["skills"], response_model=CandidateList
+)
+async def get_candidates(
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    project_id: Annotated[str, Depends(parse_project_id)],
+    skill_service: Annotated[ISkillService, Depends(get_skill_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    unassigned_only: bool = False,
+):
+    """GET /project/{project_id}/candidates route
+
+    Ranks active users by how many of the project's required skills they have, against a
+    per process in-memory skill matrix. Ties go to users with fewer skills overall.
+    Users without any of the required skills are left out.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        project_id (Annotated[str, Depends): The project id - validated as UUID4.
+        skill_service (Annotated[ISkillService, Depends): The application skill service.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        limit (int, optional): The maximum number of candidates. Defaults to 20.
+        unassigned_only (bool, optional): Only rank users without a project. Defaults to False.
+
+    Returns:
+        CandidateList: The project's required skills and its best candidates
+    """
+
+    logger.info(
+        "user: %s invoked GET /project/%s/candidates", token.username, project_id
+    )
+    return renderer.render(
+        CandidateList,
+        await skill_service.get_candidates(
+            project_id=project_id, limit=limit, unassigned_only=unassigned_only
+        ),
+    )
@@ -0,0 +1,41 @@
+"""Summary router module providing entry point for the dashboard summary API route."""
+
+import logging
+from typing import Annotated
+from fastapi import APIRouter, Depends
+
+from api.dependencies import get_response_renderer, get_summary_service, validate_user
+from api.schemas.auth import TokenData
+from api.schemas.summary import Summary
+from api.services.interfaces.summary_service_interface import ISummaryService
+from api.utils.serializers import ResponseRenderer
+
+
+router = APIRouter(prefix="/api")
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/summary", tags=["summary"], response_model=Summary)
+async def get_summary(
+    token: Annotated[TokenData, Depends(validate_user)],  # User
+    summary_service: Annotated[ISummaryService, Depends(get_summary_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """GET /summary route
+
+    Returns the dashboard headcounts - projects per status, users per role, engineers
+    per project, unassigned engineers and active / inactive customers - computed with
+    SQL aggregates.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        summary_service (Annotated[ISummaryService, Depends): The application summary service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        Summary: The dashboard summary
+    """
+
+    logger.info("user: %s invoked GET /summary", token.username)
+    return renderer.render(Summary, await summary_service.get_summary())
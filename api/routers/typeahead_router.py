@@ -0,0 +1,58 @@
+"""Typeahead router module providing entry point for the typeahead API route."""
+
+import logging
+from typing import Annotated, List
+from fastapi import APIRouter, Depends, Query
+
+from api.dependencies import get_response_renderer, get_typeahead_service, validate_user
+from api.schemas.auth import TokenData
+from api.schemas.typeahead import TypeaheadResults, TypeaheadType
+from api.services.interfaces.typeahead_service_interface import ITypeaheadService
+from api.utils.serializers import ResponseRenderer
+
+
+router = APIRouter(prefix="/api")
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/typeahead", tags=["typeahead"], response_model=TypeaheadResults)
+async def typeahead(
+    token: Annotated[TokenData, Depends(validate_user)],  # User
+    typeahead_service: Annotated[ITypeaheadService, Depends(get_typeahead_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    prefix: Annotated[str, Query(min_length=1, max_length=100, pattern=r"\S")],
+    types: Annotated[List[TypeaheadType] | None, Query(alias="type")] = None,
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+):
+    """GET /typeahead route
+
+    Completes a typed prefix to customer, project and, for admins, user names from
+    per process in-memory indexes, for keystroke level pickers. The prefix matches the
+    start of any word, case insensitively - users also match on their user name.
+
+    Args:
+        token (Annotated[TokenData, Depends): JWT
+        typeahead_service (Annotated[ITypeaheadService, Depends): The application typeahead service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        prefix (str): The typed prefix, with at least one non-space character
+        types (List[TypeaheadType] | None, optional): The entity types to complete, as repeated
+        'type' parameters. Defaults to every type the user may list.
+        limit (int, optional): The maximum number of hits. Defaults to 10.
+
+    Returns:
+        TypeaheadResults: The matching names in alphabetical order
+    """
+
+    logger.info("user: %s invoked GET /typeahead", token.username)
+    types = [
+        entity_type
+        for entity_type in dict.fromkeys(types or TypeaheadType)
+        if token.admin or entity_type != TypeaheadType.USERS
+    ]
+    return renderer.render(
+        TypeaheadResults,
+        await typeahead_service.typeahead(
+            prefix=prefix.strip(), types=types, limit=limit
+        ),
+    )
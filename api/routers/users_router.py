@@ -1,22 +1,34 @@
 """Users router module providing entry point for all 'user' API routes."""
 
 import logging
-from typing import Annotated, List, Union
+from typing import Annotated, List
 from fastapi import APIRouter, Depends, Response
 
 from api.core.config import app_config
+from api.database.loading import LoadPlan
 from api.dependencies import (
+    get_response_renderer,
     get_user_service,
     hash_password,
+    parse_current_user_include,
+    parse_optional_ids,
     parse_project_id,
+    parse_user_fields,
     parse_user_id,
+    parse_user_include,
     validate_admin,
     validate_user,
 )
 from api.schemas.auth import TokenData
-from api.schemas.relationships import UserWithProjectOut
-from api.schemas.user import UserCreate, UserOut, UserUpdate
+from api.schemas.relationships import (
+    UserResponse,
+    UserWithProjectOut,
+    expand_response_model,
+)
+from api.schemas.user import UserCreate, UserOut, UserProjectMoves, UserUpdate
 from api.services.interfaces.user_service_interface import IUserService
+from api.utils.fieldsets import FieldSet, list_of
+from api.utils.serializers import ResponseRenderer
 
 router = APIRouter(prefix="/api")
 
@@ -59,6 +71,7 @@ async def update_self(
     token: Annotated[TokenData, Depends(validate_user)],  # User
     user: UserUpdate,
     user_service: Annotated[IUserService, Depends(get_user_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
 ):
     """PATCH /user route
 
@@ -68,6 +81,7 @@ async def update_self(
     Args:
         token (Annotated[TokenData, Depends): JWT
         user_service (Annotated[IUserService, Depends): The application user service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
         user (UserUpdate): The user object - validated by the UserUpdate model.
 
     Returns:
@@ -75,44 +89,60 @@ async def update_self(
     """
 
     logger.info("user: %s invoked PATCH /user", token.username)
-    return await user_service.update_user(user_id=str(token.id), user=user)
+    return renderer.render(
+        UserOut, await user_service.update_user(user_id=str(token.id), user=user)
+    )
 
 
 @router.get(
     "/user/{user_id}",
     tags=["users"],
-    response_model=Union[UserOut | UserWithProjectOut],
+    response_model=UserResponse,
 )
 async def get_user(
     user_id: Annotated[str, Depends(parse_user_id)],
     token: Annotated[TokenData, Depends(validate_admin)],  # Admin
     user_service: Annotated[IUserService, Depends(get_user_service)],
-    project: bool = False,
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    fields: Annotated[FieldSet, Depends(parse_user_fields)],
+    include: Annotated[LoadPlan, Depends(parse_user_include)],
 ):
     """GET /user/{user_id} route
 
     Looks for and returns a specified user by id.
     Provides option to return the user with related project.
+    (The legacy 'project=true' flag is still accepted)
 
     Args:
         user_id (Annotated[str, Depends): The user ID to search for
         token (Annotated[TokenData, Depends): JWT
         user_service (Annotated[IUserService, Depends): The application user service
-        project (bool, optional): Set True if user related 'Project' required in the response.
-        Defaults to False.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        fields (Annotated[FieldSet, Depends): Sparse fieldset - 'fields' and 'fields[<relation>]'
+        include (Annotated[LoadPlan, Depends): Relations to load - 'include=project'.
 
     Returns:
         User: The updated user entity - validated against the UserOut | UserWithProjectOut model.
     """
 
     logger.info("user: %s invoked GET /user/%s", token.username, user_id)
-    return await user_service.get_user_by_id(user_id=user_id, project=project)
+    plan = include.restrict(fields)
+    return renderer.render(
+        expand_response_model(plan),
+        await user_service.get_user_by_id(
+            user_id=user_id, include=plan.paths(), fields=fields.selected()
+        ),
+        fields=fields,
+    )
 
 
 @router.get("/users/me", tags=["users"], response_model=UserWithProjectOut)
 async def get_current_user(
     token: Annotated[TokenData, Depends(validate_user)],  # User
     user_service: Annotated[IUserService, Depends(get_user_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    fields: Annotated[FieldSet, Depends(parse_user_fields)],
+    include: Annotated[LoadPlan, Depends(parse_current_user_include)],
 ):
     """GET /users/me route
 
@@ -121,39 +151,61 @@ async def get_current_user(
     Args:
         token (Annotated[TokenData, Depends): JWT
         user_service (Annotated[IUserService, Depends): The application user service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        fields (Annotated[FieldSet, Depends): Sparse fieldset - 'fields' and 'fields[<relation>]'
+        include (Annotated[LoadPlan, Depends): Relations to load - 'include=project'.
 
     Returns:
         User: The current user - validated against the UserWithProjectOut model
     """
 
     logger.info("user: %s invoked GET /users/me", token.username)
-    return await user_service.get_current_user(token_data=token)
+    plan = include.restrict(fields)
+    return renderer.render(
+        expand_response_model(plan),
+        await user_service.get_current_user(
+            token_data=token, include=plan.paths(), fields=fields.selected()
+        ),
+        fields=fields,
+    )
 
 
-@router.get(
-    "/users", tags=["users"], response_model=List[Union[UserOut | UserWithProjectOut]]
-)
+@router.get("/users", tags=["users"], response_model=List[UserResponse])
 async def get_all_users(
     token: Annotated[TokenData, Depends(validate_admin)],  # Admin
     user_service: Annotated[IUserService, Depends(get_user_service)],
-    projects: bool = False,
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+    fields: Annotated[FieldSet, Depends(parse_user_fields)],
+    include: Annotated[LoadPlan, Depends(parse_user_include)],
+    ids: Annotated[List[str] | None, Depends(parse_optional_ids)],
 ):
     """GET /users route
 
-    Returns all user entities in the database.
+    Returns all user entities in the database, or only those listed in 'ids=...'
+    in the same order (looked up in a single query).
+    (The legacy 'projects=true' flag is still accepted)
 
     Args:
         token (Annotated[TokenData, Depends): JWT
         user_service (Annotated[IUserService, Depends): The application user service
-        projects (bool, optional): Set True if user related 'Projects' required in the response.
-        Defaults to False.
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+        fields (Annotated[FieldSet, Depends): Sparse fieldset - 'fields' and 'fields[<relation>]'
+        include (Annotated[LoadPlan, Depends): Relations to load - 'include=project'.
+        ids (Annotated[List[str] | None, Depends): Comma separated user IDs to return.
 
     Returns:
        List[User]: A list of all user entities in the database.
     """
 
     logger.info("user: %s invoked GET /users", token.username)
-    return await user_service.list_users(projects=projects)
+    plan = include.restrict(fields)
+    return renderer.render(
+        list_of(expand_response_model(plan)),
+        await user_service.list_users(
+            include=plan.paths(), fields=fields.selected(), ids=ids
+        ),
+        fields=fields,
+    )
 
 
 @router.delete("/user/{user_id}", tags=["users"], status_code=204)
@@ -189,6 +241,7 @@ async def add_project_to_user(
     project_id: Annotated[str, Depends(parse_project_id)],
     token: Annotated[TokenData, Depends(validate_admin)],  # Admin
     user_service: Annotated[IUserService, Depends(get_user_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
 ):
     """PATCH /user/{user_id}/project/{project_id}
 
@@ -200,6 +253,7 @@ async def add_project_to_user(
         project_id (Annotated[str, Depends): ID of project to add to the user
         token (Annotated[TokenData, Depends): JWT
         user_service (Annotated[IUserService, Depends): The application user service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
 
     Returns:
         User: The user with added project
@@ -211,8 +265,11 @@ async def add_project_to_user(
         user_id,
         project_id,
     )
-    return await user_service.update_user_project(
-        user_id=user_id, project_id=project_id
+    return renderer.render(
+        UserWithProjectOut,
+        await user_service.update_user_project(
+            user_id=user_id, project_id=project_id, actor=token.username
+        ),
     )
 
 
@@ -223,6 +280,7 @@ async def remove_project_from_user(
     user_id: Annotated[str, Depends(parse_user_id)],
     token: Annotated[TokenData, Depends(validate_admin)],  # Admin
     user_service: Annotated[IUserService, Depends(get_user_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
 ):
     """PATCH /user/{user_id}/unassign_project
 
@@ -233,6 +291,7 @@ async def remove_project_from_user(
         user_id (Annotated[str, Depends): ID of user to assign project to
         token (Annotated[TokenData, Depends): JWT
         user_service (Annotated[IUserService, Depends): The application user service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
 
     Returns:
         User: The updated user entity
@@ -241,4 +300,42 @@ async def remove_project_from_user(
     logger.info(
         "user: %s invoked PATCH /user/%s/unassign_project", token.username, user_id
     )
-    return await user_service.update_user_project(user_id=user_id, project_id=None)
+    return renderer.render(
+        UserOut,
+        await user_service.update_user_project(
+            user_id=user_id, project_id=None, actor=token.username
+        ),
+    )
+
+
+@router.patch("/users/project", tags=["users"], response_model=List[UserWithProjectOut])
+async def move_users(
+    moves: UserProjectMoves,
+    token: Annotated[TokenData, Depends(validate_admin)],  # Admin
+    user_service: Annotated[IUserService, Depends(get_user_service)],
+    renderer: Annotated[ResponseRenderer, Depends(get_response_renderer)],
+):
+    """PATCH /users/project
+
+    Assigns many users to projects, or unassigns them, in a single transaction -
+    if any user or project is not found, no user is moved.
+
+    Args:
+        moves (UserProjectMoves): The users to move and their new 'project_id'
+        token (Annotated[TokenData, Depends): JWT
+        user_service (Annotated[IUserService, Depends): The application user service
+        renderer (Annotated[ResponseRenderer, Depends): Response renderer
+
+    Returns:
+        List[User]: The updated user entities
+    """
+
+    logger.info(
+        "user: %s invoked PATCH /users/project (%s users)",
+        token.username,
+        len(moves.moves),
+    )
+    return renderer.render(
+        List[UserWithProjectOut],
+        await user_service.move_users(moves, actor=token.username),
+    )
@@ -0,0 +1,48 @@
+"""Pydantic validation models for assignment requests and responses"""
+
+from datetime import datetime
+from typing import List, Optional
+from pydantic import UUID4, AwareDatetime, BaseModel, ConfigDict, Field, model_validator
+
+
+class AssignmentBase(BaseModel):
+    allocation: int = Field(ge=1, le=100)
+    starts_at: AwareDatetime
+    ends_at: Optional[AwareDatetime] = None
+
+    @model_validator(mode="after")
+    def validate_range(self):
+        """Ensures an assignment ends after it starts - an absent end is ongoing"""
+        if self.ends_at is not None and self.ends_at <= self.starts_at:
+            raise ValueError("ends_at must be after starts_at")
+        return self
+
+
+class AssignmentCreate(AssignmentBase):
+    user_id: UUID4
+    project_id: UUID4
+
+
+class AssignmentUpdate(AssignmentBase):
+    pass
+
+
+class AssignmentOut(AssignmentBase):
+    model_config = ConfigDict(from_attributes=True)
+    id: UUID4
+    user_id: UUID4
+    project_id: UUID4
+    starts_at: datetime
+    ends_at: Optional[datetime] = None
+
+
+class Utilisation(BaseModel):
+    user_id: UUID4
+    allocation: float
+    projects: int
+
+
+class UtilisationReport(BaseModel):
+    starts_at: datetime
+    ends_at: datetime
+    users: List[Utilisation]
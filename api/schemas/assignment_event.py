@@ -0,0 +1,31 @@
+"""Pydantic validation models for assignment audit log responses"""
+
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+from pydantic import UUID4, BaseModel, ConfigDict
+
+from api.schemas.project import ProjectStatus
+
+
+class AssignmentEventType(str, Enum):
+    USER_PROJECT = "USER_PROJECT"
+    PROJECT_STATUS = "PROJECT_STATUS"
+
+
+class AssignmentEventOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: int
+    occurred_at: datetime
+    event_type: AssignmentEventType
+    actor: Optional[str]
+    user_id: Optional[UUID4]
+    project_id: Optional[UUID4]
+    previous_project_id: Optional[UUID4]
+    status: Optional[ProjectStatus]
+    previous_status: Optional[ProjectStatus]
+
+
+class AssignmentEventPage(BaseModel):
+    events: List[AssignmentEventOut]
+    next_before: Optional[int]
@@ -0,0 +1,50 @@
+"""Pydantic validation models for auto-staffing requests and responses"""
+
+from typing import Dict, List
+from pydantic import UUID4, BaseModel, Field, field_validator
+
+
+class StaffingTargets(BaseModel):
+    # Target headcount keyed by project id - projects must be active and in DESIGN or BUILD
+    targets: Dict[UUID4, int] = Field(min_length=1)
+
+    @field_validator("targets")
+    def validate_headcounts(cls, v):  # pylint: disable=no-self-argument
+        """Ensures every target headcount is between 1 and 1000"""
+        if any(not 1 <= headcount <= 1000 for headcount in v.values()):
+            raise ValueError("Target headcounts must be between 1 and 1000")
+        return v
+
+
+class PlannedAssignment(BaseModel):
+    user_id: UUID4
+    project_id: UUID4
+
+
+class ProposedAssignment(PlannedAssignment):
+    cost: float
+
+
+class StaffingPlan(BaseModel):
+    assignments: List[ProposedAssignment]
+    # Slots left open, keyed by project id, when there are not enough engineers
+    unfilled: Dict[UUID4, int]
+    candidates: int
+    total_cost: float
+
+
+class StaffingPlanApply(BaseModel):
+    assignments: List[PlannedAssignment] = Field(min_length=1)
+
+    @field_validator("assignments")
+    def validate_unique_users(cls, v):  # pylint: disable=no-self-argument
+        """Ensures each user is assigned at most once"""
+        if len({assignment.user_id for assignment in v}) != len(v):
+            raise ValueError("Each user may only be assigned once")
+        return v
+
+
+class StaffingPlanResult(BaseModel):
+    applied: List[UUID4]
+    # Users assigned to a project, or removed, since the plan was proposed
+    skipped: List[UUID4]
@@ -0,0 +1,44 @@
+"""Pydantic validation models for batched read operation requests and responses"""
+
+from enum import Enum
+from typing import Any, Dict, List
+from pydantic import BaseModel, Field, field_validator
+
+
+class BatchOperationName(str, Enum):
+    CURRENT_USER = "users.me"
+    GET_USER = "users.get"
+    LIST_USERS = "users.list"
+    GET_CUSTOMER = "customers.get"
+    LIST_CUSTOMERS = "customers.list"
+    GET_PROJECT = "projects.get"
+    LIST_PROJECTS = "projects.list"
+
+
+class BatchOperation(BaseModel):
+    id: str = Field(min_length=1, max_length=64)
+    op: BatchOperationName
+    # Query parameters of the equivalent GET route, e.g. {"include": "projects", "fields": "id,name"}
+    params: Dict[str, str] = {}
+
+
+class BatchRequest(BaseModel):
+    operations: List[BatchOperation] = Field(min_length=1)
+
+    @field_validator("operations")
+    @classmethod
+    def unique_ids(cls, operations: List[BatchOperation]) -> List[BatchOperation]:
+        ids = [operation.id for operation in operations]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Operation ids must be unique")
+        return operations
+
+
+class BatchResult(BaseModel):
+    status: int
+    data: Any = None
+    error: Any = None
+
+
+class BatchResponse(BaseModel):
+    results: Dict[str, BatchResult]
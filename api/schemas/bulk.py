@@ -0,0 +1,37 @@
+"""Pydantic validation models for bulk import and export requests and responses"""
+
+from enum import Enum
+from typing import List
+from pydantic import BaseModel
+
+
+class BulkEntity(str, Enum):
+    USERS = "users"
+    CUSTOMERS = "customers"
+    PROJECTS = "projects"
+
+
+class ImportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+    COLUMNAR = "columnar"
+    BINARY = "binary"
+
+
+class ImportRowError(BaseModel):
+    row: int
+    errors: List[str]
+
+
+class ImportReport(BaseModel):
+    entity: BulkEntity
+    processed: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = []
+    errors_truncated: bool = False
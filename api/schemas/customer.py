@@ -1,8 +1,10 @@
 """Pydantic validation models for customer requests and responses"""
 
-from typing import Optional
+from typing import List, Optional
 from pydantic import UUID4, BaseModel, ConfigDict, Field, field_validator
 
+from api.schemas.project import CustomerProjectCreate
+
 
 class CustomerBase(BaseModel):
     name: Optional[str] = Field(min_length=3, max_length=50)
@@ -19,6 +21,20 @@ class CustomerCreate(CustomerBase):
     name: str = Field(min_length=3, max_length=50)
 
 
+class CustomerWithProjectsCreate(CustomerCreate):
+    projects: List[CustomerProjectCreate] = Field(min_length=1, max_length=100)
+
+    @field_validator("projects")
+    @classmethod
+    def unique_names(
+        cls, projects: List[CustomerProjectCreate]
+    ) -> List[CustomerProjectCreate]:
+        names = [project.name for project in projects]
+        if len(names) != len(set(names)):
+            raise ValueError("Project names must be unique")
+        return projects
+
+
 class CustomerUpdate(CustomerBase):
     @field_validator("name", "details", mode="before")
     def strip(cls, v):  # pylint: disable=no-self-argument
@@ -0,0 +1,64 @@
+"""Pydantic validation models for background job requests and responses"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Literal, Optional, Union
+from pydantic import UUID4, BaseModel, ConfigDict
+
+from api.schemas.auto_staffing import StaffingTargets
+from api.schemas.bulk import BulkEntity, ExportFormat
+
+
+class JobKind(str, Enum):
+    IMPORT = "IMPORT"
+    EXPORT = "EXPORT"
+    STAFFING_REFRESH = "STAFFING_REFRESH"
+    STAFFING_PLAN = "STAFFING_PLAN"
+
+
+class JobStatus(str, Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class JobFile(str, Enum):
+    PAYLOAD = "PAYLOAD"
+    OUTPUT = "OUTPUT"
+
+
+class ExportJobCreate(BaseModel):
+    kind: Literal[JobKind.EXPORT]
+    entity: BulkEntity
+    format: ExportFormat = ExportFormat.CSV
+
+
+class StaffingRefreshJobCreate(BaseModel):
+    kind: Literal[JobKind.STAFFING_REFRESH]
+
+
+class StaffingPlanJobCreate(StaffingTargets):
+    kind: Literal[JobKind.STAFFING_PLAN]
+
+
+# Discriminated on 'kind' - imports are queued with their uploaded file by
+# POST /jobs/import/{entity} instead
+JobCreate = Union[ExportJobCreate, StaffingRefreshJobCreate, StaffingPlanJobCreate]
+
+
+class JobOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: UUID4
+    kind: JobKind
+    status: JobStatus
+    params: Dict[str, Any]
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+    progress: int
+    progress_total: Optional[int]
+    attempts: int
+    created_by: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
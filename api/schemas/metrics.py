@@ -0,0 +1,36 @@
+"""Pydantic validation models for application metrics responses"""
+
+from pydantic import BaseModel
+
+
+class SingleFlightStats(BaseModel):
+    calls: int
+    executions: int
+    coalesced: int
+    timeouts: int
+    errors: int
+    in_flight: int
+
+
+class AuditLogStats(BaseModel):
+    submitted: int
+    written: int
+    dropped: int
+    failed: int
+    batches: int
+    pending: int
+
+
+class JobWorkerStats(BaseModel):
+    workers: int
+    claimed: int
+    succeeded: int
+    failed: int
+    released: int
+    running: int
+
+
+class Metrics(BaseModel):
+    single_flight: SingleFlightStats
+    audit_log: AuditLogStats
+    job_worker: JobWorkerStats
@@ -32,6 +32,19 @@ class ProjectCreate(ProjectBase):
     customer_id: UUID4
 
 
+# A project created along with its customer, which provides the 'customer_id'
+class CustomerProjectCreate(BaseModel):
+    @field_validator("name", mode="before")
+    def capitalize(cls, v):  # pylint: disable=no-self-argument
+        """On creation, strips any leading or trailing whitespace and capitalizes the string"""
+        if v and isinstance(v, str):
+            return v.strip().capitalize()
+
+    name: str = Field(min_length=3, max_length=50, pattern="^[A-Za-z]")
+    status: ProjectStatus
+    details: Optional[str] = Field(max_length=100)
+
+
 class ProjectUpdate(ProjectBase):
     @field_validator("name", mode="before")
     def capitalize(cls, v):  # pylint: disable=no-self-argument
@@ -6,10 +6,15 @@ requests and responses.
 
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, create_model
+
+from api.database.loading import LoadPlan
 from api.schemas.customer import CustomerOut
 from api.schemas.project import ProjectOut
 from api.schemas.user import UserOut
+from api.utils.fieldsets import list_of
 
 
 class ProjectWithUsersOut(ProjectOut):
@@ -34,3 +39,53 @@ class CustomerWithProjectsUsersOut(CustomerOut):
 
 class UserWithProjectOut(UserOut):
     project: Optional[ProjectOut]
+
+
+# Documented response shapes of the entity GET routes
+CustomerResponse = Union[
+    CustomerOut | CustomerWithProjectsOut | CustomerWithProjectsUsersOut
+]
+
+ProjectResponse = Union[ProjectWithCustomerOut | ProjectWithUsersCustomerOut]
+
+UserResponse = Union[UserOut | UserWithProjectOut]
+
+
+# Base response model of each entity, keyed by database table name
+ENTITY_OUT_MODELS: Dict[str, Type[BaseModel]] = {
+    "customer": CustomerOut,
+    "project": ProjectOut,
+    "user": UserOut,
+}
+
+
+# Expanded response models keyed by load plan. Plans are validated against the
+# entity relations and bounded in depth, so the number of distinct keys is finite.
+_expanded_models: Dict[Tuple[Any, ...], Type[BaseModel]] = {}
+
+
+def expand_response_model(plan: LoadPlan) -> Type[BaseModel]:
+    """Returns the response model of an entity expanded with the relations of a load plan.
+
+    Args:
+        plan (LoadPlan): The validated relations loaded with the entity
+
+    Returns:
+        Type[BaseModel]: The entity's response model with a nested field per planned relation
+    """
+    base = ENTITY_OUT_MODELS[plan.entity.__tablename__]
+    if not plan:
+        return base
+
+    key = plan.key
+    if key not in _expanded_models:
+        relations: Dict[str, Any] = {}
+        for name, child in plan.children.items():
+            model = expand_response_model(child)
+            annotation = (
+                list_of(model) if child.uselist else Optional[model]  # type: ignore[valid-type]
+            )
+            relations[name] = (annotation, None)
+        name = "With".join([base.__name__, *(n.capitalize() for n in sorted(relations))])
+        _expanded_models[key] = create_model(name, __base__=base, **relations)
+    return _expanded_models[key]
@@ -0,0 +1,59 @@
+"""Pydantic validation models for report responses"""
+
+from datetime import datetime
+from typing import List, Optional
+from pydantic import UUID4, BaseModel, ConfigDict
+
+from api.schemas.project import ProjectStatus
+
+
+class StaffingRow(BaseModel):
+    project_id: UUID4
+    project_name: str
+    project_status: ProjectStatus
+    project_active: bool
+    customer_id: UUID4
+    customer_name: str
+    customer_active: bool
+    headcount: int
+    engineers: int
+    managers: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class StaffingReport(BaseModel):
+    refreshed_at: datetime | None
+    rows: List[StaffingRow]
+
+
+class StatusSpan(BaseModel):
+    status: ProjectStatus
+    entered_at: datetime
+    left_at: Optional[datetime]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectStatusHistory(BaseModel):
+    project_id: UUID4
+    spans: List[StatusSpan]
+
+
+class TimeInStatusRow(BaseModel):
+    customer_id: UUID4
+    customer_name: str
+    status: ProjectStatus
+    completed: int
+    in_status: int
+    mean_seconds: Optional[float]
+    p50_seconds: Optional[float]
+    p90_seconds: Optional[float]
+    max_seconds: Optional[float]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TimeInStatusReport(BaseModel):
+    since: Optional[datetime]
+    rows: List[TimeInStatusRow]
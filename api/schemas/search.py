@@ -0,0 +1,23 @@
+"""Pydantic validation models for search responses"""
+
+from typing import Generic, List, TypeVar
+from pydantic import BaseModel
+
+from api.schemas.customer import CustomerOut
+from api.schemas.project import ProjectOut
+from api.schemas.user import UserOut
+
+
+T = TypeVar("T")
+
+
+class SearchHit(BaseModel, Generic[T]):
+    rank: float
+    item: T
+
+
+class SearchResults(BaseModel):
+    query: str
+    customers: List[SearchHit[CustomerOut]] = []
+    projects: List[SearchHit[ProjectOut]] = []
+    users: List[SearchHit[UserOut]] = []
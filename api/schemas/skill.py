@@ -0,0 +1,59 @@
+"""Pydantic validation models for skill requests and responses"""
+
+from typing import List, Optional
+from pydantic import UUID4, BaseModel, ConfigDict, Field, field_validator
+
+
+def normalize_skill(name: str) -> str:
+    """Strips and lower cases a skill name so 'Python ' and 'python' are the same skill"""
+    return name.strip().lower()
+
+
+class SkillCreate(BaseModel):
+    @field_validator("name", mode="before")
+    def normalize(cls, v):  # pylint: disable=no-self-argument
+        """On creation, strips any leading or trailing whitespace and lower cases the string"""
+        if v and isinstance(v, str):
+            return normalize_skill(v)
+        return v
+
+    name: str = Field(min_length=1, max_length=30)
+
+
+class SkillOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: UUID4
+    name: str
+
+
+class SkillSet(BaseModel):
+    @field_validator("skills", mode="before")
+    def normalize(cls, v):  # pylint: disable=no-self-argument
+        """Strips and lower cases every skill name, dropping repeats"""
+        if isinstance(v, list):
+            return list(
+                dict.fromkeys(
+                    normalize_skill(name) if isinstance(name, str) else name
+                    for name in v
+                )
+            )
+        return v
+
+    skills: List[str]
+
+
+class Candidate(BaseModel):
+    user_id: UUID4
+    user_name: str
+    first_name: str
+    last_name: str
+    project_id: Optional[UUID4]
+    matched: int
+    coverage: float
+    missing: List[str]
+
+
+class CandidateList(BaseModel):
+    project_id: UUID4
+    required: List[str]
+    candidates: List[Candidate]
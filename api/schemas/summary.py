@@ -0,0 +1,18 @@
+"""Pydantic validation models for the dashboard summary response"""
+
+from datetime import datetime
+from typing import Dict
+from pydantic import UUID4, BaseModel
+
+from api.schemas.project import ProjectStatus
+from api.schemas.user import Roles
+
+
+class Summary(BaseModel):
+    projects_by_status: Dict[ProjectStatus, int]
+    users_by_role: Dict[Roles, int]
+    engineers_per_project: Dict[UUID4, int]
+    unassigned_engineers: int
+    active_customers: int
+    inactive_customers: int
+    generated_at: datetime
@@ -0,0 +1,22 @@
+"""Pydantic validation models for typeahead responses"""
+
+from enum import Enum
+from typing import List
+from pydantic import UUID4, BaseModel
+
+
+class TypeaheadType(str, Enum):
+    USERS = "users"
+    CUSTOMERS = "customers"
+    PROJECTS = "projects"
+
+
+class TypeaheadHit(BaseModel):
+    type: TypeaheadType
+    id: UUID4
+    name: str
+
+
+class TypeaheadResults(BaseModel):
+    prefix: str
+    hits: List[TypeaheadHit]
@@ -1,7 +1,7 @@
 """Pydantic validation models for user requests and responses"""
 
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from pydantic import (
     UUID4,
     BaseModel,
@@ -69,3 +69,21 @@ class UserOut(UserBase):
     admin: bool
     active: bool
     project_id: Optional[UUID4]
+
+
+class UserProjectMove(BaseModel):
+    user_id: UUID4
+    # None unassigns the user from their project
+    project_id: Optional[UUID4]
+
+
+class UserProjectMoves(BaseModel):
+    moves: List[UserProjectMove] = Field(min_length=1, max_length=100)
+
+    @field_validator("moves")
+    @classmethod
+    def unique_users(cls, moves: List[UserProjectMove]) -> List[UserProjectMove]:
+        user_ids = [move.user_id for move in moves]
+        if len(user_ids) != len(set(user_ids)):
+            raise ValueError("Each user can only be moved once")
+        return moves
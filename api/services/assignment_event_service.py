@@ -0,0 +1,171 @@
+"""The Service layer for the assignment audit log and its API routes"""
+
+from datetime import datetime, timezone
+import logging
+from typing import Any, Dict, List
+from uuid import UUID
+
+from api.core.config import app_config
+from api.database.assignment_event_repository import AssignmentEventRepository
+from api.database.interfaces.assignment_event_repository_interface import (
+    IAssignmentEventRepository,
+)
+from api.database.session import db_session_manager
+from api.schemas.assignment_event import (
+    AssignmentEventOut,
+    AssignmentEventPage,
+    AssignmentEventType,
+)
+from api.schemas.project import ProjectStatus
+from api.services.interfaces.assignment_event_service_interface import (
+    IAssignmentEventService,
+)
+from api.utils.buffered_writer import BufferedWriter
+from api.utils.exceptions import (
+    DatabaseConnectionError,
+    ExceptionHandler,
+    RepositoryError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+async def write_assignment_events(rows: List[Dict[str, Any]]) -> None:
+    """Inserts a batch of audit events in a session of its own, outside any request.
+
+    The batch is a single executemany, so every row carries every column.
+    """
+    async with db_session_manager.session() as session:
+        await AssignmentEventRepository(session).bulk_create(rows)
+
+
+# Audit events are buffered and inserted in batches, so recording one adds no query to a request
+audit_log: BufferedWriter[Dict[str, Any]] = BufferedWriter(
+    write_assignment_events,
+    interval=app_config.audit_flush_interval_ms / 1000,
+    max_batch=app_config.audit_batch_size,
+    max_pending=app_config.audit_max_pending,
+)
+
+
+def record_user_project(
+    actor: str | None,
+    user_id: str | UUID,
+    previous_project_id: str | UUID | None,
+    project_id: str | UUID | None,
+) -> None:
+    """Records a user being assigned to, moved between or removed from projects
+
+    Args:
+        actor (str | None): The user name of the admin making the change
+        user_id (str | UUID): The user
+        previous_project_id (str | UUID | None): The user's project before the change
+        project_id (str | UUID | None): The user's project after the change
+    """
+    audit_log.submit(
+        {
+            "occurred_at": datetime.now(timezone.utc),
+            "event_type": AssignmentEventType.USER_PROJECT,
+            "actor": actor,
+            "user_id": user_id,
+            "project_id": project_id,
+            "previous_project_id": previous_project_id,
+            "status": None,
+            "previous_status": None,
+        }
+    )
+
+
+def record_project_status(
+    actor: str | None,
+    project_id: str | UUID,
+    previous_status: ProjectStatus,
+    status: ProjectStatus,
+) -> None:
+    """Records a project's status change
+
+    Args:
+        actor (str | None): The user name of the admin making the change
+        project_id (str | UUID): The project
+        previous_status (ProjectStatus): The project's status before the change
+        status (ProjectStatus): The project's status after the change
+    """
+    audit_log.submit(
+        {
+            "occurred_at": datetime.now(timezone.utc),
+            "event_type": AssignmentEventType.PROJECT_STATUS,
+            "actor": actor,
+            "user_id": None,
+            "project_id": project_id,
+            "previous_project_id": None,
+            "status": status,
+            "previous_status": previous_status,
+        }
+    )
+
+
+class AssignmentEventService(IAssignmentEventService):
+    """The service for all assignment event routes.
+    Contains all business logic
+
+    Args:
+        IAssignmentEventService: Interface defining required functionalities
+    """
+
+    def __init__(self, assignment_event_repository: IAssignmentEventRepository) -> None:
+        """Initialize the service
+
+        Args:
+            assignment_event_repository (IAssignmentEventRepository): The repository layer for the audit log
+        """
+        logger.info("Initializing AssignmentEventService")
+        self._assignment_event_repository = assignment_event_repository
+
+    async def list_events(
+        self,
+        limit: int,
+        before: int | None = None,
+        user_id: str | None = None,
+        project_id: str | None = None,
+        event_type: AssignmentEventType | None = None,
+    ) -> AssignmentEventPage:
+        """Functionality for reading a page of the audit log, newest first
+
+        Events are written asynchronously, so the latest changes may take up to
+        AUDIT_FLUSH_INTERVAL_MS to appear.
+
+        Args:
+            limit (int): The maximum number of events
+            before (int | None, optional): Only return events older than this event id,
+            the previous page's 'next_before'. Defaults to None.
+            user_id (str | None, optional): Only return the user's events. Defaults to None.
+            project_id (str | None, optional): Only return the project's events. Defaults to None.
+            event_type (AssignmentEventType | None, optional): Only return events of this type. Defaults to None.
+
+        Returns:
+            AssignmentEventPage: The events and the cursor of the next page, if any
+        """
+
+        try:
+            logger.info("Listing assignment events")
+            events = await self._assignment_event_repository.list_page(
+                limit=limit + 1,
+                before=before,
+                user_id=user_id,
+                project_id=project_id,
+                event_type=event_type,
+            )
+            return AssignmentEventPage(
+                events=[AssignmentEventOut.model_validate(event) for event in events[:limit]],
+                next_before=events[limit - 1].id if len(events) > limit else None,
+            )
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error listing assignment events: %s", e)
+            ExceptionHandler.raise_internal_server_error()
@@ -0,0 +1,354 @@
+"""The Service layer for all assignment API routes"""
+
+from datetime import datetime, timezone
+import logging
+from typing import Iterable, List, Tuple
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import Range
+
+from api.database.interfaces.assignment_repository_interface import (
+    IAssignmentRepository,
+)
+from api.database.interfaces.repository_interface import IRepository
+from api.database.models import Assignment, Project
+from api.schemas.assignment import (
+    AssignmentBase,
+    AssignmentCreate,
+    AssignmentUpdate,
+    Utilisation,
+    UtilisationReport,
+)
+from api.services.interfaces.assignment_service_interface import IAssignmentService
+from api.utils.exceptions import (
+    AssignmentNotFoundError,
+    DatabaseConnectionError,
+    ExceptionHandler,
+    IntegrityViolationError,
+    OverAllocationError,
+    ProjectNotFoundError,
+    RepositoryError,
+    UserNotFoundError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# The most a user can be allocated, in percent, at any time
+MAX_ALLOCATION = 100
+
+
+# The start of a range unbounded below
+EARLIEST = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def validity_range(assignment: AssignmentBase) -> Range[datetime]:
+    """Builds the validity range of an assignment - closed at its start, open at its end
+
+    Args:
+        assignment (AssignmentBase): The validated assignment
+
+    Returns:
+        Range[datetime]: The validity range, unbounded above if the assignment is ongoing
+    """
+    return Range(assignment.starts_at, assignment.ends_at, bounds="[)")
+
+
+def peak_allocation(
+    allocations: Iterable[Tuple[Range[datetime], int]], within: Range[datetime]
+) -> int:
+    """Finds the highest total allocation at any instant of a range.
+
+    Sweeps the start and end of every allocation clipped to the range in time order,
+    ends before starts at the same instant as the ranges are open at their end.
+
+    Args:
+        allocations (Iterable[Tuple[Range[datetime], int]]): Validity ranges and their allocations
+        within (Range[datetime]): The range checked
+
+    Returns:
+        int: The peak total allocation within the range
+    """
+    changes = []
+    for validity, allocation in allocations:
+        starts_at = max(validity.lower or EARLIEST, within.lower or EARLIEST)
+        ends_at = min(
+            (end for end in (validity.upper, within.upper) if end is not None),
+            default=None,
+        )
+        if ends_at is not None and ends_at <= starts_at:
+            continue
+        changes.append((starts_at, allocation))
+        if ends_at is not None:
+            changes.append((ends_at, -allocation))
+
+    peak, total = 0, 0
+    for _, change in sorted(changes):
+        total += change
+        peak = max(peak, total)
+    return peak
+
+
+class AssignmentService(IAssignmentService):
+    """The service for all assignment routes.
+    Contains all business logic
+
+    Args:
+        IAssignmentService: Interface defining required functionalities
+    """
+
+    def __init__(
+        self,
+        assignment_repository: IAssignmentRepository,
+        project_repository: IRepository[Project],
+    ) -> None:
+        """Initialize the service
+
+        Args:
+            assignment_repository (IAssignmentRepository): The assignment repository layer for database interactions
+            project_repository (IRepository[Project]): The project repository layer for database interactions
+        """
+
+        logger.info("Initializing AssignmentService")
+        self._assignment_repository = assignment_repository
+        self._project_repository = project_repository
+
+    async def create_assignment(self, assignment: AssignmentCreate) -> Assignment:
+        """Functionality for 'Assignment' entity creation and storage.
+
+        The user's row is locked until the assignment is stored, so concurrent
+        assignments of the same user cannot together exceed MAX_ALLOCATION.
+
+        Args:
+            assignment (AssignmentCreate): Validated Pydantic AssignmentCreate model
+
+        Returns:
+            Assignment: The successfully stored and created assignment
+        """
+
+        try:
+            logger.info("Creating assignment")
+            user_id, project_id = str(assignment.user_id), str(assignment.project_id)
+            if not await self._assignment_repository.lock_user(user_id):
+                raise UserNotFoundError
+            if not await self._project_repository.find(
+                {"id": project_id}, load_only=["id"]
+            ):
+                raise ProjectNotFoundError
+
+            validity = validity_range(assignment)
+            await self._check_allocation(user_id, validity, assignment.allocation)
+
+            return await self._assignment_repository.create(
+                Assignment(
+                    user_id=user_id,
+                    project_id=project_id,
+                    allocation=assignment.allocation,
+                    validity=validity,
+                )
+            )
+        except UserNotFoundError:
+            logger.error("User not found")
+            ExceptionHandler.raise_http_exception(400, "User not found")
+        except ProjectNotFoundError:
+            logger.error("Project not found")
+            ExceptionHandler.raise_http_exception(400, "Project not found")
+        except OverAllocationError as e:
+            logger.error("Over allocation: %s", e)
+            ExceptionHandler.raise_http_exception(409, str(e))
+        except IntegrityViolationError as e:
+            logger.error("Integrity violation: %s", e)
+            ExceptionHandler.raise_http_exception(
+                409, "User is already assigned to the project within this period"
+            )
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error creating assignment: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def update_assignment(
+        self, assignment_id: str, assignment: AssignmentUpdate
+    ) -> Assignment:
+        """Functionality for updating the allocation and validity of an existing assignment
+
+        Args:
+            assignment_id (str): The ID of the assignment to update
+            assignment (AssignmentUpdate): Validated Pydantic AssignmentUpdate model
+
+        Returns:
+            Assignment: Updated assignment
+        """
+
+        try:
+            logger.info("Updating assignment")
+            db_assignment = await self._find_assignment(assignment_id)
+            await self._assignment_repository.lock_user(str(db_assignment.user_id))
+
+            validity = validity_range(assignment)
+            await self._check_allocation(
+                str(db_assignment.user_id),
+                validity,
+                assignment.allocation,
+                exclude_id=db_assignment.id,
+            )
+
+            return await self._assignment_repository.update(
+                db_assignment,
+                updates={"allocation": assignment.allocation, "validity": validity},
+            )
+        except AssignmentNotFoundError:
+            logger.error("Assignment not found")
+            ExceptionHandler.raise_http_exception(404, "Assignment not found")
+        except OverAllocationError as e:
+            logger.error("Over allocation: %s", e)
+            ExceptionHandler.raise_http_exception(409, str(e))
+        except IntegrityViolationError as e:
+            logger.error("Integrity violation: %s", e)
+            ExceptionHandler.raise_http_exception(
+                409, "User is already assigned to the project within this period"
+            )
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error updating assignment: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def list_assignments(
+        self,
+        at: datetime,
+        user_id: str | None = None,
+        project_id: str | None = None,
+    ) -> List[Assignment]:
+        """Functionality for listing who is assigned to what at an instant
+
+        Args:
+            at (datetime): The instant
+            user_id (str | None, optional): Only list the user's assignments. Defaults to None.
+            project_id (str | None, optional): Only list the project's assignments. Defaults to None.
+
+        Returns:
+            List[Assignment]: The assignments valid at the instant
+        """
+
+        try:
+            logger.info("Listing assignments")
+            return await self._assignment_repository.list_at(
+                at, user_id=user_id, project_id=project_id
+            )
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error listing assignments: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def get_utilisation(
+        self, starts_at: datetime, ends_at: datetime, user_id: str | None = None
+    ) -> UtilisationReport:
+        """Functionality for reporting each user's time weighted allocation over a window
+
+        Args:
+            starts_at (datetime): The start of the window (inclusive)
+            ends_at (datetime): The end of the window (exclusive)
+            user_id (str | None, optional): Only report the user. Defaults to None.
+
+        Returns:
+            UtilisationReport: The allocation of every user assigned within the window
+        """
+
+        try:
+            logger.info("Getting utilisation")
+            if ends_at <= starts_at:
+                raise ValueError("ends_at must be after starts_at")
+
+            return UtilisationReport(
+                starts_at=starts_at,
+                ends_at=ends_at,
+                users=[
+                    Utilisation.model_validate(row)
+                    for row in await self._assignment_repository.utilisation(
+                        starts_at, ends_at, user_id=user_id
+                    )
+                ],
+            )
+        except ValueError as e:
+            logger.error("Invalid window: %s", e)
+            ExceptionHandler.raise_http_exception(400, str(e))
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error getting utilisation: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def delete_assignment(self, assignment_id: str) -> None:
+        """Functionality to find and delete an assignment entity
+
+        Args:
+            assignment_id (str): The ID of the assignment to delete
+        """
+
+        try:
+            logger.info("Deleting assignment")
+            await self._assignment_repository.delete(
+                await self._find_assignment(assignment_id)
+            )
+        except AssignmentNotFoundError:
+            logger.error("Assignment not found")
+            ExceptionHandler.raise_http_exception(404, "Assignment not found")
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error deleting assignment: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def _find_assignment(self, assignment_id: str) -> Assignment:
+        """Finds an assignment by ID, raising AssignmentNotFoundError if missing"""
+        assignments = await self._assignment_repository.find({"id": assignment_id})
+        if not assignments:
+            raise AssignmentNotFoundError
+        return assignments[0]
+
+    async def _check_allocation(
+        self,
+        user_id: str,
+        validity: Range[datetime],
+        allocation: int,
+        exclude_id: UUID | None = None,
+    ) -> None:
+        """Raises OverAllocationError if an allocation would take the user beyond MAX_ALLOCATION"""
+        overlapping = await self._assignment_repository.list_overlapping(
+            user_id, validity
+        )
+        peak = peak_allocation(
+            [
+                (existing.validity, existing.allocation)
+                for existing in overlapping
+                if existing.id != exclude_id
+            ]
+            + [(validity, allocation)],
+            within=validity,
+        )
+        if peak > MAX_ALLOCATION:
+            raise OverAllocationError(
+                f"User would be allocated {peak}% within this period (maximum {MAX_ALLOCATION}%)"
+            )
@@ -0,0 +1,319 @@
+"""The Service layer for the auto-staffing API routes"""
+
+import asyncio
+from datetime import datetime, timezone
+import logging
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from api.database.interfaces.assignment_repository_interface import (
+    IAssignmentRepository,
+)
+from api.database.interfaces.repository_interface import IRepository
+from api.database.models import Project, User
+from api.schemas.auto_staffing import (
+    ProposedAssignment,
+    StaffingPlan,
+    StaffingPlanApply,
+    StaffingPlanResult,
+    StaffingTargets,
+)
+from api.schemas.project import ProjectStatus
+from api.schemas.user import Roles
+from api.services.assignment_event_service import record_user_project
+from api.services.interfaces.auto_staffing_service_interface import (
+    IAutoStaffingService,
+)
+from api.utils.auto_staffing import build_cost_matrix, solve_staffing
+from api.utils.exceptions import (
+    DatabaseConnectionError,
+    ExceptionHandler,
+    IntegrityViolationError,
+    ProjectNotFoundError,
+    RepositoryError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Project statuses open to auto-staffing
+STAFFABLE_STATUSES = (ProjectStatus.DESIGN, ProjectStatus.BUILD)
+
+
+def compute_plan(
+    engineers: List[UUID],
+    projects: List[Project],
+    slots: List[int],
+    customer_of: Dict[UUID, UUID],
+    history: List[Tuple[UUID, UUID, int]],
+) -> Tuple[List[Tuple[UUID, UUID, float]], List[int]]:
+    """Builds the cost matrix inputs as NumPy arrays and solves the plan.
+
+    CPU bound - run outside the event loop.
+
+    Args:
+        engineers (List[UUID]): The ids of the unassigned engineers
+        projects (List[Project]): The projects to staff
+        slots (List[int]): The open slots of each project
+        customer_of (Dict[UUID, UUID]): The customer id of every project id
+        history (List[Tuple[UUID, UUID, int]]): (user id, project id, current allocation)
+        of every assignment of the engineers - the allocation is 0 unless valid now
+
+    Returns:
+        Tuple[List[Tuple[UUID, UUID, float]], List[int]]: The planned (user id, project id, cost)
+        assignments and the slots of each project left open
+    """
+    engineer_index = {user_id: i for i, user_id in enumerate(engineers)}
+    project_index = {project.id: j for j, project in enumerate(projects)}
+    customer_index = {
+        customer_id: k for k, customer_id in enumerate(set(customer_of.values()))
+    }
+    project_customers = np.array(
+        [customer_index[project.customer_id] for project in projects], dtype=np.intp
+    )
+    building = np.array(
+        [project.status == ProjectStatus.BUILD for project in projects], dtype=bool
+    )
+
+    load = np.zeros(len(engineers))
+    project_history = np.zeros((len(engineers), len(projects)), dtype=bool)
+    customer_history = np.zeros((len(engineers), len(customer_index)), dtype=bool)
+    if history:
+        rows = np.array(
+            [engineer_index[user_id] for user_id, _, _ in history], dtype=np.intp
+        )
+        np.add.at(
+            load, rows, np.array([allocation for _, _, allocation in history]) / 100
+        )
+
+        columns = np.array(
+            [project_index.get(project_id, -1) for _, project_id, _ in history],
+            dtype=np.intp,
+        )
+        staffed = columns >= 0
+        project_history[rows[staffed], columns[staffed]] = True
+
+        customer_columns = np.array(
+            [
+                (
+                    customer_index[customer_of[project_id]]
+                    if project_id in customer_of
+                    else -1
+                )
+                for _, project_id, _ in history
+            ],
+            dtype=np.intp,
+        )
+        known = customer_columns >= 0
+        customer_history[rows[known], customer_columns[known]] = True
+
+    cost = build_cost_matrix(
+        np.minimum(load, 1),
+        project_history,
+        customer_history,
+        project_customers,
+        building,
+    )
+    # Fully allocated engineers are left out of the plan
+    available = np.flatnonzero(load < 1)
+    open_slots = np.array(slots, dtype=np.intp)
+    rows, columns = solve_staffing(cost[available], open_slots)
+
+    filled = np.bincount(columns, minlength=len(projects))
+    planned = [
+        (
+            engineers[available[row]],
+            projects[column].id,
+            float(cost[available[row], column]),
+        )
+        for row, column in zip(rows, columns)
+    ]
+    return planned, (open_slots - filled).tolist()
+
+
+class AutoStaffingService(IAutoStaffingService):
+    """The service for the auto-staffing routes.
+    Contains all business logic
+
+    Args:
+        IAutoStaffingService: Interface defining required functionalities
+    """
+
+    def __init__(
+        self,
+        user_repository: IRepository[User],
+        project_repository: IRepository[Project],
+        assignment_repository: IAssignmentRepository,
+    ) -> None:
+        """Initialize the service
+
+        Args:
+            user_repository (IRepository[User]): The user repository layer for database interactions
+            project_repository (IRepository[Project]): The project repository layer for database interactions
+            assignment_repository (IAssignmentRepository): The assignment repository layer for database interactions
+        """
+        logger.info("Initializing AutoStaffingService")
+        self._user_repository = user_repository
+        self._project_repository = project_repository
+        self._assignment_repository = assignment_repository
+
+    async def propose_plan(self, targets: StaffingTargets) -> StaffingPlan:
+        """Functionality for proposing an optimal assignment of unassigned engineers to projects.
+
+        Each project's open slots are its target headcount less its current headcount.
+        Engineers are matched to slots at minimum total cost, preferring engineers who
+        worked on the project or for its customer before, engineers with the least
+        current allocation elsewhere and BUILD projects over DESIGN projects.
+        Nothing is stored - the plan is applied with 'apply_plan'.
+
+        Args:
+            targets (StaffingTargets): Target headcounts keyed by project id
+
+        Returns:
+            StaffingPlan: The proposed assignments and the slots left open
+        """
+
+        try:
+            logger.info("Proposing staffing plan")
+            all_projects = {
+                project.id: project
+                for project in await self._project_repository.list_all(
+                    load_only=["status", "active"]
+                )
+            }
+            projects = []
+            for project_id in targets.targets:
+                project = all_projects.get(project_id)
+                if project is None:
+                    raise ProjectNotFoundError(str(project_id))
+                if not project.active or project.status not in STAFFABLE_STATUSES:
+                    raise ValueError(
+                        f"Project {project_id} must be active and in DESIGN or BUILD"
+                    )
+                projects.append(project)
+
+            engineers = [
+                user.id
+                for user in await self._user_repository.find(
+                    {"role": Roles.ENGINEER, "project_id": None, "active": True},
+                    load_only=["id"],
+                )
+                or []
+            ]
+            headcounts = await self._user_repository.count_by(
+                "project_id", {"role": Roles.ENGINEER}
+            )
+            slots = [
+                max(targets.targets[project.id] - headcounts.get(project.id, 0), 0)
+                for project in projects
+            ]
+            now = datetime.now(timezone.utc)
+            history = [
+                (
+                    assignment.user_id,
+                    assignment.project_id,
+                    assignment.allocation if assignment.validity.contains(now) else 0,
+                )
+                for assignment in await self._assignment_repository.list_by_users(
+                    [str(user_id) for user_id in engineers]
+                )
+            ]
+
+            planned, unfilled = await asyncio.to_thread(
+                compute_plan,
+                engineers,
+                projects,
+                slots,
+                {project.id: project.customer_id for project in all_projects.values()},
+                history,
+            )
+            logger.info(
+                "Planned %s assignments from %s engineers", len(planned), len(engineers)
+            )
+            return StaffingPlan(
+                assignments=[
+                    ProposedAssignment(
+                        user_id=user_id, project_id=project_id, cost=cost
+                    )
+                    for user_id, project_id, cost in planned
+                ],
+                unfilled={
+                    project.id: open_slots
+                    for project, open_slots in zip(projects, unfilled)
+                    if open_slots
+                },
+                candidates=len(engineers),
+                total_cost=sum(cost for _, _, cost in planned),
+            )
+        except ProjectNotFoundError as e:
+            logger.error("Project not found: %s", e)
+            ExceptionHandler.raise_http_exception(400, f"Project not found: {e}")
+        except ValueError as e:
+            logger.error("Project not staffable: %s", e)
+            ExceptionHandler.raise_http_exception(400, str(e))
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error proposing staffing plan: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def apply_plan(
+        self, plan: StaffingPlanApply, actor: str | None = None
+    ) -> StaffingPlanResult:
+        """Functionality for applying a staffing plan as a single batch update.
+
+        Only users still without a project are assigned, so engineers assigned by
+        hand since the plan was proposed keep their project. Each assignment made is
+        recorded in the assignment audit log.
+
+        Args:
+            plan (StaffingPlanApply): The planned assignments
+            actor (str | None, optional): The user name of the admin applying the plan. Defaults to None.
+
+        Returns:
+            StaffingPlanResult: The users assigned and the users skipped
+        """
+
+        try:
+            logger.info(
+                "Applying staffing plan of %s assignments", len(plan.assignments)
+            )
+            applied = set(
+                await self._user_repository.bulk_update(
+                    "project_id",
+                    {
+                        assignment.user_id: assignment.project_id
+                        for assignment in plan.assignments
+                    },
+                    only_unset=True,
+                )
+            )
+            for assignment in plan.assignments:
+                if assignment.user_id in applied:
+                    record_user_project(
+                        actor, assignment.user_id, None, assignment.project_id
+                    )
+            return StaffingPlanResult(
+                applied=[a.user_id for a in plan.assignments if a.user_id in applied],
+                skipped=[
+                    a.user_id for a in plan.assignments if a.user_id not in applied
+                ],
+            )
+        except IntegrityViolationError as e:
+            logger.error("Integrity violation: %s", e)
+            ExceptionHandler.raise_http_exception(400, "Project not found")
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error applying staffing plan: %s", e)
+            ExceptionHandler.raise_internal_server_error()
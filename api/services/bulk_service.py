@@ -0,0 +1,411 @@
+"""The Service layer for all bulk import and export API routes"""
+
+import asyncio
+import logging
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import String
+
+from api.core.config import app_config
+from api.database.interfaces.repository_interface import IRepository
+from api.database.models import Customer, Project, User
+from api.database.session import Base
+from api.schemas.bulk import (
+    BulkEntity,
+    ExportFormat,
+    ImportFormat,
+    ImportReport,
+    ImportRowError,
+)
+from api.schemas.customer import CustomerCreate, CustomerOut
+from api.schemas.project import ProjectCreate, ProjectOut
+from api.schemas.user import Roles, UserCreate, UserOut
+from api.services.interfaces.auth_service_interface import IAuthService
+from api.services.interfaces.bulk_service_interface import IBulkService
+from api.utils.exceptions import (
+    DatabaseConnectionError,
+    ExceptionHandler,
+    PasswordHashingError,
+    RepositoryError,
+)
+from api.utils.parsers import Record, iter_records, next_chunk
+
+
+logger = logging.getLogger(__name__)
+
+RowT = TypeVar("RowT", bound=BaseModel)
+
+# Validated rows paired with their record number in the upload
+ValidRows = List[Tuple[int, RowT]]
+
+
+class BulkService(IBulkService):
+    """The service for all bulk routes.
+    Contains all business logic
+
+    Args:
+        IBulkService: Interface defining required functionalities
+    """
+
+    def __init__(
+        self,
+        user_repository: IRepository[User],
+        customer_repository: IRepository[Customer],
+        project_repository: IRepository[Project],
+        auth_service: IAuthService,
+    ) -> None:
+        """Initialize the service
+
+        Args:
+            user_repository (IRepository[User]): The user repository layer
+            customer_repository (IRepository[Customer]): The customer repository layer
+            project_repository (IRepository[Project]): The project repository layer
+            auth_service (IAuthService): Service containing AuthN / AuthZ functionalities
+        """
+        logger.info("Initializing BulkService")
+        self._user_repository = user_repository
+        self._customer_repository = customer_repository
+        self._project_repository = project_repository
+        self._auth_service = auth_service
+
+    async def import_records(
+        self,
+        entity: BulkEntity,
+        stream: BinaryIO,
+        file_format: ImportFormat,
+        chunk_size: int | None = None,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> ImportReport:
+        """Functionality to stream, validate and load an uploaded file of entities.
+
+        The file is parsed one chunk at a time and each chunk is loaded
+        with a single batched insert, so memory use is bounded by the chunk size.
+
+        Args:
+            entity (BulkEntity): The type of entity contained in the file
+            stream (BinaryIO): The uploaded file
+            file_format (ImportFormat): The format of the uploaded file
+            chunk_size (int | None, optional): Records loaded per batch. Defaults to None.
+            on_progress (Callable[[int], None] | None, optional): Called with the number of
+            records processed after each chunk is loaded. Defaults to None.
+
+        Returns:
+            ImportReport: Counts of processed, imported and failed rows with per-row errors
+        """
+
+        try:
+            logger.info("Importing %s", entity.value)
+            size = chunk_size or app_config.bulk_chunk_size
+            records = iter_records(stream, file_format)
+            report = ImportReport(entity=entity)
+
+            # Parse off the event loop - file reads may hit the disk
+            while chunk := await asyncio.to_thread(next_chunk, records, size):
+                report.processed += len(chunk)
+                rows = self._validate(entity, chunk, report)
+
+                if entity == BulkEntity.CUSTOMERS:
+                    await self._import_customers(
+                        cast(ValidRows[CustomerCreate], rows), report
+                    )
+                elif entity == BulkEntity.PROJECTS:
+                    await self._import_projects(
+                        cast(ValidRows[ProjectCreate], rows), report
+                    )
+                else:
+                    await self._import_users(cast(ValidRows[UserCreate], rows), report)
+
+                if on_progress is not None:
+                    on_progress(report.processed)
+
+            logger.info(
+                "Imported %s of %s %s", report.imported, report.processed, entity.value
+            )
+            report.errors.sort(key=lambda error: error.row)
+            return report
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except PasswordHashingError as e:
+            logger.error("Password hashing error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except UnicodeDecodeError as e:
+            logger.error("Decoding error: %s", e)
+            ExceptionHandler.raise_http_exception(400, "File must be UTF-8 encoded")
+        except Exception as e:
+            logger.error("Error importing records: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def export_records(
+        self, entity: BulkEntity, file_format: ExportFormat
+    ) -> AsyncIterator[bytes]:
+        """Functionality to stream every stored entity of a type in the requested format.
+
+        Only the fields of the entity's response model are exported,
+        so private columns such as password hashes are never included.
+
+        Args:
+            entity (BulkEntity): The type of entity to export
+            file_format (ExportFormat): The output format
+
+        Yields:
+            bytes: Chunks of the encoded export
+        """
+
+        logger.info("Exporting %s", entity.value)
+        exports: Dict[
+            BulkEntity, Tuple[IRepository, Type[BaseModel], Type[Base]]
+        ] = {
+            BulkEntity.USERS: (self._user_repository, UserOut, User),
+            BulkEntity.CUSTOMERS: (self._customer_repository, CustomerOut, Customer),
+            BulkEntity.PROJECTS: (self._project_repository, ProjectOut, Project),
+        }
+        repository, schema, model = exports[entity]
+        columns = [
+            column.key
+            for column in model.__table__.columns
+            if column.key in schema.model_fields
+        ]
+
+        try:
+            async for chunk in repository.stream_export(columns, file_format):
+                yield chunk
+            logger.info("Exported %s", entity.value)
+        except RepositoryError as e:
+            # The response has already started, so the stream can only be cut short
+            logger.error("Repository error exporting %s: %s", entity.value, e)
+            raise
+
+    def _validate(
+        self, entity: BulkEntity, chunk: List[Record], report: ImportReport
+    ) -> ValidRows[BaseModel]:
+        """Validates a chunk of records against the entity's creation schema and the
+        lengths of its columns, which can be shorter than the schema allows.
+
+        Args:
+            entity (BulkEntity): The type of entity being imported
+            chunk (List[Record]): The parsed records
+            report (ImportReport): The report to record any failures against
+
+        Returns:
+            ValidRows: The records that passed validation
+        """
+        schemas: Dict[BulkEntity, Tuple[Type[BaseModel], Type[Base]]] = {
+            BulkEntity.USERS: (UserCreate, User),
+            BulkEntity.CUSTOMERS: (CustomerCreate, Customer),
+            BulkEntity.PROJECTS: (ProjectCreate, Project),
+        }
+        schema, model = schemas[entity]
+        lengths = {
+            column.key: column.type.length
+            for column in model.__table__.columns
+            if isinstance(column.type, String)
+            and column.type.length
+            and column.key in schema.model_fields
+        }
+
+        rows: ValidRows[BaseModel] = []
+        for row_number, record in chunk:
+            if isinstance(record, Exception):
+                self._fail(report, row_number, [f"Invalid record: {record}"])
+                continue
+            try:
+                row = schema.model_validate(record)
+            except ValidationError as e:
+                self._fail(
+                    report,
+                    row_number,
+                    [
+                        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                        for error in e.errors()
+                    ],
+                )
+                continue
+
+            too_long = [
+                f"{key}: String should have at most {length} characters"
+                for key, length in lengths.items()
+                if isinstance(getattr(row, key), str) and len(getattr(row, key)) > length
+            ]
+            if too_long:
+                self._fail(report, row_number, too_long)
+                continue
+            rows.append((row_number, row))
+        return rows
+
+    async def _import_customers(
+        self, rows: ValidRows[CustomerCreate], report: ImportReport
+    ) -> None:
+        """Loads a chunk of validated customers.
+
+        Args:
+            rows (ValidRows): Validated CustomerCreate models
+            report (ImportReport): The report to record results against
+        """
+        rows = self._drop_duplicates(rows, ("name",), report)
+        inserted = set(
+            await self._customer_repository.bulk_create(
+                [{"name": row.name, "details": row.details} for _, row in rows],
+                returning="name",
+            )
+        )
+        self._reconcile(rows, "name", inserted, "Customer already exists", report)
+
+    async def _import_projects(
+        self, rows: ValidRows[ProjectCreate], report: ImportReport
+    ) -> None:
+        """Loads a chunk of validated projects, rejecting any with an unknown customer.
+
+        Args:
+            rows (ValidRows): Validated ProjectCreate models
+            report (ImportReport): The report to record results against
+        """
+        rows = self._drop_duplicates(rows, ("name",), report)
+        customers = await self._customer_repository.existing_values(
+            "id", list({row.customer_id for _, row in rows})
+        )
+
+        valid: ValidRows[ProjectCreate] = []
+        for row_number, row in rows:
+            if row.customer_id in customers:
+                valid.append((row_number, row))
+            else:
+                self._fail(report, row_number, ["Customer not found"])
+
+        inserted = set(
+            await self._project_repository.bulk_create(
+                [
+                    {
+                        "name": row.name,
+                        "status": row.status,
+                        "details": row.details,
+                        "customer_id": row.customer_id,
+                    }
+                    for _, row in valid
+                ],
+                returning="name",
+            )
+        )
+        self._reconcile(valid, "name", inserted, "Project already exists", report)
+
+    async def _import_users(
+        self, rows: ValidRows[UserCreate], report: ImportReport
+    ) -> None:
+        """Loads a chunk of validated users, hashing their passwords in parallel.
+
+        Args:
+            rows (ValidRows): Validated UserCreate models
+            report (ImportReport): The report to record results against
+        """
+        rows = self._drop_duplicates(rows, ("user_name", "email"), report)
+
+        # bcrypt releases the GIL, so hashing scales across the default thread pool
+        loop = asyncio.get_running_loop()
+        hashes = await asyncio.gather(
+            *(
+                loop.run_in_executor(None, self._auth_service.hash_pwd, row.password)
+                for _, row in rows
+            )
+        )
+
+        inserted = set(
+            await self._user_repository.bulk_create(
+                [
+                    {
+                        "user_name": row.user_name,
+                        "hashed_password": hashed_password,
+                        "first_name": row.first_name,
+                        "last_name": row.last_name,
+                        "email": row.email,
+                        "role": row.role,
+                        "admin": row.role == Roles.MANAGER,
+                    }
+                    for (_, row), hashed_password in zip(rows, hashes)
+                ],
+                returning="user_name",
+            )
+        )
+        self._reconcile(
+            rows, "user_name", inserted, "Username or email already exists", report
+        )
+
+    def _drop_duplicates(
+        self, rows: ValidRows[RowT], keys: Tuple[str, ...], report: ImportReport
+    ) -> ValidRows[RowT]:
+        """Rejects rows repeating a unique value already seen earlier in the same chunk.
+
+        Args:
+            rows (ValidRows): Validated rows
+            keys (Tuple[str, ...]): The unique attributes of the entity
+            report (ImportReport): The report to record failures against
+
+        Returns:
+            ValidRows: The rows with in-chunk duplicates removed
+        """
+        seen: Dict[str, Set[Any]] = {key: set() for key in keys}
+        unique: ValidRows[RowT] = []
+        for row_number, row in rows:
+            duplicates = [key for key in keys if getattr(row, key) in seen[key]]
+            if duplicates:
+                self._fail(
+                    report,
+                    row_number,
+                    [f"{key}: duplicated within upload" for key in duplicates],
+                )
+                continue
+            for key in keys:
+                seen[key].add(getattr(row, key))
+            unique.append((row_number, row))
+        return unique
+
+    def _reconcile(
+        self,
+        rows: ValidRows[RowT],
+        key: str,
+        inserted: Set[Any],
+        message: str,
+        report: ImportReport,
+    ) -> None:
+        """Records every row missing from the inserted set as a conflict failure.
+
+        Args:
+            rows (ValidRows): The rows submitted for insertion
+            key (str): The unique attribute returned by the insert
+            inserted (Set[Any]): The key values of the inserted rows
+            message (str): Error message for rows that were skipped
+            report (ImportReport): The report to record results against
+        """
+        report.imported += len(inserted)
+        for row_number, row in rows:
+            if getattr(row, key) not in inserted:
+                self._fail(report, row_number, [message])
+
+    def _fail(self, report: ImportReport, row_number: int, errors: List[str]) -> None:
+        """Records a failed row, keeping the error list within the configured bound.
+
+        Args:
+            report (ImportReport): The report to record the failure against
+            row_number (int): The 1-based record number within the upload
+            errors (List[str]): The reasons the row failed
+        """
+        report.failed += 1
+        if len(report.errors) < app_config.bulk_max_errors:
+            report.errors.append(ImportRowError(row=row_number, errors=errors))
+        else:
+            report.errors_truncated = True
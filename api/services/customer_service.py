@@ -4,8 +4,13 @@ import logging
 from typing import List
 
 from api.database.interfaces.repository_interface import IRepository
-from api.database.models import Customer
-from api.schemas.customer import CustomerCreate, CustomerUpdate
+from api.database.interfaces.unit_of_work_interface import IUnitOfWork
+from api.database.models import Customer, Project
+from api.schemas.customer import (
+    CustomerCreate,
+    CustomerUpdate,
+    CustomerWithProjectsCreate,
+)
 from api.services.interfaces.customer_service_interface import ICustomerService
 from api.utils.exceptions import (
     AttributeNotFoundError,
@@ -14,6 +19,7 @@ from api.utils.exceptions import (
     DatabaseConnectionError,
     ExceptionHandler,
     IntegrityViolationError,
+    ProjectAlreadyExistsError,
     RepositoryError,
 )
 
@@ -29,14 +35,23 @@ class CustomerService(ICustomerService):
         ICustomerService: Interface defining required functionalities
     """
 
-    def __init__(self, customer_repository: IRepository[Customer]) -> None:
+    def __init__(
+        self,
+        customer_repository: IRepository[Customer],
+        project_repository: IRepository[Project],
+        unit_of_work: IUnitOfWork,
+    ) -> None:
         """Initialize the service
 
         Args:
             customer_repository (IRepository[Customer]): The repository layer for database interactions
+            project_repository (IRepository[Project]): The repository layer for a customer's projects
+            unit_of_work (IUnitOfWork): Groups the repositories' writes into one transaction
         """
         logger.info("Initializing CustomerService")
         self._customer_repository = customer_repository
+        self._project_repository = project_repository
+        self._unit_of_work = unit_of_work
 
     async def create_customer(self, customer: CustomerCreate) -> Customer:
         """Functionality for 'Customer' entity creation and storage
@@ -76,6 +91,76 @@ class CustomerService(ICustomerService):
             logger.error("Error creating user: %s", e)
             ExceptionHandler.raise_internal_server_error()
 
+    async def create_customer_with_projects(
+        self, customer: CustomerWithProjectsCreate
+    ) -> Customer:
+        """Functionality for creating a customer together with its projects.
+
+        The customer and its projects are written in a single unit of work, so either
+        all of them are created or, if any name is taken, none are.
+
+        Args:
+            customer (CustomerWithProjectsCreate): Validated Pydantic CustomerWithProjectsCreate model
+
+        Returns:
+            Customer: The created customer with its projects loaded
+        """
+
+        try:
+            logger.info("Creating customer with %s projects", len(customer.projects))
+            names = [project.name for project in customer.projects]
+            if await self.find_customer(name=customer.name):
+                raise CustomerAlreadyExistsError
+            if await self._project_repository.existing_values("name", names):
+                raise ProjectAlreadyExistsError
+
+            async with self._unit_of_work:
+                db_customer = await self._customer_repository.create(
+                    Customer(name=customer.name, details=customer.details)
+                )
+                created = await self._project_repository.bulk_create(
+                    [
+                        {
+                            "name": project.name,
+                            "status": project.status,
+                            "details": project.details,
+                            "customer_id": db_customer.id,
+                        }
+                        for project in customer.projects
+                    ],
+                    returning="id",
+                )
+                # A project created concurrently under the same name was skipped
+                if len(created) < len(names):
+                    raise ProjectAlreadyExistsError
+
+            logger.info("Customer and projects created")
+            created_customer = await self.find_customer(
+                customer_id=str(db_customer.id), load_relations=["projects"]
+            )
+            # Deleted by a concurrent request since the unit committed
+            if created_customer is None:
+                raise CustomerNotFoundError
+            return created_customer
+        except CustomerNotFoundError as e:
+            logger.error("Customer not found: %s", e)
+            ExceptionHandler.raise_http_exception(404, "Customer not found")
+        except (CustomerAlreadyExistsError, ProjectAlreadyExistsError) as e:
+            logger.error("Customer or project already exists: %s", e)
+            ExceptionHandler.raise_already_exists_exception()
+        except IntegrityViolationError as e:
+            logger.error("Integrity violation: %s", e)
+            ExceptionHandler.raise_already_exists_exception()
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error creating customer with projects: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
     async def update_customer(
         self, customer_id: str, customer: CustomerUpdate
     ) -> Customer:
@@ -125,17 +210,17 @@ class CustomerService(ICustomerService):
         self,
         name: str | None = None,
         customer_id: str | None = None,
-        projects: bool = False,
-        users: bool = False,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
     ) -> Customer:
         """Functionality for retrieving a customer entity from database
 
         Args:
             name (str | None, optional): Name of customer to find. Defaults to None.
             customer_id (str | None, optional): ID of customer to find. Defaults to None.
-            projects (bool, optional): Include customer's related projects? Defaults to False.
-            users (bool, optional): Include customer's related users? Defaults to False.
-            Only applicable if projects loaded.
+            include (List[str] | None, optional): Dotted paths of the related entities to load,
+            e.g. 'projects.users'. Defaults to None.
+            fields (List[str] | None, optional): The only attributes to load. Defaults to None.
 
         Returns:
             Customer: Retrieved customer entity
@@ -148,15 +233,13 @@ class CustomerService(ICustomerService):
             customer = await self.find_customer(
                 name=name,
                 customer_id=customer_id,
-                load_relations=["projects"] if projects else None,
+                load_relations=include,
+                load_only=fields,
             )
 
             if not customer:
                 raise CustomerNotFoundError
             logger.info("Customer found")
-            if users and projects:
-                logger.info("Loading users")
-                await self.load_users([customer])
             return customer
         except CustomerNotFoundError as e:
             logger.error("Customer not found: %s", e)
@@ -175,14 +258,19 @@ class CustomerService(ICustomerService):
             ExceptionHandler.raise_internal_server_error()
 
     async def list_customers(
-        self, projects: bool = False, users: bool = False
+        self,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
+        ids: List[str] | None = None,
     ) -> List[Customer]:
-        """Functionality for listing all customers in the database.
+        """Functionality for listing all customers in the database, or those with the given ids.
 
         Args:
-            projects (bool, optional): Include customer's related projects? Defaults to False.
-            users (bool, optional): Include customer's related users? Defaults to False.
-            Only applicable if projects loaded.
+            include (List[str] | None, optional): Dotted paths of the related entities to load,
+            e.g. 'projects.users'. Defaults to None.
+            fields (List[str] | None, optional): The only attributes to load. Defaults to None.
+            ids (List[str] | None, optional): Only return the customers with these ids,
+            in the same order. Defaults to None (all customers).
 
         Returns:
             List[Customer]: A list containing all customer entities
@@ -190,16 +278,13 @@ class CustomerService(ICustomerService):
 
         try:
             logger.info("Listing customers")
-            customers = await self._customer_repository.list_all(
-                load_relations=["projects"] if projects else None
+            if ids is not None:
+                return await self._customer_repository.get_many(
+                    ids, load_relations=include, load_only=fields
+                )
+            return await self._customer_repository.list_all(
+                load_relations=include, load_only=fields
             )
-
-            if len(customers) < 1 or not users or not projects:
-                return customers
-
-            logger.info("Loading relations")
-            await self.load_users(customers)
-            return customers
         except DatabaseConnectionError as e:
             logger.error("Database connection error: %s", e)
             ExceptionHandler.raise_internal_server_error()
@@ -215,6 +300,7 @@ class CustomerService(ICustomerService):
         load_relations: List[str] | None = None,
         name: str | None = None,
         customer_id: str | None = None,
+        load_only: List[str] | None = None,
     ) -> Customer | None:
         """Functionality for finding a customer in the database.
 
@@ -225,6 +311,7 @@ class CustomerService(ICustomerService):
             to load async. Defaults to None.
             name (str | None, optional): Name of customer to find. Defaults to None.
             customer_id (str | None, optional): ID of customer to find. Defaults to None.
+            load_only (List[str] | None, optional): The only attributes to load. Defaults to None.
 
         Returns:
             Customer | None: The found customer entity or None
@@ -247,7 +334,10 @@ class CustomerService(ICustomerService):
                 raise ValueError("No parameters provided")
 
             result = await self._customer_repository.find(
-                params=params, and_condition=False, load_relations=load_relations
+                params=params,
+                and_condition=False,
+                load_relations=load_relations,
+                load_only=load_only,
             )
             if not result:
                 return None
@@ -294,14 +384,3 @@ class CustomerService(ICustomerService):
         except Exception as e:
             logger.error("Error creating user: %s", e)
             ExceptionHandler.raise_internal_server_error()
-
-    async def load_users(self, customers: List[Customer]) -> None:
-        """Helper function to load any required related users async.
-
-        Args:
-            customers (List[Customer]): A list containing customer entities
-        """
-        for customer in customers:
-            if customer.projects:
-                for project in customer.projects:
-                    await project.awaitable_attrs.users
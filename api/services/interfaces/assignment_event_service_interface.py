@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+
+from api.schemas.assignment_event import AssignmentEventPage, AssignmentEventType
+
+
+class IAssignmentEventService(ABC):
+    """Service interface for Assignment Event Service
+
+    Defines necessary functions for inheriting service
+    """
+
+    @abstractmethod
+    async def list_events(
+        self,
+        limit: int,
+        before: int | None = None,
+        user_id: str | None = None,
+        project_id: str | None = None,
+        event_type: AssignmentEventType | None = None,
+    ) -> AssignmentEventPage:
+        pass
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+from api.database.models import Assignment
+from api.schemas.assignment import AssignmentCreate, AssignmentUpdate, UtilisationReport
+
+
+class IAssignmentService(ABC):
+    """Service interface for Assignment Service
+
+    Defines necessary functions for inheriting service
+    """
+
+    @abstractmethod
+    async def create_assignment(self, assignment: AssignmentCreate) -> Assignment:
+        pass
+
+    @abstractmethod
+    async def update_assignment(
+        self, assignment_id: str, assignment: AssignmentUpdate
+    ) -> Assignment:
+        pass
+
+    @abstractmethod
+    async def list_assignments(
+        self,
+        at: datetime,
+        user_id: str | None = None,
+        project_id: str | None = None,
+    ) -> List[Assignment]:
+        pass
+
+    @abstractmethod
+    async def get_utilisation(
+        self, starts_at: datetime, ends_at: datetime, user_id: str | None = None
+    ) -> UtilisationReport:
+        pass
+
+    @abstractmethod
+    async def delete_assignment(self, assignment_id: str) -> None:
+        pass
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+
+from api.schemas.auto_staffing import (
+    StaffingPlan,
+    StaffingPlanApply,
+    StaffingPlanResult,
+    StaffingTargets,
+)
+
+
+class IAutoStaffingService(ABC):
+    """Service interface for Auto Staffing Service
+
+    Defines necessary functions for inheriting service
+    """
+
+    @abstractmethod
+    async def propose_plan(self, targets: StaffingTargets) -> StaffingPlan:
+        pass
+
+    @abstractmethod
+    async def apply_plan(
+        self, plan: StaffingPlanApply, actor: str | None = None
+    ) -> StaffingPlanResult:
+        pass
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, BinaryIO, Callable
+
+from api.schemas.bulk import BulkEntity, ExportFormat, ImportFormat, ImportReport
+
+
+class IBulkService(ABC):
+    """Service interface for Bulk Service
+
+    Defines necessary functions for inheriting service
+    """
+
+    @abstractmethod
+    async def import_records(
+        self,
+        entity: BulkEntity,
+        stream: BinaryIO,
+        file_format: ImportFormat,
+        chunk_size: int | None = None,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> ImportReport:
+        pass
+
+    @abstractmethod
+    def export_records(
+        self, entity: BulkEntity, file_format: ExportFormat
+    ) -> AsyncIterator[bytes]:
+        pass
@@ -2,7 +2,11 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from api.database.models import Customer
-from api.schemas.customer import CustomerCreate, CustomerUpdate
+from api.schemas.customer import (
+    CustomerCreate,
+    CustomerUpdate,
+    CustomerWithProjectsCreate,
+)
 
 
 class ICustomerService(ABC):
@@ -15,6 +19,12 @@ class ICustomerService(ABC):
     async def create_customer(self, customer: CustomerCreate) -> Customer:
         pass
 
+    @abstractmethod
+    async def create_customer_with_projects(
+        self, customer: CustomerWithProjectsCreate
+    ) -> Customer:
+        pass
+
     @abstractmethod
     async def update_customer(
         self, customer_id: str, customer: CustomerUpdate
@@ -23,7 +33,10 @@ class ICustomerService(ABC):
 
     @abstractmethod
     async def list_customers(
-        self, projects: bool = False, users: bool = False
+        self,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
+        ids: List[str] | None = None,
     ) -> List[Customer]:
         pass
 
@@ -32,8 +45,8 @@ class ICustomerService(ABC):
         self,
         name: str | None = None,
         customer_id: str | None = None,
-        projects: bool = False,
-        users: bool = False,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
     ) -> Customer:
         pass
 
@@ -43,6 +56,7 @@ class ICustomerService(ABC):
         load_relations: List[str] | None = None,
         name: str | None = None,
         customer_id: str | None = None,
+        load_only: List[str] | None = None,
     ) -> Optional[Customer]:
         pass
 
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, BinaryIO, Tuple
+
+from api.database.models import Job
+from api.schemas.bulk import BulkEntity, ImportFormat
+from api.schemas.job import JobCreate
+
+
+class IJobService(ABC):
+    """Service interface for Job Service
+
+    Defines necessary functions for inheriting service
+    """
+
+    @abstractmethod
+    async def enqueue(self, job: JobCreate, actor: str | None = None) -> Job:
+        pass
+
+    @abstractmethod
+    async def enqueue_import(
+        self,
+        entity: BulkEntity,
+        file_format: ImportFormat,
+        payload: BinaryIO,
+        actor: str | None = None,
+    ) -> Job:
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> Job:
+        pass
+
+    @abstractmethod
+    async def get_output(self, job_id: str) -> Tuple[Job, AsyncIterator[bytes]]:
+        pass
@@ -16,7 +16,9 @@ class IProjectService(ABC):
         pass
 
     @abstractmethod
-    async def update_project(self, project_id: str, project: ProjectUpdate) -> Project:
+    async def update_project(
+        self, project_id: str, project: ProjectUpdate, actor: str | None = None
+    ) -> Project:
         pass
 
     @abstractmethod
@@ -24,7 +26,8 @@ class IProjectService(ABC):
         self,
         name: str | None = None,
         project_id: str | None = None,
-        users: bool = False,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
     ) -> Project:
         pass
 
@@ -34,11 +37,17 @@ class IProjectService(ABC):
         load_relations: List[str] | None = None,
         name: str | None = None,
         project_id: str | None = None,
+        load_only: List[str] | None = None,
     ) -> Project | None:
         pass
 
     @abstractmethod
-    async def list_projects(self, users: bool = False) -> List[Project]:
+    async def list_projects(
+        self,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
+        ids: List[str] | None = None,
+    ) -> List[Project]:
         pass
 
     @abstractmethod
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from api.schemas.project import ProjectStatus
+from api.schemas.report import (
+    ProjectStatusHistory,
+    StaffingReport,
+    TimeInStatusReport,
+)
+
+
+class IReportService(ABC):
+    """Service interface for Report Service
+
+    Defines necessary functions for inheriting service
+    """
+
+    @abstractmethod
+    async def get_staffing_report(
+        self, customer_id: str | None = None, status: ProjectStatus | None = None
+    ) -> StaffingReport:
+        pass
+
+    @abstractmethod
+    async def refresh_staffing_report(self) -> None:
+        pass
+
+    @abstractmethod
+    async def get_time_in_status(
+        self, customer_id: str | None = None, since: datetime | None = None
+    ) -> TimeInStatusReport:
+        pass
+
+    @abstractmethod
+    async def get_project_status_history(self, project_id: str) -> ProjectStatusHistory:
+        pass
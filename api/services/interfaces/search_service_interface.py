@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+from api.schemas.search import SearchResults
+
+
+class ISearchService(ABC):
+    """Service interface for Search Service
+
+    Defines necessary functions for inheriting service
+    """
+
+    @abstractmethod
+    async def search(
+        self, query: str, limit: int, include_users: bool = False
+    ) -> SearchResults:
+        pass
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from api.database.models import Skill
+from api.schemas.skill import CandidateList, SkillCreate, SkillSet
+
+
+class ISkillService(ABC):
+    """Service interface for Skill Service
+
+    Defines necessary functions for inheriting service
+    """
+
+    @abstractmethod
+    async def create_skill(self, skill: SkillCreate) -> Skill:
+        pass
+
+    @abstractmethod
+    async def list_skills(self) -> List[Skill]:
+        pass
+
+    @abstractmethod
+    async def set_user_skills(self, user_id: str, skills: SkillSet) -> SkillSet:
+        pass
+
+    @abstractmethod
+    async def set_project_skills(self, project_id: str, skills: SkillSet) -> SkillSet:
+        pass
+
+    @abstractmethod
+    async def get_candidates(
+        self, project_id: str, limit: int, unassigned_only: bool = False
+    ) -> CandidateList:
+        pass
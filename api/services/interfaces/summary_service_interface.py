@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+from api.schemas.summary import Summary
+
+
+class ISummaryService(ABC):
+    """Service interface for Summary Service
+
+    Defines necessary functions for inheriting service
+    """
+
+    @abstractmethod
+    async def get_summary(self) -> Summary:
+        pass
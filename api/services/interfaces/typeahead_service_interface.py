@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from api.schemas.typeahead import TypeaheadResults, TypeaheadType
+
+
+class ITypeaheadService(ABC):
+    """Service interface for Typeahead Service
+
+    Defines necessary functions for inheriting service
+    """
+
+    @abstractmethod
+    async def typeahead(
+        self, prefix: str, types: List[TypeaheadType], limit: int
+    ) -> TypeaheadResults:
+        pass
@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from api.database.models import User
 from api.schemas.auth import Token, TokenData
-from api.schemas.user import UserCreate, UserUpdate
+from api.schemas.user import UserCreate, UserProjectMoves, UserUpdate
 
 
 class IUserService(ABC):
@@ -21,15 +21,30 @@ class IUserService(ABC):
         pass
 
     @abstractmethod
-    async def get_user_by_id(self, user_id: str, project: bool = False) -> User:
+    async def get_user_by_id(
+        self,
+        user_id: str,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
+    ) -> User:
         pass
 
     @abstractmethod
-    async def list_users(self, projects: bool = False) -> List[User]:
+    async def list_users(
+        self,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
+        ids: List[str] | None = None,
+    ) -> List[User]:
         pass
 
     @abstractmethod
-    async def get_current_user(self, token_data: TokenData) -> User:
+    async def get_current_user(
+        self,
+        token_data: TokenData,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
+    ) -> User:
         pass
 
     @abstractmethod
@@ -39,6 +54,7 @@ class IUserService(ABC):
         username: str | None = None,
         user_email: str | None = None,
         user_id: str | None = None,
+        load_only: List[str] | None = None,
     ) -> Optional[User]:
         pass
 
@@ -47,5 +63,13 @@ class IUserService(ABC):
         pass
 
     @abstractmethod
-    async def update_user_project(self, user_id: str, project_id: str | None) -> User:
+    async def update_user_project(
+        self, user_id: str, project_id: str | None, actor: str | None = None
+    ) -> User:
+        pass
+
+    @abstractmethod
+    async def move_users(
+        self, moves: UserProjectMoves, actor: str | None = None
+    ) -> List[User]:
         pass
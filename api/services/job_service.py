@@ -0,0 +1,194 @@
+"""The Service layer for queueing background jobs and reading their progress"""
+
+import logging
+from typing import AsyncIterator, BinaryIO, Tuple
+
+from api.core.config import app_config
+from api.database.interfaces.job_repository_interface import IJobRepository
+from api.database.models import Job
+from api.schemas.bulk import BulkEntity, ImportFormat
+from api.schemas.job import JobCreate, JobFile, JobKind, JobStatus
+from api.services.interfaces.job_service_interface import IJobService
+from api.utils.exceptions import (
+    DatabaseConnectionError,
+    ExceptionHandler,
+    JobNotFoundError,
+    JobOutputUnavailableError,
+    RepositoryError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobService(IJobService):
+    """The service for all job routes.
+    Contains all business logic
+
+    Jobs are only queued here - they are claimed and run by the job workers,
+    see 'api.services.job_worker'.
+
+    Args:
+        IJobService: Interface defining required functionalities
+    """
+
+    def __init__(self, job_repository: IJobRepository) -> None:
+        """Initialize the service
+
+        Args:
+            job_repository (IJobRepository): The repository layer for the job queue
+        """
+        logger.info("Initializing JobService")
+        self._job_repository = job_repository
+
+    async def enqueue(self, job: JobCreate, actor: str | None = None) -> Job:
+        """Functionality for queueing an export or staffing job
+
+        Args:
+            job (JobCreate): The kind of job and its parameters
+            actor (str | None, optional): Username of the admin queueing the job. Defaults to None.
+
+        Returns:
+            Job: The queued job
+        """
+
+        try:
+            logger.info("Queueing %s job", job.kind.value)
+            return await self._job_repository.create(
+                Job(
+                    kind=job.kind,
+                    params=job.model_dump(mode="json", exclude={"kind"}),
+                    created_by=actor,
+                )
+            )
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error queueing job: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def enqueue_import(
+        self,
+        entity: BulkEntity,
+        file_format: ImportFormat,
+        payload: BinaryIO,
+        actor: str | None = None,
+    ) -> Job:
+        """Functionality for queueing the import of an uploaded file
+
+        The file is copied to the job's chunks JOB_CHUNK_SIZE bytes at a time, so any
+        worker process can run the import and the upload is never read into memory whole.
+
+        Args:
+            entity (BulkEntity): The type of entity contained in the file
+            file_format (ImportFormat): The format of the file
+            payload (BinaryIO): The uploaded file
+            actor (str | None, optional): Username of the admin queueing the job. Defaults to None.
+
+        Returns:
+            Job: The queued job
+        """
+
+        try:
+            logger.info("Queueing import of %s", entity.value)
+            return await self._job_repository.create_with_file(
+                Job(
+                    kind=JobKind.IMPORT,
+                    params={"entity": entity.value, "format": file_format.value},
+                    created_by=actor,
+                ),
+                JobFile.PAYLOAD,
+                iter(lambda: payload.read(app_config.job_chunk_size), b""),
+            )
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error queueing import job: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def get_job(self, job_id: str) -> Job:
+        """Functionality for reading a job's status, progress and result
+
+        Args:
+            job_id (str): The job's id
+
+        Raises:
+            HTTPException: 404 if the job does not exist
+
+        Returns:
+            Job: The job
+        """
+
+        try:
+            logger.info("Finding job %s", job_id)
+            jobs = await self._job_repository.find({"id": job_id})
+            if not jobs:
+                raise JobNotFoundError
+            return jobs[0]
+        except JobNotFoundError:
+            logger.error("Job not found")
+            ExceptionHandler.raise_http_exception(404, "Job not found")
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error finding job: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def get_output(self, job_id: str) -> Tuple[Job, AsyncIterator[bytes]]:
+        """Functionality for reading the file written by a job, such as an export
+
+        The file is streamed one stored chunk at a time.
+
+        Args:
+            job_id (str): The job's id
+
+        Raises:
+            HTTPException: 404 if the job does not exist, 409 if it has not succeeded
+            or wrote no file
+
+        Returns:
+            Tuple[Job, AsyncIterator[bytes]]: The job and its file's chunks
+        """
+
+        try:
+            logger.info("Reading output of job %s", job_id)
+            jobs = await self._job_repository.find(
+                {"id": job_id}, load_only=["id", "kind", "status", "params"]
+            )
+            if not jobs:
+                raise JobNotFoundError
+            job = jobs[0]
+            if job.status != JobStatus.SUCCEEDED or not await self._job_repository.has_file(
+                job_id, JobFile.OUTPUT
+            ):
+                raise JobOutputUnavailableError
+            return job, self._job_repository.iter_file(job_id, JobFile.OUTPUT)
+        except JobNotFoundError:
+            logger.error("Job not found")
+            ExceptionHandler.raise_http_exception(404, "Job not found")
+        except JobOutputUnavailableError:
+            logger.error("Job %s has no output", job_id)
+            ExceptionHandler.raise_http_exception(
+                409, "Job has not succeeded or has no output"
+            )
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error reading job output: %s", e)
+            ExceptionHandler.raise_internal_server_error()
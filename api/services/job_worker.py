@@ -0,0 +1,388 @@
+"""Module containing the background job workers and the handlers running each kind of job"""
+
+import asyncio
+import logging
+from tempfile import SpooledTemporaryFile
+from typing import Any, Awaitable, BinaryIO, Callable, Dict, List, cast
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.config import app_config
+from api.database.models import Job
+from api.database.session import db_session_manager
+from api.dependencies import (
+    get_assignment_repository,
+    get_auth_service,
+    get_auto_staffing_service,
+    get_bulk_service,
+    get_customer_repository,
+    get_job_repository,
+    get_project_repository,
+    get_project_status_repository,
+    get_report_service,
+    get_staffing_repository,
+    get_user_repository,
+)
+from api.schemas.auto_staffing import StaffingTargets
+from api.schemas.bulk import BulkEntity, ExportFormat, ImportFormat
+from api.schemas.job import JobFile, JobKind, JobStatus
+from api.services.interfaces.bulk_service_interface import IBulkService
+from api.utils.events import subscribe_entity_changed
+
+
+logger = logging.getLogger(__name__)
+
+# The error recorded for a job failing with an unexpected exception
+JOB_INTERNAL_ERROR = "Internal Server Error"
+
+
+class JobProgress:
+    """The progress of a running job, reported by its handler and written to the
+    job's row with each heartbeat.
+
+    Args:
+        total (int | None, optional): Units of work in total, if known. Defaults to None.
+    """
+
+    def __init__(self, total: int | None = None) -> None:
+        self.done = 0
+        self.total = total
+
+    def update(self, done: int, total: int | None = None) -> None:
+        """Records the units of work done, and the total if it has become known
+
+        Args:
+            done (int): Units of work done
+            total (int | None, optional): Units of work in total. Defaults to None.
+        """
+        self.done = done
+        if total is not None:
+            self.total = total
+
+
+# A handler runs a claimed job and returns its JSON result, if any. Files are
+# written to the job's chunks as they are produced
+JobOutcome = Dict[str, Any] | None
+JobHandler = Callable[[AsyncSession, Job, JobProgress], Awaitable[JobOutcome]]
+
+
+def get_session_bulk_service(session: AsyncSession) -> IBulkService:
+    """Builds the bulk service for a worker's database session"""
+    user_repository = get_user_repository(session)
+    return get_bulk_service(
+        user_repository,
+        get_customer_repository(session),
+        get_project_repository(session),
+        get_auth_service(user_repository),
+    )
+
+
+def count_records(payload: BinaryIO, file_format: ImportFormat) -> int:
+    """Counts the records of an import file - its non-empty lines, less the CSV header.
+    The file is read line by line and rewound afterwards.
+
+    Args:
+        payload (BinaryIO): The uploaded file
+        file_format (ImportFormat): The format of the file
+
+    Returns:
+        int: The number of records, used as the import's progress total
+    """
+    lines = sum(1 for line in payload if line.strip())
+    payload.seek(0)
+    return max(lines - 1, 0) if file_format == ImportFormat.CSV else lines
+
+
+async def run_import(
+    session: AsyncSession, job: Job, progress: JobProgress
+) -> JobOutcome:
+    """Runs an IMPORT job - the equivalent of POST /import/{entity}.
+    The uploaded file is spooled from its chunks, to disk once it outgrows one chunk."""
+
+    file_format = ImportFormat(job.params["format"])
+    spool = SpooledTemporaryFile(max_size=app_config.job_chunk_size)
+    with cast(BinaryIO, spool) as payload:
+        async for chunk in get_job_repository(session).iter_file(
+            str(job.id), JobFile.PAYLOAD
+        ):
+            payload.write(chunk)
+        payload.seek(0)
+        progress.update(0, count_records(payload, file_format))
+        report = await get_session_bulk_service(session).import_records(
+            BulkEntity(job.params["entity"]),
+            payload,
+            file_format,
+            on_progress=progress.update,
+        )
+    return report.model_dump(mode="json")
+
+
+async def run_export(
+    session: AsyncSession, job: Job, progress: JobProgress
+) -> JobOutcome:
+    """Runs an EXPORT job - the equivalent of GET /export/{entity}, written to the job's output.
+
+    The export is written in JOB_CHUNK_SIZE chunks as it is streamed, through a
+    session of its own as committing the export's session would end its stream.
+    Output left by an earlier, interrupted attempt is deleted first.
+    """
+
+    async with db_session_manager.session() as output_session:
+        job_repository = get_job_repository(output_session)
+        await job_repository.delete_file(str(job.id), JobFile.OUTPUT)
+        buffer = bytearray()
+        seq = size = 0
+        async for chunk in get_session_bulk_service(session).export_records(
+            BulkEntity(job.params["entity"]), ExportFormat(job.params["format"])
+        ):
+            buffer += chunk
+            size += len(chunk)
+            progress.update(size)
+            while len(buffer) >= app_config.job_chunk_size:
+                await job_repository.append_chunk(
+                    str(job.id),
+                    JobFile.OUTPUT,
+                    seq,
+                    bytes(buffer[: app_config.job_chunk_size]),
+                )
+                del buffer[: app_config.job_chunk_size]
+                seq += 1
+        if buffer or seq == 0:
+            await job_repository.append_chunk(
+                str(job.id), JobFile.OUTPUT, seq, bytes(buffer)
+            )
+    return {"bytes": size}
+
+
+async def run_staffing_refresh(
+    session: AsyncSession, job: Job, progress: JobProgress
+) -> JobOutcome:
+    """Runs a STAFFING_REFRESH job - the equivalent of POST /reports/staffing/refresh"""
+
+    report_service = get_report_service(
+        get_staffing_repository(session), get_project_status_repository(session)
+    )
+    await report_service.refresh_staffing_report()
+    return None
+
+
+async def run_staffing_plan(
+    session: AsyncSession, job: Job, progress: JobProgress
+) -> JobOutcome:
+    """Runs a STAFFING_PLAN job - the equivalent of POST /auto_staffing/plan"""
+
+    auto_staffing_service = get_auto_staffing_service(
+        get_user_repository(session),
+        get_project_repository(session),
+        get_assignment_repository(session),
+    )
+    plan = await auto_staffing_service.propose_plan(
+        StaffingTargets.model_validate(job.params)
+    )
+    return plan.model_dump(mode="json")
+
+
+JOB_HANDLERS: Dict[JobKind, JobHandler] = {
+    JobKind.IMPORT: run_import,
+    JobKind.EXPORT: run_export,
+    JobKind.STAFFING_REFRESH: run_staffing_refresh,
+    JobKind.STAFFING_PLAN: run_staffing_plan,
+}
+
+
+class JobWorker:
+    """Runs queued jobs on a number of concurrent polling loops.
+
+    Each loop claims the oldest queued job, runs its handler in a fresh database
+    session and records the outcome. While a job runs, its progress is written
+    every 'heartbeat_interval' seconds; a running job whose heartbeat is older than
+    'stale_after' seconds - its worker crashed or lost its connection - is queued
+    again by the next loop to poll, or failed once claimed 'max_attempts' times.
+
+    Idle loops poll every 'poll_interval' seconds and are woken sooner when a job
+    is queued through this process. Jobs running when the worker stops are
+    returned to the queue.
+
+    Args:
+        concurrency (int): The number of jobs run at once
+        poll_interval (float): Seconds an idle loop waits before polling the queue
+        heartbeat_interval (float): Seconds between the progress writes of a running job
+        stale_after (float): Seconds without a heartbeat before a running job is recovered
+        max_attempts (int): The number of times a job is claimed before it is failed
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        poll_interval: float,
+        heartbeat_interval: float,
+        stale_after: float,
+        max_attempts: int,
+    ) -> None:
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self.max_attempts = max_attempts
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self.claimed = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.released = 0
+        self.running = 0
+
+    def start(self, concurrency: int | None = None) -> None:
+        """Starts the polling loops on the running event loop
+
+        Args:
+            concurrency (int | None, optional): Overrides the configured concurrency. Defaults to None.
+        """
+        if self._tasks:
+            return
+        if concurrency is not None:
+            self.concurrency = concurrency
+        logger.info("Starting %s job worker loops", self.concurrency)
+        self._tasks = [
+            asyncio.create_task(self._poll(), name=f"job-worker-{index}")
+            for index in range(self.concurrency)
+        ]
+
+    async def stop(self) -> None:
+        """Stops the polling loops, returning any jobs they are running to the queue"""
+        if not self._tasks:
+            return
+        logger.info("Stopping job worker loops")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self, _table: str | None = None) -> None:
+        """Wakes the idle loops, called when a job is queued through this process"""
+        self._wakeup.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the worker's counters
+
+        Returns:
+            Dict[str, Any]: Loops running, jobs claimed, succeeded, failed and released
+            back to the queue on shutdown, and the jobs currently running
+        """
+        return {
+            "workers": len(self._tasks),
+            "claimed": self.claimed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "released": self.released,
+            "running": self.running,
+        }
+
+    async def _poll(self) -> None:
+        """A polling loop - claims and runs jobs until cancelled"""
+        while True:
+            self._wakeup.clear()
+            try:
+                job = await self._claim()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("Error claiming job: %s", e)
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._run(job)
+
+    async def _claim(self) -> Job | None:
+        """Recovers stale jobs, then claims the oldest queued job"""
+        async with db_session_manager.session() as session:
+            job_repository = get_job_repository(session)
+            await job_repository.requeue_stale(self.stale_after, self.max_attempts)
+            job = await job_repository.claim()
+        if job is not None:
+            self.claimed += 1
+            logger.info(
+                "Claimed %s job %s (attempt %s)", job.kind.value, job.id, job.attempts
+            )
+        return job
+
+    async def _run(self, job: Job) -> None:
+        """Runs a claimed job's handler and records its outcome"""
+        progress = JobProgress()
+        heartbeat = asyncio.create_task(self._heartbeat(job, progress))
+        status, result, error = JobStatus.FAILED, None, None
+        self.running += 1
+        try:
+            async with db_session_manager.session() as session:
+                result = await JOB_HANDLERS[job.kind](session, job, progress)
+            status = JobStatus.SUCCEEDED
+        except asyncio.CancelledError:
+            await self._release(job)
+            raise
+        except HTTPException as e:
+            logger.error("Job %s failed: %s", job.id, e.detail)
+            error = str(e.detail)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Job %s failed: %s", job.id, e)
+            error = JOB_INTERNAL_ERROR
+        finally:
+            self.running -= 1
+            heartbeat.cancel()
+
+        if status == JobStatus.SUCCEEDED:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        try:
+            async with db_session_manager.session() as session:
+                finished = await get_job_repository(session).finish(
+                    str(job.id),
+                    status,
+                    progress.done,
+                    progress.total,
+                    result=result,
+                    error=error,
+                )
+            if not finished:
+                logger.warning("Job %s was recovered by another worker", job.id)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Error finishing job %s: %s", job.id, e)
+
+    async def _heartbeat(self, job: Job, progress: JobProgress) -> None:
+        """Writes a running job's progress every heartbeat interval"""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                async with db_session_manager.session() as session:
+                    await get_job_repository(session).heartbeat(
+                        str(job.id), progress.done, progress.total
+                    )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("Error recording heartbeat of job %s: %s", job.id, e)
+
+    async def _release(self, job: Job) -> None:
+        """Returns a job interrupted by shutdown to the queue"""
+        try:
+            async with db_session_manager.session() as session:
+                if await get_job_repository(session).release(str(job.id)):
+                    self.released += 1
+                    logger.warning("Released job %s back to the queue", job.id)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Error releasing job %s: %s", job.id, e)
+
+
+job_worker = JobWorker(
+    concurrency=app_config.job_workers,
+    poll_interval=app_config.job_poll_interval,
+    heartbeat_interval=app_config.job_heartbeat_interval,
+    stale_after=app_config.job_stale_after,
+    max_attempts=app_config.job_max_attempts,
+)
+
+# Run jobs queued through this process without waiting for the next poll
+subscribe_entity_changed(Job.__tablename__, job_worker.notify)
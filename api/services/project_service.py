@@ -6,6 +6,7 @@ from typing import List
 from api.database.interfaces.repository_interface import IRepository
 from api.database.models import Project
 from api.schemas.project import ProjectCreate, ProjectUpdate
+from api.services.assignment_event_service import record_project_status
 from api.services.interfaces.project_service_interface import IProjectService
 from api.utils.exceptions import (
     AttributeNotFoundError,
@@ -79,12 +80,16 @@ class ProjectService(IProjectService):
             logger.error("Error creating project: %s", e)
             ExceptionHandler.raise_internal_server_error()
 
-    async def update_project(self, project_id: str, project: ProjectUpdate) -> Project:
-        """Functionality for updating an existing project entity
+    async def update_project(
+        self, project_id: str, project: ProjectUpdate, actor: str | None = None
+    ) -> Project:
+        """Functionality for updating an existing project entity.
+        A status change is recorded in the assignment audit log.
 
         Args:
             project_id (str): The ID of project to update
             project (ProjectUpdate): Validated Pydantic ProjectUpdate model
+            actor (str | None, optional): The user name of the admin making the change. Defaults to None.
 
         Returns:
             Project: Updated project
@@ -98,8 +103,17 @@ class ProjectService(IProjectService):
                 raise ProjectNotFoundError
 
             logger.info("Project found")
+            previous_status = db_project.status
             updates = project.model_dump()
-            return await self._project_repository.update(db_project, updates=updates)
+            updated_project = await self._project_repository.update(
+                db_project, updates=updates
+            )
+
+            if updated_project.status != previous_status:
+                record_project_status(
+                    actor, updated_project.id, previous_status, updated_project.status
+                )
+            return updated_project
         except ProjectNotFoundError:
             logger.error("Project not found")
             ExceptionHandler.raise_http_exception(404, "Project not found")
@@ -123,14 +137,17 @@ class ProjectService(IProjectService):
         self,
         name: str | None = None,
         project_id: str | None = None,
-        users: bool = False,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
     ) -> Project:
         """Functionality for retrieving a project entity from database
 
         Args:
             name (str | None, optional): Name of project to find. Defaults to None.
             project_id (str | None, optional): ID of project to find. Defaults to None.
-            users (bool, optional): Include project's related users? Defaults to False.
+            include (List[str] | None, optional): Dotted paths of the related entities to load,
+            e.g. 'projects.users'. Defaults to None.
+            fields (List[str] | None, optional): The only attributes to load. Defaults to None.
 
         Returns:
             Project: Retrieved project entity
@@ -144,7 +161,8 @@ class ProjectService(IProjectService):
             project = await self.find_project(
                 name=name,
                 project_id=project_id,
-                load_relations=["users"] if users else None,
+                load_relations=include,
+                load_only=fields,
             )
             logger.info("Project found")
             if not project:
@@ -167,11 +185,20 @@ class ProjectService(IProjectService):
             logger.error("Error creating user: %s", e)
             ExceptionHandler.raise_internal_server_error()
 
-    async def list_projects(self, users: bool = False) -> List[Project]:
-        """Functionality for listing all projects in the database.
+    async def list_projects(
+        self,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
+        ids: List[str] | None = None,
+    ) -> List[Project]:
+        """Functionality for listing all projects in the database, or those with the given ids.
 
         Args:
-            users (bool, optional): Include project's related users? Defaults to False.
+            include (List[str] | None, optional): Dotted paths of the related entities to load,
+            e.g. 'projects.users'. Defaults to None.
+            fields (List[str] | None, optional): The only attributes to load. Defaults to None.
+            ids (List[str] | None, optional): Only return the projects with these ids,
+            in the same order. Defaults to None (all projects).
 
         Returns:
             List[Project]: A list containing all project entities
@@ -179,8 +206,12 @@ class ProjectService(IProjectService):
 
         try:
             logger.info("Listing projects")
+            if ids is not None:
+                return await self._project_repository.get_many(
+                    ids, load_relations=include, load_only=fields
+                )
             projects = await self._project_repository.list_all(
-                load_relations=["users"] if users else None
+                load_relations=include, load_only=fields
             )
             return projects
         except DatabaseConnectionError as e:
@@ -198,6 +229,7 @@ class ProjectService(IProjectService):
         load_relations: List[str] | None = None,
         name: str | None = None,
         project_id: str | None = None,
+        load_only: List[str] | None = None,
     ) -> Project | None:
         """Functionality for finding a project in the database.
 
@@ -208,6 +240,7 @@ class ProjectService(IProjectService):
             to load async. Defaults to None.
             name (str | None, optional): Name of project to find. Defaults to None.
             project_id (str | None, optional): ID of project to find. Defaults to None.
+            load_only (List[str] | None, optional): The only attributes to load. Defaults to None.
 
         Returns:
             Project | None: The found project entity or None
@@ -228,7 +261,10 @@ class ProjectService(IProjectService):
                 raise ValueError("No parameters provided")
 
             result = await self._project_repository.find(
-                params=params, and_condition=False, load_relations=load_relations
+                params=params,
+                and_condition=False,
+                load_relations=load_relations,
+                load_only=load_only,
             )
             logger.info("Project found")
             if not result:
@@ -0,0 +1,190 @@
+"""The Service layer for all report API routes"""
+
+from datetime import datetime
+import logging
+from uuid import UUID
+
+from api.core.config import app_config
+from api.database.interfaces.project_status_repository_interface import (
+    IProjectStatusRepository,
+)
+from api.database.interfaces.staffing_repository_interface import IStaffingRepository
+from api.database.models import Customer, Project, User
+from api.database.session import db_session_manager
+from api.database.staffing_repository import StaffingRepository
+from api.schemas.project import ProjectStatus
+from api.schemas.report import (
+    ProjectStatusHistory,
+    StaffingReport,
+    StaffingRow,
+    StatusSpan,
+    TimeInStatusReport,
+    TimeInStatusRow,
+)
+from api.services.interfaces.report_service_interface import IReportService
+from api.utils.debounce import Debouncer
+from api.utils.events import subscribe_entity_changed
+from api.utils.exceptions import (
+    DatabaseConnectionError,
+    ExceptionHandler,
+    ProjectNotFoundError,
+    RepositoryError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_staffing_view() -> None:
+    """Refreshes the staffing report in a session of its own, outside any request"""
+    async with db_session_manager.session() as session:
+        await StaffingRepository(session).refresh()
+
+
+# Refreshes the staffing report once a burst of user, project or customer writes settles
+staffing_refresher = Debouncer(
+    refresh_staffing_view,
+    delay=app_config.staffing_refresh_delay,
+    max_delay=app_config.staffing_refresh_max_delay,
+)
+for staffed_table in (User.__tablename__, Project.__tablename__, Customer.__tablename__):
+    subscribe_entity_changed(staffed_table, staffing_refresher.notify)
+
+
+class ReportService(IReportService):
+    """The service for all report routes.
+    Contains all business logic
+
+    Args:
+        IReportService: Interface defining required functionalities
+    """
+
+    def __init__(
+        self,
+        staffing_repository: IStaffingRepository,
+        project_status_repository: IProjectStatusRepository,
+    ) -> None:
+        """Initialize the service
+
+        Args:
+            staffing_repository (IStaffingRepository): The repository layer for the staffing report
+            project_status_repository (IProjectStatusRepository): The repository layer for the project status history
+        """
+        logger.info("Initializing ReportService")
+        self._staffing_repository = staffing_repository
+        self._project_status_repository = project_status_repository
+
+    async def get_staffing_report(
+        self, customer_id: str | None = None, status: ProjectStatus | None = None
+    ) -> StaffingReport:
+        """Functionality for reading the per-project staffing report.
+
+        Rows come from the pre-joined materialized view rather than joining
+        customers, projects and users on every request.
+
+        Args:
+            customer_id (str | None, optional): Only report the customer's projects. Defaults to None.
+            status (ProjectStatus | None, optional): Only report projects in this status. Defaults to None.
+
+        Returns:
+            StaffingReport: The staffing rows and when the view was last refreshed
+        """
+
+        try:
+            logger.info("Getting staffing report")
+            rows = await self._staffing_repository.list_rows(
+                customer_id=customer_id, status=status
+            )
+            return StaffingReport(
+                refreshed_at=rows[0]["refreshed_at"] if rows else None,
+                rows=[StaffingRow.model_validate(row) for row in rows],
+            )
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error getting staffing report: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def refresh_staffing_report(self) -> None:
+        """Functionality for refreshing the staffing report immediately."""
+
+        try:
+            logger.info("Refreshing staffing report")
+            await self._staffing_repository.refresh()
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error refreshing staffing report: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def get_time_in_status(
+        self, customer_id: str | None = None, since: datetime | None = None
+    ) -> TimeInStatusReport:
+        """Functionality for reading the time projects spend in each status, per customer.
+
+        Args:
+            customer_id (str | None, optional): Only report the customer's projects. Defaults to None.
+            since (datetime | None, optional): Only report statuses entered since. Defaults to None.
+
+        Returns:
+            TimeInStatusReport: The duration distribution of each customer's project statuses
+        """
+
+        try:
+            logger.info("Getting time in status report")
+            rows = await self._project_status_repository.time_in_status(
+                customer_id=customer_id, since=since
+            )
+            return TimeInStatusReport(
+                since=since, rows=[TimeInStatusRow.model_validate(row) for row in rows]
+            )
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error getting time in status report: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def get_project_status_history(self, project_id: str) -> ProjectStatusHistory:
+        """Functionality for reading the statuses a project has been in.
+
+        Args:
+            project_id (str): The ID of the project
+
+        Returns:
+            ProjectStatusHistory: The project's status spans, oldest first
+        """
+
+        try:
+            logger.info("Getting project status history")
+            spans = await self._project_status_repository.list_spans(project_id)
+            # Every project has at least the status it was created in
+            if not spans:
+                raise ProjectNotFoundError
+            return ProjectStatusHistory(
+                project_id=UUID(project_id),
+                spans=[StatusSpan.model_validate(span) for span in spans],
+            )
+        except ProjectNotFoundError:
+            logger.error("Project not found")
+            ExceptionHandler.raise_http_exception(404, "Project not found")
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error getting project status history: %s", e)
+            ExceptionHandler.raise_internal_server_error()
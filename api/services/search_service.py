@@ -0,0 +1,90 @@
+"""The Service layer for the search API route"""
+
+import logging
+from typing import Any, Dict, List, Tuple
+
+from api.database.interfaces.repository_interface import IRepository
+from api.database.models import Customer, Project, User
+from api.schemas.search import SearchResults
+from api.services.interfaces.search_service_interface import ISearchService
+from api.utils.exceptions import (
+    DatabaseConnectionError,
+    ExceptionHandler,
+    RepositoryError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class SearchService(ISearchService):
+    """The service for the search route.
+    Contains all business logic
+
+    Args:
+        ISearchService: Interface defining required functionalities
+    """
+
+    def __init__(
+        self,
+        user_repository: IRepository[User],
+        project_repository: IRepository[Project],
+        customer_repository: IRepository[Customer],
+    ) -> None:
+        """Initialize the service
+
+        Args:
+            user_repository (IRepository[User]): The user repository layer for database interactions
+            project_repository (IRepository[Project]): The project repository layer for database interactions
+            customer_repository (IRepository[Customer]): The customer repository layer for database interactions
+        """
+        logger.info("Initializing SearchService")
+        self._user_repository = user_repository
+        self._project_repository = project_repository
+        self._customer_repository = customer_repository
+
+    async def search(
+        self, query: str, limit: int, include_users: bool = False
+    ) -> SearchResults:
+        """Functionality for ranked free text search across customers, projects and users.
+
+        Args:
+            query (str): The search text
+            limit (int): The maximum number of results per entity type
+            include_users (bool, optional): Whether users are searched - only admins may list users.
+            Defaults to False.
+
+        Returns:
+            SearchResults: The ranked matches grouped by entity type
+        """
+
+        try:
+            logger.info("Searching for '%s'", query)
+            customers = await self._customer_repository.search(query, limit)
+            projects = await self._project_repository.search(query, limit)
+            users = (
+                await self._user_repository.search(query, limit) if include_users else []
+            )
+            return SearchResults.model_validate(
+                {
+                    "query": query,
+                    "customers": self._hits(customers),
+                    "projects": self._hits(projects),
+                    "users": self._hits(users),
+                },
+                from_attributes=True,
+            )
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error searching: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    @staticmethod
+    def _hits(matches: List[Tuple[Any, float]]) -> List[Dict[str, Any]]:
+        """Pairs each matched entity with its rank"""
+        return [{"rank": rank, "item": item} for item, rank in matches]
@@ -0,0 +1,362 @@
+"""The Service layer for all skill API routes"""
+
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List
+
+from api.core.config import app_config
+from api.database.interfaces.repository_interface import IRepository
+from api.database.models import Project, Skill, User
+from api.schemas.skill import Candidate, CandidateList, SkillCreate, SkillSet
+from api.services.interfaces.skill_service_interface import ISkillService
+from api.utils.events import subscribe_entity_changed
+from api.utils.exceptions import (
+    DatabaseConnectionError,
+    ExceptionHandler,
+    IntegrityViolationError,
+    ProjectNotFoundError,
+    RepositoryError,
+    SkillAlreadyExistsError,
+    UnknownSkillError,
+    UserNotFoundError,
+)
+from api.utils.singleflight import SingleFlight
+from api.utils.skill_matrix import SkillMatrix, bit_positions
+
+
+logger = logging.getLogger(__name__)
+
+
+class SkillMatrixCache:
+    """The per process skill matrix of every active user, discarded whenever users are
+    written through this process or it outlives its ttl.
+
+    Writes made by other processes are only reflected once the ttl expires.
+    Concurrent rebuilds after an invalidation share a single query.
+
+    Args:
+        ttl (float): Seconds a matrix is served for. 0 keeps it until invalidated.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._matrix: SkillMatrix | None = None
+        self._expires = 0.0
+        self._generation = 0
+        self._flight = SingleFlight()
+
+    def invalidate(self, table: str | None = None) -> None:
+        """Discards the cached matrix
+
+        Args:
+            table (str | None, optional): The written table, when invalidated by a write.
+            Defaults to None.
+        """
+        logger.debug("Skill matrix invalidated by %s", table)
+        self._generation += 1
+        self._matrix = None
+
+    async def get(self, load: Callable[[], Awaitable[SkillMatrix]]) -> SkillMatrix:
+        """Returns the cached matrix, building it if missing or expired
+
+        Args:
+            load (Callable[[], Awaitable[SkillMatrix]]): Builds a fresh matrix
+
+        Returns:
+            SkillMatrix: The cached or freshly built matrix
+        """
+        if self._matrix is not None and (
+            not self.ttl or time.monotonic() < self._expires
+        ):
+            return self._matrix
+        return await self._flight.do(self._generation, lambda: self._rebuild(load))
+
+    async def _rebuild(self, load: Callable[[], Awaitable[SkillMatrix]]) -> SkillMatrix:
+        """Builds a matrix, only caching it if no write happened meanwhile"""
+        generation = self._generation
+        matrix = await load()
+        logger.info("Built skill matrix of %s users", len(matrix))
+        if generation == self._generation:
+            self._matrix = matrix
+            self._expires = time.monotonic() + self.ttl
+        return matrix
+
+
+skill_matrix_cache = SkillMatrixCache(ttl=app_config.skill_matrix_ttl)
+subscribe_entity_changed(User.__tablename__, skill_matrix_cache.invalidate)
+
+
+class SkillService(ISkillService):
+    """The service for all skill routes.
+    Contains all business logic
+
+    Args:
+        ISkillService: Interface defining required functionalities
+    """
+
+    def __init__(
+        self,
+        skill_repository: IRepository[Skill],
+        user_repository: IRepository[User],
+        project_repository: IRepository[Project],
+    ) -> None:
+        """Initialize the service
+
+        Args:
+            skill_repository (IRepository[Skill]): The skill repository layer for database interactions
+            user_repository (IRepository[User]): The user repository layer for database interactions
+            project_repository (IRepository[Project]): The project repository layer for database interactions
+        """
+        logger.info("Initializing SkillService")
+        self._skill_repository = skill_repository
+        self._user_repository = user_repository
+        self._project_repository = project_repository
+
+    async def create_skill(self, skill: SkillCreate) -> Skill:
+        """Functionality for 'Skill' entity creation, allotting it the next free bit position
+
+        Args:
+            skill (SkillCreate): Validated Pydantic SkillCreate model
+
+        Returns:
+            Skill: The successfully stored and created skill
+        """
+
+        try:
+            logger.info("Creating skill")
+            skills = await self._skill_repository.list_all()
+            if any(existing.name == skill.name for existing in skills):
+                raise SkillAlreadyExistsError
+
+            bit = max((existing.bit for existing in skills), default=-1) + 1
+            if bit >= app_config.skills_max:
+                raise ValueError(f"At most {app_config.skills_max} skills can be created")
+
+            return await self._skill_repository.create(Skill(name=skill.name, bit=bit))
+        except (SkillAlreadyExistsError, IntegrityViolationError) as e:
+            logger.error("Skill already exists: %s", e)
+            ExceptionHandler.raise_already_exists_exception()
+        except ValueError as e:
+            logger.error("Skill limit reached: %s", e)
+            ExceptionHandler.raise_http_exception(400, str(e))
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error creating skill: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def list_skills(self) -> List[Skill]:
+        """Functionality for listing the skill catalogue
+
+        Returns:
+            List[Skill]: Every skill, ordered by name
+        """
+
+        try:
+            logger.info("Listing skills")
+            return sorted(
+                await self._skill_repository.list_all(), key=lambda skill: skill.name
+            )
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error listing skills: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def set_user_skills(self, user_id: str, skills: SkillSet) -> SkillSet:
+        """Functionality for replacing a user's skills
+
+        Args:
+            user_id (str): The ID of the user
+            skills (SkillSet): The user's skills
+
+        Returns:
+            SkillSet: The user's stored skills
+        """
+
+        try:
+            logger.info("Setting user skills")
+            bits = await self._encode(skills.skills)
+            users = await self._user_repository.find({"id": user_id}, load_only=["skills"])
+            if not users:
+                raise UserNotFoundError
+            await self._user_repository.update(users[0], updates={"skills": bits})
+            return SkillSet(skills=sorted(skills.skills))
+        except UserNotFoundError:
+            logger.error("User not found")
+            ExceptionHandler.raise_http_exception(404, "User not found")
+        except UnknownSkillError as e:
+            logger.error("Unknown skills: %s", e)
+            ExceptionHandler.raise_http_exception(400, f"Unknown skills: {e}")
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error setting user skills: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def set_project_skills(self, project_id: str, skills: SkillSet) -> SkillSet:
+        """Functionality for replacing the skills a project requires
+
+        Args:
+            project_id (str): The ID of the project
+            skills (SkillSet): The required skills
+
+        Returns:
+            SkillSet: The project's stored required skills
+        """
+
+        try:
+            logger.info("Setting project skills")
+            bits = await self._encode(skills.skills)
+            projects = await self._project_repository.find(
+                {"id": project_id}, load_only=["required_skills"]
+            )
+            if not projects:
+                raise ProjectNotFoundError
+            await self._project_repository.update(
+                projects[0], updates={"required_skills": bits}
+            )
+            return SkillSet(skills=sorted(skills.skills))
+        except ProjectNotFoundError:
+            logger.error("Project not found")
+            ExceptionHandler.raise_http_exception(404, "Project not found")
+        except UnknownSkillError as e:
+            logger.error("Unknown skills: %s", e)
+            ExceptionHandler.raise_http_exception(400, f"Unknown skills: {e}")
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error setting project skills: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def get_candidates(
+        self, project_id: str, limit: int, unassigned_only: bool = False
+    ) -> CandidateList:
+        """Functionality for ranking active users by their coverage of a project's required skills.
+
+        Ranked against the cached in-memory skill matrix, so only the project,
+        the skill catalogue and the returned users are read from the database.
+
+        Args:
+            project_id (str): The ID of the project
+            limit (int): The maximum number of candidates
+            unassigned_only (bool, optional): Only rank users without a project. Defaults to False.
+
+        Returns:
+            CandidateList: The project's required skills and its best candidates
+        """
+
+        try:
+            logger.info("Getting candidates")
+            projects = await self._project_repository.find(
+                {"id": project_id}, load_only=["required_skills"]
+            )
+            if not projects:
+                raise ProjectNotFoundError
+            required = projects[0].required_skills
+            if not required:
+                raise ValueError("Project has no required skills")
+            names = await self._skill_names()
+
+            matrix = await skill_matrix_cache.get(self._load_matrix)
+            ranked = matrix.rank(required, limit, unassigned_only=unassigned_only)
+            users = {
+                user.id: user
+                for user in await self._user_repository.get_many(
+                    [matrix.user_ids[row] for row, _ in ranked],
+                    load_only=[
+                        "user_name",
+                        "first_name",
+                        "last_name",
+                        "project_id",
+                        "skills",
+                    ],
+                )
+            }
+
+            required_count = len(bit_positions(required))
+            candidates = []
+            for row, matched in ranked:
+                user = users.get(matrix.user_ids[row])
+                if user is None:
+                    continue
+                candidates.append(
+                    Candidate(
+                        user_id=user.id,
+                        user_name=user.user_name,
+                        first_name=user.first_name,
+                        last_name=user.last_name,
+                        project_id=user.project_id,
+                        matched=matched,
+                        coverage=matched / required_count,
+                        missing=self._decode(required & ~user.skills, names),
+                    )
+                )
+            return CandidateList(
+                project_id=projects[0].id,
+                required=self._decode(required, names),
+                candidates=candidates,
+            )
+        except ProjectNotFoundError:
+            logger.error("Project not found")
+            ExceptionHandler.raise_http_exception(404, "Project not found")
+        except ValueError as e:
+            logger.error("Invalid candidate request: %s", e)
+            ExceptionHandler.raise_http_exception(400, str(e))
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error getting candidates: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def _load_matrix(self) -> SkillMatrix:
+        """Loads the skill bitsets of every active user into a skill matrix"""
+        users = [
+            user
+            for user in await self._user_repository.list_all(
+                load_only=["skills", "active", "project_id"]
+            )
+            if user.active
+        ]
+        return SkillMatrix(
+            [user.id for user in users],
+            [user.skills for user in users],
+            [user.project_id is not None for user in users],
+        )
+
+    async def _skill_names(self) -> Dict[int, str]:
+        """Returns the skill catalogue as names keyed by bit position"""
+        return {skill.bit: skill.name for skill in await self._skill_repository.list_all()}
+
+    async def _encode(self, names: List[str]) -> int:
+        """Encodes skill names as a bitset, raising UnknownSkillError for names not in the catalogue"""
+        bits = {name: bit for bit, name in (await self._skill_names()).items()}
+        unknown = [name for name in names if name not in bits]
+        if unknown:
+            raise UnknownSkillError(", ".join(unknown))
+        return sum(1 << bits[name] for name in names)
+
+    @staticmethod
+    def _decode(bitset: int, names: Dict[int, str]) -> List[str]:
+        """Decodes a bitset to its skill names in bit order"""
+        return [names[bit] for bit in bit_positions(bitset) if bit in names]
@@ -0,0 +1,162 @@
+"""The Service layer for the dashboard summary API route"""
+
+from datetime import datetime, timezone
+import logging
+import time
+from typing import Awaitable, Callable
+
+from api.core.config import app_config
+from api.database.interfaces.repository_interface import IRepository
+from api.database.models import Customer, Project, User
+from api.schemas.project import ProjectStatus
+from api.schemas.summary import Summary
+from api.schemas.user import Roles
+from api.services.interfaces.summary_service_interface import ISummaryService
+from api.utils.events import subscribe_entity_changed
+from api.utils.exceptions import (
+    DatabaseConnectionError,
+    ExceptionHandler,
+    RepositoryError,
+)
+from api.utils.singleflight import SingleFlight
+
+
+logger = logging.getLogger(__name__)
+
+
+class SummarySnapshot:
+    """A cached summary, discarded whenever a summarized table is written or it outlives its ttl.
+
+    Writes made by other processes are only reflected once the ttl expires.
+    Concurrent rebuilds after an invalidation share a single computation.
+
+    Args:
+        ttl (float): Seconds a snapshot is served for. 0 disables the snapshot.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._summary: Summary | None = None
+        self._expires = 0.0
+        self._generation = 0
+        self._flight = SingleFlight()
+
+    def invalidate(self, table: str | None = None) -> None:
+        """Discards the cached summary
+
+        Args:
+            table (str | None, optional): The written table, when invalidated by a write.
+            Defaults to None.
+        """
+        logger.debug("Summary snapshot invalidated by %s", table)
+        self._generation += 1
+        self._summary = None
+
+    async def get(self, compute: Callable[[], Awaitable[Summary]]) -> Summary:
+        """Returns the cached summary, computing it if missing or expired
+
+        Args:
+            compute (Callable[[], Awaitable[Summary]]): Computes a fresh summary
+
+        Returns:
+            Summary: The cached or freshly computed summary
+        """
+        if not self.ttl:
+            return await compute()
+        if self._summary is not None and time.monotonic() < self._expires:
+            return self._summary
+        return await self._flight.do(self._generation, lambda: self._rebuild(compute))
+
+    async def _rebuild(self, compute: Callable[[], Awaitable[Summary]]) -> Summary:
+        """Computes a summary, only caching it if no write happened meanwhile"""
+        generation = self._generation
+        summary = await compute()
+        if generation == self._generation:
+            self._summary = summary
+            self._expires = time.monotonic() + self.ttl
+        return summary
+
+
+summary_snapshot = SummarySnapshot(ttl=app_config.summary_cache_ttl)
+for summarized_table in (User.__tablename__, Project.__tablename__, Customer.__tablename__):
+    subscribe_entity_changed(summarized_table, summary_snapshot.invalidate)
+
+
+class SummaryService(ISummaryService):
+    """The service for the dashboard summary route.
+    Contains all business logic
+
+    Args:
+        ISummaryService: Interface defining required functionalities
+    """
+
+    def __init__(
+        self,
+        user_repository: IRepository[User],
+        project_repository: IRepository[Project],
+        customer_repository: IRepository[Customer],
+    ) -> None:
+        """Initialize the service
+
+        Args:
+            user_repository (IRepository[User]): The user repository layer for database interactions
+            project_repository (IRepository[Project]): The project repository layer for database interactions
+            customer_repository (IRepository[Customer]): The customer repository layer for database interactions
+        """
+        logger.info("Initializing SummaryService")
+        self._user_repository = user_repository
+        self._project_repository = project_repository
+        self._customer_repository = customer_repository
+
+    async def get_summary(self) -> Summary:
+        """Functionality for summarizing project, user and customer headcounts.
+
+        Served from the cached snapshot when SUMMARY_CACHE_TTL is set.
+
+        Returns:
+            Summary: The dashboard summary
+        """
+
+        try:
+            logger.info("Getting summary")
+            return await summary_snapshot.get(self.compute_summary)
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error getting summary: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    async def compute_summary(self) -> Summary:
+        """Computes the summary with one GROUP BY aggregate per summarized column.
+
+        Returns:
+            Summary: The freshly computed dashboard summary
+        """
+
+        logger.info("Computing summary")
+        projects_by_status = await self._project_repository.count_by("status")
+        users_by_role = await self._user_repository.count_by("role")
+        engineers_per_project = await self._user_repository.count_by(
+            "project_id", {"role": Roles.ENGINEER}
+        )
+        customers_by_active = await self._customer_repository.count_by("active")
+
+        return Summary(
+            projects_by_status={
+                status: projects_by_status.get(status, 0) for status in ProjectStatus
+            },
+            users_by_role={role: users_by_role.get(role, 0) for role in Roles},
+            engineers_per_project={
+                project_id: count
+                for project_id, count in engineers_per_project.items()
+                if project_id is not None
+            },
+            unassigned_engineers=engineers_per_project.get(None, 0),
+            active_customers=customers_by_active.get(True, 0),
+            inactive_customers=customers_by_active.get(False, 0),
+            generated_at=datetime.now(timezone.utc),
+        )
@@ -0,0 +1,200 @@
+"""The Service layer for the typeahead API route"""
+
+from collections import defaultdict
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from api.core.config import app_config
+from api.database.interfaces.repository_interface import IRepository
+from api.database.models import Customer, Project, User
+from api.schemas.typeahead import TypeaheadHit, TypeaheadResults, TypeaheadType
+from api.services.interfaces.typeahead_service_interface import ITypeaheadService
+from api.utils.events import subscribe_entity_changed
+from api.utils.exceptions import (
+    DatabaseConnectionError,
+    ExceptionHandler,
+    RepositoryError,
+)
+from api.utils.prefix_index import PrefixIndex
+from api.utils.singleflight import SingleFlight
+
+
+logger = logging.getLogger(__name__)
+
+# The indexes to discard when a table is written - deleting a customer cascades to its projects
+INVALIDATED_BY_TABLE: Dict[str, Tuple[TypeaheadType, ...]] = {
+    User.__tablename__: (TypeaheadType.USERS,),
+    Project.__tablename__: (TypeaheadType.PROJECTS,),
+    Customer.__tablename__: (TypeaheadType.CUSTOMERS, TypeaheadType.PROJECTS),
+}
+
+
+class TypeaheadIndexes:
+    """Per process prefix indexes of entity names, one per entity type.
+
+    An index is built on first use, discarded whenever its table is written through
+    this process and rebuilt on the next lookup. Writes made by other processes are
+    only reflected once the index outlives its ttl.
+    Concurrent rebuilds after an invalidation share a single query.
+
+    Args:
+        ttl (float): Seconds an index is served for. 0 keeps indexes until invalidated.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._indexes: Dict[TypeaheadType, PrefixIndex] = {}
+        self._expires: Dict[TypeaheadType, float] = {}
+        self._generations: Dict[TypeaheadType, int] = defaultdict(int)
+        self._flight = SingleFlight()
+
+    def invalidate(self, table: str) -> None:
+        """Discards the indexes built from a written table
+
+        Args:
+            table (str): The written table
+        """
+        for entity_type in INVALIDATED_BY_TABLE.get(table, ()):
+            logger.debug("Typeahead index %s invalidated by %s", entity_type.value, table)
+            self._generations[entity_type] += 1
+            self._indexes.pop(entity_type, None)
+
+    async def get(
+        self,
+        entity_type: TypeaheadType,
+        load: Callable[[], Awaitable[List[Tuple[str, str, Any]]]],
+    ) -> PrefixIndex:
+        """Returns the index of an entity type, building it if missing or expired
+
+        Args:
+            entity_type (TypeaheadType): The entity type
+            load (Callable[[], Awaitable[List[Tuple[str, str, Any]]]]): Loads the
+            (indexed text, display name, id) entries of the entity type
+
+        Returns:
+            PrefixIndex: The cached or freshly built index
+        """
+        index = self._indexes.get(entity_type)
+        if index is not None and (
+            not self.ttl or time.monotonic() < self._expires[entity_type]
+        ):
+            return index
+        return await self._flight.do(
+            (entity_type, self._generations[entity_type]),
+            lambda: self._rebuild(entity_type, load),
+        )
+
+    async def _rebuild(
+        self,
+        entity_type: TypeaheadType,
+        load: Callable[[], Awaitable[List[Tuple[str, str, Any]]]],
+    ) -> PrefixIndex:
+        """Builds an index, only caching it if no write happened meanwhile"""
+        generation = self._generations[entity_type]
+        index = PrefixIndex(await load())
+        logger.info("Built typeahead index %s with %s keys", entity_type.value, len(index))
+        if generation == self._generations[entity_type]:
+            self._indexes[entity_type] = index
+            self._expires[entity_type] = time.monotonic() + self.ttl
+        return index
+
+
+typeahead_indexes = TypeaheadIndexes(ttl=app_config.typeahead_index_ttl)
+for indexed_table in INVALIDATED_BY_TABLE:
+    subscribe_entity_changed(indexed_table, typeahead_indexes.invalidate)
+
+
+class TypeaheadService(ITypeaheadService):
+    """The service for the typeahead route.
+    Contains all business logic
+
+    Args:
+        ITypeaheadService: Interface defining required functionalities
+    """
+
+    def __init__(
+        self,
+        user_repository: IRepository[User],
+        project_repository: IRepository[Project],
+        customer_repository: IRepository[Customer],
+    ) -> None:
+        """Initialize the service
+
+        Args:
+            user_repository (IRepository[User]): The user repository layer for database interactions
+            project_repository (IRepository[Project]): The project repository layer for database interactions
+            customer_repository (IRepository[Customer]): The customer repository layer for database interactions
+        """
+        logger.info("Initializing TypeaheadService")
+        self._loaders: Dict[
+            TypeaheadType, Callable[[], Awaitable[List[Tuple[str, str, Any]]]]
+        ] = {
+            TypeaheadType.USERS: lambda: self._load_users(user_repository),
+            TypeaheadType.PROJECTS: lambda: self._load_named(project_repository),
+            TypeaheadType.CUSTOMERS: lambda: self._load_named(customer_repository),
+        }
+
+    async def typeahead(
+        self, prefix: str, types: List[TypeaheadType], limit: int
+    ) -> TypeaheadResults:
+        """Functionality for completing a typed prefix to entity names.
+
+        Answered from the in-memory indexes - only a missing or expired index queries the database.
+
+        Args:
+            prefix (str): The typed prefix, matched case insensitively against the start of any word
+            types (List[TypeaheadType]): The entity types to complete
+            limit (int): The maximum number of hits
+
+        Returns:
+            TypeaheadResults: The matching names in alphabetical order
+        """
+
+        try:
+            logger.debug("Completing prefix %s", prefix)
+            hits: List[TypeaheadHit] = []
+            for entity_type in types:
+                index = await typeahead_indexes.get(
+                    entity_type, self._loaders[entity_type]
+                )
+                hits.extend(
+                    TypeaheadHit(type=entity_type, id=entity_id, name=name)
+                    for name, entity_id in index.search(prefix, limit)
+                )
+            hits.sort(key=lambda hit: (hit.name.casefold(), hit.type.value))
+            return TypeaheadResults(prefix=prefix, hits=hits[:limit])
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error completing prefix: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+
+    @staticmethod
+    async def _load_users(
+        user_repository: IRepository[User],
+    ) -> List[Tuple[str, str, Any]]:
+        """Loads user index entries - completed by first name, last name or user name"""
+        users = await user_repository.list_all(
+            load_only=["first_name", "last_name", "user_name"]
+        )
+        return [
+            (
+                f"{user.first_name} {user.last_name} {user.user_name}",
+                f"{user.first_name} {user.last_name}",
+                user.id,
+            )
+            for user in users
+        ]
+
+    @staticmethod
+    async def _load_named(
+        repository: IRepository[Project] | IRepository[Customer],
+    ) -> List[Tuple[str, str, Any]]:
+        """Loads project or customer index entries - completed by any word of the name"""
+        entities = await repository.list_all(load_only=["name"])
+        return [(entity.name, entity.name, entity.id) for entity in entities]
@@ -4,8 +4,10 @@ from typing import List
 
 from api.database.models import User
 from api.database.interfaces.repository_interface import IRepository
+from api.database.interfaces.unit_of_work_interface import IUnitOfWork
 from api.schemas.auth import Token, TokenData
-from api.schemas.user import Roles, UserCreate, UserUpdate
+from api.schemas.user import Roles, UserCreate, UserProjectMoves, UserUpdate
+from api.services.assignment_event_service import record_user_project
 from api.services.interfaces.auth_service_interface import IAuthService
 from api.services.interfaces.user_service_interface import IUserService
 from api.utils.exceptions import (
@@ -36,16 +38,19 @@ class UserService(IUserService):
         self,
         user_repository: IRepository[User],
         auth_service: IAuthService,
+        unit_of_work: IUnitOfWork,
     ) -> None:
         """Initialize the service
 
         Args:
             user_repository (IRepository[User]): The repository layer for database interactions
             auth_service (IAuthService): Service containing AuthN / AuthZ functionalities
+            unit_of_work (IUnitOfWork): Groups the repository's writes into one transaction
         """
         logger.info("Initializing UserService")
         self._user_repository = user_repository
         self._auth_service = auth_service
+        self._unit_of_work = unit_of_work
 
     async def create_user(self, user: UserCreate) -> Token:
         """Functionality for creation and storage of new users.
@@ -160,12 +165,19 @@ class UserService(IUserService):
             logger.error("Error updating user: %s", e)
             ExceptionHandler.raise_internal_server_error()
 
-    async def get_user_by_id(self, user_id: str, project: bool = False) -> User:
+    async def get_user_by_id(
+        self,
+        user_id: str,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
+    ) -> User:
         """Functionality for querying the database for a user, by user ID.
 
         Args:
             user_id (str | None, optional): ID of user to find. Defaults to None.
-            project (bool, optional): Include user's related projects? Defaults to False.
+            include (List[str] | None, optional): Dotted paths of the related entities to load,
+            e.g. 'projects.users'. Defaults to None.
+            fields (List[str] | None, optional): The only attributes to load. Defaults to None.
 
         Returns:
             Project: Retrieved user entity
@@ -174,7 +186,9 @@ class UserService(IUserService):
         try:
             logger.info("Getting user")
             user = await self.find_user(
-                user_id=user_id, load_relations=["project"] if project else None
+                user_id=user_id,
+                load_relations=include,
+                load_only=fields,
             )
 
             if user is None:
@@ -194,11 +208,20 @@ class UserService(IUserService):
             logger.error("Error updating user: %s", e)
             ExceptionHandler.raise_internal_server_error()
 
-    async def list_users(self, projects: bool = False) -> List[User]:
-        """Functionality for listing all users in the database.
+    async def list_users(
+        self,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
+        ids: List[str] | None = None,
+    ) -> List[User]:
+        """Functionality for listing all users in the database, or those with the given ids.
 
         Args:
-            projects (bool, optional): Include any related projects? Defaults to False.
+            include (List[str] | None, optional): Dotted paths of the related entities to load,
+            e.g. 'projects.users'. Defaults to None.
+            fields (List[str] | None, optional): The only attributes to load. Defaults to None.
+            ids (List[str] | None, optional): Only return the users with these ids,
+            in the same order. Defaults to None (all users).
 
         Returns:
             List[User]: A list containing all user entities
@@ -206,8 +229,12 @@ class UserService(IUserService):
 
         try:
             logger.info("Listing users")
+            if ids is not None:
+                return await self._user_repository.get_many(
+                    ids, load_relations=include, load_only=fields
+                )
             return await self._user_repository.list_all(
-                load_relations=["project"] if projects else None
+                load_relations=include, load_only=fields
             )
         except DatabaseConnectionError as e:
             logger.error("Database connection error: %s", e)
@@ -219,9 +246,16 @@ class UserService(IUserService):
             logger.error("Error updating user: %s", e)
             ExceptionHandler.raise_internal_server_error()
 
-    async def get_current_user(self, token_data: TokenData) -> User:
+    async def get_current_user(
+        self,
+        token_data: TokenData,
+        include: List[str] | None = None,
+        fields: List[str] | None = None,
+    ) -> User:
         logger.info("Getting current user")
-        return await self.get_user_by_id(user_id=str(token_data.id), project=True)
+        return await self.get_user_by_id(
+            user_id=str(token_data.id), include=include, fields=fields
+        )
 
     async def find_user(
         self,
@@ -229,6 +263,7 @@ class UserService(IUserService):
         username: str | None = None,
         user_email: str | None = None,
         user_id: str | None = None,
+        load_only: List[str] | None = None,
     ) -> User | None:
         """Functionality for finding a user in the database.
 
@@ -240,6 +275,7 @@ class UserService(IUserService):
             username (str | None, optional): Username of user to find. Defaults to None.
             user_email (str | None, optional): Email address of user to find. Defaults to None.
             user_id (str | None, optional): ID of user to find. Defaults to None.
+            load_only (List[str] | None, optional): The only attributes to load. Defaults to None.
 
         Returns:
             Project | None: The found user entity or None
@@ -261,7 +297,10 @@ class UserService(IUserService):
                 raise ValueError("No parameters provided")
 
             result = await self._user_repository.find(
-                params=params, and_condition=False, load_relations=load_relations
+                params=params,
+                and_condition=False,
+                load_relations=load_relations,
+                load_only=load_only,
             )
             if not result or result[0] is None:
                 return None
@@ -312,14 +351,18 @@ class UserService(IUserService):
             logger.error("Error updating user: %s", e)
             ExceptionHandler.raise_internal_server_error()
 
-    async def update_user_project(self, user_id: str, project_id: str | None) -> User:
+    async def update_user_project(
+        self, user_id: str, project_id: str | None, actor: str | None = None
+    ) -> User:
         """Functionality to update the 'project_id' of a user entity.
         Used to either assign or unassign a project to the user.
+        The change is recorded in the assignment audit log.
 
         Args:
             user_id (str): The ID of the user
             project_id (str | None): The Project ID to update the user with.
             If None - the user will no longer be assigned a project.
+            actor (str | None, optional): The user name of the admin making the change. Defaults to None.
 
         Returns:
             User: The updated user entity
@@ -333,6 +376,7 @@ class UserService(IUserService):
                 raise UserNotFoundError
 
             logger.info("User found")
+            previous_project_id = user.project_id
             updated_user = await self._user_repository.update(
                 item=user,
                 updates={"project_id": project_id},
@@ -340,6 +384,9 @@ class UserService(IUserService):
             )
 
             logger.info("User project updated")
+            record_user_project(
+                actor, updated_user.id, previous_project_id, updated_user.project_id
+            )
             return updated_user
         except UserNotFoundError as e:
             logger.error("User not found: %s", e)
@@ -359,3 +406,61 @@ class UserService(IUserService):
         except Exception as e:
             logger.error("Error updating user: %s", e)
             ExceptionHandler.raise_internal_server_error()
+
+    async def move_users(
+        self, moves: UserProjectMoves, actor: str | None = None
+    ) -> List[User]:
+        """Functionality to update the 'project_id' of many users at once.
+
+        The users are updated in a single unit of work, so either every user is moved
+        or, if any project is not found, none are. The changes are recorded in the
+        assignment audit log once committed.
+
+        Args:
+            moves (UserProjectMoves): The users to move and the projects to move them to.
+            A 'project_id' of None unassigns the user.
+            actor (str | None, optional): The user name of the admin making the change. Defaults to None.
+
+        Returns:
+            List[User]: The updated user entities, in the order of the moves
+        """
+
+        try:
+            logger.info("Moving %s users", len(moves.moves))
+            user_ids = [str(move.user_id) for move in moves.moves]
+            # Read within the unit, so the users are loaded by its own query and session
+            async with self._unit_of_work:
+                users = await self._user_repository.get_many(user_ids)
+                if len(users) < len(moves.moves):
+                    raise UserNotFoundError
+
+                previous_project_ids = [user.project_id for user in users]
+                await self._user_repository.update_many(
+                    users, [{"project_id": move.project_id} for move in moves.moves]
+                )
+                # Loads the new projects, and the attributes expired by the update
+                users = await self._user_repository.get_many(
+                    user_ids, load_relations=["project"]
+                )
+
+            logger.info("Users moved")
+            for user, previous_project_id in zip(users, previous_project_ids):
+                record_user_project(
+                    actor, user.id, previous_project_id, user.project_id
+                )
+            return users
+        except UserNotFoundError as e:
+            logger.error("User not found: %s", e)
+            ExceptionHandler.raise_http_exception(404, "User not found")
+        except IntegrityViolationError as e:
+            logger.error("Integrity violation: %s", e)
+            ExceptionHandler.raise_http_exception(400, "Project not found")
+        except DatabaseConnectionError as e:
+            logger.error("Database connection error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except RepositoryError as e:
+            logger.error("Repository error: %s", e)
+            ExceptionHandler.raise_internal_server_error()
+        except Exception as e:
+            logger.error("Error moving users: %s", e)
+            ExceptionHandler.raise_internal_server_error()
@@ -0,0 +1,91 @@
+"""Module containing the vectorised engine matching engineers to open project slots"""
+
+from typing import Tuple
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment  # type: ignore[import-untyped]
+
+
+# Cost weights - the plan minimises the total cost of its assignments
+BASE_COST = 1.0
+# Per unit of current allocation elsewhere (0 - 1), e.g. part time assignments
+LOAD_PENALTY = 0.5
+# Continuity with a project, or a customer, the engineer was assigned to before
+PROJECT_HISTORY_DISCOUNT = 0.5
+CUSTOMER_HISTORY_DISCOUNT = 0.25
+# BUILD projects are staffed ahead of DESIGN projects when engineers run short
+BUILD_DISCOUNT = 0.1
+
+
+def build_cost_matrix(
+    load: np.ndarray,
+    project_history: np.ndarray,
+    customer_history: np.ndarray,
+    project_customers: np.ndarray,
+    building: np.ndarray,
+) -> np.ndarray:
+    """Builds the engineer x project cost matrix in a single vectorised expression.
+
+    Args:
+        load (np.ndarray): (engineers,) current allocation of each engineer, from 0 to 1
+        project_history (np.ndarray): (engineers, projects) whether the engineer was assigned to the project
+        customer_history (np.ndarray): (engineers, customers) whether the engineer was assigned to the customer
+        project_customers (np.ndarray): (projects,) customer column of each project
+        building (np.ndarray): (projects,) whether each project is in BUILD
+
+    Returns:
+        np.ndarray: (engineers, projects) cost of assigning each engineer to each project
+    """
+    return (
+        BASE_COST
+        + LOAD_PENALTY * load[:, np.newaxis]
+        - PROJECT_HISTORY_DISCOUNT * project_history
+        - CUSTOMER_HISTORY_DISCOUNT * customer_history[:, project_customers]
+        - BUILD_DISCOUNT * building[np.newaxis, :]
+    )
+
+
+def candidate_rows(cost: np.ndarray, total_slots: int) -> np.ndarray:
+    """Selects the engineers that can appear in an optimal plan.
+
+    Only a project's 'total_slots' cheapest engineers can be needed for it: were it
+    given a costlier one, one of those would be free and no costlier to swap in.
+    As engineers without history rank the same for every project, this shrinks
+    thousands of candidates to little more than the number of slots.
+
+    Args:
+        cost (np.ndarray): (engineers, projects) cost matrix
+        total_slots (int): The number of open slots across all projects
+
+    Returns:
+        np.ndarray: The candidate engineer rows, in ascending order
+    """
+    if total_slots >= cost.shape[0]:
+        return np.arange(cost.shape[0])
+    cheapest = np.argpartition(cost, total_slots - 1, axis=0)[:total_slots]
+    return np.unique(cheapest)
+
+
+def solve_staffing(
+    cost: np.ndarray, slots: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes the minimum cost assignment of engineers to open project slots.
+
+    Each project contributes one column per open slot and the rectangular assignment
+    problem is solved with scipy's Hungarian (Jonker-Volgenant) solver, filling as
+    many slots as there are engineers.
+
+    Args:
+        cost (np.ndarray): (engineers, projects) cost matrix
+        slots (np.ndarray): (projects,) open slots of each project
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The assigned engineer rows and their project columns
+    """
+    columns = np.repeat(np.arange(len(slots)), np.minimum(slots, cost.shape[0]))
+    if cost.shape[0] == 0 or len(columns) == 0:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+
+    rows = candidate_rows(cost, len(columns))
+    matched_rows, matched_columns = linear_sum_assignment(cost[np.ix_(rows, columns)])
+    return rows[matched_rows], columns[matched_columns]
@@ -0,0 +1,121 @@
+"""Module containing the buffered writer used to batch writes off the request path"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Generic, List, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BufferedWriter(Generic[T]):
+    """Buffers items in process and writes them in batches from a background task.
+
+    Submitting an item only appends it to the buffer, so the caller never waits on
+    the write. Items are written 'interval' seconds after the first buffered item, or
+    as soon as 'max_batch' items are buffered. Once 'max_pending' items are buffered,
+    further items are dropped rather than letting a stalled database exhaust memory.
+    A failed batch is logged and dropped.
+
+    Args:
+        write (Callable[[List[T]], Awaitable[None]]): Writes a batch of items
+        interval (float): Seconds items are buffered for before a write
+        max_batch (int): Maximum items per write
+        max_pending (int): Maximum items buffered
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[T]], Awaitable[None]],
+        interval: float,
+        max_batch: int,
+        max_pending: int,
+    ) -> None:
+        self._write = write
+        self.interval = interval
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self._pending: List[T] = []
+        self._full = asyncio.Event()
+        self._closing = False
+        self._task: asyncio.Task | None = None
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+    def submit(self, item: T) -> None:
+        """Buffers an item, scheduling a write if none is pending
+
+        Args:
+            item (T): The item to write
+        """
+        self.submitted += 1
+        if len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            logger.warning("Write buffer full - item dropped")
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.dropped += 1
+            logger.warning("No running event loop - item dropped")
+            return
+
+        self._pending.append(item)
+        if len(self._pending) >= self.max_batch:
+            self._full.set()
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def close(self) -> None:
+        """Writes every buffered item without waiting for the interval to pass"""
+        self._closing = True
+        self._full.set()
+        if self._task is not None and not self._task.done():
+            await self._task
+        while self._pending:
+            await self._write_batch()
+        self._closing = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the writer's counters
+
+        Returns:
+            Dict[str, Any]: Items submitted, written, dropped when the buffer was full
+            and lost to failed writes, batches written and items currently buffered
+        """
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "pending": len(self._pending),
+        }
+
+    async def _run(self) -> None:
+        """Writes buffered items in batches until the buffer is empty"""
+        while self._pending:
+            if len(self._pending) < self.max_batch and not self._closing:
+                self._full.clear()
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.interval)
+                except asyncio.TimeoutError:
+                    pass
+            await self._write_batch()
+
+    async def _write_batch(self) -> None:
+        """Writes up to 'max_batch' of the oldest buffered items"""
+        batch = self._pending[: self.max_batch]
+        del self._pending[: self.max_batch]
+        try:
+            await self._write(batch)
+            self.written += len(batch)
+            self.batches += 1
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.failed += len(batch)
+            logger.error("Buffered write of %s items failed: %s", len(batch), e)
@@ -0,0 +1,73 @@
+"""Module containing the debouncer used to coalesce bursts of notifications into one action"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+
+logger = logging.getLogger(__name__)
+
+
+class Debouncer:
+    """Runs an async action once a burst of notifications has settled.
+
+    Each notification pushes the action back by 'delay' seconds, but never beyond
+    'max_delay' seconds after the first pending notification, so a steady stream of
+    writes still triggers the action periodically. Notifications received while the
+    action runs schedule one more run afterwards.
+
+    Args:
+        action (Callable[[], Awaitable[None]]): The action to run
+        delay (float): Seconds of quiet to wait for. 0 disables the debouncer.
+        max_delay (float): Longest wait, in seconds, after the first pending notification
+    """
+
+    def __init__(
+        self, action: Callable[[], Awaitable[None]], delay: float, max_delay: float
+    ) -> None:
+        self._action = action
+        self.delay = delay
+        self.max_delay = max_delay
+        self._pending_since: float | None = None
+        self._deadline = 0.0
+        self._task: asyncio.Task | None = None
+        self.runs = 0
+        self.failures = 0
+
+    def notify(self, *_args) -> None:
+        """Records a notification, scheduling the action if it is not already pending.
+
+        Accepts and ignores any arguments, so it can be subscribed to events directly.
+        """
+        if not self.delay:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("No running event loop - notification ignored")
+            return
+
+        now = time.monotonic()
+        if self._pending_since is None:
+            self._pending_since = now
+        self._deadline = min(now + self.delay, self._pending_since + self.max_delay)
+
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Waits for the pending notifications to settle and runs the action"""
+        while self._pending_since is not None:
+            remaining = self._deadline - time.monotonic()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+                continue
+
+            self._pending_since = None
+            try:
+                await self._action()
+                self.runs += 1
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.failures += 1
+                logger.error("Debounced action failed: %s", e)
@@ -0,0 +1,52 @@
+"""Module containing the in-process publish / subscribe hooks for entity changes"""
+
+from collections import defaultdict
+import logging
+from typing import Callable, DefaultDict, List
+
+
+logger = logging.getLogger(__name__)
+
+# Callbacks receive the table name of the changed entity
+EntityChangedCallback = Callable[[str], None]
+
+_subscribers: DefaultDict[str, List[EntityChangedCallback]] = defaultdict(list)
+# Committed writes published by this process, across all tables
+_published = 0
+
+
+def subscribe_entity_changed(table: str, callback: EntityChangedCallback) -> None:
+    """Registers a callback run whenever rows of a table are written by this process
+
+    Args:
+        table (str): The table name, e.g. 'project'
+        callback (EntityChangedCallback): Called with the table name after each committed write
+    """
+    _subscribers[table].append(callback)
+
+
+def publish_entity_changed(table: str) -> None:
+    """Notifies the subscribers of a table that its rows were written
+
+    Subscriber errors are logged rather than failing the write that triggered them.
+
+    Args:
+        table (str): The table name, e.g. 'project'
+    """
+    global _published  # pylint: disable=global-statement
+    _published += 1
+    for callback in _subscribers.get(table, []):
+        try:
+            callback(table)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Entity changed subscriber failed for %s: %s", table, e)
+
+
+def published_changes() -> int:
+    """Returns the number of committed writes published by this process so far, so
+    a read can tell whether a write was committed since another read started
+
+    Returns:
+        int: The number of published writes
+    """
+    return _published
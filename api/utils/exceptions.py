@@ -82,6 +82,55 @@ class ProjectAlreadyExistsError(ProjectServiceError):
     """Raised when a project already exists."""
 
 
+# Assignment Service
+class AssignmentServiceError(Exception):
+    """Base class for assignment service exceptions."""
+
+
+class AssignmentNotFoundError(AssignmentServiceError):
+    """Raised when an assignment is not found."""
+
+
+class OverAllocationError(AssignmentServiceError):
+    """Raised when an assignment would allocate a user beyond their capacity."""
+
+
+# Skill Service
+class SkillServiceError(Exception):
+    """Base class for skill service exceptions."""
+
+
+class SkillAlreadyExistsError(SkillServiceError):
+    """Raised when a skill already exists."""
+
+
+class UnknownSkillError(SkillServiceError):
+    """Raised when a skill name is not in the skill catalogue."""
+
+
+# Job Service
+class JobServiceError(Exception):
+    """Base class for job service exceptions."""
+
+
+class JobNotFoundError(JobServiceError):
+    """Raised when a job is not found."""
+
+
+class JobOutputUnavailableError(JobServiceError):
+    """Raised when a job's output is requested before it has succeeded."""
+
+
+# Idempotency Middleware
+class IdempotencyConflictError(Exception):
+    """Raised when an idempotency key cannot be replayed or reserved for a request."""
+
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
 class ExceptionHandler:
     """Static class containing frequently used HTTP error responses."""
 
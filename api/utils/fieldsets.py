@@ -0,0 +1,224 @@
+"""Module containing sparse fieldset parsing and response model narrowing"""
+
+from copy import deepcopy
+from functools import lru_cache
+import logging
+import re
+from types import UnionType
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+
+logger = logging.getLogger(__name__)
+
+# Matches the 'fields' and 'fields[<relation>]' query parameters
+FIELDS_PARAM = re.compile(r"^fields(?:\[(?P<relation>\w+)\])?$")
+
+# Key of the root entity's fields within a FieldSet
+ROOT = ""
+
+
+class FieldSet:
+    """The attributes requested for the root entity and each nested relation.
+
+    A relation with no selection keeps every attribute of its response model.
+
+    Args:
+        selections (Dict[str, FrozenSet[str]] | None, optional): Requested attribute names
+        keyed by relation name, with ROOT ('') for the root entity. Defaults to None.
+    """
+
+    def __init__(self, selections: Dict[str, FrozenSet[str]] | None = None) -> None:
+        self._selections = selections or {}
+
+    def __bool__(self) -> bool:
+        return bool(self._selections)
+
+    @property
+    def key(self) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """A hashable, order independent representation used as a cache key"""
+        return tuple(
+            sorted(
+                (relation, tuple(sorted(names)))
+                for relation, names in self._selections.items()
+            )
+        )
+
+    def selected(self, relation: str = ROOT) -> List[str] | None:
+        """Returns the attributes requested for a relation
+
+        Args:
+            relation (str, optional): The relation name. Defaults to the root entity.
+
+        Returns:
+            List[str] | None: The requested attribute names, or None if unrestricted
+        """
+        names = self._selections.get(relation)
+        return sorted(names) if names is not None else None
+
+    def includes(self, name: str, relation: str = ROOT) -> bool:
+        """Checks whether an attribute is part of the response
+
+        Args:
+            name (str): The attribute name
+            relation (str, optional): The relation the attribute belongs to. Defaults to the root entity.
+
+        Returns:
+            bool: True if the attribute was requested or the relation is unrestricted
+        """
+        names = self._selections.get(relation)
+        return names is None or name in names
+
+
+def parse_fieldsets(
+    params: Iterable[Tuple[str, str]], allowed: Dict[str, Set[str]]
+) -> FieldSet:
+    """Parses 'fields' and 'fields[<relation>]' query parameters into a FieldSet.
+
+    Args:
+        params (Iterable[Tuple[str, str]]): The query parameter key / value pairs
+        allowed (Dict[str, Set[str]]): The attribute names each relation may select
+
+    Raises:
+        ValueError: If a relation or attribute is not part of the response model
+
+    Returns:
+        FieldSet: The parsed field selections
+    """
+    selections: Dict[str, Set[str]] = {}
+    for key, value in params:
+        match = FIELDS_PARAM.match(key)
+        if match is None:
+            continue
+
+        relation = match.group("relation") or ROOT
+        if relation not in allowed:
+            raise ValueError(f"Unknown relation: {relation}")
+
+        names = {name.strip() for name in value.split(",") if name.strip()}
+        unknown = names - allowed[relation]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        selections.setdefault(relation, set()).update(names)
+
+    return FieldSet(
+        {relation: frozenset(names) for relation, names in selections.items() if names}
+    )
+
+
+def _models(annotation: Any) -> List[type[BaseModel]]:
+    """Finds every Pydantic model within a (possibly nested) type annotation"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return [annotation]
+    return [model for arg in get_args(annotation) for model in _models(arg)]
+
+
+def collect_fields(response_model: Any) -> Dict[str, Set[str]]:
+    """Collects the selectable attribute names of a response model and its nested relations.
+
+    Args:
+        response_model (Any): A Pydantic model or typing construct such as List[Union[...]]
+
+    Returns:
+        Dict[str, Set[str]]: Attribute names keyed by relation name, with ROOT for the root entity
+    """
+    allowed: Dict[str, Set[str]] = {}
+
+    def visit(annotation: Any, relation: str) -> None:
+        for model in _models(annotation):
+            allowed.setdefault(relation, set()).update(model.model_fields)
+            for name, field in model.model_fields.items():
+                if _models(field.annotation):
+                    visit(field.annotation, name)
+
+    visit(response_model, ROOT)
+    return allowed
+
+
+def _narrow_annotation(annotation: Any, fields: FieldSet, relation: str) -> Any:
+    """Rebuilds a type annotation with every model narrowed to the selected fields"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _narrow_model(annotation, fields, relation)
+
+    args = get_args(annotation)
+    if not args:
+        return annotation
+
+    narrowed = tuple(_narrow_annotation(arg, fields, relation) for arg in args)
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        return Union[narrowed]
+    return origin[narrowed]
+
+
+def _narrow_model(
+    model: type[BaseModel], fields: FieldSet, relation: str
+) -> type[BaseModel]:
+    """Creates a model containing only the selected fields of a relation"""
+    definitions: Dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        if not fields.includes(name, relation):
+            continue
+        if _models(field.annotation):
+            annotation = _narrow_annotation(field.annotation, fields, name)
+        else:
+            annotation = field.annotation
+        # Pydantic mutates the FieldInfo it is given, so the original model's is copied
+        definitions[name] = (annotation, deepcopy(field))
+
+    return create_model(
+        f"{model.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions,
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_narrow(response_model: Any, key: Tuple) -> Any:
+    """Narrows a response model once per distinct field selection"""
+    fields = FieldSet({relation: frozenset(names) for relation, names in key})
+    logger.info("Narrowing %s to %s", response_model, key)
+    return _narrow_annotation(response_model, fields, ROOT)
+
+
+def list_of(response_model: Any) -> Any:
+    """Builds the list type of a response model created at runtime, such as an
+    expanded or narrowed model, which cannot be subscripted into 'List' statically
+
+    Args:
+        response_model (Any): The model of each list item
+
+    Returns:
+        Any: List[response_model]
+    """
+    return List[response_model]  # type: ignore[valid-type]
+
+
+def narrow_response_model(response_model: Any, fields: FieldSet) -> Any:
+    """Narrows a response model to the requested sparse fieldset.
+
+    Only the selected attributes are read from the ORM entities during
+    validation, so columns and relations left out are never loaded.
+
+    Args:
+        response_model (Any): A Pydantic model or typing construct such as List[Union[...]]
+        fields (FieldSet): The requested fields
+
+    Returns:
+        Any: The narrowed response model, or the original model if no fields were requested
+    """
+    if not fields:
+        return response_model
+    return _cached_narrow(response_model, fields.key)
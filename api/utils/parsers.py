@@ -0,0 +1,95 @@
+"""Module containing streaming parsers for bulk upload files and request header parsers"""
+
+import csv
+import io
+import json
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple, TypeVar
+
+from api.schemas.bulk import ImportFormat
+
+
+T = TypeVar("T")
+
+# A parsed record is either the row data or the exception raised whilst decoding it
+Record = Tuple[int, Dict[str, Any] | Exception]
+
+
+def iter_records(stream: BinaryIO, file_format: ImportFormat) -> Iterator[Record]:
+    """Lazily parses an uploaded file one record at a time.
+
+    Only the current line is held in memory, so arbitrarily large files
+    can be processed in bounded memory.
+
+    Args:
+        stream (BinaryIO): The binary file object to read from.
+        file_format (ImportFormat): The format of the file contents.
+
+    Yields:
+        Record: The 1-based record number and either the parsed record or the decoding error.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+
+    if file_format == ImportFormat.CSV:
+        reader = csv.DictReader(text)
+        for row_number, row in enumerate(reader, start=1):
+            # Empty CSV cells are treated as missing values
+            yield row_number, {
+                key: (value if value != "" else None)
+                for key, value in row.items()
+                if key is not None
+            }
+        return
+
+    row_number = 0
+    for line in text:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("Each line must contain a JSON object")
+            yield row_number, record
+        except ValueError as e:
+            yield row_number, e
+
+
+def next_chunk(iterator: Iterator[T], size: int) -> List[T]:
+    """Consumes up to 'size' items from an iterator.
+
+    Args:
+        iterator (Iterator[T]): The iterator to consume.
+        size (int): The maximum number of items to return.
+
+    Returns:
+        List[T]: The consumed items, an empty list once the iterator is exhausted.
+    """
+    return list(islice(iterator, size))
+
+
+def parse_header_qualities(header: str) -> List[Tuple[str, float]]:
+    """Parses a comma separated header with quality values, such as Accept or Accept-Encoding.
+
+    Args:
+        header (str): The raw header value.
+
+    Returns:
+        List[Tuple[str, float]]: Each lower-cased value with its quality (1.0 if not given).
+    """
+    values = []
+    for part in header.split(","):
+        value, *params = part.split(";")
+        value = value.strip().lower()
+        if not value:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, raw = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(raw)
+                except ValueError:
+                    quality = 0.0
+        values.append((value, quality))
+    return values
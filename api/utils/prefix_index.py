@@ -0,0 +1,74 @@
+"""Module containing the sorted in-memory prefix index used for typeahead"""
+
+from bisect import bisect_left
+from typing import Any, Iterable, List, Set, Tuple
+
+
+def normalize(text: str) -> str:
+    """Case folds text and collapses its whitespace so lookups ignore case and spacing
+
+    Args:
+        text (str): The text to normalize
+
+    Returns:
+        str: The normalized text
+    """
+    return " ".join(text.casefold().split())
+
+
+class PrefixIndex:
+    """An immutable, sorted index answering prefix lookups by binary search.
+
+    Every word of an entry's text starts a key, so 'smi' finds 'John Smith' as
+    well as 'Smithson'. A lookup costs O(log n) plus the number of keys returned.
+
+    Args:
+        entries (Iterable[Tuple[str, str, Any]]): (indexed text, display name, value)
+        triples, e.g. ('John Smith jsmith01', 'John Smith', <id>)
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, Any]] = ()) -> None:
+        rows = sorted(
+            (key, name, value)
+            for text, name, value in entries
+            for key in self._keys(text)
+        )
+        self._keys_sorted = [key for key, _, _ in rows]
+        self._entries = [(name, value) for _, name, value in rows]
+
+    def __len__(self) -> int:
+        return len(self._keys_sorted)
+
+    @staticmethod
+    def _keys(text: str) -> Set[str]:
+        """Returns the keys of an entry - its normalized text from each word onwards"""
+        words = normalize(text).split(" ")
+        return {" ".join(words[i:]) for i in range(len(words)) if words[i]}
+
+    def search(self, prefix: str, limit: int) -> List[Tuple[str, Any]]:
+        """Finds the entries with a word starting with the prefix
+
+        Args:
+            prefix (str): The typed prefix
+            limit (int): The maximum number of entries to return
+
+        Returns:
+            List[Tuple[str, Any]]: (display name, value) pairs, each value at most once,
+            ordered by the matching key
+        """
+        prefix = normalize(prefix)
+        results: List[Tuple[str, Any]] = []
+        seen = set()
+        for position in range(
+            bisect_left(self._keys_sorted, prefix), len(self._keys_sorted)
+        ):
+            if not self._keys_sorted[position].startswith(prefix):
+                break
+            name, value = self._entries[position]
+            if value in seen:
+                continue
+            seen.add(value)
+            results.append((name, value))
+            if len(results) == limit:
+                break
+        return results
@@ -0,0 +1,200 @@
+"""Module containing the response renderer used to serialize route responses"""
+
+from functools import lru_cache
+import logging
+from typing import Any, Tuple
+from uuid import UUID
+
+from fastapi import Response
+import msgpack  # type: ignore[import-untyped]
+from pydantic import TypeAdapter
+from pydantic_core import PydanticSerializationError, to_jsonable_python
+
+from api.utils.fieldsets import FieldSet, narrow_response_model
+from api.utils.parsers import parse_header_qualities
+
+
+logger = logging.getLogger(__name__)
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+# MessagePack extension type code for UUIDs - the data is the 16 raw UUID bytes
+MSGPACK_UUID_EXT = 1
+
+
+# Bounded, as narrowed sparse fieldset models are created per distinct selection
+@lru_cache(maxsize=512)
+def get_type_adapter(response_model: Any) -> TypeAdapter:
+    """Builds, once per response model, the TypeAdapter used to validate and serialize it.
+
+    Args:
+        response_model (Any): A Pydantic model or typing construct such as List[Union[...]].
+
+    Returns:
+        TypeAdapter: The cached adapter with its core schema and serializer compiled.
+    """
+    logger.info("Compiling serializer for %s", response_model)
+    return TypeAdapter(response_model)
+
+
+def encode_msgpack_default(obj: Any) -> Any:
+    """Encodes the values MessagePack does not support natively.
+
+    UUIDs become a 16 byte extension type rather than a 36 character string.
+    Timezone aware datetimes are packed as the Timestamp extension type before
+    reaching this hook; any other value - enums, naive datetimes, dates, durations,
+    decimals - is encoded as it is in JSON responses.
+
+    Args:
+        obj (Any): The value to encode
+
+    Raises:
+        TypeError: If the value cannot be encoded
+
+    Returns:
+        Any: The MessagePack encodable value
+    """
+    if isinstance(obj, UUID):
+        return msgpack.ExtType(MSGPACK_UUID_EXT, obj.bytes)
+    try:
+        return to_jsonable_python(obj)
+    except PydanticSerializationError as e:
+        raise TypeError(f"Cannot encode {type(obj).__name__} as MessagePack") from e
+
+
+def decode_msgpack_ext(code: int, data: bytes) -> Any:
+    """Decodes the extension types written by 'encode_msgpack_default'
+
+    Args:
+        code (int): The extension type code
+        data (bytes): The extension data
+
+    Returns:
+        Any: A UUID, or the undecoded extension
+    """
+    if code == MSGPACK_UUID_EXT:
+        return UUID(bytes=data)
+    return msgpack.ExtType(code, data)
+
+
+def decode_msgpack(body: bytes) -> Any:
+    """Decodes a MessagePack response body, with UUIDs and timezone aware datetimes restored
+
+    Args:
+        body (bytes): The response body
+
+    Returns:
+        Any: The decoded content
+    """
+    return msgpack.unpackb(body, ext_hook=decode_msgpack_ext, timestamp=3)
+
+
+def negotiate_media_type(accept: str | None) -> str:
+    """Selects the response media type from a request's Accept header.
+
+    MessagePack is only selected when requested with at least the quality of JSON,
+    so clients sending a wildcard or no Accept header keep receiving JSON.
+
+    Args:
+        accept (str | None): The request's Accept header value
+
+    Returns:
+        str: The selected media type
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+
+    msgpack_quality, json_quality = 0.0, 0.0
+    for media_type, quality in parse_header_qualities(accept):
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_quality = max(msgpack_quality, quality)
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            json_quality = max(json_quality, quality)
+
+    if msgpack_quality > 0 and msgpack_quality >= json_quality:
+        return MSGPACK_MEDIA_TYPES[0]
+    return JSON_MEDIA_TYPE
+
+
+class ResponseRenderer:
+    """Serializes route responses directly to JSON or MessagePack bytes.
+
+    Returning a Response from a route bypasses FastAPI's own response_model
+    handling, which validates, dumps to Python objects and then re-encodes.
+    The renderer instead validates ORM entities once against the cached
+    adapter and writes JSON straight from the compiled Rust serializer.
+    The route's response_model is still declared for the OpenAPI schema.
+
+    Args:
+        media_type (str, optional): The negotiated media type. Defaults to JSON.
+    """
+
+    def __init__(self, media_type: str = JSON_MEDIA_TYPE) -> None:
+        self.media_type = media_type
+
+    def render(
+        self,
+        response_model: Any,
+        content: Any,
+        fields: FieldSet | None = None,
+        status_code: int = 200,
+    ) -> Response:
+        """Validates and serializes content against a response model.
+
+        Args:
+            response_model (Any): The model the content is validated against.
+            content (Any): ORM entities, Pydantic models or plain data.
+            fields (FieldSet | None, optional): Sparse fieldset narrowing the response model.
+            Defaults to None.
+            status_code (int, optional): The response status code. Defaults to 200.
+
+        Returns:
+            Response: The serialized response.
+        """
+        adapter, validated = self._validate(response_model, content, fields)
+
+        if self.media_type == JSON_MEDIA_TYPE:
+            body = adapter.dump_json(validated)
+        else:
+            body = msgpack.packb(
+                adapter.dump_python(validated),
+                default=encode_msgpack_default,
+                datetime=True,
+            )
+
+        return Response(
+            content=body,
+            status_code=status_code,
+            media_type=self.media_type,
+            headers={"Vary": "Accept"},
+        )
+
+    def dump(
+        self, response_model: Any, content: Any, fields: FieldSet | None = None
+    ) -> Any:
+        """Validates content against a response model and dumps it to Python objects.
+
+        Used where the content is embedded in a larger response rendered afterwards.
+
+        Args:
+            response_model (Any): The model the content is validated against.
+            content (Any): ORM entities, Pydantic models or plain data.
+            fields (FieldSet | None, optional): Sparse fieldset narrowing the response model.
+            Defaults to None.
+
+        Returns:
+            Any: The validated content as dicts, lists and scalar values.
+        """
+        adapter, validated = self._validate(response_model, content, fields)
+        return adapter.dump_python(validated)
+
+    @staticmethod
+    def _validate(
+        response_model: Any, content: Any, fields: FieldSet | None
+    ) -> Tuple[TypeAdapter, Any]:
+        """Validates content against the (narrowed) response model's cached adapter"""
+        if fields:
+            response_model = narrow_response_model(response_model, fields)
+        adapter = get_type_adapter(response_model)
+        return adapter, adapter.validate_python(content, from_attributes=True)
@@ -0,0 +1,93 @@
+"""Module containing request coalescing (single-flight) for identical concurrent reads"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces identical concurrent calls into a single in-flight call.
+
+    The first caller for a key (the leader) runs the call; callers arriving while it is
+    in flight (followers) await the leader's result, or its exception, instead of
+    running their own. Once the call completes the key is forgotten, so results are
+    never cached beyond the lifetime of the call.
+
+    A follower waits at most 'timeout' seconds before running the call itself, so a
+    slow leader cannot hold every identical request up. A cancelled leader cancels the
+    shared call, and its followers then run the call themselves.
+
+    Args:
+        timeout (float | None, optional): Seconds a follower waits for the leader's result.
+        Defaults to None (no limit).
+    """
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self.timeout = timeout
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Runs fn, or awaits the in-flight call of an identical key
+
+        Args:
+            key (Hashable): Identifies identical calls
+            fn (Callable[[], Awaitable[T]]): Creates the awaitable performing the call
+
+        Returns:
+            T: The result of the call
+        """
+        self.calls += 1
+        task = self._calls.get(key)
+
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            return await task
+
+        self.coalesced += 1
+        logger.debug("Coalescing call %s", key)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            logger.warning("Timed out waiting for call %s - running it again", key)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise
+            logger.warning("Call %s was cancelled - running it again", key)
+        return await fn()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the coalescing counters
+
+        Returns:
+            Dict[str, Any]: Calls made, calls executed, calls coalesced onto an in-flight call,
+            followers that timed out, failed executions and the calls currently in flight
+        """
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "in_flight": len(self._calls),
+        }
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """Removes a completed call so the next caller runs a fresh one"""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
@@ -0,0 +1,103 @@
+"""Module containing the in-memory NumPy bit matrix used to match users to required skills"""
+
+from typing import Any, List, Tuple
+
+import numpy as np
+
+
+WORD_BITS = 64
+
+
+def bit_positions(bits: int) -> List[int]:
+    """Returns the positions of the set bits of a bitset
+
+    Args:
+        bits (int): The bitset
+
+    Returns:
+        List[int]: The set bit positions in ascending order
+    """
+    positions = []
+    while bits:
+        lowest = bits & -bits
+        positions.append(lowest.bit_length() - 1)
+        bits ^= lowest
+    return positions
+
+
+def to_words(bits: int, words: int) -> np.ndarray:
+    """Splits a bitset into little-endian uint64 words
+
+    Args:
+        bits (int): The bitset, no longer than 'words' words
+        words (int): The number of words
+
+    Returns:
+        np.ndarray: (words,) uint64 array
+    """
+    return np.frombuffer(bits.to_bytes(words * 8, "little"), dtype="<u8")
+
+
+class SkillMatrix:
+    """Skill bitsets of many users packed into a (users, words) uint64 matrix.
+
+    Ranking users against a set of required skills is a broadcast AND followed by a
+    popcount per word, so it is a handful of vectorised passes over a few kilobytes
+    per thousand users rather than a loop over users.
+
+    Args:
+        user_ids (List[Any]): The user of each row
+        skills (List[int]): The skill bitset of each row
+        assigned (List[bool]): Whether each user currently has a project
+    """
+
+    def __init__(
+        self, user_ids: List[Any], skills: List[int], assigned: List[bool]
+    ) -> None:
+        self.user_ids = user_ids
+        longest = max((bits.bit_length() for bits in skills), default=0)
+        self.words = max(1, (longest + WORD_BITS - 1) // WORD_BITS)
+        self._bits = np.frombuffer(
+            b"".join(bits.to_bytes(self.words * 8, "little") for bits in skills),
+            dtype="<u8",
+        ).reshape(len(skills), self.words)
+        self._skill_counts = np.bitwise_count(self._bits).sum(axis=1, dtype=np.int64)
+        self._assigned = np.array(assigned, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+    def rank(
+        self, required: int, limit: int, unassigned_only: bool = False
+    ) -> List[Tuple[int, int]]:
+        """Ranks users by the number of required skills they have.
+
+        Ties go to the user with fewer skills overall, keeping broader skill sets free
+        for projects that need them. Users without any required skill are left out.
+
+        Args:
+            required (int): The required skills bitset
+            limit (int): The maximum number of users to return
+            unassigned_only (bool, optional): Only rank users without a project. Defaults to False.
+
+        Returns:
+            List[Tuple[int, int]]: (row, matched skill count) of the best users, best first
+        """
+        # Skills nobody has are beyond the matrix and can never match
+        required &= (1 << (self.words * WORD_BITS)) - 1
+        if not required or not len(self):
+            return []
+
+        matched = np.bitwise_count(self._bits & to_words(required, self.words)).sum(
+            axis=1, dtype=np.int64
+        )
+        eligible = matched > 0
+        if unassigned_only:
+            eligible &= ~self._assigned
+
+        rows = np.flatnonzero(eligible)
+        if len(rows) > limit:
+            score = matched[rows] * (self.words * WORD_BITS + 1) - self._skill_counts[rows]
+            rows = rows[np.argpartition(-score, limit - 1)[:limit]]
+        rows = rows[np.lexsort((self._skill_counts[rows], -matched[rows]))]
+        return [(int(row), int(matched[row])) for row in rows]
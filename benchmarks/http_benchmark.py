@@ -0,0 +1,525 @@
+"""End-to-end HTTP benchmarks for every API route.
+
+Drives the FastAPI application in-process through an ASGI client (the default),
+or a running server when '--url' is given, and reports latency percentiles,
+throughput, database queries per request and peak RSS for each route.
+
+Usage:
+    python -m benchmarks.http_benchmark --requests 200 --concurrency 10
+    python -m benchmarks.http_benchmark --baseline bench_baseline.json
+"""
+
+import argparse
+import asyncio
+from contextvars import ContextVar
+from datetime import datetime
+from http.cookies import SimpleCookie
+import itertools
+import logging
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+from uuid import UUID
+
+import httpx
+from sqlalchemy import event
+
+from api.core.config import app_config
+from api.database.session import db_session_manager
+from api.index import app
+from api.utils.serializers import MSGPACK_MEDIA_TYPES, decode_msgpack
+from seed_database import generate_dataset
+from benchmarks.utils import (
+    build_report,
+    compare_to_baseline,
+    summarize,
+    write_report,
+)
+
+
+# Database statements executed by the request running in the current task
+query_counter: ContextVar[List[int] | None] = ContextVar("query_counter", default=None)
+
+
+@event.listens_for(db_session_manager.engine.sync_engine, "before_cursor_execute")
+def count_query(*_: Any) -> None:
+    counter = query_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+class HttpBenchmark:
+    """Runs each route scenario and collects its latency and query samples."""
+
+    def __init__(self, client: httpx.AsyncClient, requests: int, concurrency: int):
+        self.client = client
+        self.requests = requests
+        self._concurrency = concurrency
+        self._unique = itertools.count()
+        self.cookie: Dict[str, str] = {}
+        self.results: Dict[str, Any] = {}
+        self.state: Dict[str, Any] = {}
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        # The session cookie is 'secure', so it is sent explicitly to support plain http
+        return await self.client.request(
+            method,
+            url,
+            headers={"Cookie": self._cookie_header(), **(headers or {})},
+            **kwargs,
+        )
+
+    def _cookie_header(self) -> str:
+        return "; ".join(f"{key}={value}" for key, value in self.cookie.items())
+
+    def unique(self) -> int:
+        return next(self._unique)
+
+    async def login(self) -> None:
+        response = await self.client.post(
+            "/api/login",
+            data={
+                "username": app_config.admin_username,
+                "password": app_config.admin_password,
+            },
+        )
+        response.raise_for_status()
+        cookies = SimpleCookie(response.headers["set-cookie"])
+        self.cookie = {"access_token": cookies["access_token"].value}
+
+    async def run(
+        self,
+        name: str,
+        operation: Callable[[int], Awaitable[httpx.Response]],
+        requests: int | None = None,
+    ) -> None:
+        """Runs 'operation' the configured number of times at the configured concurrency.
+
+        Args:
+            name (str): The name the results are reported under.
+            operation (Callable[[int], Awaitable[httpx.Response]]): Issues one request,
+            receiving the iteration number.
+            requests (int | None, optional): Overrides the number of requests. Defaults to None.
+        """
+        total = requests if requests is not None else self.requests
+        iterations = iter(range(total))
+        samples: List[float] = []
+        queries: List[int] = []
+        errors = 0
+
+        async def worker() -> None:
+            nonlocal errors
+            for iteration in iterations:
+                counter = [0]
+                query_counter.set(counter)
+                started = time.perf_counter()
+                try:
+                    response = await operation(iteration)
+                    failed = response.status_code >= 400
+                except httpx.HTTPError:
+                    failed = True
+                samples.append(time.perf_counter() - started)
+                queries.append(counter[0])
+                errors += failed
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(
+                asyncio.create_task(worker())
+                for _ in range(min(self._concurrency, total))
+            )
+        )
+        result = summarize(samples, time.perf_counter() - started, errors)
+        if queries and any(queries):
+            result["queries_per_request"] = round(sum(queries) / len(queries), 2)
+        self.results[name] = result
+
+        print(
+            f"{name:<45} p50 {result.get('p50_ms', 0):>8.2f}ms  "
+            f"p95 {result.get('p95_ms', 0):>8.2f}ms  "
+            f"p99 {result.get('p99_ms', 0):>8.2f}ms  "
+            f"{result.get('throughput_ops', 0):>8.1f} req/s  errors {errors}"
+        )
+
+
+async def read_routes(bench: HttpBenchmark) -> None:
+    """Benchmarks every read-only route of the users, customers and projects routers."""
+    me = (await bench.request("GET", "/api/users/me")).json()
+    customer = (await bench.request("GET", "/api/customers")).json()
+    project = (await bench.request("GET", "/api/projects")).json()
+    bench.state.update(
+        me=me,
+        customer_id=customer[0]["id"] if customer else None,
+        project_id=project[0]["id"] if project else None,
+    )
+
+    routes = [
+        ("GET /users/me", "/api/users/me", None),
+        ("GET /users", "/api/users", None),
+        ("GET /users?projects=true", "/api/users", {"projects": True}),
+        ("GET /user/{user_id}", f"/api/user/{me['id']}", None),
+        (
+            "GET /user/{user_id}?project=true",
+            f"/api/user/{me['id']}",
+            {"project": True},
+        ),
+        ("GET /customers", "/api/customers", None),
+        ("GET /customers?projects=true", "/api/customers", {"projects": True}),
+        (
+            "GET /customers?projects=true&users=true",
+            "/api/customers",
+            {"projects": True, "users": True},
+        ),
+        ("GET /projects", "/api/projects", None),
+        ("GET /projects?users=true", "/api/projects", {"users": True}),
+    ]
+    if bench.state["customer_id"]:
+        routes.append(
+            (
+                "GET /customer?projects=true&users=true",
+                "/api/customer",
+                {
+                    "customer_id": bench.state["customer_id"],
+                    "projects": True,
+                    "users": True,
+                },
+            )
+        )
+    if bench.state["project_id"]:
+        routes.append(
+            (
+                "GET /project?users=true",
+                "/api/project",
+                {"project_id": bench.state["project_id"], "users": True},
+            )
+        )
+
+    for name, url, params in routes:
+
+        async def get(
+            _: int, url: str = url, params: Dict[str, Any] | None = params
+        ) -> httpx.Response:
+            return await bench.request("GET", url, params=params)
+
+        await bench.run(name, get)
+
+
+def same_content(decoded: Any, expected: Any) -> bool:
+    """Compares decoded MessagePack content to the JSON content of the same response.
+
+    UUIDs are compared as strings and datetimes as instants, as the Timestamp
+    extension type keeps the instant but not the UTC offset.
+    """
+    if isinstance(decoded, dict):
+        return (
+            isinstance(expected, dict)
+            and decoded.keys() == expected.keys()
+            and all(same_content(decoded[key], expected[key]) for key in decoded)
+        )
+    if isinstance(decoded, list):
+        return (
+            isinstance(expected, list)
+            and len(decoded) == len(expected)
+            and all(map(same_content, decoded, expected))
+        )
+    if isinstance(decoded, datetime):
+        return isinstance(expected, str) and decoded == datetime.fromisoformat(expected)
+    if isinstance(decoded, UUID):
+        return str(decoded) == expected
+    return decoded == expected
+
+
+async def msgpack_routes(bench: HttpBenchmark) -> bool:
+    """Checks the MessagePack responses of the read routes round-trip to their JSON content.
+
+    Returns:
+        bool: True if any route's MessagePack response differs from its JSON response
+    """
+    routes = [
+        ("/api/users/me", None),
+        ("/api/users", {"projects": True}),
+        ("/api/customers", {"projects": True, "users": True}),
+        ("/api/summary", None),
+        ("/api/assignments/utilisation", None),
+        ("/api/assignment_events", None),
+        ("/api/reports/staffing", None),
+        ("/api/reports/time_in_status", None),
+    ]
+    mismatched = False
+    for url, params in routes:
+        json_response = await bench.request("GET", url, params=params)
+        msgpack_response = await bench.request(
+            "GET", url, params=params, headers={"Accept": MSGPACK_MEDIA_TYPES[0]}
+        )
+        if json_response.status_code != msgpack_response.status_code:
+            matches = False
+        elif json_response.status_code >= 400:
+            continue
+        else:
+            matches = same_content(
+                decode_msgpack(msgpack_response.content), json_response.json()
+            )
+        if not matches:
+            mismatched = True
+            print(
+                f"MessagePack mismatch for GET {url}: "
+                f"{msgpack_response.status_code} vs {json_response.status_code}"
+            )
+    return mismatched
+
+
+async def write_routes(bench: HttpBenchmark) -> None:
+    """Benchmarks every write route, cleaning up every entity it creates."""
+    run_id = f"{int(time.time()) % 100000:05d}"
+    customers: List[str] = []
+    projects: List[str] = []
+    users: List[str] = []
+
+    async def create_customer(_: int) -> httpx.Response:
+        response = await bench.request(
+            "POST",
+            "/api/customer",
+            json={"name": f"Bench {run_id}-{bench.unique()}", "details": "benchmark"},
+        )
+        if response.status_code == 200:
+            customers.append(response.json()["id"])
+        return response
+
+    await bench.run("POST /customer", create_customer)
+    if not customers:
+        print("Skipping remaining write routes - no customers could be created")
+        return
+
+    await bench.run(
+        "PUT /customer/{customer_id}",
+        lambda i: bench.request(
+            "PUT",
+            f"/api/customer/{customers[i % len(customers)]}",
+            json={"name": f"Bench {run_id}-{bench.unique()}", "details": "updated"},
+        ),
+    )
+
+    async def create_project(_: int) -> httpx.Response:
+        response = await bench.request(
+            "POST",
+            "/api/project",
+            json={
+                "name": f"Bench {run_id}-{bench.unique()}",
+                "status": "DESIGN",
+                "details": "benchmark",
+                "customer_id": customers[0],
+            },
+        )
+        if response.status_code == 200:
+            projects.append(response.json()["id"])
+        return response
+
+    await bench.run("POST /project", create_project)
+    await bench.run(
+        "PUT /project/{project_id}",
+        lambda i: bench.request(
+            "PUT",
+            f"/api/project/{projects[i % len(projects)]}",
+            json={
+                "name": f"Bench {run_id}-{bench.unique()}",
+                "status": "BUILD",
+                "details": "updated",
+                "customer_id": customers[0],
+            },
+        ),
+    )
+
+    async def create_user(_: int) -> httpx.Response:
+        user_name = f"b{bench.unique():07d}"
+        response = await bench.request(
+            "POST",
+            "/api/user",
+            data={
+                "user_name": user_name,
+                "first_name": "Bench",
+                "last_name": "Mark",
+                "role": "ENGINEER",
+                "email": f"{user_name}.{run_id}@example.com",
+                "password": "Benchmark1",
+            },
+        )
+        return response
+
+    # User creation hashes a password, so fewer requests keep the run short
+    user_requests = max(1, bench.requests // 10)
+    await bench.run("POST /user", create_user, requests=user_requests)
+    users = [
+        user["id"]
+        for user in (await bench.request("GET", "/api/users")).json()
+        if user["email"].endswith(f".{run_id}@example.com")
+    ]
+
+    me = bench.state["me"]
+    await bench.run(
+        "PATCH /user",
+        lambda _: bench.request(
+            "PATCH",
+            "/api/user",
+            json={
+                "first_name": me["first_name"],
+                "last_name": me["last_name"],
+                "email": me["email"],
+            },
+        ),
+    )
+    if users and projects:
+        await bench.run(
+            "PATCH /user/{user_id}/project/{project_id}",
+            lambda i: bench.request(
+                "PATCH",
+                f"/api/user/{users[i % len(users)]}/project/{projects[i % len(projects)]}",
+            ),
+        )
+        await bench.run(
+            "PATCH /user/{user_id}/unassign_project",
+            lambda i: bench.request(
+                "PATCH", f"/api/user/{users[i % len(users)]}/unassign_project"
+            ),
+        )
+        await bench.run(
+            "DELETE /user/{user_id}",
+            lambda i: bench.request("DELETE", f"/api/user/{users[i]}"),
+            requests=len(users),
+        )
+
+    await bench.run(
+        "DELETE /project/{project_id}",
+        lambda i: bench.request("DELETE", f"/api/project/{projects[i]}"),
+        requests=len(projects),
+    )
+    await bench.run(
+        "DELETE /customer/{customer_id}",
+        lambda i: bench.request("DELETE", f"/api/customer/{customers[i]}"),
+        requests=len(customers),
+    )
+
+
+async def auth_routes(bench: HttpBenchmark) -> None:
+    """Benchmarks the auth router. Log in verifies a bcrypt hash, so runs fewer requests."""
+    await bench.run(
+        "POST /login",
+        lambda _: bench.client.post(
+            "/api/login",
+            data={
+                "username": app_config.admin_username,
+                "password": app_config.admin_password,
+            },
+        ),
+        requests=max(1, bench.requests // 10),
+    )
+    await bench.run("POST /logout", lambda _: bench.request("POST", "/api/logout"))
+
+
+async def main(args: argparse.Namespace) -> bool:
+    if args.customers or args.users:
+        await generate_dataset(
+            customers=args.customers,
+            projects_per_customer=args.projects_per_customer,
+            users=args.users,
+            assignment_ratio=args.assignment_ratio,
+            manager_ratio=0.1,
+            seed=args.seed,
+            batch_size=app_config.bulk_chunk_size,
+            password="Synthetic1",
+        )
+
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+    else:
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="https://benchmark",
+            timeout=args.timeout,
+        )
+
+    async with client:
+        bench = HttpBenchmark(client, args.requests, args.concurrency)
+        await bench.login()
+
+        print(
+            f"Running {args.requests} requests per route at concurrency "
+            f"{args.concurrency} against {args.url or 'the in-process app'}\n"
+        )
+        await auth_routes(bench)
+        await read_routes(bench)
+        msgpack_mismatch = await msgpack_routes(bench)
+        if args.writes:
+            await write_routes(bench)
+
+    if not args.url:
+        await db_session_manager.close()
+
+    report = build_report(
+        "http",
+        {
+            "mode": "server" if args.url else "in-process",
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "writes": args.writes,
+            "customers": args.customers,
+            "projects_per_customer": args.projects_per_customer,
+            "users": args.users,
+        },
+        bench.results,
+    )
+    write_report(report, args.output)
+
+    regressed = msgpack_mismatch
+    if args.baseline:
+        regressed = (
+            compare_to_baseline(report, args.baseline, args.threshold) or regressed
+        )
+    return regressed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--url", help="Benchmark a running server instead of the in-process app"
+    )
+    parser.add_argument("--requests", type=int, default=100, help="Requests per route")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument(
+        "--no-writes",
+        dest="writes",
+        action="store_false",
+        help="Skip routes that create, update or delete entities",
+    )
+    parser.add_argument(
+        "--customers", type=int, default=0, help="Generate this many customers first"
+    )
+    parser.add_argument("--projects-per-customer", type=int, default=5)
+    parser.add_argument(
+        "--users", type=int, default=0, help="Generate this many users first"
+    )
+    parser.add_argument("--assignment-ratio", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        help="Application log level while benchmarking",
+    )
+    parser.add_argument("--output", default="bench_http.json")
+    parser.add_argument("--baseline", help="A previous report to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Fractional slowdown reported as a regression",
+    )
+    arguments = parser.parse_args()
+
+    logging.getLogger().setLevel(arguments.log_level)
+    sys.exit(1 if asyncio.run(main(arguments)) else 0)
@@ -0,0 +1,320 @@
+"""Repository layer micro-benchmarks.
+
+Creates a throwaway PostgreSQL database on the configured server (or '--database-url'),
+fills it with a synthetic dataset for each requested row count and times the ORM and
+bulk repository paths across relation depths. The database is dropped afterwards.
+
+Usage:
+    python -m benchmarks.repository_benchmark --rows 100,1000,10000
+    python -m benchmarks.repository_benchmark --baseline bench_repository_baseline.json
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from api.core.config import app_config
+from api.database import Base
+from api.database.models import Customer, Project, User
+from api.database.repository import Repository
+from api.database.session import DatabaseSessionManager
+from api.schemas.bulk import ExportFormat
+from benchmarks.utils import (
+    build_report,
+    compare_to_baseline,
+    summarize,
+    write_report,
+)
+from seed_database import generate_dataset
+
+
+@asynccontextmanager
+async def throwaway_database(server_url: str, keep: bool) -> AsyncIterator[str]:
+    """Creates an empty database containing the application schema and drops it on exit.
+
+    Args:
+        server_url (str): URL of any database on the target PostgreSQL server.
+        keep (bool): Leave the database in place for inspection.
+
+    Yields:
+        str: The URL of the throwaway database.
+    """
+    url = make_url(server_url)
+    name = f"bench_{uuid.uuid4().hex[:12]}"
+    admin = create_async_engine(
+        url.set(database="postgres"), isolation_level="AUTOCOMMIT"
+    )
+    database_url = url.set(database=name).render_as_string(hide_password=False)
+
+    async with admin.connect() as connection:
+        await connection.execute(text(f'CREATE DATABASE "{name}"'))
+    engine = create_async_engine(database_url)
+    async with engine.begin() as connection:
+        # The search indexes use trigram operator classes and the assignment
+        # exclusion constraint compares uuids within a GiST index
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+        await connection.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+    print(f"Created throwaway database {name}")
+
+    try:
+        yield database_url
+    finally:
+        if keep:
+            print(f"Keeping database {name}")
+        else:
+            async with admin.connect() as connection:
+                await connection.execute(
+                    text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)')
+                )
+            print(f"Dropped throwaway database {name}")
+        await admin.dispose()
+
+
+class RepositoryBenchmark:
+    """Times repository operations against the throwaway database."""
+
+    def __init__(self, database_url: str, operations: int, repeat: int) -> None:
+        self._manager = DatabaseSessionManager(database_url)
+        self.operations = operations
+        self.repeat = repeat
+        self.results: Dict[str, Any] = {}
+
+    async def close(self) -> None:
+        await self._manager.close()
+
+    @asynccontextmanager
+    async def repository(self, entity: type) -> AsyncIterator[Repository]:
+        async with self._manager.session() as session:
+            yield Repository(session, entity)
+
+    async def measure(
+        self,
+        name: str,
+        operation: Callable[[int], Awaitable[Any]],
+        iterations: int,
+    ) -> None:
+        """Runs 'operation' sequentially and records the latency of each call.
+
+        Args:
+            name (str): The name the results are reported under.
+            operation (Callable[[int], Awaitable[Any]]): The timed call, receiving the iteration number.
+            iterations (int): Number of timed calls.
+        """
+        samples: List[float] = []
+        started = time.perf_counter()
+        for iteration in range(iterations):
+            call_started = time.perf_counter()
+            await operation(iteration)
+            samples.append(time.perf_counter() - call_started)
+        self._record(name, summarize(samples, time.perf_counter() - started))
+
+    async def measure_fresh(
+        self,
+        name: str,
+        entity: type,
+        operation: Callable[[Repository], Awaitable[Any]],
+    ) -> None:
+        """Runs 'operation' in a new session each time so no identity map state is reused."""
+        samples: List[float] = []
+        started = time.perf_counter()
+        for _ in range(self.repeat):
+            async with self.repository(entity) as repository:
+                call_started = time.perf_counter()
+                await operation(repository)
+                samples.append(time.perf_counter() - call_started)
+        self._record(name, summarize(samples, time.perf_counter() - started))
+
+    def _record(self, name: str, result: Dict[str, Any]) -> None:
+        self.results[name] = result
+        print(
+            f"{name:<55} p50 {result['p50_ms']:>9.3f}ms  "
+            f"p95 {result['p95_ms']:>9.3f}ms  {result['throughput_ops']:>9.1f} ops/s"
+        )
+
+
+async def run_for_size(bench: RepositoryBenchmark, rows: int, names: List[str]) -> None:
+    """Runs every benchmark against a dataset of 'rows' customers."""
+    tag = f"rows={rows}"
+    operations = bench.operations
+    rng = random.Random(rows)
+    created: List[Customer] = []
+
+    # Single row ORM paths, sharing one session like a request would
+    async with bench.repository(Customer) as repository:
+
+        async def create(iteration: int) -> None:
+            created.append(
+                await repository.create(
+                    Customer(name=f"Bench {rows}-{iteration}", details="benchmark")
+                )
+            )
+
+        await bench.measure(f"create[{tag}]", create, operations)
+        await bench.measure(
+            f"find[{tag}]",
+            lambda _: repository.find({"name": rng.choice(names)}),
+            operations,
+        )
+        await bench.measure(
+            f"find_or[{tag}]",
+            lambda _: repository.find(
+                {"name": rng.choice(names), "id": str(uuid.uuid4())},
+                and_condition=False,
+            ),
+            operations,
+        )
+        await bench.measure(
+            f"update[{tag}]",
+            lambda i: repository.update(created[i], {"details": f"updated {i}"}),
+            operations,
+        )
+        await bench.measure(
+            f"delete[{tag}]", lambda i: repository.delete(created[i]), operations
+        )
+
+    # Listing across relation depths
+    await bench.measure_fresh(
+        f"list_all[customers,depth=0,{tag}]", Customer, lambda r: r.list_all()
+    )
+    await bench.measure_fresh(
+        f"list_all[customers,depth=1,{tag}]",
+        Customer,
+        lambda r: r.list_all(load_relations=["projects"]),
+    )
+    await bench.measure_fresh(
+        f"list_all[customers,depth=2,{tag}]",
+        Customer,
+        lambda r: r.list_all(load_relations=["projects.users"]),
+    )
+    await bench.measure_fresh(
+        f"list_all[projects,depth=1,{tag}]",
+        Project,
+        lambda r: r.list_all(load_relations=["users"]),
+    )
+    await bench.measure_fresh(
+        f"list_all[users,depth=1,{tag}]",
+        User,
+        lambda r: r.list_all(load_relations=["project"]),
+    )
+
+    async def load_awaitables(repository: Repository) -> None:
+        customers = await repository.list_all()
+        await repository.load_awaitables(load_relations=["projects"], results=customers)
+
+    await bench.measure_fresh(
+        f"load_awaitables[customers.projects,{tag}]", Customer, load_awaitables
+    )
+
+    # Bulk and raw paths
+    async with bench.repository(Customer) as repository:
+        await bench.measure(
+            f"bulk_create[{tag}]",
+            lambda i: repository.bulk_create(
+                [
+                    {"name": f"Bulk {rows}-{i}-{index}", "details": "benchmark"}
+                    for index in range(rows)
+                ]
+            ),
+            bench.repeat,
+        )
+        await bench.measure(
+            f"existing_values[{tag}]",
+            lambda _: repository.existing_values(
+                "name", rng.sample(names, min(len(names), 1000))
+            ),
+            operations,
+        )
+
+    for file_format in ExportFormat:
+
+        async def export(repository: Repository, file_format=file_format) -> None:
+            async for _ in repository.stream_export(["id", "name", "details"], file_format):
+                pass
+
+        await bench.measure_fresh(
+            f"stream_export[{file_format.value},{tag}]", Customer, export
+        )
+
+
+async def main(args: argparse.Namespace) -> bool:
+    sizes = [int(size) for size in args.rows.split(",")]
+    results: Dict[str, Any] = {}
+
+    for rows in sizes:
+        async with throwaway_database(args.database_url, args.keep) as database_url:
+            await generate_dataset(
+                customers=rows,
+                projects_per_customer=args.projects_per_customer,
+                users=rows * args.users_per_customer,
+                assignment_ratio=0.8,
+                manager_ratio=0.1,
+                seed=args.seed,
+                batch_size=app_config.bulk_chunk_size,
+                password="Synthetic1",
+                database_url=database_url,
+            )
+            names = [f"Customer {args.seed}-{index:07d}" for index in range(rows)]
+
+            print(f"\nBenchmarking {rows} customers\n")
+            bench = RepositoryBenchmark(database_url, args.operations, args.repeat)
+            try:
+                await run_for_size(bench, rows, names)
+            finally:
+                await bench.close()
+            results.update(bench.results)
+
+    report = build_report(
+        "repository",
+        {
+            "rows": sizes,
+            "projects_per_customer": args.projects_per_customer,
+            "users_per_customer": args.users_per_customer,
+            "operations": args.operations,
+            "repeat": args.repeat,
+        },
+        results,
+    )
+    write_report(report, args.output)
+
+    if args.baseline:
+        return compare_to_baseline(report, args.baseline, args.threshold)
+    return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--database-url",
+        default=app_config.database_url,
+        help="Any database on the PostgreSQL server to create the throwaway database on",
+    )
+    parser.add_argument("--rows", default="100,1000,10000", help="Customer row counts")
+    parser.add_argument("--projects-per-customer", type=int, default=3)
+    parser.add_argument("--users-per-customer", type=int, default=5)
+    parser.add_argument(
+        "--operations", type=int, default=200, help="Calls per single row benchmark"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="Calls per list / bulk benchmark"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--keep", action="store_true", help="Keep the database")
+    parser.add_argument("--output", default="bench_repository.json")
+    parser.add_argument("--baseline", help="A previous report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    arguments = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    sys.exit(1 if asyncio.run(main(arguments)) else 0)
@@ -0,0 +1,237 @@
+"""Project status history analytics benchmarks.
+
+Creates a throwaway PostgreSQL database on the configured server (or '--database-url'),
+fills it with projects and a synthetic status transition history for each requested
+transition count and times the time in status report and project history queries.
+The database is dropped afterwards.
+
+Usage:
+    python -m benchmarks.status_history_benchmark --transitions 100000,1000000
+    python -m benchmarks.status_history_benchmark --baseline bench_status_history_baseline.json
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import logging
+import math
+import random
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from sqlalchemy import text
+
+from api.core.config import app_config
+from api.database.project_status_repository import ProjectStatusRepository
+from api.database.session import DatabaseSessionManager
+from benchmarks.repository_benchmark import throwaway_database
+from benchmarks.utils import (
+    build_report,
+    compare_to_baseline,
+    summarize,
+    write_report,
+)
+from seed_database import generate_dataset, synthetic_id
+
+
+# Replaces the single transition recorded per generated project with 'per_project'
+# transitions cycling through the statuses, roughly 30 days apart and ending now
+SEED_TRANSITIONS = """
+INSERT INTO project_status_transition (project_id, status, entered_at)
+SELECT project.id,
+       (enum_range(NULL::projectstatus))[1 + step % 4],
+       now()
+           - make_interval(days => (:per_project - step) * 30)
+           + random() * interval '20 days'
+FROM project CROSS JOIN generate_series(0, :per_project - 1) AS step
+"""
+
+
+async def seed_transitions(
+    manager: DatabaseSessionManager, per_project: int, seed: int
+) -> int:
+    """Replaces the status history of every project with a synthetic one.
+
+    Args:
+        manager (DatabaseSessionManager): Session manager of the throwaway database.
+        per_project (int): Transitions generated per project.
+        seed (int): Seed of the random transition times.
+
+    Returns:
+        int: The number of transitions in the history table.
+    """
+    async with manager.session() as session:
+        await session.execute(text("TRUNCATE project_status_transition"))
+        await session.execute(text("SELECT setseed(:seed)"), {"seed": 1 / (seed + 1)})
+        await session.execute(text(SEED_TRANSITIONS), {"per_project": per_project})
+        await session.commit()
+        rows = (
+            await session.execute(
+                text("SELECT count(*) FROM project_status_transition")
+            )
+        ).scalar_one()
+    # Autovacuum would have set the visibility map of an append only table by now,
+    # without it the history index only scans fall back to reading the heap
+    async with manager.engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(text("VACUUM ANALYZE project_status_transition"))
+    return rows
+
+
+async def measure(
+    manager: DatabaseSessionManager,
+    results: Dict[str, Any],
+    name: str,
+    operation: Callable[[ProjectStatusRepository], Awaitable[Any]],
+    iterations: int,
+) -> None:
+    """Runs 'operation' in a new session each time and records the latency of each call."""
+    samples: List[float] = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        async with manager.session() as session:
+            repository = ProjectStatusRepository(session)
+            call_started = time.perf_counter()
+            await operation(repository)
+            samples.append(time.perf_counter() - call_started)
+    result = summarize(samples, time.perf_counter() - started)
+    results[name] = result
+    print(
+        f"{name:<55} p50 {result['p50_ms']:>9.3f}ms  "
+        f"p95 {result['p95_ms']:>9.3f}ms  {result['throughput_ops']:>9.1f} ops/s"
+    )
+
+
+async def run_for_size(
+    database_url: str, args: argparse.Namespace, transitions: int
+) -> Dict[str, Any]:
+    """Seeds a history of about 'transitions' rows and runs every benchmark against it."""
+    projects = math.ceil(transitions / args.transitions_per_project)
+    customers = math.ceil(projects / args.projects_per_customer)
+    await generate_dataset(
+        customers=customers,
+        projects_per_customer=args.projects_per_customer,
+        users=customers,
+        assignment_ratio=0.8,
+        manager_ratio=0.1,
+        seed=args.seed,
+        batch_size=app_config.bulk_chunk_size,
+        password="Synthetic1",
+        database_url=database_url,
+    )
+
+    manager = DatabaseSessionManager(database_url)
+    results: Dict[str, Any] = {}
+    try:
+        rows = await seed_transitions(manager, args.transitions_per_project, args.seed)
+        tag = f"transitions={transitions}"
+        print(
+            f"\nBenchmarking {rows} transitions of "
+            f"{customers * args.projects_per_customer} projects\n"
+        )
+
+        rng = random.Random(transitions)
+        since = datetime.now(timezone.utc) - timedelta(days=90)
+
+        await measure(
+            manager,
+            results,
+            f"time_in_status[all,{tag}]",
+            lambda r: r.time_in_status(),
+            args.repeat,
+        )
+        await measure(
+            manager,
+            results,
+            f"time_in_status[since=90d,{tag}]",
+            lambda r: r.time_in_status(since=since),
+            args.repeat,
+        )
+        await measure(
+            manager,
+            results,
+            f"time_in_status[customer,{tag}]",
+            lambda r: r.time_in_status(
+                customer_id=str(
+                    synthetic_id(args.seed, "customer", rng.randrange(customers))
+                )
+            ),
+            args.operations,
+        )
+        await measure(
+            manager,
+            results,
+            f"list_spans[project,{tag}]",
+            lambda r: r.list_spans(
+                str(
+                    synthetic_id(
+                        args.seed,
+                        "project",
+                        rng.randrange(customers * args.projects_per_customer),
+                    )
+                )
+            ),
+            args.operations,
+        )
+    finally:
+        await manager.close()
+    return results
+
+
+async def main(args: argparse.Namespace) -> bool:
+    sizes = [int(size) for size in args.transitions.split(",")]
+    results: Dict[str, Any] = {}
+
+    for transitions in sizes:
+        async with throwaway_database(args.database_url, args.keep) as database_url:
+            results.update(await run_for_size(database_url, args, transitions))
+
+    report = build_report(
+        "status_history",
+        {
+            "transitions": sizes,
+            "transitions_per_project": args.transitions_per_project,
+            "projects_per_customer": args.projects_per_customer,
+            "operations": args.operations,
+            "repeat": args.repeat,
+        },
+        results,
+    )
+    write_report(report, args.output)
+
+    if args.baseline:
+        return compare_to_baseline(report, args.baseline, args.threshold)
+    return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--database-url",
+        default=app_config.database_url,
+        help="Any database on the PostgreSQL server to create the throwaway database on",
+    )
+    parser.add_argument(
+        "--transitions", default="100000,1000000", help="Status transition row counts"
+    )
+    parser.add_argument("--transitions-per-project", type=int, default=12)
+    parser.add_argument("--projects-per-customer", type=int, default=5)
+    parser.add_argument(
+        "--operations",
+        type=int,
+        default=200,
+        help="Calls per single customer / project benchmark",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="Calls per whole history benchmark"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--keep", action="store_true", help="Keep the database")
+    parser.add_argument("--output", default="bench_status_history.json")
+    parser.add_argument("--baseline", help="A previous report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    arguments = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    sys.exit(1 if asyncio.run(main(arguments)) else 0)
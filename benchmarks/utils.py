@@ -0,0 +1,129 @@
+"""Shared timing, reporting and baseline comparison helpers for the benchmark suites"""
+
+from datetime import datetime, timezone
+import json
+import platform
+import resource
+from statistics import fmean, quantiles
+import sys
+from typing import Any, Dict, List
+
+
+def peak_rss_mb() -> float:
+    """Returns the peak resident set size of the current process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def summarize(samples: List[float], elapsed: float, errors: int = 0) -> Dict[str, Any]:
+    """Summarizes a list of latency samples (in seconds) taken over 'elapsed' seconds.
+
+    Args:
+        samples (List[float]): Latency of each operation in seconds.
+        elapsed (float): Wall clock time taken to run every operation.
+        errors (int, optional): Number of failed operations. Defaults to 0.
+
+    Returns:
+        Dict[str, Any]: Count, error count, throughput and latency percentiles in ms.
+    """
+    if not samples:
+        return {"count": 0, "errors": errors}
+
+    if len(samples) > 1:
+        cuts = quantiles(samples, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = samples[0]
+
+    return {
+        "count": len(samples),
+        "errors": errors,
+        "throughput_ops": round(len(samples) / elapsed, 2) if elapsed else None,
+        "mean_ms": round(fmean(samples) * 1000, 3),
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3),
+    }
+
+
+def build_report(
+    suite: str, parameters: Dict[str, Any], results: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Wraps benchmark results with the metadata needed to compare runs.
+
+    Args:
+        suite (str): Name of the benchmark suite.
+        parameters (Dict[str, Any]): The arguments the suite was run with.
+        results (Dict[str, Any]): Result summaries keyed by benchmark name.
+
+    Returns:
+        Dict[str, Any]: The full report.
+    """
+    return {
+        "suite": suite,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": parameters,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "results": results,
+    }
+
+
+def write_report(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, sort_keys=True)
+    print(f"\nReport written to {path}")
+
+
+def compare_to_baseline(
+    report: Dict[str, Any], baseline_path: str, threshold: float
+) -> bool:
+    """Prints the change in latency and throughput of each result against a saved baseline.
+
+    Args:
+        report (Dict[str, Any]): The current report.
+        baseline_path (str): Path to a report saved by a previous run.
+        threshold (float): Fractional slowdown (e.g. 0.1 = 10%) flagged as a regression.
+
+    Returns:
+        bool: True if any result regressed by more than the threshold.
+    """
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    regressed = False
+    print(f"\nComparison against {baseline_path} (threshold {threshold:.0%})")
+    print(f"{'benchmark':<45} {'p50':>9} {'p95':>9} {'p99':>9} {'ops/s':>9}")
+
+    for name, result in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not result.get("count") or not previous.get("count"):
+            print(f"{name:<45} {'(no baseline)':>39}")
+            continue
+
+        changes: List[float | None] = []
+        for metric in ("p50_ms", "p95_ms", "p99_ms", "throughput_ops"):
+            before, after = previous.get(metric), result.get(metric)
+            if not before or after is None:
+                changes.append(None)
+                continue
+            change = (after - before) / before
+            changes.append(change)
+            # Higher latency or lower throughput is a regression, p99 is too noisy to gate on
+            slower = -change if metric == "throughput_ops" else change
+            if metric != "p99_ms" and slower > threshold:
+                regressed = True
+
+        print(
+            f"{name:<45} "
+            + " ".join(
+                f"{change:>+9.1%}" if change is not None else f"{'-':>9}"
+                for change in changes
+            )
+        )
+
+    print("\nRegression detected" if regressed else "\nNo regressions detected")
+    return regressed
@@ -0,0 +1,69 @@
+import argparse
+import asyncio
+
+from fastapi import HTTPException
+
+from api.core.config import app_config
+from api.database.models import Customer, Project, User
+from api.database.repository import Repository
+from api.database.session import DatabaseSessionManager
+from api.schemas.bulk import BulkEntity, ImportFormat
+from api.services.auth_service import AuthService
+from api.services.bulk_service import BulkService
+
+
+async def import_data(
+    entity: BulkEntity, path: str, file_format: ImportFormat, chunk_size: int
+):
+    db_session_manager = DatabaseSessionManager(
+        app_config.database_url,
+    )
+
+    async with db_session_manager.session() as session:
+        user_repository = Repository(session, User)
+        bulk_service = BulkService(
+            user_repository,
+            Repository(session, Customer),
+            Repository(session, Project),
+            AuthService(user_repository),
+        )
+
+        try:
+            print(f"Importing {entity.value} from {path}...\n")
+
+            with open(path, "rb") as stream:
+                report = await bulk_service.import_records(
+                    entity, stream, file_format, chunk_size
+                )
+
+            print(report.model_dump_json(indent=2))
+            print(f"\nImported {report.imported} of {report.processed} rows")
+        except HTTPException as e:
+            print(f"\nImport failed: {e.detail}")
+        finally:
+            await db_session_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Bulk import users, customers or projects from a CSV or NDJSON file."
+    )
+    parser.add_argument("entity", choices=[entity.value for entity in BulkEntity])
+    parser.add_argument("path", help="Path to the file to import")
+    parser.add_argument(
+        "--format",
+        dest="file_format",
+        choices=[file_format.value for file_format in ImportFormat],
+        default=ImportFormat.CSV.value,
+    )
+    parser.add_argument("--chunk-size", type=int, default=app_config.bulk_chunk_size)
+    args = parser.parse_args()
+
+    asyncio.run(
+        import_data(
+            BulkEntity(args.entity),
+            args.path,
+            ImportFormat(args.file_format),
+            args.chunk_size,
+        )
+    )
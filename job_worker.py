@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+import signal
+
+from api.core.config import app_config
+from api.database.session import db_session_manager
+from api.services.job_worker import job_worker
+
+
+async def run_workers(concurrency: int):
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+
+    print(f"Running {concurrency} job workers, press Ctrl+C to stop...\n")
+    job_worker.start(concurrency)
+    try:
+        await stopping.wait()
+    finally:
+        print("\nStopping job workers...")
+        await job_worker.stop()
+        await db_session_manager.close()
+        print(job_worker.stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run background jobs queued through the API, outside the API processes."
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=max(app_config.job_workers, 1),
+        help="Number of jobs run at once",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run_workers(args.concurrency))
@@ -1,12 +1,25 @@
+import argparse
 import asyncio
+import hashlib
+import random
+import time
+import uuid
+from typing import Any, Dict, Iterator
 
 from api.core.config import app_config
-from api.database.models import User
+from api.database.models import Customer, Project, User
 from api.database.repository import Repository
 from api.database.session import DatabaseSessionManager
+from api.schemas.project import ProjectStatus
 from api.schemas.user import Roles, UserCreate
 from api.services.auth_service import AuthService
 from api.utils.exceptions import IntegrityViolationError
+from api.utils.parsers import next_chunk
+
+
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie"]
+LAST_NAMES = ["Smith", "Jones", "Brown", "Wilson", "Evans", "Walker", "Wright", "Hall"]
+DETAIL_WORDS = ["platform", "migration", "network", "upgrade", "rollout", "support"]
 
 
 async def seed_database():
@@ -47,5 +60,174 @@ async def seed_database():
             print("\nDatabase already seeded")
 
 
+def synthetic_id(seed: int, kind: str, index: int) -> uuid.UUID:
+    """Derives a stable version 4 UUID for the n-th generated entity of a kind.
+
+    Deriving ids from the index means related rows can reference each other
+    without holding every generated id in memory.
+    """
+    digest = hashlib.blake2b(f"{seed}:{kind}:{index}".encode(), digest_size=16)
+    return uuid.UUID(int=int.from_bytes(digest.digest(), "big"), version=4)
+
+
+# Base 36 digits of the seed and the user index in a synthetic username
+USER_NAME_SEED_DIGITS = 2
+USER_NAME_INDEX_DIGITS = 5
+
+
+def base36(value: int, width: int) -> str:
+    """Encodes a non-negative int as 'width' base 36 digits, zero padded."""
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    encoded = ""
+    while value:
+        value, remainder = divmod(value, 36)
+        encoded = digits[remainder] + encoded
+    return encoded.rjust(width, "0")
+
+
+def synthetic_user_name(seed: int, index: int) -> str:
+    """Returns a unique 8 character username, starting with a letter, for the n-th user
+    of a seed. The seed and index are encoded separately, so datasets generated with
+    different seeds never share a username, whatever their sizes."""
+    return (
+        "u"
+        + base36(seed, USER_NAME_SEED_DIGITS)
+        + base36(index, USER_NAME_INDEX_DIGITS)
+    )
+
+
+async def generate_dataset(
+    customers: int,
+    projects_per_customer: int,
+    users: int,
+    assignment_ratio: float,
+    manager_ratio: float,
+    seed: int,
+    batch_size: int,
+    password: str,
+    database_url: str | None = None,
+):
+    db_session_manager = DatabaseSessionManager(
+        database_url or app_config.database_url,
+    )
+    if not 0 <= seed < 36**USER_NAME_SEED_DIGITS:
+        raise ValueError(f"seed must be between 0 and {36**USER_NAME_SEED_DIGITS - 1}")
+    if users > 36**USER_NAME_INDEX_DIGITS:
+        raise ValueError(f"users must be at most {36**USER_NAME_INDEX_DIGITS}")
+
+    rng = random.Random(seed)
+    total_projects = customers * projects_per_customer
+
+    def customer_rows() -> Iterator[Dict[str, Any]]:
+        for index in range(customers):
+            yield {
+                "id": synthetic_id(seed, "customer", index),
+                "name": f"Customer {seed}-{index:07d}",
+                "details": " ".join(rng.choices(DETAIL_WORDS, k=4)),
+                "active": rng.random() > 0.1,
+            }
+
+    def project_rows() -> Iterator[Dict[str, Any]]:
+        statuses = list(ProjectStatus)
+        for index in range(total_projects):
+            yield {
+                "id": synthetic_id(seed, "project", index),
+                "name": f"Project {seed}-{index:09d}",
+                "status": rng.choice(statuses),
+                "details": " ".join(rng.choices(DETAIL_WORDS, k=4)),
+                "customer_id": synthetic_id(
+                    seed, "customer", index // projects_per_customer
+                ),
+            }
+
+    def user_rows(hashed_password: str) -> Iterator[Dict[str, Any]]:
+        for index in range(users):
+            user_name = synthetic_user_name(seed, index)
+            role = Roles.MANAGER if rng.random() < manager_ratio else Roles.ENGINEER
+            assigned = total_projects > 0 and rng.random() < assignment_ratio
+            yield {
+                "id": synthetic_id(seed, "user", index),
+                "user_name": user_name,
+                "hashed_password": hashed_password,
+                "first_name": rng.choice(FIRST_NAMES),
+                "last_name": rng.choice(LAST_NAMES),
+                "email": f"{user_name}@example.com",
+                "role": role,
+                "admin": role == Roles.MANAGER,
+                "project_id": (
+                    synthetic_id(seed, "project", rng.randrange(total_projects))
+                    if assigned
+                    else None
+                ),
+            }
+
+    async with db_session_manager.session() as session:
+        user_repository = Repository(session, User)
+        # Every synthetic user shares one password, so bcrypt only runs once
+        hashed_password = AuthService(user_repository).hash_pwd(password)
+
+        print(
+            f"Generating {customers} customers, {total_projects} projects "
+            f"and {users} users (seed {seed})...\n"
+        )
+        try:
+            for label, repository, rows in (
+                ("customers", Repository(session, Customer), customer_rows()),
+                ("projects", Repository(session, Project), project_rows()),
+                ("users", user_repository, user_rows(hashed_password)),
+            ):
+                started = time.perf_counter()
+                count = 0
+                while batch := next_chunk(rows, batch_size):
+                    await repository.bulk_create(batch)
+                    count += len(batch)
+                print(f"{label}: {count} rows in {time.perf_counter() - started:.1f}s")
+
+            print(f"\nSynthetic users can log in with the password '{password}'")
+        except IntegrityViolationError:
+            print(
+                f"\nA dataset with seed {seed} was already generated, use another --seed"
+            )
+
+    await db_session_manager.close()
+
+
 if __name__ == "__main__":
-    asyncio.run(seed_database())
+    parser = argparse.ArgumentParser(
+        description="Seed the admin user, or generate a large synthetic dataset."
+    )
+    parser.add_argument("--customers", type=int, default=0)
+    parser.add_argument("--projects-per-customer", type=int, default=5)
+    parser.add_argument("--users", type=int, default=0)
+    parser.add_argument(
+        "--assignment-ratio",
+        type=float,
+        default=0.8,
+        help="Fraction of users assigned to a project",
+    )
+    parser.add_argument(
+        "--manager-ratio",
+        type=float,
+        default=0.1,
+        help="Fraction of users given the MANAGER (admin) role",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=app_config.bulk_chunk_size)
+    parser.add_argument("--password", default="Synthetic1")
+    args = parser.parse_args()
+
+    if not args.customers and not args.users:
+        asyncio.run(seed_database())
+    else:
+        asyncio.run(
+            generate_dataset(
+                customers=args.customers,
+                projects_per_customer=args.projects_per_customer,
+                users=args.users,
+                assignment_ratio=args.assignment_ratio,
+                manager_ratio=args.manager_ratio,
+                seed=args.seed,
+                batch_size=args.batch_size,
+                password=args.password,
+            )
+        )
@@ -1,7 +1,7 @@
 'use client';
 
 import { AxiosError } from 'axios';
-import { useContext, useState } from 'react';
+import { useContext, useRef, useState } from 'react';
 import { useForm } from 'react-hook-form';
 import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
@@ -37,6 +37,9 @@ type CustomerFormProps = AddCustomerFormProps | EditCustomerFormProps;
 
 const CustomerForm = (props: CustomerFormProps) => {
   const [isLoading, setIsLoading] = useState<boolean>(false);
+  // Kept across a submission that gets no response, so retrying it is
+  // answered with the first attempt's result instead of a duplicate
+  const idempotencyKey = useRef(crypto.randomUUID());
 
   const { toast } = useToast();
   const { isAdmin, logout } = useContext(AuthContext);
@@ -66,9 +69,10 @@ const CustomerForm = (props: CustomerFormProps) => {
       if (props.formType === 'edit') {
         await updateCustomer(props.customerId, data);
       } else {
-        await createCustomer(data);
+        await createCustomer(data, idempotencyKey.current);
       }
 
+      idempotencyKey.current = crypto.randomUUID();
       toast({
         title: 'Success',
         description: `Customer successfully ${
@@ -78,6 +82,9 @@ const CustomerForm = (props: CustomerFormProps) => {
 
       if (props.formType === 'edit') props.handleRefresh();
     } catch (error) {
+      if (!(error instanceof AxiosError) || error.response) {
+        idempotencyKey.current = crypto.randomUUID();
+      }
       if (error instanceof AxiosError) {
         if (error.response?.status === 401) {
           toast({
@@ -3,7 +3,7 @@
 import { AxiosError } from 'axios';
 import { zodResolver } from '@hookform/resolvers/zod';
 import { CaretSortIcon, CheckIcon } from '@radix-ui/react-icons';
-import { useCallback, useContext, useEffect, useState } from 'react';
+import { useCallback, useContext, useEffect, useRef, useState } from 'react';
 import { useForm } from 'react-hook-form';
 import { z } from 'zod';
 
@@ -64,6 +64,9 @@ const ProjectForm = (props: ProjectFormProps) => {
   );
   const [isReady, setIsReady] = useState<boolean>(false);
   const [isLoading, setIsLoading] = useState<boolean>(false);
+  // Kept across a submission that gets no response, so retrying it is
+  // answered with the first attempt's result instead of a duplicate
+  const idempotencyKey = useRef(crypto.randomUUID());
 
   const errorTitle = `Error - Cannot ${
     props.formType === 'add' ? 'Add' : 'Update'
@@ -98,9 +101,10 @@ const ProjectForm = (props: ProjectFormProps) => {
       if (props.formType === 'edit') {
         await updateProject(props.projectId, data);
       } else {
-        await createProject(data);
+        await createProject(data, idempotencyKey.current);
       }
 
+      idempotencyKey.current = crypto.randomUUID();
       toast({
         title: 'Success',
         description: `Project successfully ${
@@ -110,6 +114,9 @@ const ProjectForm = (props: ProjectFormProps) => {
 
       if (props.formType === 'edit') props.handleRefresh();
     } catch (error) {
+      if (!(error instanceof AxiosError) || error.response) {
+        idempotencyKey.current = crypto.randomUUID();
+      }
       if (error instanceof AxiosError) {
         if (error.response?.status === 401) {
           toast({
@@ -8,6 +8,11 @@ import {
 } from '@/models/Relations';
 import { UserCreate, UserLogin, UserResponse, UserUpdate } from '@/models/User';
 
+// Retries of a request sent with the same key replay its stored response
+// rather than repeating the write
+const idempotencyHeaders = (idempotencyKey?: string) =>
+  idempotencyKey ? { 'Idempotency-Key': idempotencyKey } : {};
+
 // Login and logout
 export const logInUser = async (user: UserLogin) =>
   await axios.post<{}>('/api/login', user, {
@@ -40,24 +45,33 @@ export const updateUser = async (user: UserUpdate) =>
     headers: { 'Content-Type': 'application/json' },
   });
 
-export const assignProjectToUser = async (userId: string, projectId: string) =>
+export const assignProjectToUser = async (
+  userId: string,
+  projectId: string,
+  idempotencyKey?: string
+) =>
   await axios.patch<UserWithProjectResponse>(
     `/api/user/${userId}/project/${projectId}`,
     {},
     {
       headers: {
         'Content-Type': 'application/json',
+        ...idempotencyHeaders(idempotencyKey),
       },
     }
   );
 
-export const unassignProjectFromUser = async (userId: string) =>
+export const unassignProjectFromUser = async (
+  userId: string,
+  idempotencyKey?: string
+) =>
   await axios.patch<UserResponse>(
     `/api/user/${userId}/unassign_project`,
     {},
     {
       headers: {
         'Content-Type': 'application/json',
+        ...idempotencyHeaders(idempotencyKey),
       },
     }
   );
@@ -66,9 +80,15 @@ export const deleteUser = async (userId: string) =>
   await axios.delete(`api/user/${userId}`);
 
 // Projects CRUD
-export const createProject = async (project: ProjectCreate) =>
+export const createProject = async (
+  project: ProjectCreate,
+  idempotencyKey?: string
+) =>
   await axios.post<ProjectResponse>('/api/project', project, {
-    headers: { 'Content-Type': 'application/json' },
+    headers: {
+      'Content-Type': 'application/json',
+      ...idempotencyHeaders(idempotencyKey),
+    },
   });
 
 export const getProjects = async (users?: boolean) => {
@@ -96,9 +116,15 @@ export const deleteProject = async (projectId: string) =>
   await axios.delete(`api/project/${projectId}`);
 
 // Customers CRUD
-export const createCustomer = async (customer: CustomerCreate) =>
+export const createCustomer = async (
+  customer: CustomerCreate,
+  idempotencyKey?: string
+) =>
   await axios.post<CustomerResponse>('/api/customer', customer, {
-    headers: { 'Content-Type': 'application/json' },
+    headers: {
+      'Content-Type': 'application/json',
+      ...idempotencyHeaders(idempotencyKey),
+    },
   });
 
 export const getCustomers = async () =>